@@ -1,12 +1,19 @@
-from flask import Flask, render_template, request, jsonify
-from src.database import Database
-from src.bill_utils import get_popular_bills_sql, clean_law_name
-import re
+from flask import Flask, Response, render_template, request, jsonify, stream_with_context
+from src.bill_record import Member, Party, org_party
+from src.database import OTHER_ARTICLE_GROUP
+from src.db_pool import DEFAULT_POOL_SIZE, get_db, init_app as init_db_pool
+from src.http_cache import conditional_response, init_app as init_http_cache
+from src.law_names import canonical_law_name
+from src.legislator_lookup import get_party
+from src.name_matcher import extract_names
+from src.search_cache import DEFAULT_CACHE_SIZE, DEFAULT_CACHE_TTL, SearchCache
 import webbrowser
 import threading
 import time
 from collections import defaultdict
 import os
+import json
+import re
 
 # 獲取當前腳本的目錄
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -15,308 +22,49 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 template_dir = os.path.join(current_dir, 'templates')
 app = Flask(__name__, template_folder=template_dir)
 
-def cn_to_arab(cn_str):
-    """將中文數字轉換為阿拉伯數字
-    
-    Args:
-        cn_str: 中文數字字串
-        
-    Returns:
-        int: 阿拉伯數字
-    """
-    # 中文數字對照表
-    cn_num = {
-        '零': 0, '一': 1, '二': 2, '三': 3, '四': 4, '五': 5,
-        '六': 6, '七': 7, '八': 8, '九': 9, '十': 10,
-        '百': 100, '千': 1000, '萬': 10000,
-        '０': 0, '１': 1, '２': 2, '３': 3, '４': 4, '５': 5,
-        '６': 6, '７': 7, '８': 8, '９': 9
-    }
-    
-    # 如果是純數字，直接返回
-    if cn_str.isdigit():
-        return int(cn_str)
-        
-    # 如果字串中包含非中文數字，返回原始字串
-    for char in cn_str:
-        if char not in cn_num and char not in ['百', '千', '萬', '零']:
-            return cn_str
-            
-    # 處理特殊情況
-    if not cn_str:
-        return 0
-        
-    # 處理一位數
-    if len(cn_str) == 1:
-        return cn_num.get(cn_str, cn_str)
-        
-    # 處理「十」開頭的數字
-    if cn_str.startswith('十'):
-        if len(cn_str) == 1:
-            return 10
-        return 10 + cn_to_arab(cn_str[1:])
+# 資料庫連線池設定，連線池大小應與 gunicorn 每個 worker 的執行緒數一致
+app.config['DB_POOL_SIZE'] = int(os.environ.get('DB_POOL_SIZE', DEFAULT_POOL_SIZE))
+app.config['DATABASE_PATH'] = os.environ.get('DATABASE_PATH')
 
-    # 處理帶「千」的數字
-    if '千' in cn_str:
-        parts = cn_str.split('千')
-        base = cn_num[parts[0]] * 1000
-        if not parts[1]:
-            return base
-        if parts[1].startswith('零'):
-            # 處理「一千零八」這樣的情況
-            remaining = parts[1][1:]
-            if remaining:
-                return base + cn_to_arab(remaining)
-            return base
-        return base + cn_to_arab(parts[1])
-        
-    # 處理帶「百」的數字
-    if '百' in cn_str:
-        parts = cn_str.split('百')
-        base = cn_num[parts[0]] * 100
-        if not parts[1]:
-            return base
-        if parts[1].startswith('零'):
-            remaining = parts[1][1:]
-            if remaining:
-                return base + cn_to_arab(remaining)
-            return base
-        return base + cn_to_arab(parts[1])
-        
-    # 處理帶「十」的數字
-    if '十' in cn_str:
-        parts = cn_str.split('十')
-        base = cn_num[parts[0]] * 10
-        if not parts[1]:
-            return base
-        return base + cn_num[parts[1]]
-        
-    # 處理其他情況
-    return cn_num.get(cn_str, cn_str)
+# 啟動時建立資料表並初始化連線池，請求中以 get_db() 借用連線
+init_db_pool(app)
 
-def extract_article_numbers(bill_name: str) -> list:
-    """從法案名稱中提取條號
-    
-    Args:
-        bill_name: 法案名稱
-        
-    Returns:
-        list: 條號列表，每個條號是一個字典，包含 full_text 和 number
-    """
-    articles = []
-    
-    # 處理中文數字的條號，如「第二條及第三條」
-    cn_pattern = r'第([零一二三四五六七八九十百千萬０１２３４５６７８９]+)條(?:之([零一二三四五六七八九十百千萬０１２３４５６７８９]+))?(?:及|、|，|和|暨)第([零一二三四五六七八九十百千萬０１２３４５６７８９]+)條(?:之([零一二三四五六七八九十百千萬０１２３４５６７８９]+))?'
-    cn_matches = re.finditer(cn_pattern, bill_name)
-    
-    for match in cn_matches:
-        # 第一個條號
-        first_number = cn_to_arab(match.group(1))
-        if isinstance(first_number, str):
-            continue
-        first_sub = cn_to_arab(match.group(2)) if match.group(2) else 0
-        if isinstance(first_sub, str):
-            first_sub = 0
-        
-        if first_sub:
-            first_text = f"第{first_number}條之{first_sub}"
-        else:
-            first_text = f"第{first_number}條"
-            
-        articles.append({
-            'full_text': first_text,
-            'number': first_number,
-            'sub_number': first_sub
-        })
-        
-        # 第二個條號
-        second_number = cn_to_arab(match.group(3))
-        if isinstance(second_number, str):
-            continue
-        second_sub = cn_to_arab(match.group(4)) if match.group(4) else 0
-        if isinstance(second_sub, str):
-            second_sub = 0
-        
-        if second_sub:
-            second_text = f"第{second_number}條之{second_sub}"
-        else:
-            second_text = f"第{second_number}條"
-            
-        articles.append({
-            'full_text': second_text,
-            'number': second_number,
-            'sub_number': second_sub
-        })
-    
-    # 處理單一中文數字條號，如「第二條」
-    cn_single_pattern = r'第([零一二三四五六七八九十百千萬０１２３４５６７８９]+)條(?:之([零一二三四五六七八九十百千萬０１２３４５６７８９]+))?'
-    cn_single_matches = re.finditer(cn_single_pattern, bill_name)
-    
-    for match in cn_single_matches:
-        number = cn_to_arab(match.group(1))
-        if isinstance(number, str):
-            continue
-        sub_number = cn_to_arab(match.group(2)) if match.group(2) else 0
-        if isinstance(sub_number, str):
-            sub_number = 0
-        
-        # 檢查是否已經在多條模式中處理過
-        already_processed = False
-        for article in articles:
-            if article['number'] == number and article['sub_number'] == sub_number:
-                already_processed = True
-                break
-                
-        if already_processed:
-            continue
-            
-        if sub_number:
-            full_text = f"第{number}條之{sub_number}"
-        else:
-            full_text = f"第{number}條"
-            
-        articles.append({
-            'full_text': full_text,
-            'number': number,
-            'sub_number': sub_number
-        })
-    
-    # 處理阿拉伯數字條號，如「第1條及第2條」
-    arab_pattern = r'第(\d+)條(?:之(\d+))?(?:及|、|，|和|暨)第(\d+)條(?:之(\d+))?'
-    arab_matches = re.finditer(arab_pattern, bill_name)
-    
-    for match in arab_matches:
-        # 第一個條號
-        first_number = int(match.group(1))
-        first_sub = int(match.group(2)) if match.group(2) else 0
-        
-        # 檢查是否已經處理過
-        already_processed = False
-        for article in articles:
-            if article['number'] == first_number and article['sub_number'] == first_sub:
-                already_processed = True
-                break
-                
-        if not already_processed:
-            if first_sub:
-                first_text = f"第{first_number}條之{first_sub}"
-            else:
-                first_text = f"第{first_number}條"
-                
-            articles.append({
-                'full_text': first_text,
-                'number': first_number,
-                'sub_number': first_sub
-            })
-        
-        # 第二個條號
-        second_number = int(match.group(3))
-        second_sub = int(match.group(4)) if match.group(4) else 0
-        
-        # 檢查是否已經處理過
-        already_processed = False
-        for article in articles:
-            if article['number'] == second_number and article['sub_number'] == second_sub:
-                already_processed = True
-                break
-                
-        if not already_processed:
-            if second_sub:
-                second_text = f"第{second_number}條之{second_sub}"
-            else:
-                second_text = f"第{second_number}條"
-                
-            articles.append({
-                'full_text': second_text,
-                'number': second_number,
-                'sub_number': second_sub
-            })
-    
-    # 處理單一阿拉伯數字條號，如「第1條」
-    arab_single_pattern = r'第(\d+)條(?:之(\d+))?'
-    arab_single_matches = re.finditer(arab_single_pattern, bill_name)
-    
-    for match in arab_single_matches:
-        number = int(match.group(1))
-        sub_number = int(match.group(2)) if match.group(2) else 0
-        
-        # 檢查是否已經處理過
-        already_processed = False
-        for article in articles:
-            if article['number'] == number and article['sub_number'] == sub_number:
-                already_processed = True
-                break
-                
-        if already_processed:
-            continue
-            
-        if sub_number:
-            full_text = f"第{number}條之{sub_number}"
-        else:
-            full_text = f"第{number}條"
-            
-        articles.append({
-            'full_text': full_text,
-            'number': number,
-            'sub_number': sub_number
-        })
-    
-    # 處理中文區間條號，如「第一條至第十條」
-    cn_range_pattern = r'第([零一二三四五六七八九十百千萬０１２３４５６７８９]+)條至第([零一二三四五六七八九十百千萬０１２３４５６７８９]+)條'
-    cn_range_matches = re.finditer(cn_range_pattern, bill_name)
-    
-    for match in cn_range_matches:
-        start_number = cn_to_arab(match.group(1))
-        end_number = cn_to_arab(match.group(2))
-        
-        for num in range(start_number, end_number + 1):
-            # 檢查是否已經處理過
-            already_processed = False
-            for article in articles:
-                if article['number'] == num and article['sub_number'] == 0:
-                    already_processed = True
-                    break
-                    
-            if already_processed:
-                continue
-                
-            full_text = f"第{num}條"
-            articles.append({
-                'full_text': full_text,
-                'number': num,
-                'sub_number': 0
-            })
-    
-    # 處理阿拉伯數字區間條號，如「第1條至第10條」
-    arab_range_pattern = r'第(\d+)條至第(\d+)條'
-    arab_range_matches = re.finditer(arab_range_pattern, bill_name)
-    
-    for match in arab_range_matches:
-        start_number = int(match.group(1))
-        end_number = int(match.group(2))
-        
-        for num in range(start_number, end_number + 1):
-            # 檢查是否已經處理過
-            already_processed = False
-            for article in articles:
-                if article['number'] == num and article['sub_number'] == 0:
-                    already_processed = True
-                    break
-                    
-            if already_processed:
-                continue
-                
-            full_text = f"第{num}條"
-            articles.append({
-                'full_text': full_text,
-                'number': num,
-                'sub_number': 0
-            })
-    
-    # 打印調試信息
-    print(f"從 '{bill_name}' 提取條號: {[a['full_text'] for a in articles]}")
-    
-    return articles
+# 搜尋結果快取：SEARCH_CACHE_SIZE 為 0 時停用；設定 SEARCH_CACHE_PATH 時多個 worker 共用快取檔案
+app.config['SEARCH_CACHE_SIZE'] = int(os.environ.get('SEARCH_CACHE_SIZE', DEFAULT_CACHE_SIZE))
+app.config['SEARCH_CACHE_TTL'] = float(os.environ.get('SEARCH_CACHE_TTL', DEFAULT_CACHE_TTL))
+app.config['SEARCH_CACHE_PATH'] = os.environ.get('SEARCH_CACHE_PATH')
+search_cache = SearchCache(app.config['SEARCH_CACHE_SIZE'], app.config['SEARCH_CACHE_TTL'],
+                           shared_path=app.config['SEARCH_CACHE_PATH'])
+
+# 搜尋與 API 回應加上 ETag、Cache-Control，並壓縮 HTML 與 JSON
+init_http_cache(app)
+
+# 搜尋結果每個分組每次載入的法案數
+SEARCH_PAGE_SIZE = 20
+MAX_SEARCH_PAGE_SIZE = 100
+
+# 依審查進度分組時的顯示順序
+STATUS_GROUP_ORDER = ['三讀', '二讀', '一讀', '審查完畢', '委員會審查', '待審查', '退回/撤回']
+
+# 委員黨籍對應的政黨分類，其他政黨的委員歸為 Party.OTHER
+MEMBER_PARTIES = {
+    '民進黨': Party.DPP,
+    '國民黨': Party.KMT,
+    '民眾黨': Party.TPP,
+    '無黨籍': Party.NO_PARTY,
+}
+
+# 以完整姓名（含族名）顯示的原住民委員：中文姓名 -> 完整姓名
+MEMBER_FULL_NAMES = {
+    '鄭天財': '鄭天財Sra Kacaw',
+    '伍麗華': '伍麗華Saidhai Tahovecahe',
+}
+
+# /api/bills 的條號參數，例如 10、第10條、10-1、第10條之1
+ARTICLE_PARAM_PATTERN = re.compile(r'^第?(\d+)條?(?:[-之](\d+))?$')
+
+# /api/search/group 依條號分組時的 group 參數：條號-之幾，例如 10-0、10-1
+ARTICLE_GROUP_PATTERN = re.compile(r'^(\d+)-(\d+)$')
 
 def normalize_name(name: str) -> str:
     """標準化人名格式
@@ -337,65 +85,12 @@ def normalize_name(name: str) -> str:
     # 不再抽取原住民名字的中文部分，保留完整名字
     return name
 
-def extract_names(names_str: str) -> list:
-    """從字串中提取人名列表
-    
-    Args:
-        names_str: 包含多個姓名的字串
-        
-    Returns:
-        list: 人名列表
-    """
-    if not names_str:
-        return []
-    
-    # 移除全形空格和換行符號
-    names_str = names_str.replace('　', ' ').replace('\n', ' ')
-    
-    # 移除"本院委員XXX等N人"的部分
-    names_str = re.sub(r'本院委員.+?等\d+人', '', names_str)
-    
-    # 首先嘗試匹配原住民名字（中文+英文組合）
-    aboriginal_names = []
-    aboriginal_pattern = r'([\u4e00-\u9fa5]{2,4}\s*[A-Za-z]+\s*[A-Za-z]+(?:\s*[A-Za-z]+)?)'
-    aboriginal_matches = re.finditer(aboriginal_pattern, names_str)
-    
-    for match in aboriginal_matches:
-        aboriginal_name = match.group(0).strip()
-        if aboriginal_name:
-            aboriginal_names.append(aboriginal_name)
-            # 將匹配到的原住民名字從原始字串中移除，避免重複匹配
-            names_str = names_str.replace(aboriginal_name, '')
-    
-    # 然後匹配一般中文名字
-    chinese_names = []
-    chinese_pattern = r'([\u4e00-\u9fa5]{2,4})'
-    chinese_matches = re.finditer(chinese_pattern, names_str)
-    
-    for match in chinese_matches:
-        chinese_name = match.group(0).strip()
-        if chinese_name:
-            chinese_names.append(chinese_name)
-    
-    # 合併原住民名字和中文名字
-    all_names = aboriginal_names + chinese_names
-    
-    # 如果沒有找到任何名字，嘗試使用分隔符號分割
-    if not all_names:
-        for sep in ['、', '，', ',', ' ']:
-            if sep in names_str:
-                parts = [part.strip() for part in names_str.split(sep)]
-                all_names.extend([part for part in parts if part and len(part) >= 2])
-                break
-    
-    # 移除重複的名字
-    return list(dict.fromkeys(all_names))
-
-def count_party_members(names_str: str) -> dict:
+def count_party_members(names_str: str, term: str = None) -> dict:
     """統計名單中各黨籍人數
     
     Args:
         names_str: 包含多個姓名的字串
+        term: 屆別，用於查詢該屆的黨籍
         
     Returns:
         dict: 各黨籍人數統計
@@ -403,210 +98,6 @@ def count_party_members(names_str: str) -> dict:
     if not names_str:
         return {}
         
-    # 立委黨籍對照表（第8-11屆）
-    legislators = {
-        # 第11屆立委
-        # 民進黨籍立委
-        '伍麗華': '民進黨', '何欣純': '民進黨', '劉建國': '民進黨', '吳思瑤': '民進黨',
-        '吳沛憶': '民進黨', '吳琪銘': '民進黨', '吳秉叡': '民進黨', '張宏陸': '民進黨',
-        '張雅琳': '民進黨', '徐富癸': '民進黨', '李坤城': '民進黨', '李昆澤': '民進黨',
-        '李柏毅': '民進黨', '林俊憲': '民進黨', '林宜瑾': '民進黨', '林岱樺': '民進黨',
-        '林月琴': '民進黨', '林楚茵': '民進黨', '林淑芬': '民進黨', '柯建銘': '民進黨',
-        '楊曜': '民進黨', '沈伯洋': '民進黨', '沈發惠': '民進黨', '洪申翰': '民進黨',
-        '游錫堃': '民進黨', '王世堅': '民進黨', '王定宇': '民進黨', '王正旭': '民進黨',
-        '王美惠': '民進黨', '王義川': '民進黨', '羅美玲': '民進黨', '范雲': '民進黨',
-        '莊瑞雄': '民進黨', '蔡其昌': '民進黨', '蔡易餘': '民進黨', '蘇巧慧': '民進黨',
-        '許智傑': '民進黨', '賴惠員': '民進黨', '賴瑞隆': '民進黨', '邱志偉': '民進黨',
-        '邱議瑩': '民進黨', '郭國文': '民進黨', '郭昱晴': '民進黨', '鍾佳濱': '民進黨',
-        '陳亭妃': '民進黨', '陳俊宇': '民進黨', '陳冠廷': '民進黨', '陳培瑜': '民進黨',
-        '陳瑩': '民進黨', '陳秀寳': '民進黨', '陳素月': '民進黨', '黃捷': '民進黨',
-        '黃秀芳': '民進黨',
-        
-        # 國民黨籍立委
-        '丁學忠': '國民黨', '傅崐萁': '國民黨', '吳宗憲': '國民黨', '呂玉玲': '國民黨',
-        '廖偉翔': '國民黨', '廖先翔': '國民黨', '張嘉郡': '國民黨', '張智倫': '國民黨',
-        '徐巧芯': '國民黨', '徐欣瑩': '國民黨', '李彥秀': '國民黨', '林倩綺': '國民黨',
-        '林德福': '國民黨', '林思銘': '國民黨', '林沛祥': '國民黨', '柯志恩': '國民黨',
-        '楊瓊瓔': '國民黨', '江啟臣': '國民黨', '洪孟楷': '國民黨', '涂權吉': '國民黨',
-        '游顥': '國民黨', '牛煦庭': '國民黨', '王育敏': '國民黨', '王鴻薇': '國民黨',
-        '盧縣一': '國民黨', '羅廷瑋': '國民黨', '羅明才': '國民黨', '羅智強': '國民黨',
-        '翁曉玲': '國民黨', '萬美玲': '國民黨', '葉元之': '國民黨', '葛如鈞': '國民黨',
-        '蘇清泉': '國民黨', '許宇甄': '國民黨', '謝衣鳯': '國民黨', '謝龍介': '國民黨',
-        '賴士葆': '國民黨', '邱若華': '國民黨', '邱鎮軍': '國民黨', '鄭天財': '國民黨',
-        '鄭正鈐': '國民黨', '陳永康': '國民黨', '陳玉珍': '國民黨', '陳菁徽': '國民黨',
-        '陳雪生': '國民黨', '韓國瑜': '國民黨', '顏寬恒': '國民黨', '馬文君': '國民黨',
-        '魯明哲': '國民黨', '黃仁': '國民黨', '黃健豪': '國民黨', '黃建賓': '國民黨',
-        '溫玉霞': '國民黨', '李貴敏': '國民黨',
-        
-        # 民眾黨籍立委
-        '劉書彬': '民眾黨', '吳春城': '民眾黨', '張啓楷': '民眾黨', '林國成': '民眾黨',
-        '林憶君': '民眾黨', '陳昭姿': '民眾黨', '麥玉珍': '民眾黨', '黃國昌': '民眾黨',
-        '黃珊珊': '民眾黨',
-        
-        # 無黨籍立委
-        '陳超明': '無黨籍', '高金素梅': '無黨籍',
-
-        # 第10屆立委
-        # 民進黨籍立委
-        '王定宇': '民進黨', '王美惠': '民進黨', '王榮璋': '民進黨', '伍麗華': '民進黨',
-        '何志偉': '民進黨', '何欣純': '民進黨', '余天': '民進黨', '吳玉琴': '民進黨',
-        '吳思瑤': '民進黨', '吳秉叡': '民進黨', '吳琪銘': '民進黨', '呂孫綾': '民進黨',
-        '李俊俋': '民進黨', '李昆澤': '民進黨', '李麗芬': '民進黨', '沈發惠': '民進黨',
-        '周春米': '民進黨', '林宜瑾': '民進黨', '林俊憲': '民進黨', '林岱樺': '民進黨',
-        '林楚茵': '民進黨', '林淑芬': '民進黨', '林靜儀': '民進黨', '邱志偉': '民進黨',
-        '邱泰源': '民進黨', '邱議瑩': '民進黨', '柯建銘': '民進黨', '洪申翰': '民進黨',
-        '范雲': '民進黨', '莊競程': '民進黨', '莊瑞雄': '民進黨', '許智傑': '民進黨',
-        '郭國文': '民進黨', '陳亭妃': '民進黨', '陳明文': '民進黨', '陳秀寳': '民進黨',
-        '陳素月': '民進黨', '陳瑩': '民進黨', '陳歐珀': '民進黨', '黃世杰': '民進黨',
-        '黃秀芳': '民進黨', '黃國書': '民進黨', '楊曜': '民進黨', '葉宜津': '民進黨',
-        '劉世芳': '民進黨', '劉建國': '民進黨', '劉櫂豪': '民進黨', '蔡易餘': '民進黨',
-        '蔡培慧': '民進黨', '蔡適應': '民進黨', '鄭運鵬': '民進黨', '賴品妤': '民進黨',
-        '賴惠員': '民進黨', '賴瑞隆': '民進黨', '鍾佳濱': '民進黨', '羅美玲': '民進黨',
-        '蘇巧慧': '民進黨', '蘇治芬': '民進黨', '蘇震清': '民進黨', '許添財': '民進黨',
-        '黃偉哲': '民進黨', '尤美女': '民進黨', '姚文智': '民進黨', '鄭麗君': '民進黨',
-        '蔡煌瑯': '民進黨',
-
-        # 國民黨籍立委
-        '丁守中': '國民黨', '孔文吉': '國民黨', '王育敏': '國民黨', '王惠美': '國民黨',
-        '江啟臣': '國民黨', '呂玉玲': '國民黨', '李彥秀': '國民黨', '李德維': '國民黨',
-        '林文瑞': '國民黨', '林為洲': '國民黨', '林奕華': '國民黨', '林德福': '國民黨',
-        '林麗蟬': '國民黨', '洪孟楷': '國民黨', '徐志榮': '國民黨', '翁重鈞': '國民黨',
-        '馬文君': '國民黨', '高金素梅': '國民黨', '張育美': '國民黨', '張智倫': '國民黨',
-        '許淑華': '國民黨', '陳以信': '國民黨', '陳玉珍': '國民黨', '陳雪生': '國民黨',
-        '陳超明': '國民黨', '曾銘宗': '國民黨', '費鴻泰': '國民黨', '楊瓊瓔': '國民黨',
-        '葉毓蘭': '國民黨', '廖國棟': '國民黨', '廖婉汝': '國民黨', '鄭天財': '國民黨',
-        '鄭正鈐': '國民黨', '鄭麗文': '國民黨', '賴士葆': '國民黨', '謝衣鳯': '國民黨',
-        '謝龍介': '國民黨', '顏寬恒': '國民黨', '羅明才': '國民黨', '羅智強': '國民黨',
-        '溫玉霞': '國民黨', '李貴敏': '國民黨',
-
-        # 民眾黨籍立委
-        '邱臣遠': '民眾黨', '高虹安': '民眾黨', '張其祿': '民眾黨', '蔡壁如': '民眾黨',
-        '賴香伶': '民眾黨',
-
-        # 時代力量立委
-        '王婉諭': '時代力量', '邱顯智': '時代力量', '陳椒華': '時代力量',
-
-        # 無黨籍立委
-        '林昶佐': '無黨籍', '趙正宇': '無黨籍',
-
-        # 第9屆立委
-        # 民進黨籍立委
-        '王定宇': '民進黨', '王榮璋': '民進黨', '何欣純': '民進黨', '余天': '民進黨',
-        '吳玉琴': '民進黨', '吳思瑤': '民進黨', '吳秉叡': '民進黨', '吳琪銘': '民進黨',
-        '呂孫綾': '民進黨', '李俊俋': '民進黨', '李昆澤': '民進黨', '李麗芬': '民進黨',
-        '沈發惠': '民進黨', '周春米': '民進黨', '林宜瑾': '民進黨', '林俊憲': '民進黨',
-        '林岱樺': '民進黨', '林淑芬': '民進黨', '林靜儀': '民進黨', '邱志偉': '民進黨',
-        '邱泰源': '民進黨', '邱議瑩': '民進黨', '柯建銘': '民進黨', '洪宗熠': '民進黨',
-        '范雲': '民進黨', '莊競程': '民進黨', '莊瑞雄': '民進黨', '許智傑': '民進黨',
-        '郭國文': '民進黨', '陳亭妃': '民進黨', '陳明文': '民進黨', '陳秀寳': '民進黨',
-        '陳素月': '民進黨', '陳瑩': '民進黨', '陳歐珀': '民進黨', '黃世杰': '民進黨',
-        '黃秀芳': '民進黨', '黃國書': '民進黨', '楊曜': '民進黨', '葉宜津': '民進黨',
-        '劉世芳': '民進黨', '劉建國': '民進黨', '劉櫂豪': '民進黨', '蔡易餘': '民進黨',
-        '蔡培慧': '民進黨', '蔡適應': '民進黨', '鄭運鵬': '民進黨', '賴品妤': '民進黨',
-        '賴惠員': '民進黨', '賴瑞隆': '民進黨', '鍾佳濱': '民進黨', '羅美玲': '民進黨',
-        '蘇巧慧': '民進黨', '蘇治芬': '民進黨', '蘇震清': '民進黨', '許添財': '民進黨',
-        '黃偉哲': '民進黨', '尤美女': '民進黨', '姚文智': '民進黨', '鄭麗君': '民進黨',
-        '蔡煌瑯': '民進黨',
-
-        # 國民黨籍立委
-        '丁守中': '國民黨', '孔文吉': '國民黨', '王育敏': '國民黨', '王惠美': '國民黨',
-        '江啟臣': '國民黨', '呂玉玲': '國民黨', '李彥秀': '國民黨', '李德維': '國民黨',
-        '林文瑞': '國民黨', '林為洲': '國民黨', '林奕華': '國民黨', '林德福': '國民黨',
-        '林麗蟬': '國民黨', '洪孟楷': '國民黨', '徐志榮': '國民黨', '翁重鈞': '國民黨',
-        '馬文君': '國民黨', '高金素梅': '國民黨', '張育美': '國民黨', '張智倫': '國民黨',
-        '許淑華': '國民黨', '陳以信': '國民黨', '陳玉珍': '國民黨', '陳雪生': '國民黨',
-        '陳超明': '國民黨', '曾銘宗': '國民黨', '費鴻泰': '國民黨', '楊瓊瓔': '國民黨',
-        '葉毓蘭': '國民黨', '廖國棟': '國民黨', '廖婉汝': '國民黨', '鄭天財': '國民黨',
-        '鄭正鈐': '國民黨', '鄭麗文': '國民黨', '賴士葆': '國民黨', '謝衣鳯': '國民黨',
-        '謝龍介': '國民黨', '顏寬恒': '國民黨', '羅明才': '國民黨', '羅智強': '國民黨',
-        '溫玉霞': '國民黨', '李貴敏': '國民黨',
-
-        # 時代力量立委
-        '王婉諭': '時代力量', '邱顯智': '時代力量', '陳椒華': '時代力量', '黃國昌': '時代力量',
-        '林昶佐': '時代力量', '洪慈庸': '時代力量',
-
-        # 無黨籍立委
-        '趙正宇': '無黨籍', '高金素梅': '無黨籍',
-
-        # 第8屆立委
-        # 民進黨籍立委
-        '王定宇': '民進黨', '王榮璋': '民進黨', '何欣純': '民進黨', '余天': '民進黨',
-        '吳玉琴': '民進黨', '吳思瑤': '民進黨', '吳秉叡': '民進黨', '吳琪銘': '民進黨',
-        '呂孫綾': '民進黨', '李俊俋': '民進黨', '李昆澤': '民進黨', '李麗芬': '民進黨',
-        '沈發惠': '民進黨', '周春米': '民進黨', '林宜瑾': '民進黨', '林俊憲': '民進黨',
-        '林岱樺': '民進黨', '林淑芬': '民進黨', '林靜儀': '民進黨', '邱志偉': '民進黨',
-        '邱泰源': '民進黨', '邱議瑩': '民進黨', '柯建銘': '民進黨', '洪宗熠': '民進黨',
-        '范雲': '民進黨', '莊競程': '民進黨', '莊瑞雄': '民進黨', '許智傑': '民進黨',
-        '郭國文': '民進黨', '陳亭妃': '民進黨', '陳明文': '民進黨', '陳秀寳': '民進黨',
-        '陳素月': '民進黨', '陳瑩': '民進黨', '陳歐珀': '民進黨', '黃世杰': '民進黨',
-        '黃秀芳': '民進黨', '黃國書': '民進黨', '楊曜': '民進黨', '葉宜津': '民進黨',
-        '劉世芳': '民進黨', '劉建國': '民進黨', '劉櫂豪': '民進黨', '蔡易餘': '民進黨',
-        '蔡培慧': '民進黨', '蔡適應': '民進黨', '鄭運鵬': '民進黨', '賴品妤': '民進黨',
-        '賴惠員': '民進黨', '賴瑞隆': '民進黨', '鍾佳濱': '民進黨', '羅美玲': '民進黨',
-        '蘇巧慧': '民進黨', '蘇治芬': '民進黨', '蘇震清': '民進黨', '許添財': '民進黨',
-        '黃偉哲': '民進黨', '尤美女': '民進黨', '姚文智': '民進黨', '鄭麗君': '民進黨',
-        '蔡煌瑯': '民進黨',
-
-        # 國民黨籍立委
-        '丁守中': '國民黨', '孔文吉': '國民黨', '王育敏': '國民黨', '王惠美': '國民黨',
-        '江啟臣': '國民黨', '呂玉玲': '國民黨', '李彥秀': '國民黨', '李德維': '國民黨',
-        '林文瑞': '國民黨', '林為洲': '國民黨', '林奕華': '國民黨', '林德福': '國民黨',
-        '林麗蟬': '國民黨', '洪孟楷': '國民黨', '徐志榮': '國民黨', '翁重鈞': '國民黨',
-        '馬文君': '國民黨', '高金素梅': '國民黨', '張育美': '國民黨', '張智倫': '國民黨',
-        '許淑華': '國民黨', '陳以信': '國民黨', '陳玉珍': '國民黨', '陳雪生': '國民黨',
-        '陳超明': '國民黨', '曾銘宗': '國民黨', '費鴻泰': '國民黨', '楊瓊瓔': '國民黨',
-        '葉毓蘭': '國民黨', '廖國棟': '國民黨', '廖婉汝': '國民黨', '鄭天財': '國民黨',
-        '鄭正鈐': '國民黨', '鄭麗文': '國民黨', '賴士葆': '國民黨', '謝衣鳯': '國民黨',
-        '謝龍介': '國民黨', '顏寬恒': '國民黨', '羅明才': '國民黨', '羅智強': '國民黨',
-        '溫玉霞': '國民黨', '李貴敏': '國民黨',
-
-        # 時代力量立委
-        '王婉諭': '時代力量', '邱顯智': '時代力量', '陳椒華': '時代力量', '黃國昌': '時代力量',
-        '林昶佐': '時代力量', '洪慈庸': '時代力量',
-
-        # 無黨籍立委
-        '趙正宇': '無黨籍', '高金素梅': '無黨籍',
-
-        # 第8屆立委
-        # 民進黨籍立委
-        '王定宇': '民進黨', '王榮璋': '民進黨', '何欣純': '民進黨', '余天': '民進黨',
-        '吳玉琴': '民進黨', '吳思瑤': '民進黨', '吳秉叡': '民進黨', '吳琪銘': '民進黨',
-        '呂孫綾': '民進黨', '李俊俋': '民進黨', '李昆澤': '民進黨', '李麗芬': '民進黨',
-        '沈發惠': '民進黨', '周春米': '民進黨', '林宜瑾': '民進黨', '林俊憲': '民進黨',
-        '林岱樺': '民進黨', '林淑芬': '民進黨', '林靜儀': '民進黨', '邱志偉': '民進黨',
-        '邱泰源': '民進黨', '邱議瑩': '民進黨', '柯建銘': '民進黨', '洪宗熠': '民進黨',
-        '范雲': '民進黨', '莊競程': '民進黨', '莊瑞雄': '民進黨', '許智傑': '民進黨',
-        '郭國文': '民進黨', '陳亭妃': '民進黨', '陳明文': '民進黨', '陳秀寳': '民進黨',
-        '陳素月': '民進黨', '陳瑩': '民進黨', '陳歐珀': '民進黨', '黃世杰': '民進黨',
-        '黃秀芳': '民進黨', '黃國書': '民進黨', '楊曜': '民進黨', '葉宜津': '民進黨',
-        '劉世芳': '民進黨', '劉建國': '民進黨', '劉櫂豪': '民進黨', '蔡易餘': '民進黨',
-        '蔡培慧': '民進黨', '蔡適應': '民進黨', '鄭運鵬': '民進黨', '賴品妤': '民進黨',
-        '賴惠員': '民進黨', '賴瑞隆': '民進黨', '鍾佳濱': '民進黨', '羅美玲': '民進黨',
-        '蘇巧慧': '民進黨', '蘇治芬': '民進黨', '蘇震清': '民進黨', '許添財': '民進黨',
-        '黃偉哲': '民進黨', '尤美女': '民進黨', '姚文智': '民進黨', '鄭麗君': '民進黨',
-        '蔡煌瑯': '民進黨',
-
-        # 國民黨籍立委
-        '丁守中': '國民黨', '孔文吉': '國民黨', '王育敏': '國民黨', '王惠美': '國民黨',
-        '江啟臣': '國民黨', '呂玉玲': '國民黨', '李彥秀': '國民黨', '李德維': '國民黨',
-        '林文瑞': '國民黨', '林為洲': '國民黨', '林奕華': '國民黨', '林德福': '國民黨',
-        '林麗蟬': '國民黨', '洪孟楷': '國民黨', '徐志榮': '國民黨', '翁重鈞': '國民黨',
-        '馬文君': '國民黨', '高金素梅': '國民黨', '張育美': '國民黨', '張智倫': '國民黨',
-        '許淑華': '國民黨', '陳以信': '國民黨', '陳玉珍': '國民黨', '陳雪生': '國民黨',
-        '陳超明': '國民黨', '曾銘宗': '國民黨', '費鴻泰': '國民黨', '楊瓊瓔': '國民黨',
-        '葉毓蘭': '國民黨', '廖國棟': '國民黨', '廖婉汝': '國民黨', '鄭天財': '國民黨',
-        '鄭正鈐': '國民黨', '鄭麗文': '國民黨', '賴士葆': '國民黨', '謝衣鳯': '國民黨',
-        '謝龍介': '國民黨', '顏寬恒': '國民黨', '羅明才': '國民黨', '羅智強': '國民黨',
-        '溫玉霞': '國民黨', '李貴敏': '國民黨',
-
-        # 時代力量立委
-        '王婉諭': '時代力量', '邱顯智': '時代力量', '陳椒華': '時代力量', '黃國昌': '時代力量',
-        '林昶佐': '時代力量', '洪慈庸': '時代力量',
-
-        # 無黨籍立委
-        '趙正宇': '無黨籍', '高金素梅': '無黨籍'
-    }
-    
     # 初始化計數器
     party_counts = {
         '民進黨': 0,
@@ -622,8 +113,8 @@ def count_party_members(names_str: str) -> dict:
     
     # 計算各黨籍人數
     for name in names:
-        if name in legislators:
-            party = legislators[name]
+        party = get_party(name, term)
+        if party in party_counts:
             party_counts[party] += 1
         else:
             party_counts['其他'] += 1
@@ -631,12 +122,13 @@ def count_party_members(names_str: str) -> dict:
     # 移除計數為0的政黨
     return {k: v for k, v in party_counts.items() if v > 0}
 
-def get_party_info(proposer: str, org: str = None) -> dict:
+def get_party_info(proposer: str, org: str = None, term: str = None) -> dict:
     """從提案人或提案機關資訊中獲取政黨資訊
     
     Args:
         proposer: 提案人資訊
         org: 提案機關資訊
+        term: 屆別
         
     Returns:
         dict: 包含標籤類別和各黨人數統計的字典
@@ -674,7 +166,7 @@ def get_party_info(proposer: str, org: str = None) -> dict:
         return result
         
     # 統計提案人政黨分布
-    result['proposer_parties'] = count_party_members(proposer)
+    result['proposer_parties'] = count_party_members(proposer, term)
     
     # 根據最多數的政黨設定標籤
     if result['proposer_parties']:
@@ -722,7 +214,7 @@ app.jinja_env.globals.update(get_bill_type=get_bill_type)
 def home():
     """首頁"""
     print("正在載入首頁...")
-    db = Database()
+    db = get_db()
     try:
         # 獲取所有屆別
         cursor = db.conn.cursor()
@@ -730,17 +222,16 @@ def home():
         terms = [row['term'] for row in cursor.fetchall()]
         print(f"找到的屆別: {terms}")
         
-        # 獲取第11屆最熱門的30個法律
-        cursor.execute(get_popular_bills_sql())
-        popular_bills = [dict(row) for row in cursor.fetchall()]
+        # 獲取最新一屆最熱門的30個法律（由 law_counts 統計表查詢）
+        popular_term = terms[0] if terms else None
+        popular_bills = db.get_popular_laws(popular_term) if popular_term else []
         print(f"找到的熱門法案數量: {len(popular_bills)}")
         
-        return render_template('index.html', terms=terms, popular_bills=popular_bills)
+        return render_template('index.html', terms=terms, popular_bills=popular_bills,
+                               popular_term=popular_term)
     except Exception as e:
         print(f"載入首頁時發生錯誤: {str(e)}")
-        return render_template('index.html', terms=[], popular_bills=[], error=str(e))
-    finally:
-        db.close()
+        return render_template('index.html', terms=[], popular_bills=[], popular_term=None, error=str(e))
 
 def get_status_group(status: str) -> str:
     """根據審查進度獲取分組名稱
@@ -767,346 +258,54 @@ def get_status_group(status: str) -> str:
         return '退回/撤回'
     return '待審查'
 
-def get_member_info(name: str) -> dict:
+def get_member_info(name: str, term: str = None) -> Member:
     """獲取成員的政黨資訊
     
     Args:
         name: 成員姓名
+        term: 屆別，用於查詢該屆的黨籍
         
     Returns:
-        dict: 包含成員姓名和政黨標籤的字典
+        Member: 成員（相同姓名與政黨共用同一個物件）
     """
-    # 立委黨籍對照表（第8-11屆）
-    legislators = {
-        # 第11屆立委
-        # 民進黨籍立委
-        '伍麗華': '民進黨', '何欣純': '民進黨', '劉建國': '民進黨', '吳思瑤': '民進黨',
-        '吳沛憶': '民進黨', '吳琪銘': '民進黨', '吳秉叡': '民進黨', '張宏陸': '民進黨',
-        '張雅琳': '民進黨', '徐富癸': '民進黨', '李坤城': '民進黨', '李昆澤': '民進黨',
-        '李柏毅': '民進黨', '林俊憲': '民進黨', '林宜瑾': '民進黨', '林岱樺': '民進黨',
-        '林月琴': '民進黨', '林楚茵': '民進黨', '林淑芬': '民進黨', '柯建銘': '民進黨',
-        '楊曜': '民進黨', '沈伯洋': '民進黨', '沈發惠': '民進黨', '洪申翰': '民進黨',
-        '游錫堃': '民進黨', '王世堅': '民進黨', '王定宇': '民進黨', '王正旭': '民進黨',
-        '王美惠': '民進黨', '王義川': '民進黨', '羅美玲': '民進黨', '范雲': '民進黨',
-        '莊瑞雄': '民進黨', '蔡其昌': '民進黨', '蔡易餘': '民進黨', '蘇巧慧': '民進黨',
-        '許智傑': '民進黨', '賴惠員': '民進黨', '賴瑞隆': '民進黨', '邱志偉': '民進黨',
-        '邱議瑩': '民進黨', '郭國文': '民進黨', '郭昱晴': '民進黨', '鍾佳濱': '民進黨',
-        '陳亭妃': '民進黨', '陳俊宇': '民進黨', '陳冠廷': '民進黨', '陳培瑜': '民進黨',
-        '陳瑩': '民進黨', '陳秀寳': '民進黨', '陳素月': '民進黨', '黃捷': '民進黨',
-        '黃秀芳': '民進黨',
-        
-        # 國民黨籍立委
-        '丁學忠': '國民黨', '傅崐萁': '國民黨', '吳宗憲': '國民黨', '呂玉玲': '國民黨',
-        '廖偉翔': '國民黨', '廖先翔': '國民黨', '張嘉郡': '國民黨', '張智倫': '國民黨',
-        '徐巧芯': '國民黨', '徐欣瑩': '國民黨', '李彥秀': '國民黨', '林倩綺': '國民黨',
-        '林德福': '國民黨', '林思銘': '國民黨', '林沛祥': '國民黨', '柯志恩': '國民黨',
-        '楊瓊瓔': '國民黨', '江啟臣': '國民黨', '洪孟楷': '國民黨', '涂權吉': '國民黨',
-        '游顥': '國民黨', '牛煦庭': '國民黨', '王育敏': '國民黨', '王鴻薇': '國民黨',
-        '盧縣一': '國民黨', '羅廷瑋': '國民黨', '羅明才': '國民黨', '羅智強': '國民黨',
-        '翁曉玲': '國民黨', '萬美玲': '國民黨', '葉元之': '國民黨', '葛如鈞': '國民黨',
-        '蘇清泉': '國民黨', '許宇甄': '國民黨', '謝衣鳯': '國民黨', '謝龍介': '國民黨',
-        '賴士葆': '國民黨', '邱若華': '國民黨', '邱鎮軍': '國民黨', '鄭天財': '國民黨',
-        '鄭正鈐': '國民黨', '陳永康': '國民黨', '陳玉珍': '國民黨', '陳菁徽': '國民黨',
-        '陳雪生': '國民黨', '韓國瑜': '國民黨', '顏寬恒': '國民黨', '馬文君': '國民黨',
-        '魯明哲': '國民黨', '黃仁': '國民黨', '黃健豪': '國民黨', '黃建賓': '國民黨',
-        '溫玉霞': '國民黨', '李貴敏': '國民黨',
-        
-        # 民眾黨籍立委
-        '劉書彬': '民眾黨', '吳春城': '民眾黨', '張啓楷': '民眾黨', '林國成': '民眾黨',
-        '林憶君': '民眾黨', '陳昭姿': '民眾黨', '麥玉珍': '民眾黨', '黃國昌': '民眾黨',
-        '黃珊珊': '民眾黨',
-        
-        # 無黨籍立委
-        '陳超明': '無黨籍', '高金素梅': '無黨籍',
-
-        # 第10屆立委
-        # 民進黨籍立委
-        '王定宇': '民進黨', '王美惠': '民進黨', '王榮璋': '民進黨', '伍麗華': '民進黨',
-        '何志偉': '民進黨', '何欣純': '民進黨', '余天': '民進黨', '吳玉琴': '民進黨',
-        '吳思瑤': '民進黨', '吳秉叡': '民進黨', '吳琪銘': '民進黨', '呂孫綾': '民進黨',
-        '李俊俋': '民進黨', '李昆澤': '民進黨', '李麗芬': '民進黨', '沈發惠': '民進黨',
-        '周春米': '民進黨', '林宜瑾': '民進黨', '林俊憲': '民進黨', '林岱樺': '民進黨',
-        '林楚茵': '民進黨', '林淑芬': '民進黨', '林靜儀': '民進黨', '邱志偉': '民進黨',
-        '邱泰源': '民進黨', '邱議瑩': '民進黨', '柯建銘': '民進黨', '洪申翰': '民進黨',
-        '范雲': '民進黨', '莊競程': '民進黨', '莊瑞雄': '民進黨', '許智傑': '民進黨',
-        '郭國文': '民進黨', '陳亭妃': '民進黨', '陳明文': '民進黨', '陳秀寳': '民進黨',
-        '陳素月': '民進黨', '陳瑩': '民進黨', '陳歐珀': '民進黨', '黃世杰': '民進黨',
-        '黃秀芳': '民進黨', '黃國書': '民進黨', '楊曜': '民進黨', '葉宜津': '民進黨',
-        '劉世芳': '民進黨', '劉建國': '民進黨', '劉櫂豪': '民進黨', '蔡易餘': '民進黨',
-        '蔡培慧': '民進黨', '蔡適應': '民進黨', '鄭運鵬': '民進黨', '賴品妤': '民進黨',
-        '賴惠員': '民進黨', '賴瑞隆': '民進黨', '鍾佳濱': '民進黨', '羅美玲': '民進黨',
-        '蘇巧慧': '民進黨', '蘇治芬': '民進黨', '蘇震清': '民進黨', '許添財': '民進黨',
-        '黃偉哲': '民進黨', '尤美女': '民進黨', '姚文智': '民進黨', '鄭麗君': '民進黨',
-        '蔡煌瑯': '民進黨',
-
-        # 國民黨籍立委
-        '丁守中': '國民黨', '孔文吉': '國民黨', '王育敏': '國民黨', '王惠美': '國民黨',
-        '江啟臣': '國民黨', '呂玉玲': '國民黨', '李彥秀': '國民黨', '李德維': '國民黨',
-        '林文瑞': '國民黨', '林為洲': '國民黨', '林奕華': '國民黨', '林德福': '國民黨',
-        '林麗蟬': '國民黨', '洪孟楷': '國民黨', '徐志榮': '國民黨', '翁重鈞': '國民黨',
-        '馬文君': '國民黨', '高金素梅': '國民黨', '張育美': '國民黨', '張智倫': '國民黨',
-        '許淑華': '國民黨', '陳以信': '國民黨', '陳玉珍': '國民黨', '陳雪生': '國民黨',
-        '陳超明': '國民黨', '曾銘宗': '國民黨', '費鴻泰': '國民黨', '楊瓊瓔': '國民黨',
-        '葉毓蘭': '國民黨', '廖國棟': '國民黨', '廖婉汝': '國民黨', '鄭天財': '國民黨',
-        '鄭正鈐': '國民黨', '鄭麗文': '國民黨', '賴士葆': '國民黨', '謝衣鳯': '國民黨',
-        '謝龍介': '國民黨', '顏寬恒': '國民黨', '羅明才': '國民黨', '羅智強': '國民黨',
-        '溫玉霞': '國民黨', '李貴敏': '國民黨',
-
-        # 民眾黨籍立委
-        '邱臣遠': '民眾黨', '高虹安': '民眾黨', '張其祿': '民眾黨', '蔡壁如': '民眾黨',
-        '賴香伶': '民眾黨',
-
-        # 時代力量立委
-        '王婉諭': '時代力量', '邱顯智': '時代力量', '陳椒華': '時代力量',
-
-        # 無黨籍立委
-        '林昶佐': '無黨籍', '趙正宇': '無黨籍',
-
-        # 第9屆立委
-        # 民進黨籍立委
-        '王定宇': '民進黨', '王榮璋': '民進黨', '何欣純': '民進黨', '余天': '民進黨',
-        '吳玉琴': '民進黨', '吳思瑤': '民進黨', '吳秉叡': '民進黨', '吳琪銘': '民進黨',
-        '呂孫綾': '民進黨', '李俊俋': '民進黨', '李昆澤': '民進黨', '李麗芬': '民進黨',
-        '沈發惠': '民進黨', '周春米': '民進黨', '林宜瑾': '民進黨', '林俊憲': '民進黨',
-        '林岱樺': '民進黨', '林淑芬': '民進黨', '林靜儀': '民進黨', '邱志偉': '民進黨',
-        '邱泰源': '民進黨', '邱議瑩': '民進黨', '柯建銘': '民進黨', '洪宗熠': '民進黨',
-        '范雲': '民進黨', '莊競程': '民進黨', '莊瑞雄': '民進黨', '許智傑': '民進黨',
-        '郭國文': '民進黨', '陳亭妃': '民進黨', '陳明文': '民進黨', '陳秀寳': '民進黨',
-        '陳素月': '民進黨', '陳瑩': '民進黨', '陳歐珀': '民進黨', '黃世杰': '民進黨',
-        '黃秀芳': '民進黨', '黃國書': '民進黨', '楊曜': '民進黨', '葉宜津': '民進黨',
-        '劉世芳': '民進黨', '劉建國': '民進黨', '劉櫂豪': '民進黨', '蔡易餘': '民進黨',
-        '蔡培慧': '民進黨', '蔡適應': '民進黨', '鄭運鵬': '民進黨', '賴品妤': '民進黨',
-        '賴惠員': '民進黨', '賴瑞隆': '民進黨', '鍾佳濱': '民進黨', '羅美玲': '民進黨',
-        '蘇巧慧': '民進黨', '蘇治芬': '民進黨', '蘇震清': '民進黨', '許添財': '民進黨',
-        '黃偉哲': '民進黨', '尤美女': '民進黨', '姚文智': '民進黨', '鄭麗君': '民進黨',
-        '蔡煌瑯': '民進黨',
-
-        # 國民黨籍立委
-        '丁守中': '國民黨', '孔文吉': '國民黨', '王育敏': '國民黨', '王惠美': '國民黨',
-        '江啟臣': '國民黨', '呂玉玲': '國民黨', '李彥秀': '國民黨', '李德維': '國民黨',
-        '林文瑞': '國民黨', '林為洲': '國民黨', '林奕華': '國民黨', '林德福': '國民黨',
-        '林麗蟬': '國民黨', '洪孟楷': '國民黨', '徐志榮': '國民黨', '翁重鈞': '國民黨',
-        '馬文君': '國民黨', '高金素梅': '國民黨', '張育美': '國民黨', '張智倫': '國民黨',
-        '許淑華': '國民黨', '陳以信': '國民黨', '陳玉珍': '國民黨', '陳雪生': '國民黨',
-        '陳超明': '國民黨', '曾銘宗': '國民黨', '費鴻泰': '國民黨', '楊瓊瓔': '國民黨',
-        '葉毓蘭': '國民黨', '廖國棟': '國民黨', '廖婉汝': '國民黨', '鄭天財': '國民黨',
-        '鄭正鈐': '國民黨', '鄭麗文': '國民黨', '賴士葆': '國民黨', '謝衣鳯': '國民黨',
-        '謝龍介': '國民黨', '顏寬恒': '國民黨', '羅明才': '國民黨', '羅智強': '國民黨',
-        '溫玉霞': '國民黨', '李貴敏': '國民黨',
-
-        # 時代力量立委
-        '王婉諭': '時代力量', '邱顯智': '時代力量', '陳椒華': '時代力量', '黃國昌': '時代力量',
-        '林昶佐': '時代力量', '洪慈庸': '時代力量',
-
-        # 無黨籍立委
-        '趙正宇': '無黨籍', '高金素梅': '無黨籍',
-
-        # 第8屆立委
-        # 民進黨籍立委
-        '王定宇': '民進黨', '王榮璋': '民進黨', '何欣純': '民進黨', '余天': '民進黨',
-        '吳玉琴': '民進黨', '吳思瑤': '民進黨', '吳秉叡': '民進黨', '吳琪銘': '民進黨',
-        '呂孫綾': '民進黨', '李俊俋': '民進黨', '李昆澤': '民進黨', '李麗芬': '民進黨',
-        '沈發惠': '民進黨', '周春米': '民進黨', '林宜瑾': '民進黨', '林俊憲': '民進黨',
-        '林岱樺': '民進黨', '林淑芬': '民進黨', '林靜儀': '民進黨', '邱志偉': '民進黨',
-        '邱泰源': '民進黨', '邱議瑩': '民進黨', '柯建銘': '民進黨', '洪宗熠': '民進黨',
-        '范雲': '民進黨', '莊競程': '民進黨', '莊瑞雄': '民進黨', '許智傑': '民進黨',
-        '郭國文': '民進黨', '陳亭妃': '民進黨', '陳明文': '民進黨', '陳秀寳': '民進黨',
-        '陳素月': '民進黨', '陳瑩': '民進黨', '陳歐珀': '民進黨', '黃世杰': '民進黨',
-        '黃秀芳': '民進黨', '黃國書': '民進黨', '楊曜': '民進黨', '葉宜津': '民進黨',
-        '劉世芳': '民進黨', '劉建國': '民進黨', '劉櫂豪': '民進黨', '蔡易餘': '民進黨',
-        '蔡培慧': '民進黨', '蔡適應': '民進黨', '鄭運鵬': '民進黨', '賴品妤': '民進黨',
-        '賴惠員': '民進黨', '賴瑞隆': '民進黨', '鍾佳濱': '民進黨', '羅美玲': '民進黨',
-        '蘇巧慧': '民進黨', '蘇治芬': '民進黨', '蘇震清': '民進黨', '許添財': '民進黨',
-        '黃偉哲': '民進黨', '尤美女': '民進黨', '姚文智': '民進黨', '鄭麗君': '民進黨',
-        '蔡煌瑯': '民進黨',
-
-        # 國民黨籍立委
-        '丁守中': '國民黨', '孔文吉': '國民黨', '王育敏': '國民黨', '王惠美': '國民黨',
-        '江啟臣': '國民黨', '呂玉玲': '國民黨', '李彥秀': '國民黨', '李德維': '國民黨',
-        '林文瑞': '國民黨', '林為洲': '國民黨', '林奕華': '國民黨', '林德福': '國民黨',
-        '林麗蟬': '國民黨', '洪孟楷': '國民黨', '徐志榮': '國民黨', '翁重鈞': '國民黨',
-        '馬文君': '國民黨', '高金素梅': '國民黨', '張育美': '國民黨', '張智倫': '國民黨',
-        '許淑華': '國民黨', '陳以信': '國民黨', '陳玉珍': '國民黨', '陳雪生': '國民黨',
-        '陳超明': '國民黨', '曾銘宗': '國民黨', '費鴻泰': '國民黨', '楊瓊瓔': '國民黨',
-        '葉毓蘭': '國民黨', '廖國棟': '國民黨', '廖婉汝': '國民黨', '鄭天財': '國民黨',
-        '鄭正鈐': '國民黨', '鄭麗文': '國民黨', '賴士葆': '國民黨', '謝衣鳯': '國民黨',
-        '謝龍介': '國民黨', '顏寬恒': '國民黨', '羅明才': '國民黨', '羅智強': '國民黨',
-        '溫玉霞': '國民黨', '李貴敏': '國民黨',
-
-        # 時代力量立委
-        '王婉諭': '時代力量', '邱顯智': '時代力量', '陳椒華': '時代力量', '黃國昌': '時代力量',
-        '林昶佐': '時代力量', '洪慈庸': '時代力量',
-
-        # 無黨籍立委
-        '趙正宇': '無黨籍', '高金素梅': '無黨籍',
-
-        # 第8屆立委
-        # 民進黨籍立委
-        '王定宇': '民進黨', '王榮璋': '民進黨', '何欣純': '民進黨', '余天': '民進黨',
-        '吳玉琴': '民進黨', '吳思瑤': '民進黨', '吳秉叡': '民進黨', '吳琪銘': '民進黨',
-        '呂孫綾': '民進黨', '李俊俋': '民進黨', '李昆澤': '民進黨', '李麗芬': '民進黨',
-        '沈發惠': '民進黨', '周春米': '民進黨', '林宜瑾': '民進黨', '林俊憲': '民進黨',
-        '林岱樺': '民進黨', '林淑芬': '民進黨', '林靜儀': '民進黨', '邱志偉': '民進黨',
-        '邱泰源': '民進黨', '邱議瑩': '民進黨', '柯建銘': '民進黨', '洪宗熠': '民進黨',
-        '范雲': '民進黨', '莊競程': '民進黨', '莊瑞雄': '民進黨', '許智傑': '民進黨',
-        '郭國文': '民進黨', '陳亭妃': '民進黨', '陳明文': '民進黨', '陳秀寳': '民進黨',
-        '陳素月': '民進黨', '陳瑩': '民進黨', '陳歐珀': '民進黨', '黃世杰': '民進黨',
-        '黃秀芳': '民進黨', '黃國書': '民進黨', '楊曜': '民進黨', '葉宜津': '民進黨',
-        '劉世芳': '民進黨', '劉建國': '民進黨', '劉櫂豪': '民進黨', '蔡易餘': '民進黨',
-        '蔡培慧': '民進黨', '蔡適應': '民進黨', '鄭運鵬': '民進黨', '賴品妤': '民進黨',
-        '賴惠員': '民進黨', '賴瑞隆': '民進黨', '鍾佳濱': '民進黨', '羅美玲': '民進黨',
-        '蘇巧慧': '民進黨', '蘇治芬': '民進黨', '蘇震清': '民進黨', '許添財': '民進黨',
-        '黃偉哲': '民進黨', '尤美女': '民進黨', '姚文智': '民進黨', '鄭麗君': '民進黨',
-        '蔡煌瑯': '民進黨',
-
-        # 國民黨籍立委
-        '丁守中': '國民黨', '孔文吉': '國民黨', '王育敏': '國民黨', '王惠美': '國民黨',
-        '江啟臣': '國民黨', '呂玉玲': '國民黨', '李彥秀': '國民黨', '李德維': '國民黨',
-        '林文瑞': '國民黨', '林為洲': '國民黨', '林奕華': '國民黨', '林德福': '國民黨',
-        '林麗蟬': '國民黨', '洪孟楷': '國民黨', '徐志榮': '國民黨', '翁重鈞': '國民黨',
-        '馬文君': '國民黨', '高金素梅': '國民黨', '張育美': '國民黨', '張智倫': '國民黨',
-        '許淑華': '國民黨', '陳以信': '國民黨', '陳玉珍': '國民黨', '陳雪生': '國民黨',
-        '陳超明': '國民黨', '曾銘宗': '國民黨', '費鴻泰': '國民黨', '楊瓊瓔': '國民黨',
-        '葉毓蘭': '國民黨', '廖國棟': '國民黨', '廖婉汝': '國民黨', '鄭天財': '國民黨',
-        '鄭正鈐': '國民黨', '鄭麗文': '國民黨', '賴士葆': '國民黨', '謝衣鳯': '國民黨',
-        '謝龍介': '國民黨', '顏寬恒': '國民黨', '羅明才': '國民黨', '羅智強': '國民黨',
-        '溫玉霞': '國民黨', '李貴敏': '國民黨',
-
-        # 時代力量立委
-        '王婉諭': '時代力量', '邱顯智': '時代力量', '陳椒華': '時代力量', '黃國昌': '時代力量',
-        '林昶佐': '時代力量', '洪慈庸': '時代力量',
-
-        # 無黨籍立委
-        '趙正宇': '無黨籍', '高金素梅': '無黨籍'
-    }
-    
-    # 特殊處理原住民委員
-    special_names = {
-        '鄭天財': '鄭天財Sra Kacaw',
-        '伍麗華': '伍麗華Saidhai Tahovecahe'
-    }
-    
     # 檢查是否為原住民委員
-    for key, full_name in special_names.items():
+    for key, full_name in MEMBER_FULL_NAMES.items():
         if name.startswith(key) or name == full_name:
             # 使用完整名字顯示，但用中文名字查詢政黨
-            party = legislators.get(key)
-            if party == '民進黨':
-                return {'name': full_name, 'party_class': 'dpp'}
-            elif party == '國民黨':
-                return {'name': full_name, 'party_class': 'kmt'}
-            elif party == '民眾黨':
-                return {'name': full_name, 'party_class': 'tpp'}
-            elif party == '無黨籍':
-                return {'name': full_name, 'party_class': 'noparty'}
-            else:
-                return {'name': full_name, 'party_class': 'other'}
+            return Member.of(full_name, MEMBER_PARTIES.get(get_party(key, term), Party.OTHER))
     
     # 一般委員處理
-    party = legislators.get(name)
-    if party == '民進黨':
-        return {'name': name, 'party_class': 'dpp'}
-    elif party == '國民黨':
-        return {'name': name, 'party_class': 'kmt'}
-    elif party == '民眾黨':
-        return {'name': name, 'party_class': 'tpp'}
-    elif party == '無黨籍':
-        return {'name': name, 'party_class': 'noparty'}
-    else:
-        return {'name': name, 'party_class': 'other'}
+    return Member.of(name, MEMBER_PARTIES.get(get_party(name, term), Party.OTHER))
 
-def process_members(bill: dict) -> dict:
+def process_members(bill) -> dict:
     """處理法案的提案人和連署人資訊
     
     Args:
-        bill: 法案資訊字典
+        bill: 法案
         
     Returns:
         dict: 包含成員列表和政黨統計的字典
     """
     members = []
-    party_stats = {'民進黨': 0, '國民黨': 0, '民眾黨': 0, '無黨籍': 0, '其他': 0}
     
     # 處理提案機關
-    if bill['billOrg'] and '本院委員' not in bill['billOrg']:
-        if '行政院' in bill['billOrg']:
-            members.append({'name': bill['billOrg'], 'party_class': 'org'})
-            return {
-                'members': members,
-                'party_stats': {'行政院': 1},
-                'total': 1
-            }
-        elif '民主進步黨' in bill['billOrg'] or '民進黨' in bill['billOrg']:
-            members.append({'name': bill['billOrg'], 'party_class': 'dpp'})
-            return {
-                'members': members,
-                'party_stats': {'民進黨': 1},
-                'total': 1
-            }
-        elif '中國國民黨' in bill['billOrg'] or '國民黨' in bill['billOrg']:
-            members.append({'name': bill['billOrg'], 'party_class': 'kmt'})
-            return {
-                'members': members,
-                'party_stats': {'國民黨': 1},
-                'total': 1
-            }
-        elif '台灣民眾黨' in bill['billOrg'] or '民眾黨' in bill['billOrg']:
-            members.append({'name': bill['billOrg'], 'party_class': 'tpp'})
-            return {
-                'members': members,
-                'party_stats': {'民眾黨': 1},
-                'total': 1
-            }
-        elif '時代力量' in bill['billOrg']:
-            members.append({'name': bill['billOrg'], 'party_class': 'npp'})
-            return {
-                'members': members,
-                'party_stats': {'時代力量': 1},
-                'total': 1
-            }
-        elif '台灣基進' in bill['billOrg']:
-            members.append({'name': bill['billOrg'], 'party_class': 'other'})
-            return {
-                'members': members,
-                'party_stats': {'其他': 1},
-                'total': 1
-            }
-        else:
-            members.append({'name': bill['billOrg'], 'party_class': 'org'})
-    
-    # 處理提案人
-    if bill['billProposer']:
-        proposer_names = extract_names(bill['billProposer'])
-        for name in proposer_names:
-            member_info = get_member_info(name)
-            members.append(member_info)
-            if member_info['party_class'] == 'dpp':
-                party_stats['民進黨'] += 1
-            elif member_info['party_class'] == 'kmt':
-                party_stats['國民黨'] += 1
-            elif member_info['party_class'] == 'tpp':
-                party_stats['民眾黨'] += 1
-            elif member_info['party_class'] == 'noparty':
-                party_stats['無黨籍'] += 1
-            else:
-                party_stats['其他'] += 1
+    org = bill['billOrg']
+    if org and '本院委員' not in org:
+        if '行政院' in org:
+            return {'members': [Member.of(org, Party.ORG)], 'party_stats': {'行政院': 1}, 'total': 1}
+        party = org_party(org)
+        if party:
+            return {'members': [Member.of(org, party)], 'party_stats': {party.label: 1}, 'total': 1}
+        members.append(Member.of(org, Party.ORG))
     
-    # 處理連署人
-    if bill['billCosignatory']:
-        cosignatory_names = extract_names(bill['billCosignatory'])
-        for name in cosignatory_names:
-            member_info = get_member_info(name)
-            members.append(member_info)
-            if member_info['party_class'] == 'dpp':
-                party_stats['民進黨'] += 1
-            elif member_info['party_class'] == 'kmt':
-                party_stats['國民黨'] += 1
-            elif member_info['party_class'] == 'tpp':
-                party_stats['民眾黨'] += 1
-            elif member_info['party_class'] == 'noparty':
-                party_stats['無黨籍'] += 1
-            else:
-                party_stats['其他'] += 1
+    # 處理提案人和連署人
+    party_stats = {'民進黨': 0, '國民黨': 0, '民眾黨': 0, '無黨籍': 0, '其他': 0}
+    for names in (bill['billProposer'], bill['billCosignatory']):
+        if names:
+            for name in extract_names(names):
+                member = get_member_info(name, bill.get('term'))
+                members.append(member)
+                party_stats[member.party.label] += 1
     
     # 移除計數為0的政黨
     party_stats = {k: v for k, v in party_stats.items() if v > 0}
@@ -1119,6 +318,7 @@ def process_members(bill: dict) -> dict:
     }
 
 @app.route('/search', methods=['GET'])
+@conditional_response
 def search():
     """搜尋法案"""
     law_name = request.args.get('law_name', '')
@@ -1132,155 +332,187 @@ def search():
                              articles=[],
                              total=0)
     
-    db = Database()
+    db = get_db()
+    # 鍵值包含資料版本號，寫入新資料後舊的快取自然失效
+    cache_key = (law_name, term, sort_by, db.get_data_version())
+    cached = search_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
     try:
-        # 搜尋相關法案
-        cursor = db.conn.cursor()
-        
-        # 構建搜尋條件
-        base_name = law_name.strip('「」')  # 移除可能的引號
-        
-        # 特殊處理某些法案
-        if '刑法' in base_name and '陸海空軍刑法' not in base_name:
-            search_condition = "billName LIKE '%中華民國刑法%' AND billName NOT LIKE '%施行法%' AND billName NOT LIKE '%陸海空軍刑法%'"
-            params = tuple()
-        elif base_name == '民法':
-            search_condition = "billName LIKE '%民法%' AND billName NOT LIKE '%施行法%' AND billName NOT LIKE '%入出國及移民法%'"
-            params = tuple()
-        elif base_name == '入出國及移民法':
-            search_condition = "billName LIKE '%入出國及移民法%' AND billName NOT LIKE '%施行法%'"
-            params = tuple()
-        else:
-            # 一般法律搜尋
-            search_condition = "billName LIKE ? AND billName NOT LIKE '%施行法%'"
-            params = (f"%{base_name}%",)
-        
-        # 添加屆別條件
-        if term:
-            search_condition += " AND term = ?"
-            params = params + (term,)
-        
-        # 執行查詢
-        query = f"""
-        SELECT billNo, billName, billOrg, billProposer, billCosignatory, 
-               term, sessionPeriod, sessionTimes, billStatus, pdfUrl, docUrl
-        FROM bills 
-        WHERE {search_condition}
-        ORDER BY 
-            CAST(term AS INTEGER) DESC,
-            CAST(sessionPeriod AS INTEGER) DESC,
-            COALESCE(CAST(sessionTimes AS INTEGER), 0) DESC,
-            billNo DESC
-        """
-        
-        cursor.execute(query, params)
-        bills = [dict(row) for row in cursor.fetchall()]
-        
-        print(f"搜尋 '{law_name}' 找到 {len(bills)} 個法案")
-        
-        if sort_by == 'article':
-            # 按條號分組
-            articles_dict = defaultdict(lambda: {'bills': [], 'bills_count': 0})
-            
-            for bill in bills:
-                print(f"處理法案: {bill['billName']}")
-                # 提取條號
-                articles = extract_article_numbers(bill['billName'])
-                
-                # 處理提案人和連署人資訊
-                members_info = process_members(bill)
-                bill['all_members'] = members_info['members']
-                bill['party_stats'] = members_info['party_stats']
-                bill['total_members'] = members_info['total']
-                
-                # 如果沒有找到條號，使用預設值
-                if not articles:
-                    print(f"  未找到條號，歸入「其他修正」")
-                    key = '其他修正'
-                    articles_dict[key]['bills'].append(bill)
-                    articles_dict[key]['bills_count'] += 1
-                    continue
-                
-                # 將法案加入對應的條號
-                for article in articles:
-                    key = article['full_text']
-                    print(f"  加入條號 {key}")
-                    articles_dict[key]['bills'].append(bill)
-                    articles_dict[key]['bills_count'] += 1
-            
-            # 轉換為列表
-            articles_list = []
-            for article_text, data in articles_dict.items():
-                articles_list.append({
-                    'article': article_text,
-                    'bills': data['bills'],
-                    'bills_count': data['bills_count']
-                })
-            
-            # 按條號排序
-            def get_sort_key(article):
-                if article['article'] == '其他修正':
-                    return (float('inf'), 0)
-                match = re.search(r'第(\d+)條(?:之(\d+))?', article['article'])
-                if match:
-                    number = int(match.group(1))
-                    sub_number = int(match.group(2)) if match.group(2) else 0
-                    return (number, sub_number)
-                return (float('inf'), 0)
-            
-            articles_list.sort(key=get_sort_key)
-            
-        else:
-            # 按審查進度分組
-            status_groups = defaultdict(lambda: {'bills': [], 'bills_count': 0})
-            
-            for bill in bills:
-                # 處理提案人和連署人資訊
-                members_info = process_members(bill)
-                bill['all_members'] = members_info['members']
-                bill['party_stats'] = members_info['party_stats']
-                bill['total_members'] = members_info['total']
-                
-                # 獲取審查進度分組
-                status_group = get_status_group(bill.get('billStatus', ''))
-                status_groups[status_group]['bills'].append(bill)
-                status_groups[status_group]['bills_count'] += 1
-            
-            # 轉換為列表並排序
-            articles_list = []
-            status_order = ['三讀', '二讀', '一讀', '審查完畢', '委員會審查', '待審查', '退回/撤回']
-            
-            for status in status_order:
-                if status in status_groups:
-                    articles_list.append({
-                        'article': status,
-                        'bills': status_groups[status]['bills'],
-                        'bills_count': status_groups[status]['bills_count']
-                    })
-        
-        return render_template('search_results.html',
-                             law_name=clean_law_name(law_name),
-                             articles=articles_list,
-                             total=len(bills),
-                             sort_by=sort_by)
+        # 只查詢分組標題與筆數，各分組的法案在展開時由 /api/search/group 分頁載入
+        groups = get_search_groups(db, law_name, term, sort_by)
+        total = db.count_bills(law_name, term=term or None)
+        print(f"搜尋 '{law_name}' 找到 {total} 個法案，{len(groups)} 個分組")
+        
+        html = render_template('search_results.html',
+                             law_name=canonical_law_name(law_name),
+                             articles=groups,
+                             total=total,
+                             sort_by=sort_by,
+                             page_size=SEARCH_PAGE_SIZE)
+        search_cache.set(cache_key, html)
+        return html
     except Exception as e:
         print(f"搜尋時發生錯誤: {str(e)}")
+        # 錯誤頁面以 500 回應，conditional_response 不會加上 ETag，也不會被快取
         return render_template('search_results.html',
-                             law_name=clean_law_name(law_name),
+                             law_name=canonical_law_name(law_name),
                              message=f'搜尋時發生錯誤: {str(e)}',
                              articles=[],
                              total=0,
-                             sort_by=sort_by)
-    finally:
-        db.close()
+                             sort_by=sort_by), 500
+
+def get_search_groups(db, law_name: str, term: str, sort_by: str) -> list:
+    """取得搜尋結果的分組標題與筆數
+    
+    Args:
+        db: 資料庫物件
+        law_name: 法律名稱
+        term: 屆別，空字串表示全部屆別
+        sort_by: article（依條號分組）或 status（依審查進度分組）
+        
+    Returns:
+        list: {'article': 分組名稱, 'group': 分組代碼, 'bills_count': 法案數}
+    """
+    if sort_by == 'article':
+        return [{
+            'article': group['article'],
+            'group': OTHER_ARTICLE_GROUP if group['number'] is None else f"{group['number']}-{group['sub_number']}",
+            'bills_count': group['bills_count'],
+        } for group in db.count_bills_by_article(law_name, term=term or None)]
+    
+    counts = defaultdict(int)
+    for status, count in db.count_bills_by_status(law_name, term=term or None).items():
+        counts[get_status_group(status)] += count
+    return [{'article': status, 'group': status, 'bills_count': counts[status]}
+            for status in STATUS_GROUP_ORDER if counts[status]]
+
+@app.route('/api/search/group')
+@conditional_response
+def search_group():
+    """分頁載入搜尋結果中單一分組的法案，返回渲染好的法案卡片"""
+    law_name = request.args.get('law_name', '')
+    term = request.args.get('term', '')
+    sort_by = request.args.get('sort_by', 'article')
+    group = request.args.get('group', '')
+    cursor = request.args.get('cursor') or None
+    limit = min(max(request.args.get('limit', SEARCH_PAGE_SIZE, type=int), 1), MAX_SEARCH_PAGE_SIZE)
+    
+    if not law_name or not group:
+        return jsonify({"message": "缺少 law_name 或 group 參數"}), 400
+    
+    if sort_by == 'article':
+        match = ARTICLE_GROUP_PATTERN.match(group)
+        if group == OTHER_ARTICLE_GROUP:
+            article = OTHER_ARTICLE_GROUP
+        elif match:
+            article = (int(match.group(1)), int(match.group(2)))
+        else:
+            return jsonify({"message": "參數格式不正確"}), 400
+    
+    db = get_db()
+    try:
+        if sort_by == 'article':
+            bills, next_cursor = db.search_bills_page(law_name, term=term or None, article=article,
+                                                      cursor=cursor, limit=limit)
+        else:
+            statuses = [status for status in db.count_bills_by_status(law_name, term=term or None)
+                        if get_status_group(status) == group]
+            bills, next_cursor = db.search_bills_page(law_name, term=term or None, statuses=statuses,
+                                                      cursor=cursor, limit=limit)
+    except ValueError:
+        # 游標格式不正確
+        return jsonify({"message": "參數格式不正確"}), 400
+    except Exception as e:
+        return jsonify({"message": "發生錯誤", "error": str(e)}), 500
+    
+    for bill in bills:
+        # 處理提案人和連署人資訊
+        members_info = process_members(bill)
+        bill['all_members'] = members_info['members']
+        bill['party_stats'] = members_info['party_stats']
+        bill['total_members'] = members_info['total']
+    
+    return jsonify({
+        "message": "搜尋結果分組",
+        "data": {
+            "html": render_template('_bill_cards.html', bills=bills, sort_by=sort_by),
+            "count": len(bills),
+            "next_cursor": next_cursor
+        }
+    })
+
+def parse_bill_filters(args, db) -> dict:
+    """將 /api/bills 的查詢參數轉為 Database.iter_bills 的篩選條件
+    
+    Args:
+        args: 查詢參數
+        db: 資料庫物件
+        
+    Returns:
+        dict: 篩選條件
+        
+    Raises:
+        ValueError: 參數格式不正確
+    """
+    filters = {
+        'law_name': args.get('law_name') or None,
+        'term': args.get('term') or None,
+        'session_period': args.get('session_period') or args.get('session') or None,
+        'proposer': args.get('proposer') or None,
+    }
+    
+    status = args.get('status')
+    if status:
+        # 可傳入審查進度分組（三讀、委員會審查等）或原始的審查狀態
+        if status in STATUS_GROUP_ORDER:
+            filters['statuses'] = [value for value in db.get_bill_statuses()
+                                   if get_status_group(value) == status]
+        else:
+            filters['statuses'] = [status]
+    
+    article = args.get('article')
+    if article:
+        match = ARTICLE_PARAM_PATTERN.match(article.strip())
+        if not match:
+            raise ValueError(f"條號格式不正確: {article}")
+        filters['article'] = (int(match.group(1)), int(match.group(2) or 0))
+    return filters
+
+@app.route('/api/bills')
+@conditional_response
+def api_bills():
+    """以 NDJSON（每行一筆 JSON）串流輸出符合條件的法案
+    
+    查詢參數：law_name、term、session_period、status（分組或原始狀態）、
+    proposer、article，以及以逗號分隔的 fields 指定輸出欄位。
+    """
+    db = get_db()
+    fields = [field.strip() for field in request.args.get('fields', '').split(',') if field.strip()]
+    try:
+        filters = parse_bill_filters(request.args, db)
+        bills = db.iter_bills(filters, fields=fields or None)
+    except ValueError as e:
+        return jsonify({"message": "參數格式不正確", "error": str(e)}), 400
+    
+    def generate():
+        for bill in bills:
+            yield json.dumps(bill.to_dict(), ensure_ascii=False) + '\n'
+    
+    # stream_with_context 讓借用的連線保留到串流結束才歸還連線池
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
 
 @app.route('/api/popular-bills')
+@conditional_response
 def popular_bills():
     try:
-        db = Database()
-        cursor = db.conn.cursor()
-        cursor.execute(get_popular_bills_sql())
-        bills = [dict(row) for row in cursor.fetchall()]
+        db = get_db()
+        bills = db.get_popular_laws(
+            term=request.args.get('term') or None,
+            session_period=request.args.get('session_period') or None,
+            limit=request.args.get('limit', 30, type=int)
+        )
         return jsonify({
             "message": "熱門法案列表",
             "data": bills
@@ -1290,8 +522,14 @@ def popular_bills():
             "message": "發生錯誤",
             "error": str(e)
         }), 500
-    finally:
-        db.close()
+
+@app.route('/api/search-cache')
+def search_cache_stats():
+    """搜尋結果快取的命中統計"""
+    return jsonify({
+        "message": "搜尋結果快取統計",
+        "data": search_cache.stats()
+    })
 
 if __name__ == '__main__':
     # 啟動應用程式
@@ -0,0 +1,84 @@
+"""法案分析器效能測試
+
+比較重構前以 dict 逐筆解析的修法熱點統計（get_all_bills 後，熱點與每部法律的
+熱門條號各掃描一次全部法案）與 BillAnalyzer 欄位式快照的時間：建立快照、
+由 .npz 快照檔載入，以及統計前幾名法律與其熱門條號。
+
+用法：
+    python benchmarks/bench_analyzer.py [--db data/bills.db] [--laws 10] [--cache-dir /tmp/snapshots]
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from collections import Counter
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+
+from src.analyzer import BillAnalyzer
+from src.article_parser import extract_article_ints
+from src.database import Database
+
+
+def timed(label: str, func):
+    """執行一次並印出時間"""
+    start = time.perf_counter()
+    result = func()
+    print(f"{label:<24}{(time.perf_counter() - start) * 1000:10.1f} 毫秒")
+    return result
+
+
+def dict_analysis(bills, laws: int):
+    """重構前的方式：每次統計都對全部法案重新解析法律名稱"""
+    law_counter = Counter()
+    for bill in bills:
+        if bill.get('billName'):
+            law_name = BillAnalyzer.extract_law_name(bill['billName'])
+            if law_name and len(law_name) > 2:
+                law_counter[law_name] += 1
+    hot_laws = law_counter.most_common(laws)
+    for law_name, _ in hot_laws:
+        article_counter = Counter()
+        for bill in bills:
+            if bill.get('billName') and law_name in BillAnalyzer.extract_law_name(bill['billName']):
+                article_counter.update(extract_article_ints(bill['billName']))
+        article_counter.most_common(5)
+    return hot_laws
+
+
+def snapshot_analysis(analyzer: BillAnalyzer, laws: int):
+    hot_laws = analyzer.get_hot_laws(laws)
+    for law_name, _ in hot_laws:
+        analyzer.get_hot_articles(law_name)
+    return hot_laws
+
+
+def main():
+    parser = argparse.ArgumentParser(description='法案分析器效能測試')
+    parser.add_argument('--db', default=None, help='資料庫路徑，預設為 data/bills.db')
+    parser.add_argument('--laws', type=int, default=10, help='統計熱門條號的法律數')
+    parser.add_argument('--cache-dir', default=None, help='快照檔目錄，預設為暫存目錄')
+    args = parser.parse_args()
+
+    db = Database(args.db, read_only=True)
+    cache_dir = args.cache_dir or tempfile.mkdtemp(prefix='bill_snapshot_')
+
+    bills = timed('get_all_bills', db.get_all_bills)
+    expected = timed('dict 逐筆分析', lambda: dict_analysis(bills, args.laws))
+    del bills
+
+    timed('建立快照並存檔', lambda: BillAnalyzer.from_database(db, cache_dir=cache_dir))
+    analyzer = timed('由快照檔載入', lambda: BillAnalyzer.from_database(db, cache_dir=cache_dir))
+    result = timed('快照向量分析', lambda: snapshot_analysis(analyzer, args.laws))
+    print(f"結果一致：{result == expected}")
+
+    if not args.cache_dir:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+    db.close()
+
+
+if __name__ == '__main__':
+    main()
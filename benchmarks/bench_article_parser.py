@@ -0,0 +1,96 @@
+"""條號解析效能測試
+
+以 data/backups/page_*.json 中的提案名稱為語料，比較重構前三份條號解析實作
+與 src/article_parser.py 的執行時間，並列出與原 app.py 版本結果不同的提案。
+
+用法：
+    python benchmarks/bench_article_parser.py [--repeat 3] [--show-diff 10]
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src import article_parser
+from legacy_article_parsers import (
+    LegacyAnalyzer, app_extract_article_numbers, st_extract_article_numbers
+)
+
+
+def load_bill_names() -> list:
+    """讀取備份頁面中的所有提案名稱（保留重複，模擬實際查詢情境）"""
+    names = []
+    for path in sorted(glob.glob(os.path.join(ROOT_DIR, 'data', 'backups', 'page_*.json'))):
+        with open(path, 'r', encoding='utf-8') as f:
+            for bill in json.load(f):
+                if bill.get('billName'):
+                    names.append(bill['billName'])
+    return names
+
+
+def run(label: str, func, names: list, repeat: int, setup=None) -> float:
+    """執行多次並回報最佳時間"""
+    best = None
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        for name in names:
+            func(name)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"{label:<28}{best:>9.3f} 秒  {len(names) / best:>12,.0f} 筆/秒")
+    return best
+
+
+def as_keys(articles: list) -> set:
+    return {(article['number'], article['sub_number']) for article in articles}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='條號解析效能測試')
+    parser.add_argument('--repeat', type=int, default=3, help='每種實作的重複次數')
+    parser.add_argument('--show-diff', type=int, default=10, help='列出結果不同的提案數量上限')
+    args = parser.parse_args()
+
+    names = load_bill_names()
+    unique_names = set(names)
+    print(f"語料：{len(names):,} 筆提案名稱（不重複 {len(unique_names):,} 筆）\n")
+
+    analyzer = LegacyAnalyzer()
+    uncached = article_parser.parse_articles.__wrapped__
+
+    baseline = run('原 app.py', app_extract_article_numbers, names, args.repeat)
+    run('原 st_utils.py', st_extract_article_numbers, names, args.repeat)
+    run('原 BillAnalyzer', analyzer.extract_article_numbers, names, args.repeat)
+    run('article_parser（無快取）', uncached, names, args.repeat)
+    cached = run('article_parser（LRU 快取）', article_parser.extract_article_numbers, names,
+                 args.repeat, setup=article_parser.parse_articles.cache_clear)
+    print(f"\n快取狀態：{article_parser.parse_articles.cache_info()}")
+    print(f"相對原 app.py 加速：{baseline / cached:.1f} 倍")
+
+    # 比對與原 app.py 的解析結果
+    diffs = []
+    for name in sorted(unique_names):
+        old = as_keys(app_extract_article_numbers(name))
+        new = as_keys(article_parser.extract_article_numbers(name))
+        if old != new:
+            diffs.append((name, old - new, new - old))
+
+    print(f"\n與原 app.py 結果不同：{len(diffs)} 筆")
+    for name, missing, added in diffs[:args.show_diff]:
+        print(f"- {name}")
+        if missing:
+            print(f"    僅原版本：{sorted(missing)}")
+        if added:
+            print(f"    僅新版本：{sorted(added)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""法案紀錄記憶體測試
+
+以 tracemalloc 量測載入後仍佔用的記憶體，比較重構前每筆法案一個 dict（成員為
+{'name', 'party_class'} 字典）與 Bill、Member 紀錄：
+
+- 全部法案：重構前 get_all_bills 的 SELECT * 與目前的 get_all_bills。
+- 大量搜尋：一整屆的法案加上網頁顯示的成員列表與政黨統計。
+
+用法：
+    python benchmarks/bench_bill_memory.py [--db data/bills.db] [--term 11]
+"""
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+
+
+def retained(func) -> float:
+    """執行函式，返回結果仍佔用的記憶體 MB（結果在量測後釋放）"""
+    gc.collect()
+    tracemalloc.start()
+    result = func()
+    current = tracemalloc.get_traced_memory()[0] / 1024 / 1024
+    tracemalloc.stop()
+    del result
+    return current
+
+
+def dict_members(bill: dict, app) -> dict:
+    """重構前的成員列表：每位成員一個字典，姓名為 extract_names 切出的字串"""
+    info = app.process_members(bill)
+    members = [{'name': member.name, 'party_class': member.party_class}
+               for member in info['members'] if member.party is app.Party.ORG]
+    for names in (bill['billProposer'], bill['billCosignatory']):
+        for name in app.extract_names(names or ''):
+            members.append({'name': name, 'party_class': app.get_member_info(name, bill['term']).party_class})
+    info['members'] = members
+    return info
+
+
+def main():
+    parser = argparse.ArgumentParser(description='法案紀錄記憶體測試')
+    parser.add_argument('--db', default=None, help='資料庫路徑，預設為 data/bills.db')
+    parser.add_argument('--term', default='11', help='大量搜尋的屆別')
+    args = parser.parse_args()
+
+    # app 匯入時就會建立連線池，先指定資料庫路徑
+    if args.db:
+        os.environ['DATABASE_PATH'] = args.db
+    import app
+    from src.bill_record import Bill
+    from src.database import Database
+
+    db = Database(args.db, read_only=True)
+
+    def display(bills, members):
+        for bill in bills:
+            info = members(bill)
+            bill['all_members'] = info['members']
+            bill['party_stats'] = info['party_stats']
+            bill['total_members'] = info['total']
+        return bills
+
+    def term_rows():
+        return db.conn.execute("SELECT * FROM bills WHERE term = ?", (args.term,))
+
+    # 先執行一次，讓立委查詢表與 Member 共用物件不計入量測
+    display(Bill.from_rows(term_rows()), app.process_members)
+
+    cases = [
+        ('全部法案', [
+            ('dict（SELECT *）', lambda: [dict(row) for row in db.conn.execute("SELECT * FROM bills")]),
+            ('Bill（SELECT *）', lambda: Bill.from_rows(db.conn.execute("SELECT * FROM bills"))),
+            ('Bill（get_all_bills）', db.get_all_bills),
+        ]),
+        (f'第{args.term}屆搜尋結果與成員', [
+            ('dict', lambda: display([dict(row) for row in term_rows()],
+                                     lambda bill: dict_members(bill, app))),
+            ('Bill + Member', lambda: display(Bill.from_rows(term_rows()), app.process_members)),
+        ]),
+    ]
+    for title, variants in cases:
+        print(title)
+        baseline = None
+        for label, func in variants:
+            current = retained(func)
+            baseline = baseline or current
+            print(f"  {label:<24}{current:8.2f} MB  {current / baseline:6.1%}")
+    db.close()
+
+
+if __name__ == '__main__':
+    main()
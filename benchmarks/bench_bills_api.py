@@ -0,0 +1,70 @@
+"""法案串流 API 記憶體測試
+
+以 Flask 測試用戶端逐行讀取 /api/bills 的 NDJSON 回應，量測不同結果筆數與
+fields 欄位選取下的時間與 tracemalloc 記憶體峰值，並與一次讀出全部法案再輸出
+JSON 陣列的方式比較。
+
+用法：
+    python benchmarks/bench_bills_api.py [--db data/bills.db]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+
+DEFAULT_QUERIES = [
+    'law_name=刑法&article=185-3',
+    'law_name=刑法',
+    'fields=term,billNo,billName,billStatus',
+    '',
+]
+
+
+def measure(func):
+    """執行函式，返回 (結果, 秒數, 記憶體峰值 MB)"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description='法案串流 API 記憶體測試')
+    parser.add_argument('--db', default=None, help='資料庫路徑，預設為 data/bills.db')
+    parser.add_argument('queries', nargs='*', default=DEFAULT_QUERIES, help='/api/bills 的查詢參數')
+    args = parser.parse_args()
+
+    if args.db:
+        os.environ['DATABASE_PATH'] = args.db
+    import app
+    from src.database import Database
+
+    client = app.app.test_client()
+
+    def stream(query):
+        response = client.get(f"/api/bills?{query}")
+        count = sum(1 for _ in response.response)
+        response.close()
+        return count
+
+    for query in args.queries:
+        count, elapsed, peak = measure(lambda: stream(query))
+        print(f"{query or '（全部）':<45}{count:>7} 筆  {elapsed * 1000:9.1f} 毫秒  峰值 {peak:7.2f} MB")
+
+    db = Database(args.db)
+    count, elapsed, peak = measure(lambda: len(json.dumps([bill.to_dict() for bill in db.get_all_bills()],
+                                                            ensure_ascii=False)))
+    print(f"{'get_all_bills + json.dumps':<45}{'':>7}    {elapsed * 1000:9.1f} 毫秒  峰值 {peak:7.2f} MB")
+    db.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+"""資料庫連線池效能測試
+
+以 Flask 測試用戶端送出請求，比較每個請求都建立新 Database（重構前的做法）
+與使用連線池時的平均延遲，並以多執行緒模擬併發請求。除了 /search 之外，
+另外註冊只執行 SELECT 1 的測試路由，單獨量測取得連線的成本。
+
+用法：
+    python benchmarks/bench_db_pool.py [--db data/bills.db] [--requests 200] [--threads 4]
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+
+DEFAULT_LAWS = ['公民投票法', '勞動基準法', '所得稅法', '民法']
+
+
+class PerRequestPool:
+    """模擬重構前的做法：每次借用都建立新連線並執行資料表建立，歸還時關閉"""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+
+    def acquire(self):
+        from src.database import Database
+        return Database(self.db_path, check_same_thread=False)
+
+    def release(self, db):
+        db.close()
+
+
+def run(label: str, client, urls: list, threads: int) -> float:
+    """送出所有請求並回報平均延遲"""
+    def fetch(url):
+        start = time.perf_counter()
+        response = client.get(url)
+        assert response.status_code == 200
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    if threads > 1:
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            latencies = list(executor.map(fetch, urls))
+    else:
+        latencies = [fetch(url) for url in urls]
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    average = sum(latencies) / len(latencies)
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(f"{label:<20}平均 {average * 1000:7.2f} 毫秒  p95 {p95 * 1000:7.2f} 毫秒  "
+          f"{len(urls) / elapsed:7.1f} 請求/秒")
+    return average
+
+
+def main():
+    parser = argparse.ArgumentParser(description='資料庫連線池效能測試')
+    parser.add_argument('--db', default=None, help='資料庫路徑，預設為 data/bills.db')
+    parser.add_argument('--requests', type=int, default=200, help='請求數')
+    parser.add_argument('--threads', type=int, default=4, help='併發執行緒數（同時作為連線池大小）')
+    args = parser.parse_args()
+
+    if args.db:
+        os.environ['DATABASE_PATH'] = args.db
+    os.environ['DB_POOL_SIZE'] = str(args.threads)
+    import app
+
+    @app.app.route('/_bench/ping')
+    def bench_ping():
+        app.get_db().conn.execute("SELECT 1").fetchone()
+        return 'ok'
+
+    client = app.app.test_client()
+    pool = app.app.extensions['db_pool']
+    scenarios = {
+        'SELECT 1': ['/_bench/ping'] * args.requests,
+        '/search': [f"/search?law_name={DEFAULT_LAWS[i % len(DEFAULT_LAWS)]}&sort_by=status"
+                    for i in range(args.requests)],
+    }
+
+    # 暖身，讓黨籍查詢表、姓名切分器與連線都先建立好
+    for law_name in DEFAULT_LAWS:
+        client.get(f"/search?law_name={law_name}&sort_by=status")
+
+    for name, urls in scenarios.items():
+        for threads in (1, args.threads):
+            print(f"\n{name}，{threads} 個執行緒：")
+            app.app.extensions['db_pool'] = PerRequestPool(pool.db_path)
+            before = run('每個請求新建連線', client, urls, threads)
+            app.app.extensions['db_pool'] = pool
+            after = run('連線池', client, urls, threads)
+            print(f"每個請求節省 {(before - after) * 1000:.2f} 毫秒")
+
+
+if __name__ == '__main__':
+    main()
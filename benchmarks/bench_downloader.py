@@ -0,0 +1,115 @@
+"""併發下載效能測試
+
+啟動 local_api_server.py 的本機模擬伺服器（可設定延遲與 403 比例），比較
+reset_and_download_all 原本逐頁下載（每頁之後等待 2～5 秒）與
+LYAPIClient.iter_pages 併發下載所需的時間，並檢查：
+
+- iter_pages 依頁碼順序返回，且每頁內容與備份檔相同
+- 同時處理的請求數不超過執行緒數
+- 任一秒內的請求數不超過限速器允許的數量
+
+用法：
+    python benchmarks/bench_downloader.py [--pages 10] [--latency 1.0] [--forbidden-rate 0.05]
+        [--workers 4] [--rate 2] [--legacy-delay 2]
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from local_api_server import LocalAPIServer, load_backup_pages
+from src.api_client import LYAPIClient
+
+
+def legacy_download(client: LYAPIClient, last_page: int, delay: float) -> dict:
+    """原本的逐頁下載：每頁下載完成後固定等待"""
+    results = {}
+    for page in range(1, last_page + 1):
+        bills = client.get_bills(term="all", page=page)
+        if not bills:
+            break
+        results[page] = bills
+        time.sleep(delay)
+    return results
+
+
+def max_requests_per_window(times: list, window: float = 1.0) -> int:
+    """任一 window 秒內的最大請求數"""
+    times = sorted(times)
+    best = 0
+    start = 0
+    for end, t in enumerate(times):
+        while t - times[start] >= window:
+            start += 1
+        best = max(best, end - start + 1)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='併發下載效能測試')
+    parser.add_argument('--pages', type=int, default=10, help='模擬伺服器提供的頁數')
+    parser.add_argument('--latency', type=float, default=1.0, help='每個請求的平均延遲秒數')
+    parser.add_argument('--forbidden-rate', type=float, default=0.05, help='返回 403 的比例')
+    parser.add_argument('--workers', type=int, default=4, help='同時下載的頁數')
+    parser.add_argument('--rate', type=float, default=2.0, help='每秒請求數上限')
+    parser.add_argument('--legacy-delay', type=float, default=2.0,
+                        help='逐頁下載時每頁之後的等待秒數（原本為 2～5 秒）')
+    parser.add_argument('--skip-legacy', action='store_true', help='略過逐頁下載')
+    parser.add_argument('--verbose', action='store_true', help='顯示 API 客戶端日誌')
+    args = parser.parse_args()
+
+    if not args.verbose:
+        logging.getLogger("LYAPIClient").setLevel(logging.WARNING)
+
+    expected = load_backup_pages(args.pages)
+    server = LocalAPIServer(expected, latency=args.latency, forbidden_rate=args.forbidden_rate, seed=0)
+    server.start()
+    print(f"模擬伺服器：{len(expected)} 頁，延遲 {args.latency} 秒，403 比例 {args.forbidden_rate:.0%}\n")
+
+    def new_client(rate_limit):
+        return LYAPIClient(timeout=30, max_retries=5, retry_delay=0.5, base_url=server.url,
+                           rate_limit=rate_limit)
+
+    legacy_elapsed = None
+    if not args.skip_legacy:
+        start = time.perf_counter()
+        results = legacy_download(new_client(None), len(expected) + 1, args.legacy_delay)
+        legacy_elapsed = time.perf_counter() - start
+        print(f"逐頁下載        {legacy_elapsed:>7.2f} 秒  {len(results)} 頁  "
+              f"請求 {server.requests} 次（403 {server.forbidden} 次）")
+        assert results == expected, "逐頁下載的內容與備份不同"
+
+    server.reset_stats()
+    client = new_client(args.rate)
+    start = time.perf_counter()
+    order = []
+    results = {}
+    for page, bills in client.iter_pages(range(1, len(expected) + 10), workers=args.workers):
+        order.append(page)
+        if bills:
+            results[page] = bills
+    elapsed = time.perf_counter() - start
+    print(f"併發下載        {elapsed:>7.2f} 秒  {len(results)} 頁  "
+          f"請求 {server.requests} 次（403 {server.forbidden} 次）")
+
+    assert order == sorted(order), f"頁面未依順序返回：{order}"
+    assert results == expected, "併發下載的內容與備份不同"
+    assert server.max_active <= args.workers, f"同時請求數 {server.max_active} 超過執行緒數"
+    burst = max_requests_per_window(server.request_times)
+    assert burst <= args.rate + 1, f"一秒內送出 {burst} 個請求，超過限速"
+    print(f"\n同時處理的最大請求數 {server.max_active}（上限 {args.workers}），"
+          f"任一秒內最多 {burst} 個請求（限速每秒 {args.rate:g} 個）")
+    print("依頁碼順序返回，內容與備份相同")
+    if legacy_elapsed:
+        print(f"加速：{legacy_elapsed / elapsed:.1f} 倍")
+
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
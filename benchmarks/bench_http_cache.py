@@ -0,0 +1,55 @@
+"""HTTP 條件式請求與壓縮效能測試
+
+對幾個熱門法律的搜尋結果頁面，分別量測完整回應、gzip 壓縮回應與帶 If-None-Match
+重新驗證（304）時的延遲與傳輸位元組數。
+
+用法：
+    python benchmarks/bench_http_cache.py [--db data/bills.db] [--repeat 5]
+"""
+import argparse
+import os
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+
+DEFAULT_LAWS = ['刑法', '所得稅法', '勞動基準法', '民法']
+
+
+def measure(client, url: str, headers: dict, repeat: int):
+    """送出多次請求，返回 (最佳延遲, 回應位元組數, 狀態碼)"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        response = client.get(url, headers=headers)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, len(response.data), response.status_code
+
+
+def main():
+    parser = argparse.ArgumentParser(description='HTTP 條件式請求與壓縮效能測試')
+    parser.add_argument('--db', default=None, help='資料庫路徑，預設為 data/bills.db')
+    parser.add_argument('--repeat', type=int, default=5, help='重複次數')
+    parser.add_argument('laws', nargs='*', default=DEFAULT_LAWS, help='搜尋的法律名稱')
+    args = parser.parse_args()
+
+    if args.db:
+        os.environ['DATABASE_PATH'] = args.db
+    import app
+
+    client = app.app.test_client()
+    for law_name in args.laws:
+        url = f"/search?law_name={law_name}&sort_by=article"
+        etag = client.get(url).headers['ETag']
+        print(f"\n{law_name}：")
+        for label, headers in (('完整回應', {}),
+                               ('gzip', {'Accept-Encoding': 'gzip'}),
+                               ('If-None-Match', {'If-None-Match': etag})):
+            elapsed, size, status = measure(client, url, headers, args.repeat)
+            print(f"  {label:<14}{status}  {elapsed * 1000:8.2f} 毫秒  {size / 1024:10.1f} KB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""全部法案逐批讀取記憶體測試
+
+以 tracemalloc 量測處理全部法案時的記憶體峰值，比較一次 fetchall 讀出全部
+資料列與 Database.iter_bills 以 fetchmany 逐批讀取（只讀取需要的欄位）：
+
+- 全表掃描：逐筆計算提案名稱長度。
+- 分析器快照：建立 BillSnapshot（不寫入快照檔）。
+- 重建 bill_members：在資料庫的暫存複本上執行。
+
+用法：
+    python benchmarks/bench_iter_bills.py [--db data/bills.db] [--batch-size 500]
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+
+from src.analyzer import BillAnalyzer
+from src.bill_snapshot import SNAPSHOT_FIELDS, BillSnapshot
+from src.database import Database
+
+
+def measure(func):
+    """執行函式，返回 (秒數, 記憶體峰值 MB)"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def legacy_rebuild_bill_members(db: Database):
+    """重構前的 rebuild_bill_members：一次讀出全部法案再寫入"""
+    cursor = db.conn.cursor()
+    cursor.execute("DELETE FROM bill_members")
+    rows = db.conn.execute("SELECT term, billNo, billProposer, billCosignatory FROM bills").fetchall()
+    db._save_bill_members(cursor, (dict(row) for row in rows))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='全部法案逐批讀取記憶體測試')
+    parser.add_argument('--db', default=None, help='資料庫路徑，預設為 data/bills.db')
+    parser.add_argument('--batch-size', type=int, default=500, help='iter_bills 每批讀取的筆數')
+    args = parser.parse_args()
+
+    db = Database(args.db, read_only=True)
+    fields = ', '.join(SNAPSHOT_FIELDS)
+    cases = [
+        ('全表掃描', [
+            ('fetchall SELECT *', lambda: sum(len(row['billName'] or '') for row in
+                                              db.conn.execute("SELECT * FROM bills").fetchall())),
+            ('iter_bills', lambda: sum(len(bill['billName'] or '') for bill in
+                                       db.iter_bills(fields=['billName'], batch_size=args.batch_size,
+                                                     ordered=False))),
+        ]),
+        ('分析器快照', [
+            ('fetchall', lambda: BillSnapshot.from_bills(
+                [dict(row) for row in db.conn.execute(f"SELECT {fields} FROM bills").fetchall()],
+                BillAnalyzer.extract_law_name)),
+            ('iter_bills', lambda: BillSnapshot.from_bills(
+                db.iter_bills(fields=SNAPSHOT_FIELDS, batch_size=args.batch_size, ordered=False),
+                BillAnalyzer.extract_law_name)),
+        ]),
+    ]
+    # 先執行一次，讓法律名稱的正則表達式等快取不計入量測
+    BillSnapshot.from_bills(db.iter_bills(fields=SNAPSHOT_FIELDS, ordered=False), BillAnalyzer.extract_law_name)
+
+    copy_dir = tempfile.mkdtemp(prefix='bench_iter_bills_')
+    copy = Database(shutil.copy(db.db_path, os.path.join(copy_dir, 'bills.db')))
+    cases.append(('重建 bill_members', [
+        ('fetchall', lambda: legacy_rebuild_bill_members(copy)),
+        ('iter_bills', copy.rebuild_bill_members),
+    ]))
+
+    for title, variants in cases:
+        print(title)
+        for label, func in variants:
+            elapsed, peak = measure(func)
+            print(f"  {label:<20}{elapsed * 1000:10.1f} 毫秒  峰值 {peak:7.2f} MB")
+    db.close()
+    copy.close()
+    shutil.rmtree(copy_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""正式法律名稱欄位效能測試
+
+比較以提案名稱全文比對（重構前的搜尋方式）與以 bills.law_name 等號比對搜尋
+法律的時間，以及立委頁面分類法案時，每筆法案重新清理名稱與直接讀取 law_name
+欄位的時間。
+
+用法：
+    python benchmarks/bench_law_name.py [--db data/bills.db] [--repeat 20]
+"""
+import argparse
+import os
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+
+from src.database import Database
+from src.law_names import canonical_law_name
+
+DEFAULT_LAWS = ['刑法', '民法', '所得稅法', '勞基法', '公民投票法']
+
+
+def best_of(repeat: int, func) -> float:
+    """執行多次並返回最佳時間"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def text_match_search(db: Database, law_name: str) -> int:
+    """重構前的搜尋方式：以全文索引比對提案名稱並排除施行法等"""
+    keyword, excludes = db._law_search_terms(law_name)
+    condition, params = db._text_match_condition(keyword, ['billName'])
+    conditions = [condition] + ["billName NOT LIKE ?"] * len(excludes)
+    params += tuple(f"%{exclude}%" for exclude in excludes)
+    return len(db.conn.execute(f"SELECT billNo FROM bills WHERE {' AND '.join(conditions)}", params).fetchall())
+
+
+def law_name_search(db: Database, law_name: str) -> int:
+    """以正式法律名稱等號比對"""
+    return len(db.conn.execute(
+        "SELECT billNo FROM bills WHERE law_name = ?", (canonical_law_name(law_name),)
+    ).fetchall())
+
+
+def main():
+    parser = argparse.ArgumentParser(description='正式法律名稱欄位效能測試')
+    parser.add_argument('--db', default=None, help='資料庫路徑，預設為 data/bills.db')
+    parser.add_argument('--repeat', type=int, default=20, help='重複次數')
+    parser.add_argument('laws', nargs='*', default=DEFAULT_LAWS, help='搜尋的法律名稱')
+    args = parser.parse_args()
+
+    db = Database(args.db)
+
+    print("搜尋：")
+    for law_name in args.laws:
+        before = best_of(args.repeat, lambda: text_match_search(db, law_name))
+        after = best_of(args.repeat, lambda: law_name_search(db, law_name))
+        print(f"{law_name:<8}全文比對 {text_match_search(db, law_name):>4} 筆 {before * 1000:7.2f} 毫秒  "
+              f"law_name {law_name_search(db, law_name):>4} 筆 {after * 1000:7.2f} 毫秒")
+
+    # 立委頁面：依法律名稱分類一屆的全部法案
+    term = db.get_latest_term_session()[0]
+    rows = db.conn.execute("SELECT billName, law_name FROM bills WHERE term = ?", (term,)).fetchall()
+
+    def classify_by_name():
+        counts = {}
+        for row in rows:
+            name = canonical_law_name(row['billName'])
+            counts[name] = counts.get(name, 0) + 1
+
+    def classify_by_column():
+        counts = {}
+        for row in rows:
+            counts[row['law_name']] = counts.get(row['law_name'], 0) + 1
+
+    before = best_of(args.repeat, classify_by_name)
+    after = best_of(args.repeat, classify_by_column)
+    print(f"\n分類第{term}屆 {len(rows)} 筆法案：清理名稱 {before * 1000:.2f} 毫秒，"
+          f"讀取 law_name {after * 1000:.2f} 毫秒（{before / after:.1f} 倍）")
+    db.close()
+
+
+if __name__ == '__main__':
+    main()
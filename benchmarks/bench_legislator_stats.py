@@ -0,0 +1,83 @@
+"""按立委分析查詢效能測試
+
+比較分析頁「按立委分析」重構前的查詢方式（先以 billProposer 分組取前20名，
+再為前10名立委各以 LIKE 掃描一次提案表）與 Database.get_legislator_law_stats
+一次查詢的時間。
+
+用法：
+    python benchmarks/bench_legislator_stats.py [--db data/bills.db] [--term 11] [--session 02] [--repeat 5]
+"""
+import argparse
+import os
+import sys
+import time
+from collections import defaultdict
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+
+from src.database import Database
+from src.name_matcher import extract_names
+
+
+def best_of(repeat: int, func) -> float:
+    """執行多次並返回最佳時間"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def per_legislator_queries(db: Database, term: str, session_period: str = None) -> int:
+    """重構前的方式：1 次分組查詢加上每位立委 1 次 LIKE 掃描，返回查詢次數"""
+    session_filter = "AND sessionPeriod = ?" if session_period else ""
+    params = (term, session_period) if session_period else (term,)
+    rows = db.conn.execute(f"""
+    SELECT billProposer, COUNT(*) as count
+    FROM bills
+    WHERE term = ? {session_filter}
+    AND billProposer IS NOT NULL AND billProposer != ''
+    GROUP BY billProposer
+    ORDER BY count DESC
+    LIMIT 20
+    """, params).fetchall()
+    counts = defaultdict(int)
+    for row in rows:
+        for name in extract_names(row['billProposer']):
+            counts[name] += 1
+    top = sorted(counts.items(), key=lambda x: x[1], reverse=True)[:10]
+    for name, _ in top:
+        db.conn.execute(f"""
+        SELECT billName, billStatus, law_name FROM bills
+        WHERE term = ? {session_filter} AND billProposer LIKE ?
+        """, params + (f"%{name}%",)).fetchall()
+    return 1 + len(top)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='按立委分析查詢效能測試')
+    parser.add_argument('--db', default=None, help='資料庫路徑，預設為 data/bills.db')
+    parser.add_argument('--term', default='11', help='屆別')
+    parser.add_argument('--session', default=None, help='會期，預設為全部會期')
+    parser.add_argument('--repeat', type=int, default=5, help='重複次數')
+    args = parser.parse_args()
+
+    db = Database(args.db, read_only=True)
+    queries = per_legislator_queries(db, args.term, args.session)
+    before = best_of(args.repeat, lambda: per_legislator_queries(db, args.term, args.session))
+    after = best_of(args.repeat, lambda: db.get_legislator_law_stats(args.term, args.session, limit=10, top_laws=5))
+    print(f"重構前：{queries} 次查詢 {before * 1000:8.1f} 毫秒")
+    print(f"單一查詢：1 次查詢 {after * 1000:8.1f} 毫秒（{before / after:.1f} 倍）")
+
+    # 全部立委的分布也只需一次查詢
+    elapsed = best_of(args.repeat, lambda: db.get_legislator_law_stats(args.term, args.session))
+    count = len(db.get_legislator_law_stats(args.term, args.session))
+    print(f"全部 {count} 位立委：{elapsed * 1000:8.1f} 毫秒")
+    db.close()
+
+
+if __name__ == '__main__':
+    main()
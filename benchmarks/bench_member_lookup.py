@@ -0,0 +1,81 @@
+"""立委黨籍查詢效能測試
+
+對幾個常見的法律名稱執行搜尋，比較重構前（每次呼叫都重新建立立委對照表）
+與 src/legislator_lookup.py 共用查詢表時，整理提案人與連署人所需的時間。
+
+用法：
+    python benchmarks/bench_member_lookup.py [--db data/bills.db] [--repeat 3]
+"""
+import argparse
+import os
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import legacy_member_info
+from src.database import Database
+from src.legislator_lookup import get_lookup
+
+DEFAULT_LAWS = ['中華民國刑法', '民法', '所得稅法', '勞動基準法', '公民投票法']
+
+
+def run(label: str, bills_by_law: dict, process, repeat: int) -> float:
+    """執行多次並回報最佳時間"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for bills in bills_by_law.values():
+            for bill in bills:
+                process(bill)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    total = sum(len(bills) for bills in bills_by_law.values())
+    print(f"{label:<16}{best:>9.3f} 秒  每筆 {best / total * 1000:.3f} 毫秒")
+    return best
+
+
+def as_dicts(members_info: dict) -> dict:
+    """將 app.process_members 的 Member 轉為重構前的 {'name', 'party_class'} 以便比較"""
+    return dict(members_info, members=[{'name': member.name, 'party_class': member.party_class}
+                                       for member in members_info['members']])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='立委黨籍查詢效能測試')
+    parser.add_argument('--db', default=None, help='資料庫路徑，預設為 data/bills.db')
+    parser.add_argument('--repeat', type=int, default=3, help='重複次數')
+    parser.add_argument('laws', nargs='*', default=DEFAULT_LAWS, help='搜尋的法律名稱')
+    args = parser.parse_args()
+
+    # app 匯入時就會建立連線池，先指定資料庫路徑
+    if args.db:
+        os.environ['DATABASE_PATH'] = args.db
+    import app
+
+    db = Database(args.db)
+    bills_by_law = {}
+    for law_name in args.laws:
+        bills_by_law[law_name] = db.search_bills(law_name)
+        print(f"{law_name}：{len(bills_by_law[law_name])} 筆提案")
+    db.close()
+
+    lookup = get_lookup()
+    print(f"\n查詢表：{len(lookup._by_term)} 筆 (屆別, 姓名)、{len(lookup._by_name)} 位委員\n")
+
+    before = run('重構前', bills_by_law, legacy_member_info.process_members, args.repeat)
+    after = run('共用查詢表', bills_by_law, app.process_members, args.repeat)
+    print(f"\n加速：{before / after:.1f} 倍")
+
+    # 姓名切分或黨籍判定（依屆別查詢）與重構前不同的提案數
+    changed = 0
+    for bills in bills_by_law.values():
+        for bill in bills:
+            if legacy_member_info.process_members(bill) != as_dicts(app.process_members(bill)):
+                changed += 1
+    print(f"成員列表與重構前不同的提案：{changed} 筆")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""姓名切分效能測試
+
+以 data/backups/page_*.json 中所有提案人與連署人字串為語料，比較重構前 app.py
+的 extract_names 與 src/name_matcher.py 的處理速度（姓名/秒），並列出切分結果
+不同的字串。
+
+用法：
+    python benchmarks/bench_name_matcher.py [--repeat 3] [--show-diff 10]
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src import name_matcher
+from legacy_member_info import extract_names as legacy_extract_names
+
+
+def load_name_strings() -> list:
+    """讀取備份頁面中所有提案人與連署人字串（保留重複，模擬實際查詢情境）"""
+    strings = []
+    for path in sorted(glob.glob(os.path.join(ROOT_DIR, 'data', 'backups', 'page_*.json'))):
+        with open(path, 'r', encoding='utf-8') as f:
+            for bill in json.load(f):
+                for field in ('billProposer', 'billCosignatory'):
+                    if bill.get(field):
+                        strings.append(bill[field])
+    return strings
+
+
+def run(label: str, func, strings: list, repeat: int, setup=None) -> float:
+    """執行多次並回報最佳時間與每秒處理的姓名數"""
+    best = None
+    count = 0
+    for _ in range(repeat):
+        if setup:
+            setup()
+        count = 0
+        start = time.perf_counter()
+        for text in strings:
+            count += len(func(text))
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"{label:<24}{best:>9.3f} 秒  {count / best:>12,.0f} 姓名/秒  共 {count:,} 個姓名")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='姓名切分效能測試')
+    parser.add_argument('--repeat', type=int, default=3, help='每種實作的重複次數')
+    parser.add_argument('--show-diff', type=int, default=10, help='列出結果不同的字串數量上限')
+    args = parser.parse_args()
+
+    strings = load_name_strings()
+    unique_strings = set(strings)
+    print(f"語料：{len(strings):,} 筆名單字串（不重複 {len(unique_strings):,} 筆）\n")
+
+    start = time.perf_counter()
+    matcher = name_matcher.get_matcher()
+    print(f"建立自動機：{len(matcher.patterns)} 個姓名、{len(matcher._automaton)} 個狀態，"
+          f"耗時 {(time.perf_counter() - start) * 1000:.1f} 毫秒\n")
+
+    baseline = run('原 extract_names', legacy_extract_names, strings, args.repeat)
+    uncached = run('自動機（無快取）', matcher.extract, strings, args.repeat)
+    cached = run('自動機（LRU 快取）', name_matcher.extract_names, strings, args.repeat,
+                 setup=name_matcher._extract_names.cache_clear)
+    print(f"\n相對原 extract_names：無快取 {baseline / uncached:.1f} 倍、快取 {baseline / cached:.1f} 倍")
+
+    diffs = []
+    for text in sorted(unique_strings):
+        old = legacy_extract_names(text)
+        new = name_matcher.extract_names(text)
+        if old != new:
+            diffs.append((text, old, new))
+
+    print(f"\n與原 extract_names 結果不同：{len(diffs)} 筆")
+    for text, old, new in diffs[:args.show_diff]:
+        print(f"- {text!r}")
+        print(f"    原版本：{old}")
+        print(f"    新版本：{new}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""參數化查詢與語句快取效能測試
+
+模擬立委提案檢視頁面依序點選一屆的所有立委：比較把姓名與屆別直接寫進 SQL
+（每位立委都是新的語句，需要重新編譯）與以 BillQuery 參數化查詢（SQL 文字
+相同，重複使用已編譯的語句）的總時間。
+
+用法：
+    python benchmarks/bench_query_builder.py [--db data/bills.db] [--term 11] [--rounds 3]
+"""
+import argparse
+import os
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+
+from src.database import Database
+from src.query_builder import BillQuery
+
+COLUMNS = ['billNo', 'billName', 'billStatus', 'law_name']
+
+
+def interpolated(db: Database, name: str, term: str) -> int:
+    """重構前的寫法：以 f-string 組合 SQL"""
+    return len([dict(row) for row in db.conn.execute(f"""
+    SELECT {', '.join(COLUMNS)}
+    FROM bills
+    WHERE term = '{term}'
+    AND billNo IN (SELECT billNo FROM bill_members WHERE name = '{name}' AND term = '{term}' AND role = 'proposer')
+    """).fetchall()])
+
+
+def parameterized(db: Database, name: str, term: str) -> int:
+    """以 BillQuery 產生參數化查詢"""
+    return len(BillQuery(COLUMNS).term(term).member(name, term, 'proposer').fetch_all(db.conn))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='參數化查詢與語句快取效能測試')
+    parser.add_argument('--db', default=None, help='資料庫路徑，預設為 data/bills.db')
+    parser.add_argument('--term', default='11', help='屆別')
+    parser.add_argument('--rounds', type=int, default=3, help='點選全部立委的輪數')
+    args = parser.parse_args()
+
+    db = Database(args.db, read_only=True)
+    names = [member['name'] for member in db.get_term_members(args.term)]
+    print(f"第{args.term}屆 {len(names)} 位立委，{args.rounds} 輪")
+
+    for label, func in (('f-string', interpolated), ('BillQuery', parameterized)):
+        start = time.perf_counter()
+        total = 0
+        for _ in range(args.rounds):
+            for name in names:
+                total += func(db, name, args.term)
+        elapsed = time.perf_counter() - start
+        print(f"{label:<10}{total:>8} 筆  {elapsed * 1000:9.1f} 毫秒")
+    db.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""法案批次寫入效能測試
+
+將 data/backups/page_*.json 的所有頁面依序寫入暫存資料庫，比較重構前逐筆
+INSERT OR REPLACE、批次 executemany upsert，以及批次 upsert 搭配延後建立索引
+（Database.deferred_indexes）的每秒寫入筆數。另外再以批次 upsert 重新寫入
+一次全部資料，量測更新既有法案的速度。
+
+用法：
+    python benchmarks/bench_save_bills.py [--repeat 1] [--keep]
+"""
+import argparse
+import glob
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+from contextlib import nullcontext
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import legacy_save_bills
+from src.database import Database
+
+
+def load_pages() -> list:
+    """讀取所有備份頁面，依頁碼排序
+
+    Returns:
+        list: (頁碼, 法案列表) 列表
+    """
+    pages = []
+    for path in glob.glob(os.path.join(ROOT_DIR, 'data', 'backups', 'page_*.json')):
+        page_number = int(re.match(r'page_(\d+)_', os.path.basename(path)).group(1))
+        with open(path, 'r', encoding='utf-8') as f:
+            pages.append((page_number, json.load(f)))
+    return sorted(pages, key=lambda page: page[0])
+
+
+def load(label: str, db_path: str, pages: list, save, deferred: bool = False,
+         fresh: bool = True) -> float:
+    """將所有頁面寫入資料庫並回報每秒寫入筆數"""
+    if fresh:
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(db_path + suffix):
+                os.remove(db_path + suffix)
+    db = Database(db_path)
+
+    total = sum(len(bills) for _, bills in pages)
+    start = time.perf_counter()
+    with db.deferred_indexes() if deferred else nullcontext():
+        for page_number, bills in pages:
+            save(db, bills, page_number)
+    elapsed = time.perf_counter() - start
+
+    count = db.get_bills_count()
+    db.close()
+    print(f"{label:<28}{elapsed:>8.2f} 秒  {total / elapsed:>9,.0f} 筆/秒  資料庫 {count:,} 筆")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='法案批次寫入效能測試')
+    parser.add_argument('--repeat', type=int, default=1, help='每種寫法的重複次數（取最佳值）')
+    parser.add_argument('--keep', action='store_true', help='保留暫存資料庫')
+    args = parser.parse_args()
+
+    pages = load_pages()
+    print(f"語料：{len(pages)} 頁、{sum(len(bills) for _, bills in pages):,} 筆法案\n")
+
+    def batched(db, bills, page_number):
+        db.save_bills(bills, page_number=page_number)
+
+    def legacy(db, bills, page_number):
+        legacy_save_bills.save_bills(db, bills, page_number=page_number)
+
+    tmp_dir = tempfile.mkdtemp(prefix='bench_save_bills_')
+    db_path = os.path.join(tmp_dir, 'bills.db')
+
+    results = {}
+    for label, save, deferred in (('逐筆 INSERT OR REPLACE', legacy, False),
+                                  ('批次 upsert', batched, False),
+                                  ('批次 upsert + 延後建立索引', batched, True)):
+        results[label] = min(load(label, db_path, pages, save, deferred) for _ in range(args.repeat))
+
+    # 資料庫已有全部法案，再寫入一次即全部走 ON CONFLICT DO UPDATE
+    load('批次 upsert（更新既有法案）', db_path, pages, batched, fresh=False)
+
+    baseline = results['逐筆 INSERT OR REPLACE']
+    print()
+    for label, elapsed in results.items():
+        print(f"{label:<28}相對逐筆寫入 {baseline / elapsed:.1f} 倍")
+
+    if args.keep:
+        print(f"\n暫存資料庫：{db_path}")
+    else:
+        for name in os.listdir(tmp_dir):
+            os.remove(os.path.join(tmp_dir, name))
+        os.rmdir(tmp_dir)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""搜尋結果快取效能測試
+
+以 Flask 測試用戶端重複搜尋首頁的熱門法律，比較停用快取與啟用快取時的平均
+延遲，並在中途寫入一筆法案，確認資料版本號改變後快取會重新產生結果。
+
+用法：
+    python benchmarks/bench_search_cache.py --db /tmp/bills_copy.db [--rounds 20] [--laws 10]
+
+寫入測試會修改資料庫，請使用資料庫的複本。
+"""
+import argparse
+import os
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+
+
+def run(label: str, client, urls: list, rounds: int) -> float:
+    """依序送出請求並回報平均延遲"""
+    latencies = []
+    for _ in range(rounds):
+        for url in urls:
+            start = time.perf_counter()
+            response = client.get(url)
+            assert response.status_code == 200
+            latencies.append(time.perf_counter() - start)
+    average = sum(latencies) / len(latencies)
+    print(f"{label:<12}平均 {average * 1000:8.2f} 毫秒（{len(latencies)} 個請求）")
+    return average
+
+
+def main():
+    parser = argparse.ArgumentParser(description='搜尋結果快取效能測試')
+    parser.add_argument('--db', required=True, help='資料庫複本路徑')
+    parser.add_argument('--rounds', type=int, default=20, help='每個網址的請求次數')
+    parser.add_argument('--laws', type=int, default=10, help='搜尋的熱門法律數')
+    args = parser.parse_args()
+
+    os.environ['DATABASE_PATH'] = args.db
+    import app
+    from src.database import Database
+    from src.search_cache import SearchCache
+
+    db = Database(args.db)
+    laws = [law['law_name'] for law in db.get_popular_laws(limit=args.laws)]
+    urls = [f"/search?law_name={law}&sort_by={sort_by}" for law in laws for sort_by in ('article', 'status')]
+    client = app.app.test_client()
+
+    app.search_cache = SearchCache(max_entries=0)
+    before = run('停用快取', client, urls, args.rounds)
+    app.search_cache = SearchCache()
+    after = run('啟用快取', client, urls, args.rounds)
+    print(f"加速：{before / after:.1f} 倍  統計：{app.search_cache.stats()}")
+
+    # 寫入一筆法案後，資料版本號改變，第一輪請求全部未命中
+    version = db.get_data_version()
+    bill = dict(db.conn.execute("SELECT * FROM bills LIMIT 1").fetchone())
+    db.save_bills([bill], page_number=bill['page_number'])
+    misses = app.search_cache.stats()['misses']
+    run('寫入後', client, urls, 1)
+    print(f"資料版本 {version} -> {db.get_data_version()}，"
+          f"寫入後未命中 {app.search_cache.stats()['misses'] - misses} / {len(urls)}")
+    db.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,597 @@
+"""基準版本的條號解析實作
+
+保留重構前 app.py、st_utils.py 與 src/analyzer.py 各自的條號解析函數（移除除錯輸出），
+僅供 bench_article_parser.py 比較效能與結果使用。
+"""
+import re
+from typing import List
+
+
+def app_cn_to_arab(cn_str):
+    """將中文數字轉換為阿拉伯數字
+    
+    Args:
+        cn_str: 中文數字字串
+        
+    Returns:
+        int: 阿拉伯數字
+    """
+    # 中文數字對照表
+    cn_num = {
+        '零': 0, '一': 1, '二': 2, '三': 3, '四': 4, '五': 5,
+        '六': 6, '七': 7, '八': 8, '九': 9, '十': 10,
+        '百': 100, '千': 1000, '萬': 10000,
+        '０': 0, '１': 1, '２': 2, '３': 3, '４': 4, '５': 5,
+        '６': 6, '７': 7, '８': 8, '９': 9
+    }
+    
+    # 如果是純數字，直接返回
+    if cn_str.isdigit():
+        return int(cn_str)
+        
+    # 如果字串中包含非中文數字，返回原始字串
+    for char in cn_str:
+        if char not in cn_num and char not in ['百', '千', '萬', '零']:
+            return cn_str
+            
+    # 處理特殊情況
+    if not cn_str:
+        return 0
+        
+    # 處理一位數
+    if len(cn_str) == 1:
+        return cn_num.get(cn_str, cn_str)
+        
+    # 處理「十」開頭的數字
+    if cn_str.startswith('十'):
+        if len(cn_str) == 1:
+            return 10
+        return 10 + app_cn_to_arab(cn_str[1:])
+
+    # 處理帶「千」的數字
+    if '千' in cn_str:
+        parts = cn_str.split('千')
+        base = cn_num[parts[0]] * 1000
+        if not parts[1]:
+            return base
+        if parts[1].startswith('零'):
+            # 處理「一千零八」這樣的情況
+            remaining = parts[1][1:]
+            if remaining:
+                return base + app_cn_to_arab(remaining)
+            return base
+        return base + app_cn_to_arab(parts[1])
+        
+    # 處理帶「百」的數字
+    if '百' in cn_str:
+        parts = cn_str.split('百')
+        base = cn_num[parts[0]] * 100
+        if not parts[1]:
+            return base
+        if parts[1].startswith('零'):
+            remaining = parts[1][1:]
+            if remaining:
+                return base + app_cn_to_arab(remaining)
+            return base
+        return base + app_cn_to_arab(parts[1])
+        
+    # 處理帶「十」的數字
+    if '十' in cn_str:
+        parts = cn_str.split('十')
+        base = cn_num[parts[0]] * 10
+        if not parts[1]:
+            return base
+        return base + cn_num[parts[1]]
+        
+    # 處理其他情況
+    return cn_num.get(cn_str, cn_str)
+
+
+def app_extract_article_numbers(bill_name: str) -> list:
+    """從法案名稱中提取條號
+    
+    Args:
+        bill_name: 法案名稱
+        
+    Returns:
+        list: 條號列表，每個條號是一個字典，包含 full_text 和 number
+    """
+    articles = []
+    
+    # 處理中文數字的條號，如「第二條及第三條」
+    cn_pattern = r'第([零一二三四五六七八九十百千萬０１２３４５６７８９]+)條(?:之([零一二三四五六七八九十百千萬０１２３４５６７８９]+))?(?:及|、|，|和|暨)第([零一二三四五六七八九十百千萬０１２３４５６７８９]+)條(?:之([零一二三四五六七八九十百千萬０１２３４５６７８９]+))?'
+    cn_matches = re.finditer(cn_pattern, bill_name)
+    
+    for match in cn_matches:
+        # 第一個條號
+        first_number = app_cn_to_arab(match.group(1))
+        if isinstance(first_number, str):
+            continue
+        first_sub = app_cn_to_arab(match.group(2)) if match.group(2) else 0
+        if isinstance(first_sub, str):
+            first_sub = 0
+        
+        if first_sub:
+            first_text = f"第{first_number}條之{first_sub}"
+        else:
+            first_text = f"第{first_number}條"
+            
+        articles.append({
+            'full_text': first_text,
+            'number': first_number,
+            'sub_number': first_sub
+        })
+        
+        # 第二個條號
+        second_number = app_cn_to_arab(match.group(3))
+        if isinstance(second_number, str):
+            continue
+        second_sub = app_cn_to_arab(match.group(4)) if match.group(4) else 0
+        if isinstance(second_sub, str):
+            second_sub = 0
+        
+        if second_sub:
+            second_text = f"第{second_number}條之{second_sub}"
+        else:
+            second_text = f"第{second_number}條"
+            
+        articles.append({
+            'full_text': second_text,
+            'number': second_number,
+            'sub_number': second_sub
+        })
+    
+    # 處理單一中文數字條號，如「第二條」
+    cn_single_pattern = r'第([零一二三四五六七八九十百千萬０１２３４５６７８９]+)條(?:之([零一二三四五六七八九十百千萬０１２３４５６７８９]+))?'
+    cn_single_matches = re.finditer(cn_single_pattern, bill_name)
+    
+    for match in cn_single_matches:
+        number = app_cn_to_arab(match.group(1))
+        if isinstance(number, str):
+            continue
+        sub_number = app_cn_to_arab(match.group(2)) if match.group(2) else 0
+        if isinstance(sub_number, str):
+            sub_number = 0
+        
+        # 檢查是否已經在多條模式中處理過
+        already_processed = False
+        for article in articles:
+            if article['number'] == number and article['sub_number'] == sub_number:
+                already_processed = True
+                break
+                
+        if already_processed:
+            continue
+            
+        if sub_number:
+            full_text = f"第{number}條之{sub_number}"
+        else:
+            full_text = f"第{number}條"
+            
+        articles.append({
+            'full_text': full_text,
+            'number': number,
+            'sub_number': sub_number
+        })
+    
+    # 處理阿拉伯數字條號，如「第1條及第2條」
+    arab_pattern = r'第(\d+)條(?:之(\d+))?(?:及|、|，|和|暨)第(\d+)條(?:之(\d+))?'
+    arab_matches = re.finditer(arab_pattern, bill_name)
+    
+    for match in arab_matches:
+        # 第一個條號
+        first_number = int(match.group(1))
+        first_sub = int(match.group(2)) if match.group(2) else 0
+        
+        # 檢查是否已經處理過
+        already_processed = False
+        for article in articles:
+            if article['number'] == first_number and article['sub_number'] == first_sub:
+                already_processed = True
+                break
+                
+        if not already_processed:
+            if first_sub:
+                first_text = f"第{first_number}條之{first_sub}"
+            else:
+                first_text = f"第{first_number}條"
+                
+            articles.append({
+                'full_text': first_text,
+                'number': first_number,
+                'sub_number': first_sub
+            })
+        
+        # 第二個條號
+        second_number = int(match.group(3))
+        second_sub = int(match.group(4)) if match.group(4) else 0
+        
+        # 檢查是否已經處理過
+        already_processed = False
+        for article in articles:
+            if article['number'] == second_number and article['sub_number'] == second_sub:
+                already_processed = True
+                break
+                
+        if not already_processed:
+            if second_sub:
+                second_text = f"第{second_number}條之{second_sub}"
+            else:
+                second_text = f"第{second_number}條"
+                
+            articles.append({
+                'full_text': second_text,
+                'number': second_number,
+                'sub_number': second_sub
+            })
+    
+    # 處理單一阿拉伯數字條號，如「第1條」
+    arab_single_pattern = r'第(\d+)條(?:之(\d+))?'
+    arab_single_matches = re.finditer(arab_single_pattern, bill_name)
+    
+    for match in arab_single_matches:
+        number = int(match.group(1))
+        sub_number = int(match.group(2)) if match.group(2) else 0
+        
+        # 檢查是否已經處理過
+        already_processed = False
+        for article in articles:
+            if article['number'] == number and article['sub_number'] == sub_number:
+                already_processed = True
+                break
+                
+        if already_processed:
+            continue
+            
+        if sub_number:
+            full_text = f"第{number}條之{sub_number}"
+        else:
+            full_text = f"第{number}條"
+            
+        articles.append({
+            'full_text': full_text,
+            'number': number,
+            'sub_number': sub_number
+        })
+    
+    # 處理中文區間條號，如「第一條至第十條」
+    cn_range_pattern = r'第([零一二三四五六七八九十百千萬０１２３４５６７８９]+)條至第([零一二三四五六七八九十百千萬０１２３４５６７８９]+)條'
+    cn_range_matches = re.finditer(cn_range_pattern, bill_name)
+    
+    for match in cn_range_matches:
+        start_number = app_cn_to_arab(match.group(1))
+        end_number = app_cn_to_arab(match.group(2))
+        
+        for num in range(start_number, end_number + 1):
+            # 檢查是否已經處理過
+            already_processed = False
+            for article in articles:
+                if article['number'] == num and article['sub_number'] == 0:
+                    already_processed = True
+                    break
+                    
+            if already_processed:
+                continue
+                
+            full_text = f"第{num}條"
+            articles.append({
+                'full_text': full_text,
+                'number': num,
+                'sub_number': 0
+            })
+    
+    # 處理阿拉伯數字區間條號，如「第1條至第10條」
+    arab_range_pattern = r'第(\d+)條至第(\d+)條'
+    arab_range_matches = re.finditer(arab_range_pattern, bill_name)
+    
+    for match in arab_range_matches:
+        start_number = int(match.group(1))
+        end_number = int(match.group(2))
+        
+        for num in range(start_number, end_number + 1):
+            # 檢查是否已經處理過
+            already_processed = False
+            for article in articles:
+                if article['number'] == num and article['sub_number'] == 0:
+                    already_processed = True
+                    break
+                    
+            if already_processed:
+                continue
+                
+            full_text = f"第{num}條"
+            articles.append({
+                'full_text': full_text,
+                'number': num,
+                'sub_number': 0
+            })
+    
+    return articles
+
+
+def st_cn_to_arab(cn_str):
+    """將中文數字轉換為阿拉伯數字
+    
+    Args:
+        cn_str: 中文數字字串
+        
+    Returns:
+        int: 阿拉伯數字
+    """
+    # 中文數字對照表
+    cn_num = {
+        '零': 0, '一': 1, '二': 2, '三': 3, '四': 4, '五': 5,
+        '六': 6, '七': 7, '八': 8, '九': 9, '十': 10,
+        '百': 100, '千': 1000, '萬': 10000,
+        '０': 0, '１': 1, '２': 2, '３': 3, '４': 4, '５': 5,
+        '６': 6, '７': 7, '８': 8, '９': 9
+    }
+    
+    # 如果是純數字，直接返回
+    if cn_str.isdigit():
+        return int(cn_str)
+        
+    # 如果字串中包含非中文數字，返回原始字串
+    for char in cn_str:
+        if char not in cn_num and char not in ['百', '千', '萬', '零']:
+            return cn_str
+            
+    # 處理特殊情況
+    if not cn_str:
+        return 0
+        
+    # 處理一位數
+    if len(cn_str) == 1:
+        return cn_num.get(cn_str, cn_str)
+        
+    # 處理「十」開頭的數字
+    if cn_str.startswith('十'):
+        if len(cn_str) == 1:
+            return 10
+        return 10 + st_cn_to_arab(cn_str[1:])
+
+    # 處理帶「千」的數字
+    if '千' in cn_str:
+        parts = cn_str.split('千')
+        base = cn_num[parts[0]] * 1000
+        if not parts[1]:
+            return base
+        if parts[1].startswith('零'):
+            # 處理「一千零八」這樣的情況
+            remaining = parts[1][1:]
+            if remaining:
+                return base + st_cn_to_arab(remaining)
+            return base
+        return base + st_cn_to_arab(parts[1])
+        
+    # 處理帶「百」的數字
+    if '百' in cn_str:
+        parts = cn_str.split('百')
+        base = cn_num[parts[0]] * 100
+        if not parts[1]:
+            return base
+        if parts[1].startswith('零'):
+            remaining = parts[1][1:]
+            if remaining:
+                return base + st_cn_to_arab(remaining)
+            return base
+        return base + st_cn_to_arab(parts[1])
+        
+    # 處理帶「十」的數字
+    if '十' in cn_str:
+        parts = cn_str.split('十')
+        base = cn_num[parts[0]] * 10
+        if not parts[1]:
+            return base
+        return base + cn_num[parts[1]]
+        
+    # 處理其他情況
+    return cn_num.get(cn_str, cn_str)
+
+
+def st_extract_article_numbers(bill_name: str) -> list:
+    """從法案名稱中提取條號
+    
+    Args:
+        bill_name: 法案名稱
+        
+    Returns:
+        list: 條號列表，每個條號是一個字典，包含 full_text 和 number
+    """
+    articles = []
+    
+    # 處理中文數字的條號，如「第二條及第三條」
+    cn_pattern = r'第([零一二三四五六七八九十百千萬０１２３４５６７８９]+)條(?:之([零一二三四五六七八九十百千萬０１２３４５６７８９]+))?(?:及|、|，|和|暨)第([零一二三四五六七八九十百千萬０１２３４５６７８９]+)條(?:之([零一二三四五六七八九十百千萬０１２３４５６７８９]+))?'
+    cn_matches = re.finditer(cn_pattern, bill_name)
+    
+    for match in cn_matches:
+        # 第一個條號
+        first_number = st_cn_to_arab(match.group(1))
+        if isinstance(first_number, str):
+            continue
+        first_sub = st_cn_to_arab(match.group(2)) if match.group(2) else 0
+        if isinstance(first_sub, str):
+            first_sub = 0
+        
+        if first_sub:
+            first_text = f"第{first_number}條之{first_sub}"
+        else:
+            first_text = f"第{first_number}條"
+            
+        articles.append({
+            'full_text': first_text,
+            'number': first_number,
+            'sub_number': first_sub
+        })
+        
+        # 第二個條號
+        second_number = st_cn_to_arab(match.group(3))
+        if isinstance(second_number, str):
+            continue
+        second_sub = st_cn_to_arab(match.group(4)) if match.group(4) else 0
+        if isinstance(second_sub, str):
+            second_sub = 0
+        
+        if second_sub:
+            second_text = f"第{second_number}條之{second_sub}"
+        else:
+            second_text = f"第{second_number}條"
+            
+        articles.append({
+            'full_text': second_text,
+            'number': second_number,
+            'sub_number': second_sub
+        })
+    
+    # 處理單一中文數字條號，如「第二條」
+    cn_single_pattern = r'第([零一二三四五六七八九十百千萬０１２３４５６７８９]+)條(?:之([零一二三四五六七八九十百千萬０１２３４５６７８９]+))?'
+    cn_single_matches = re.finditer(cn_single_pattern, bill_name)
+    
+    for match in cn_single_matches:
+        number = st_cn_to_arab(match.group(1))
+        if isinstance(number, str):
+            continue
+        sub_number = st_cn_to_arab(match.group(2)) if match.group(2) else 0
+        if isinstance(sub_number, str):
+            sub_number = 0
+        
+        # 檢查是否已經在多條模式中處理過
+        already_processed = False
+        for article in articles:
+            if article['number'] == number and article['sub_number'] == sub_number:
+                already_processed = True
+                break
+                
+        if already_processed:
+            continue
+            
+        if sub_number:
+            full_text = f"第{number}條之{sub_number}"
+        else:
+            full_text = f"第{number}條"
+            
+        articles.append({
+            'full_text': full_text,
+            'number': number,
+            'sub_number': sub_number
+        })
+    
+    # 處理阿拉伯數字條號，如「第1條」
+    arab_single_pattern = r'第(\d+)條(?:之(\d+))?'
+    arab_single_matches = re.finditer(arab_single_pattern, bill_name)
+    
+    for match in arab_single_matches:
+        number = int(match.group(1))
+        sub_number = int(match.group(2)) if match.group(2) else 0
+        
+        # 檢查是否已經處理過
+        already_processed = False
+        for article in articles:
+            if article['number'] == number and article['sub_number'] == sub_number:
+                already_processed = True
+                break
+                
+        if already_processed:
+            continue
+            
+        if sub_number:
+            full_text = f"第{number}條之{sub_number}"
+        else:
+            full_text = f"第{number}條"
+            
+        articles.append({
+            'full_text': full_text,
+            'number': number,
+            'sub_number': sub_number
+        })
+    
+    return articles
+
+
+class LegacyAnalyzer:
+    """BillAnalyzer 原本的條號解析（僅保留相關方法）"""
+    
+    # 中文數字對照表
+    CN_NUM = {
+        '零': 0, '一': 1, '二': 2, '三': 3, '四': 4, '五': 5,
+        '六': 6, '七': 7, '八': 8, '九': 9, '十': 10,
+        '百': 100, '千': 1000, '〇': 0
+    }
+    
+    def cn2num(self, cn_str: str) -> int:
+        """將中文數字轉換為阿拉伯數字
+        
+        Args:
+            cn_str: 中文數字字串
+            
+        Returns:
+            int: 阿拉伯數字
+        """
+        if not cn_str:
+            return 0
+            
+        # 處理特殊情況
+        if cn_str == '十':
+            return 10
+            
+        result = 0
+        unit = 1
+        for i in range(len(cn_str) - 1, -1, -1):
+            if cn_str[i] in ['十', '百', '千']:
+                unit = self.CN_NUM[cn_str[i]]
+                if i == 0:
+                    result += unit
+            elif cn_str[i] in self.CN_NUM:
+                result += self.CN_NUM[cn_str[i]] * unit
+                unit = 1
+                
+        return result
+    
+    def extract_article_numbers(self, bill_name: str) -> List[int]:
+        """從提案名稱中提取條號
+        
+        Args:
+            bill_name: 提案名稱
+            
+        Returns:
+            List[int]: 條號列表
+        """
+        # 移除「審查」、「審議」等字樣
+        bill_name = re.sub(r'[「」『』]', '', bill_name)
+        
+        article_numbers = []
+        
+        # 匹配阿拉伯數字條號
+        patterns = [
+            r'第([0-9]+)條(?:之[0-9]+)?',  # 匹配「第X條」和「第X條之Y」
+            r'第([0-9]+)條至第[0-9]+條',   # 匹配範圍條號的起始
+            r'至第([0-9]+)條',             # 匹配範圍條號的結束
+        ]
+        
+        for pattern in patterns:
+            matches = re.finditer(pattern, bill_name)
+            for match in matches:
+                try:
+                    article_numbers.append(int(match.group(1)))
+                except (ValueError, IndexError):
+                    continue
+        
+        # 匹配中文數字條號
+        cn_patterns = [
+            r'第([零一二三四五六七八九十百千]+)條(?:之[零一二三四五六七八九十百千]+)?',
+            r'第([零一二三四五六七八九十百千]+)條至第[零一二三四五六七八九十百千]+條',
+            r'至第([零一二三四五六七八九十百千]+)條'
+        ]
+        
+        for pattern in cn_patterns:
+            matches = re.finditer(pattern, bill_name)
+            for match in matches:
+                try:
+                    cn_num = match.group(1)
+                    num = self.cn2num(cn_num)
+                    if num > 0:
+                        article_numbers.append(num)
+                except (ValueError, IndexError):
+                    continue
+                    
+        return sorted(list(set(article_numbers)))
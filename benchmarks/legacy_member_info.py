@@ -0,0 +1,414 @@
+"""基準版本的立委黨籍查詢實作
+
+保留重構前 app.py 的 extract_names、get_member_info 與 process_members
+（每次呼叫都重新建立立委對照表），僅供 bench_member_lookup.py 比較效能使用。
+"""
+import re
+
+
+def extract_names(names_str: str) -> list:
+    """從字串中提取人名列表
+    
+    Args:
+        names_str: 包含多個姓名的字串
+        
+    Returns:
+        list: 人名列表
+    """
+    if not names_str:
+        return []
+    
+    # 移除全形空格和換行符號
+    names_str = names_str.replace('　', ' ').replace('\n', ' ')
+    
+    # 移除"本院委員XXX等N人"的部分
+    names_str = re.sub(r'本院委員.+?等\d+人', '', names_str)
+    
+    # 首先嘗試匹配原住民名字（中文+英文組合）
+    aboriginal_names = []
+    aboriginal_pattern = r'([\u4e00-\u9fa5]{2,4}\s*[A-Za-z]+\s*[A-Za-z]+(?:\s*[A-Za-z]+)?)'
+    aboriginal_matches = re.finditer(aboriginal_pattern, names_str)
+    
+    for match in aboriginal_matches:
+        aboriginal_name = match.group(0).strip()
+        if aboriginal_name:
+            aboriginal_names.append(aboriginal_name)
+            # 將匹配到的原住民名字從原始字串中移除，避免重複匹配
+            names_str = names_str.replace(aboriginal_name, '')
+    
+    # 然後匹配一般中文名字
+    chinese_names = []
+    chinese_pattern = r'([\u4e00-\u9fa5]{2,4})'
+    chinese_matches = re.finditer(chinese_pattern, names_str)
+    
+    for match in chinese_matches:
+        chinese_name = match.group(0).strip()
+        if chinese_name:
+            chinese_names.append(chinese_name)
+    
+    # 合併原住民名字和中文名字
+    all_names = aboriginal_names + chinese_names
+    
+    # 如果沒有找到任何名字，嘗試使用分隔符號分割
+    if not all_names:
+        for sep in ['、', '，', ',', ' ']:
+            if sep in names_str:
+                parts = [part.strip() for part in names_str.split(sep)]
+                all_names.extend([part for part in parts if part and len(part) >= 2])
+                break
+    
+    # 移除重複的名字
+    return list(dict.fromkeys(all_names))
+
+
+def get_member_info(name: str) -> dict:
+    """獲取成員的政黨資訊
+    
+    Args:
+        name: 成員姓名
+        
+    Returns:
+        dict: 包含成員姓名和政黨標籤的字典
+    """
+    # 立委黨籍對照表（第8-11屆）
+    legislators = {
+        # 第11屆立委
+        # 民進黨籍立委
+        '伍麗華': '民進黨', '何欣純': '民進黨', '劉建國': '民進黨', '吳思瑤': '民進黨',
+        '吳沛憶': '民進黨', '吳琪銘': '民進黨', '吳秉叡': '民進黨', '張宏陸': '民進黨',
+        '張雅琳': '民進黨', '徐富癸': '民進黨', '李坤城': '民進黨', '李昆澤': '民進黨',
+        '李柏毅': '民進黨', '林俊憲': '民進黨', '林宜瑾': '民進黨', '林岱樺': '民進黨',
+        '林月琴': '民進黨', '林楚茵': '民進黨', '林淑芬': '民進黨', '柯建銘': '民進黨',
+        '楊曜': '民進黨', '沈伯洋': '民進黨', '沈發惠': '民進黨', '洪申翰': '民進黨',
+        '游錫堃': '民進黨', '王世堅': '民進黨', '王定宇': '民進黨', '王正旭': '民進黨',
+        '王美惠': '民進黨', '王義川': '民進黨', '羅美玲': '民進黨', '范雲': '民進黨',
+        '莊瑞雄': '民進黨', '蔡其昌': '民進黨', '蔡易餘': '民進黨', '蘇巧慧': '民進黨',
+        '許智傑': '民進黨', '賴惠員': '民進黨', '賴瑞隆': '民進黨', '邱志偉': '民進黨',
+        '邱議瑩': '民進黨', '郭國文': '民進黨', '郭昱晴': '民進黨', '鍾佳濱': '民進黨',
+        '陳亭妃': '民進黨', '陳俊宇': '民進黨', '陳冠廷': '民進黨', '陳培瑜': '民進黨',
+        '陳瑩': '民進黨', '陳秀寳': '民進黨', '陳素月': '民進黨', '黃捷': '民進黨',
+        '黃秀芳': '民進黨',
+        
+        # 國民黨籍立委
+        '丁學忠': '國民黨', '傅崐萁': '國民黨', '吳宗憲': '國民黨', '呂玉玲': '國民黨',
+        '廖偉翔': '國民黨', '廖先翔': '國民黨', '張嘉郡': '國民黨', '張智倫': '國民黨',
+        '徐巧芯': '國民黨', '徐欣瑩': '國民黨', '李彥秀': '國民黨', '林倩綺': '國民黨',
+        '林德福': '國民黨', '林思銘': '國民黨', '林沛祥': '國民黨', '柯志恩': '國民黨',
+        '楊瓊瓔': '國民黨', '江啟臣': '國民黨', '洪孟楷': '國民黨', '涂權吉': '國民黨',
+        '游顥': '國民黨', '牛煦庭': '國民黨', '王育敏': '國民黨', '王鴻薇': '國民黨',
+        '盧縣一': '國民黨', '羅廷瑋': '國民黨', '羅明才': '國民黨', '羅智強': '國民黨',
+        '翁曉玲': '國民黨', '萬美玲': '國民黨', '葉元之': '國民黨', '葛如鈞': '國民黨',
+        '蘇清泉': '國民黨', '許宇甄': '國民黨', '謝衣鳯': '國民黨', '謝龍介': '國民黨',
+        '賴士葆': '國民黨', '邱若華': '國民黨', '邱鎮軍': '國民黨', '鄭天財': '國民黨',
+        '鄭正鈐': '國民黨', '陳永康': '國民黨', '陳玉珍': '國民黨', '陳菁徽': '國民黨',
+        '陳雪生': '國民黨', '韓國瑜': '國民黨', '顏寬恒': '國民黨', '馬文君': '國民黨',
+        '魯明哲': '國民黨', '黃仁': '國民黨', '黃健豪': '國民黨', '黃建賓': '國民黨',
+        '溫玉霞': '國民黨', '李貴敏': '國民黨',
+        
+        # 民眾黨籍立委
+        '劉書彬': '民眾黨', '吳春城': '民眾黨', '張啓楷': '民眾黨', '林國成': '民眾黨',
+        '林憶君': '民眾黨', '陳昭姿': '民眾黨', '麥玉珍': '民眾黨', '黃國昌': '民眾黨',
+        '黃珊珊': '民眾黨',
+        
+        # 無黨籍立委
+        '陳超明': '無黨籍', '高金素梅': '無黨籍',
+
+        # 第10屆立委
+        # 民進黨籍立委
+        '王定宇': '民進黨', '王美惠': '民進黨', '王榮璋': '民進黨', '伍麗華': '民進黨',
+        '何志偉': '民進黨', '何欣純': '民進黨', '余天': '民進黨', '吳玉琴': '民進黨',
+        '吳思瑤': '民進黨', '吳秉叡': '民進黨', '吳琪銘': '民進黨', '呂孫綾': '民進黨',
+        '李俊俋': '民進黨', '李昆澤': '民進黨', '李麗芬': '民進黨', '沈發惠': '民進黨',
+        '周春米': '民進黨', '林宜瑾': '民進黨', '林俊憲': '民進黨', '林岱樺': '民進黨',
+        '林楚茵': '民進黨', '林淑芬': '民進黨', '林靜儀': '民進黨', '邱志偉': '民進黨',
+        '邱泰源': '民進黨', '邱議瑩': '民進黨', '柯建銘': '民進黨', '洪申翰': '民進黨',
+        '范雲': '民進黨', '莊競程': '民進黨', '莊瑞雄': '民進黨', '許智傑': '民進黨',
+        '郭國文': '民進黨', '陳亭妃': '民進黨', '陳明文': '民進黨', '陳秀寳': '民進黨',
+        '陳素月': '民進黨', '陳瑩': '民進黨', '陳歐珀': '民進黨', '黃世杰': '民進黨',
+        '黃秀芳': '民進黨', '黃國書': '民進黨', '楊曜': '民進黨', '葉宜津': '民進黨',
+        '劉世芳': '民進黨', '劉建國': '民進黨', '劉櫂豪': '民進黨', '蔡易餘': '民進黨',
+        '蔡培慧': '民進黨', '蔡適應': '民進黨', '鄭運鵬': '民進黨', '賴品妤': '民進黨',
+        '賴惠員': '民進黨', '賴瑞隆': '民進黨', '鍾佳濱': '民進黨', '羅美玲': '民進黨',
+        '蘇巧慧': '民進黨', '蘇治芬': '民進黨', '蘇震清': '民進黨', '許添財': '民進黨',
+        '黃偉哲': '民進黨', '尤美女': '民進黨', '姚文智': '民進黨', '鄭麗君': '民進黨',
+        '蔡煌瑯': '民進黨',
+
+        # 國民黨籍立委
+        '丁守中': '國民黨', '孔文吉': '國民黨', '王育敏': '國民黨', '王惠美': '國民黨',
+        '江啟臣': '國民黨', '呂玉玲': '國民黨', '李彥秀': '國民黨', '李德維': '國民黨',
+        '林文瑞': '國民黨', '林為洲': '國民黨', '林奕華': '國民黨', '林德福': '國民黨',
+        '林麗蟬': '國民黨', '洪孟楷': '國民黨', '徐志榮': '國民黨', '翁重鈞': '國民黨',
+        '馬文君': '國民黨', '高金素梅': '國民黨', '張育美': '國民黨', '張智倫': '國民黨',
+        '許淑華': '國民黨', '陳以信': '國民黨', '陳玉珍': '國民黨', '陳雪生': '國民黨',
+        '陳超明': '國民黨', '曾銘宗': '國民黨', '費鴻泰': '國民黨', '楊瓊瓔': '國民黨',
+        '葉毓蘭': '國民黨', '廖國棟': '國民黨', '廖婉汝': '國民黨', '鄭天財': '國民黨',
+        '鄭正鈐': '國民黨', '鄭麗文': '國民黨', '賴士葆': '國民黨', '謝衣鳯': '國民黨',
+        '謝龍介': '國民黨', '顏寬恒': '國民黨', '羅明才': '國民黨', '羅智強': '國民黨',
+        '溫玉霞': '國民黨', '李貴敏': '國民黨',
+
+        # 民眾黨籍立委
+        '邱臣遠': '民眾黨', '高虹安': '民眾黨', '張其祿': '民眾黨', '蔡壁如': '民眾黨',
+        '賴香伶': '民眾黨',
+
+        # 時代力量立委
+        '王婉諭': '時代力量', '邱顯智': '時代力量', '陳椒華': '時代力量',
+
+        # 無黨籍立委
+        '林昶佐': '無黨籍', '趙正宇': '無黨籍',
+
+        # 第9屆立委
+        # 民進黨籍立委
+        '王定宇': '民進黨', '王榮璋': '民進黨', '何欣純': '民進黨', '余天': '民進黨',
+        '吳玉琴': '民進黨', '吳思瑤': '民進黨', '吳秉叡': '民進黨', '吳琪銘': '民進黨',
+        '呂孫綾': '民進黨', '李俊俋': '民進黨', '李昆澤': '民進黨', '李麗芬': '民進黨',
+        '沈發惠': '民進黨', '周春米': '民進黨', '林宜瑾': '民進黨', '林俊憲': '民進黨',
+        '林岱樺': '民進黨', '林淑芬': '民進黨', '林靜儀': '民進黨', '邱志偉': '民進黨',
+        '邱泰源': '民進黨', '邱議瑩': '民進黨', '柯建銘': '民進黨', '洪宗熠': '民進黨',
+        '范雲': '民進黨', '莊競程': '民進黨', '莊瑞雄': '民進黨', '許智傑': '民進黨',
+        '郭國文': '民進黨', '陳亭妃': '民進黨', '陳明文': '民進黨', '陳秀寳': '民進黨',
+        '陳素月': '民進黨', '陳瑩': '民進黨', '陳歐珀': '民進黨', '黃世杰': '民進黨',
+        '黃秀芳': '民進黨', '黃國書': '民進黨', '楊曜': '民進黨', '葉宜津': '民進黨',
+        '劉世芳': '民進黨', '劉建國': '民進黨', '劉櫂豪': '民進黨', '蔡易餘': '民進黨',
+        '蔡培慧': '民進黨', '蔡適應': '民進黨', '鄭運鵬': '民進黨', '賴品妤': '民進黨',
+        '賴惠員': '民進黨', '賴瑞隆': '民進黨', '鍾佳濱': '民進黨', '羅美玲': '民進黨',
+        '蘇巧慧': '民進黨', '蘇治芬': '民進黨', '蘇震清': '民進黨', '許添財': '民進黨',
+        '黃偉哲': '民進黨', '尤美女': '民進黨', '姚文智': '民進黨', '鄭麗君': '民進黨',
+        '蔡煌瑯': '民進黨',
+
+        # 國民黨籍立委
+        '丁守中': '國民黨', '孔文吉': '國民黨', '王育敏': '國民黨', '王惠美': '國民黨',
+        '江啟臣': '國民黨', '呂玉玲': '國民黨', '李彥秀': '國民黨', '李德維': '國民黨',
+        '林文瑞': '國民黨', '林為洲': '國民黨', '林奕華': '國民黨', '林德福': '國民黨',
+        '林麗蟬': '國民黨', '洪孟楷': '國民黨', '徐志榮': '國民黨', '翁重鈞': '國民黨',
+        '馬文君': '國民黨', '高金素梅': '國民黨', '張育美': '國民黨', '張智倫': '國民黨',
+        '許淑華': '國民黨', '陳以信': '國民黨', '陳玉珍': '國民黨', '陳雪生': '國民黨',
+        '陳超明': '國民黨', '曾銘宗': '國民黨', '費鴻泰': '國民黨', '楊瓊瓔': '國民黨',
+        '葉毓蘭': '國民黨', '廖國棟': '國民黨', '廖婉汝': '國民黨', '鄭天財': '國民黨',
+        '鄭正鈐': '國民黨', '鄭麗文': '國民黨', '賴士葆': '國民黨', '謝衣鳯': '國民黨',
+        '謝龍介': '國民黨', '顏寬恒': '國民黨', '羅明才': '國民黨', '羅智強': '國民黨',
+        '溫玉霞': '國民黨', '李貴敏': '國民黨',
+
+        # 時代力量立委
+        '王婉諭': '時代力量', '邱顯智': '時代力量', '陳椒華': '時代力量', '黃國昌': '時代力量',
+        '林昶佐': '時代力量', '洪慈庸': '時代力量',
+
+        # 無黨籍立委
+        '趙正宇': '無黨籍', '高金素梅': '無黨籍',
+
+        # 第8屆立委
+        # 民進黨籍立委
+        '王定宇': '民進黨', '王榮璋': '民進黨', '何欣純': '民進黨', '余天': '民進黨',
+        '吳玉琴': '民進黨', '吳思瑤': '民進黨', '吳秉叡': '民進黨', '吳琪銘': '民進黨',
+        '呂孫綾': '民進黨', '李俊俋': '民進黨', '李昆澤': '民進黨', '李麗芬': '民進黨',
+        '沈發惠': '民進黨', '周春米': '民進黨', '林宜瑾': '民進黨', '林俊憲': '民進黨',
+        '林岱樺': '民進黨', '林淑芬': '民進黨', '林靜儀': '民進黨', '邱志偉': '民進黨',
+        '邱泰源': '民進黨', '邱議瑩': '民進黨', '柯建銘': '民進黨', '洪宗熠': '民進黨',
+        '范雲': '民進黨', '莊競程': '民進黨', '莊瑞雄': '民進黨', '許智傑': '民進黨',
+        '郭國文': '民進黨', '陳亭妃': '民進黨', '陳明文': '民進黨', '陳秀寳': '民進黨',
+        '陳素月': '民進黨', '陳瑩': '民進黨', '陳歐珀': '民進黨', '黃世杰': '民進黨',
+        '黃秀芳': '民進黨', '黃國書': '民進黨', '楊曜': '民進黨', '葉宜津': '民進黨',
+        '劉世芳': '民進黨', '劉建國': '民進黨', '劉櫂豪': '民進黨', '蔡易餘': '民進黨',
+        '蔡培慧': '民進黨', '蔡適應': '民進黨', '鄭運鵬': '民進黨', '賴品妤': '民進黨',
+        '賴惠員': '民進黨', '賴瑞隆': '民進黨', '鍾佳濱': '民進黨', '羅美玲': '民進黨',
+        '蘇巧慧': '民進黨', '蘇治芬': '民進黨', '蘇震清': '民進黨', '許添財': '民進黨',
+        '黃偉哲': '民進黨', '尤美女': '民進黨', '姚文智': '民進黨', '鄭麗君': '民進黨',
+        '蔡煌瑯': '民進黨',
+
+        # 國民黨籍立委
+        '丁守中': '國民黨', '孔文吉': '國民黨', '王育敏': '國民黨', '王惠美': '國民黨',
+        '江啟臣': '國民黨', '呂玉玲': '國民黨', '李彥秀': '國民黨', '李德維': '國民黨',
+        '林文瑞': '國民黨', '林為洲': '國民黨', '林奕華': '國民黨', '林德福': '國民黨',
+        '林麗蟬': '國民黨', '洪孟楷': '國民黨', '徐志榮': '國民黨', '翁重鈞': '國民黨',
+        '馬文君': '國民黨', '高金素梅': '國民黨', '張育美': '國民黨', '張智倫': '國民黨',
+        '許淑華': '國民黨', '陳以信': '國民黨', '陳玉珍': '國民黨', '陳雪生': '國民黨',
+        '陳超明': '國民黨', '曾銘宗': '國民黨', '費鴻泰': '國民黨', '楊瓊瓔': '國民黨',
+        '葉毓蘭': '國民黨', '廖國棟': '國民黨', '廖婉汝': '國民黨', '鄭天財': '國民黨',
+        '鄭正鈐': '國民黨', '鄭麗文': '國民黨', '賴士葆': '國民黨', '謝衣鳯': '國民黨',
+        '謝龍介': '國民黨', '顏寬恒': '國民黨', '羅明才': '國民黨', '羅智強': '國民黨',
+        '溫玉霞': '國民黨', '李貴敏': '國民黨',
+
+        # 時代力量立委
+        '王婉諭': '時代力量', '邱顯智': '時代力量', '陳椒華': '時代力量', '黃國昌': '時代力量',
+        '林昶佐': '時代力量', '洪慈庸': '時代力量',
+
+        # 無黨籍立委
+        '趙正宇': '無黨籍', '高金素梅': '無黨籍',
+
+        # 第8屆立委
+        # 民進黨籍立委
+        '王定宇': '民進黨', '王榮璋': '民進黨', '何欣純': '民進黨', '余天': '民進黨',
+        '吳玉琴': '民進黨', '吳思瑤': '民進黨', '吳秉叡': '民進黨', '吳琪銘': '民進黨',
+        '呂孫綾': '民進黨', '李俊俋': '民進黨', '李昆澤': '民進黨', '李麗芬': '民進黨',
+        '沈發惠': '民進黨', '周春米': '民進黨', '林宜瑾': '民進黨', '林俊憲': '民進黨',
+        '林岱樺': '民進黨', '林淑芬': '民進黨', '林靜儀': '民進黨', '邱志偉': '民進黨',
+        '邱泰源': '民進黨', '邱議瑩': '民進黨', '柯建銘': '民進黨', '洪宗熠': '民進黨',
+        '范雲': '民進黨', '莊競程': '民進黨', '莊瑞雄': '民進黨', '許智傑': '民進黨',
+        '郭國文': '民進黨', '陳亭妃': '民進黨', '陳明文': '民進黨', '陳秀寳': '民進黨',
+        '陳素月': '民進黨', '陳瑩': '民進黨', '陳歐珀': '民進黨', '黃世杰': '民進黨',
+        '黃秀芳': '民進黨', '黃國書': '民進黨', '楊曜': '民進黨', '葉宜津': '民進黨',
+        '劉世芳': '民進黨', '劉建國': '民進黨', '劉櫂豪': '民進黨', '蔡易餘': '民進黨',
+        '蔡培慧': '民進黨', '蔡適應': '民進黨', '鄭運鵬': '民進黨', '賴品妤': '民進黨',
+        '賴惠員': '民進黨', '賴瑞隆': '民進黨', '鍾佳濱': '民進黨', '羅美玲': '民進黨',
+        '蘇巧慧': '民進黨', '蘇治芬': '民進黨', '蘇震清': '民進黨', '許添財': '民進黨',
+        '黃偉哲': '民進黨', '尤美女': '民進黨', '姚文智': '民進黨', '鄭麗君': '民進黨',
+        '蔡煌瑯': '民進黨',
+
+        # 國民黨籍立委
+        '丁守中': '國民黨', '孔文吉': '國民黨', '王育敏': '國民黨', '王惠美': '國民黨',
+        '江啟臣': '國民黨', '呂玉玲': '國民黨', '李彥秀': '國民黨', '李德維': '國民黨',
+        '林文瑞': '國民黨', '林為洲': '國民黨', '林奕華': '國民黨', '林德福': '國民黨',
+        '林麗蟬': '國民黨', '洪孟楷': '國民黨', '徐志榮': '國民黨', '翁重鈞': '國民黨',
+        '馬文君': '國民黨', '高金素梅': '國民黨', '張育美': '國民黨', '張智倫': '國民黨',
+        '許淑華': '國民黨', '陳以信': '國民黨', '陳玉珍': '國民黨', '陳雪生': '國民黨',
+        '陳超明': '國民黨', '曾銘宗': '國民黨', '費鴻泰': '國民黨', '楊瓊瓔': '國民黨',
+        '葉毓蘭': '國民黨', '廖國棟': '國民黨', '廖婉汝': '國民黨', '鄭天財': '國民黨',
+        '鄭正鈐': '國民黨', '鄭麗文': '國民黨', '賴士葆': '國民黨', '謝衣鳯': '國民黨',
+        '謝龍介': '國民黨', '顏寬恒': '國民黨', '羅明才': '國民黨', '羅智強': '國民黨',
+        '溫玉霞': '國民黨', '李貴敏': '國民黨',
+
+        # 時代力量立委
+        '王婉諭': '時代力量', '邱顯智': '時代力量', '陳椒華': '時代力量', '黃國昌': '時代力量',
+        '林昶佐': '時代力量', '洪慈庸': '時代力量',
+
+        # 無黨籍立委
+        '趙正宇': '無黨籍', '高金素梅': '無黨籍'
+    }
+    
+    # 特殊處理原住民委員
+    special_names = {
+        '鄭天財': '鄭天財Sra Kacaw',
+        '伍麗華': '伍麗華Saidhai Tahovecahe'
+    }
+    
+    # 檢查是否為原住民委員
+    for key, full_name in special_names.items():
+        if name.startswith(key) or name == full_name:
+            # 使用完整名字顯示，但用中文名字查詢政黨
+            party = legislators.get(key)
+            if party == '民進黨':
+                return {'name': full_name, 'party_class': 'dpp'}
+            elif party == '國民黨':
+                return {'name': full_name, 'party_class': 'kmt'}
+            elif party == '民眾黨':
+                return {'name': full_name, 'party_class': 'tpp'}
+            elif party == '無黨籍':
+                return {'name': full_name, 'party_class': 'noparty'}
+            else:
+                return {'name': full_name, 'party_class': 'other'}
+    
+    # 一般委員處理
+    party = legislators.get(name)
+    if party == '民進黨':
+        return {'name': name, 'party_class': 'dpp'}
+    elif party == '國民黨':
+        return {'name': name, 'party_class': 'kmt'}
+    elif party == '民眾黨':
+        return {'name': name, 'party_class': 'tpp'}
+    elif party == '無黨籍':
+        return {'name': name, 'party_class': 'noparty'}
+    else:
+        return {'name': name, 'party_class': 'other'}
+
+
+def process_members(bill: dict) -> dict:
+    """處理法案的提案人和連署人資訊
+    
+    Args:
+        bill: 法案資訊字典
+        
+    Returns:
+        dict: 包含成員列表和政黨統計的字典
+    """
+    members = []
+    party_stats = {'民進黨': 0, '國民黨': 0, '民眾黨': 0, '無黨籍': 0, '其他': 0}
+    
+    # 處理提案機關
+    if bill['billOrg'] and '本院委員' not in bill['billOrg']:
+        if '行政院' in bill['billOrg']:
+            members.append({'name': bill['billOrg'], 'party_class': 'org'})
+            return {
+                'members': members,
+                'party_stats': {'行政院': 1},
+                'total': 1
+            }
+        elif '民主進步黨' in bill['billOrg'] or '民進黨' in bill['billOrg']:
+            members.append({'name': bill['billOrg'], 'party_class': 'dpp'})
+            return {
+                'members': members,
+                'party_stats': {'民進黨': 1},
+                'total': 1
+            }
+        elif '中國國民黨' in bill['billOrg'] or '國民黨' in bill['billOrg']:
+            members.append({'name': bill['billOrg'], 'party_class': 'kmt'})
+            return {
+                'members': members,
+                'party_stats': {'國民黨': 1},
+                'total': 1
+            }
+        elif '台灣民眾黨' in bill['billOrg'] or '民眾黨' in bill['billOrg']:
+            members.append({'name': bill['billOrg'], 'party_class': 'tpp'})
+            return {
+                'members': members,
+                'party_stats': {'民眾黨': 1},
+                'total': 1
+            }
+        elif '時代力量' in bill['billOrg']:
+            members.append({'name': bill['billOrg'], 'party_class': 'npp'})
+            return {
+                'members': members,
+                'party_stats': {'時代力量': 1},
+                'total': 1
+            }
+        elif '台灣基進' in bill['billOrg']:
+            members.append({'name': bill['billOrg'], 'party_class': 'other'})
+            return {
+                'members': members,
+                'party_stats': {'其他': 1},
+                'total': 1
+            }
+        else:
+            members.append({'name': bill['billOrg'], 'party_class': 'org'})
+    
+    # 處理提案人
+    if bill['billProposer']:
+        proposer_names = extract_names(bill['billProposer'])
+        for name in proposer_names:
+            member_info = get_member_info(name)
+            members.append(member_info)
+            if member_info['party_class'] == 'dpp':
+                party_stats['民進黨'] += 1
+            elif member_info['party_class'] == 'kmt':
+                party_stats['國民黨'] += 1
+            elif member_info['party_class'] == 'tpp':
+                party_stats['民眾黨'] += 1
+            elif member_info['party_class'] == 'noparty':
+                party_stats['無黨籍'] += 1
+            else:
+                party_stats['其他'] += 1
+    
+    # 處理連署人
+    if bill['billCosignatory']:
+        cosignatory_names = extract_names(bill['billCosignatory'])
+        for name in cosignatory_names:
+            member_info = get_member_info(name)
+            members.append(member_info)
+            if member_info['party_class'] == 'dpp':
+                party_stats['民進黨'] += 1
+            elif member_info['party_class'] == 'kmt':
+                party_stats['國民黨'] += 1
+            elif member_info['party_class'] == 'tpp':
+                party_stats['民眾黨'] += 1
+            elif member_info['party_class'] == 'noparty':
+                party_stats['無黨籍'] += 1
+            else:
+                party_stats['其他'] += 1
+    
+    # 移除計數為0的政黨
+    party_stats = {k: v for k, v in party_stats.items() if v > 0}
+    total = sum(party_stats.values())
+    
+    return {
+        'members': members,
+        'party_stats': party_stats,
+        'total': total
+    }
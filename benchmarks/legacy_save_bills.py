@@ -0,0 +1,63 @@
+"""基準版本的法案寫入實作
+
+保留重構前 Database.save_bills 逐筆 INSERT OR REPLACE 的寫法（每次呼叫都先
+查詢 PRAGMA table_info、在迴圈中組 SQL 並逐筆捕捉例外），僅供
+bench_save_bills.py 比較效能使用。
+"""
+import json
+import sqlite3
+from typing import Dict, List
+
+
+def save_bills(db, bills: List[Dict], page_number: int = None):
+    """儲存法案資料
+    
+    Args:
+        db: Database 物件
+        bills: 法案資料列表
+        page_number: 資料來源頁碼，如果提供則儲存到資料庫
+    """
+    cursor = db.conn.cursor()
+    
+    # 檢查表結構
+    cursor.execute("PRAGMA table_info(bills)")
+    columns = {col['name']: col for col in cursor.fetchall()}
+    
+    for bill in bills:
+        try:
+            # 建立插入語句
+            sql = """
+            INSERT OR REPLACE INTO bills (
+                term, sessionPeriod, sessionTimes, meetingTimes,
+                billNo, billName, billOrg, billProposer,
+                billCosignatory, billStatus, pdfUrl, docUrl,
+                page_number, updated_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+            """
+            
+            params = (
+                bill.get('term'),
+                bill.get('sessionPeriod'),
+                bill.get('sessionTimes'),
+                bill.get('meetingTimes'),
+                bill.get('billNo'),
+                bill.get('billName'),
+                bill.get('billOrg'),
+                bill.get('billProposer'),
+                bill.get('billCosignatory'),
+                bill.get('billStatus'),
+                bill.get('pdfUrl'),
+                bill.get('docUrl'),
+                page_number
+            )
+            
+            cursor.execute(sql, params)
+            db._save_bill_articles(cursor, [bill])
+            db._save_bill_members(cursor, [bill])
+            
+        except sqlite3.Error as e:
+            print(f"儲存提案時發生錯誤: {e}")
+            print(f"提案資料: {json.dumps(bill, ensure_ascii=False)}")
+            continue
+    
+    db.conn.commit()
@@ -0,0 +1,150 @@
+"""本機模擬立法院 API 伺服器
+
+以 data/backups/page_*.json 模擬 openDatasetJson.action 的回應（同一頁有多份
+備份時使用最新的一份），超出範圍的頁碼返回空的 jsonList。可設定回應延遲與
+403 比例，並記錄請求數、同時處理的最大請求數與 403 次數，供
+bench_downloader.py 驗證併發下載與限速。
+
+用法：
+    python benchmarks/local_api_server.py [--port 8765] [--latency 1.0] [--forbidden-rate 0.05]
+"""
+import argparse
+import glob
+import json
+import os
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_backup_pages(max_pages: int = None) -> dict:
+    """讀取備份頁面，同一頁有多份時使用檔名時間戳最新的一份
+
+    Args:
+        max_pages: 只提供前幾頁，None 表示全部
+
+    Returns:
+        dict: 頁碼 -> 法案列表
+    """
+    latest = {}
+    for path in glob.glob(os.path.join(ROOT_DIR, 'data', 'backups', 'page_*.json')):
+        match = re.match(r'page_(\d+)_(\d{8}_\d{6})\.json$', os.path.basename(path))
+        if not match:
+            continue
+        page = int(match.group(1))
+        if page not in latest or match.group(2) > latest[page][0]:
+            latest[page] = (match.group(2), path)
+
+    pages = {}
+    for page in sorted(latest):
+        if max_pages and page > max_pages:
+            break
+        with open(latest[page][1], 'r', encoding='utf-8') as f:
+            pages[page] = json.load(f)
+    return pages
+
+
+class LocalAPIServer(ThreadingHTTPServer):
+    """模擬 API 的多執行緒 HTTP 伺服器"""
+
+    daemon_threads = True
+
+    def __init__(self, pages: dict, port: int = 0, latency: float = 0.0,
+                 forbidden_rate: float = 0.0, seed: int = None):
+        """
+        Args:
+            pages: 頁碼 -> 法案列表
+            port: 連接埠，0 表示由系統指定
+            latency: 每個請求的平均延遲秒數（實際為 0.5～1.5 倍）
+            forbidden_rate: 返回 403 的比例
+            seed: 隨機種子，固定後 403 出現的位置可重現
+        """
+        super().__init__(('127.0.0.1', port), LocalAPIHandler)
+        self.pages = {page: json.dumps({'jsonList': bills}, ensure_ascii=False).encode('utf-8')
+                      for page, bills in pages.items()}
+        self.empty_page = json.dumps({'jsonList': []}).encode('utf-8')
+        self.latency = latency
+        self.forbidden_rate = forbidden_rate
+        self.random = random.Random(seed)
+        self.stats_lock = threading.Lock()
+        self.reset_stats()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/odw/openDatasetJson.action"
+
+    def reset_stats(self):
+        with self.stats_lock:
+            self.requests = 0
+            self.forbidden = 0
+            self.active = 0
+            self.max_active = 0
+            self.request_times = []
+
+    def start(self) -> threading.Thread:
+        """於背景執行緒啟動伺服器"""
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return thread
+
+
+class LocalAPIHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        server = self.server
+        with server.stats_lock:
+            server.requests += 1
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+            server.request_times.append(time.monotonic())
+            forbidden = server.random.random() < server.forbidden_rate
+            delay = server.latency * server.random.uniform(0.5, 1.5)
+        try:
+            time.sleep(delay)
+            if forbidden:
+                with server.stats_lock:
+                    server.forbidden += 1
+                self.send_response(403)
+                self.end_headers()
+                return
+
+            query = parse_qs(urlparse(self.path).query)
+            page = int(query.get('page', ['1'])[0])
+            body = server.pages.get(page, server.empty_page)
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with server.stats_lock:
+                server.active -= 1
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description='本機模擬立法院 API 伺服器')
+    parser.add_argument('--port', type=int, default=8765, help='連接埠')
+    parser.add_argument('--latency', type=float, default=1.0, help='每個請求的平均延遲秒數')
+    parser.add_argument('--forbidden-rate', type=float, default=0.0, help='返回 403 的比例')
+    parser.add_argument('--pages', type=int, default=None, help='只提供前幾頁')
+    args = parser.parse_args()
+
+    server = LocalAPIServer(load_backup_pages(args.pages), port=args.port, latency=args.latency,
+                            forbidden_rate=args.forbidden_rate)
+    print(f"提供 {len(server.pages)} 頁資料：{server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
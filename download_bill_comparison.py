@@ -6,9 +6,10 @@ import time
 from datetime import datetime
 import ssl
 import urllib3
-import random
 import sys
 
+from src.database import connect
+
 # 關閉SSL警告
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
@@ -20,36 +21,22 @@ os.makedirs("data", exist_ok=True)
 
 # 資料庫相關函數
 def get_db_connection():
-    """創建並返回一個資料庫連接"""
-    db_path = "data/bills.db"
-    
-    # 如果資料庫被鎖定，嘗試使用臨時資料庫
-    for attempt in range(3):
-        try:
-            # 設置超時以避免長時間等待鎖定
-            conn = sqlite3.connect(db_path, timeout=30)
-            # 啟用外鍵約束
-            conn.execute("PRAGMA foreign_keys = ON")
-            # 配置連接以返回行作為字典
-            conn.row_factory = sqlite3.Row
-            return conn, db_path
-        except sqlite3.OperationalError as e:
-            if "database is locked" in str(e) and attempt < 2:
-                print(f"資料庫鎖定，嘗試使用臨時資料庫 (嘗試 {attempt+1}/3)...")
-                # 創建一個帶有隨機後綴的新資料庫文件
-                random_suffix = random.randint(1000, 9999)
-                db_path = f"data/bills_{random_suffix}.db"
-                print(f"嘗試使用臨時資料庫文件: {db_path}")
-                continue
-            else:
-                print(f"資料庫連接錯誤: {e}")
-                raise
-        except sqlite3.Error as e:
-            print(f"資料庫連接錯誤: {e}")
-            raise
+    """創建並返回一個資料庫連接
     
-    # 如果所有嘗試都失敗，拋出異常
-    raise sqlite3.OperationalError("無法連接到任何資料庫")
+    資料庫使用 WAL 模式，讀取與寫入不會互相阻塞；遇到其他寫入者時
+    依 busy_timeout 等待，不再改寫到臨時資料庫檔案。
+    """
+    db_path = "data/bills.db"
+    try:
+        conn = connect(db_path)
+        # 啟用外鍵約束
+        conn.execute("PRAGMA foreign_keys = ON")
+        # 配置連接以返回行作為字典
+        conn.row_factory = sqlite3.Row
+        return conn, db_path
+    except sqlite3.Error as e:
+        print(f"資料庫連接錯誤: {e}")
+        raise
 
 def init_db(conn):
     """初始化資料庫，創建必要的表格"""
@@ -4,6 +4,8 @@ import json
 from datetime import datetime
 import time
 
+from src.database import connect
+
 def create_historical_legislators_table(cursor):
     """建立歷屆立委資料表"""
     cursor.execute('''
@@ -41,7 +43,7 @@ def download_historical_legislators():
     
     try:
         # 連接到資料庫
-        conn = sqlite3.connect('data/legislative.db')
+        conn = connect('data/legislative.db')
         cursor = conn.cursor()
         
         # 建立資料表
@@ -3,6 +3,8 @@ import sqlite3
 import json
 from datetime import datetime
 
+from src.database import connect
+
 def create_legislators_table(cursor):
     """建立立委資料表"""
     cursor.execute('''
@@ -43,7 +45,7 @@ def download_legislators():
         print(json.dumps(data, indent=2, ensure_ascii=False))
         
         # 連接到資料庫
-        conn = sqlite3.connect('data/legislative.db')
+        conn = connect('data/legislative.db')
         cursor = conn.cursor()
         
         # 建立資料表
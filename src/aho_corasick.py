@@ -0,0 +1,57 @@
+"""Aho–Corasick 自動機模組
+
+NameMatcher（提案人姓名切分）與 LawAliasMatcher（法律別名比對）共用的多字串
+比對自動機。本模組只負責建立 goto、failure 與 output 表；各比對器的掃描迴圈
+另有略過空白、名稱邊界等規則，直接讀取這些表以免每個字元多一次函式呼叫。
+"""
+from collections import deque
+from typing import Dict, Iterable, List, Tuple
+
+
+class AhoCorasick:
+    """多字串比對自動機
+
+    Attributes:
+        goto: 每個狀態讀入字元後的下一個狀態，沒有對應時需沿 failure 連結回退
+        fail: 每個狀態的 failure 連結
+        output: 每個狀態結束時比對到的字串（含後綴狀態的輸出）
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        """建立自動機
+
+        Args:
+            patterns: 要比對的字串
+        """
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.output: List[Tuple[str, ...]] = [()]
+
+        for pattern in patterns:
+            state = 0
+            for char in pattern:
+                next_state = self.goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto[state][char] = next_state
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append(())
+                state = next_state
+            self.output[state] = (pattern,)
+
+        # 以廣度優先計算 failure 連結，並合併後綴狀態的輸出
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fail = self.fail[state]
+                while fail and char not in self.goto[fail]:
+                    fail = self.fail[fail]
+                self.fail[next_state] = self.goto[fail].get(char, 0)
+                self.output[next_state] += self.output[self.fail[next_state]]
+
+    def __len__(self) -> int:
+        """狀態數"""
+        return len(self.goto)
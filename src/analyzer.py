@@ -1,50 +1,47 @@
-from collections import Counter
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 import re
 
+import numpy as np
+
+try:
+    from src.article_parser import extract_article_ints
+    from src.bill_snapshot import BillSnapshot, load_snapshot
+except ImportError:  # 以 src 為工作目錄直接執行腳本時
+    from article_parser import extract_article_ints
+    from bill_snapshot import BillSnapshot, load_snapshot
+
+# 法律名稱長度不超過此值時視為雜訊，不列入修法熱點
+MIN_LAW_NAME_LENGTH = 3
+
 class BillAnalyzer:
-    """法案分析器"""
+    """法案分析器
     
-    # 中文數字對照表
-    CN_NUM = {
-        '零': 0, '一': 1, '二': 2, '三': 3, '四': 4, '五': 5,
-        '六': 6, '七': 7, '八': 8, '九': 9, '十': 10,
-        '百': 100, '千': 1000, '〇': 0
-    }
+    分析以 BillSnapshot 的欄位陣列進行，每筆法案只在建立快照時解析一次法律名稱與條號。
+    """
     
-    def __init__(self, bills: List[Dict]):
-        self.bills = bills
-        
-    def cn2num(self, cn_str: str) -> int:
-        """將中文數字轉換為阿拉伯數字
+    def __init__(self, bills: Iterable[Dict] = None, snapshot: BillSnapshot = None):
+        """
+        Args:
+            bills: 法案資料，可為 Database.iter_bills 逐批讀取的迭代器
+            snapshot: 已建立的快照，提供時不需要 bills
+        """
+        self.snapshot = snapshot if snapshot is not None else BillSnapshot.from_bills(bills or [], self.extract_law_name)
+    
+    @classmethod
+    def from_database(cls, db, cache_dir: str = None) -> 'BillAnalyzer':
+        """以資料庫目前資料版本的快照建立分析器，快照檔存在時直接讀檔
         
         Args:
-            cn_str: 中文數字字串
+            db: Database 物件
+            cache_dir: 快照檔目錄，預設為資料庫所在目錄下的 snapshots
             
         Returns:
-            int: 阿拉伯數字
+            BillAnalyzer: 分析器
         """
-        if not cn_str:
-            return 0
-            
-        # 處理特殊情況
-        if cn_str == '十':
-            return 10
-            
-        result = 0
-        unit = 1
-        for i in range(len(cn_str) - 1, -1, -1):
-            if cn_str[i] in ['十', '百', '千']:
-                unit = self.CN_NUM[cn_str[i]]
-                if i == 0:
-                    result += unit
-            elif cn_str[i] in self.CN_NUM:
-                result += self.CN_NUM[cn_str[i]] * unit
-                unit = 1
-                
-        return result
+        return cls(snapshot=load_snapshot(db, cls.extract_law_name, cache_dir=cache_dir))
         
-    def extract_law_name(self, bill_name: str) -> str:
+    @staticmethod
+    def extract_law_name(bill_name: str) -> str:
         """從提案名稱中提取法律名稱
         
         Args:
@@ -93,7 +90,8 @@ class BillAnalyzer:
         cleaned_name = re.sub(r'\s*\d+\s*$', '', cleaned_name)
         return cleaned_name
     
-    def extract_article_numbers(self, bill_name: str) -> List[int]:
+    @staticmethod
+    def extract_article_numbers(bill_name: str) -> List[int]:
         """從提案名稱中提取條號
         
         Args:
@@ -102,88 +100,71 @@ class BillAnalyzer:
         Returns:
             List[int]: 條號列表
         """
-        # 移除「審查」、「審議」等字樣
-        bill_name = re.sub(r'[「」『』]', '', bill_name)
-        
-        article_numbers = []
-        
-        # 匹配阿拉伯數字條號
-        patterns = [
-            r'第([0-9]+)條(?:之[0-9]+)?',  # 匹配「第X條」和「第X條之Y」
-            r'第([0-9]+)條至第[0-9]+條',   # 匹配範圍條號的起始
-            r'至第([0-9]+)條',             # 匹配範圍條號的結束
-        ]
-        
-        for pattern in patterns:
-            matches = re.finditer(pattern, bill_name)
-            for match in matches:
-                try:
-                    article_numbers.append(int(match.group(1)))
-                except (ValueError, IndexError):
-                    continue
-        
-        # 匹配中文數字條號
-        cn_patterns = [
-            r'第([零一二三四五六七八九十百千]+)條(?:之[零一二三四五六七八九十百千]+)?',
-            r'第([零一二三四五六七八九十百千]+)條至第[零一二三四五六七八九十百千]+條',
-            r'至第([零一二三四五六七八九十百千]+)條'
-        ]
-        
-        for pattern in cn_patterns:
-            matches = re.finditer(pattern, bill_name)
-            for match in matches:
-                try:
-                    cn_num = match.group(1)
-                    num = self.cn2num(cn_num)
-                    if num > 0:
-                        article_numbers.append(num)
-                except (ValueError, IndexError):
-                    continue
-                    
-        return sorted(list(set(article_numbers)))
+        return extract_article_ints(bill_name)
+    
+    def _filter_mask(self, term: Optional[str], session_period: Optional[str]) -> Optional[np.ndarray]:
+        """屆別與會期的法案遮罩，都不篩選時返回 None"""
+        masks = [mask for mask in (self.snapshot.mask('term', term),
+                                   self.snapshot.mask('session', session_period)) if mask is not None]
+        if not masks:
+            return None
+        return np.logical_and.reduce(masks)
     
-    def get_hot_laws(self, top_n: int = 10) -> List[Tuple[str, int]]:
+    @staticmethod
+    def _most_common(values: np.ndarray, top_n: int) -> List[Tuple[int, int]]:
+        """與 Counter.most_common 相同的排序：數量由多到少，數量相同時先出現的在前"""
+        if not len(values):
+            return []
+        unique, first_index, counts = np.unique(values, return_index=True, return_counts=True)
+        order = np.lexsort((first_index, -counts))[:top_n]
+        return [(int(unique[i]), int(counts[i])) for i in order]
+    
+    def get_hot_laws(self, top_n: int = 10, term: str = None, session_period: str = None) -> List[Tuple[str, int]]:
         """獲取修法熱點
         
         Args:
             top_n: 返回前N名，預設為10
+            term: 只統計此屆別，None 表示全部屆別
+            session_period: 只統計此會期，None 表示全部會期
             
         Returns:
             List[Tuple[str, int]]: (法律名稱, 提案數量) 的列表
         """
-        law_counter = Counter()
-        
-        for bill in self.bills:
-            bill_name = bill.get('billName', '')
-            if not bill_name:
-                continue
-                
-            law_name = self.extract_law_name(bill_name)
-            if law_name and len(law_name) > 2:  # 過濾可能的雜訊
-                law_counter[law_name] += 1
-        
-        return law_counter.most_common(top_n)
+        snapshot = self.snapshot
+        codes = snapshot.law_codes
+        mask = self._filter_mask(term, session_period)
+        if mask is not None:
+            codes = codes[mask]
+        
+        counts = np.bincount(codes, minlength=len(snapshot.law_categories))
+        # 過濾可能的雜訊（0 號為沒有提案名稱的法案，名稱為空字串）
+        counts[np.char.str_len(snapshot.law_categories) < MIN_LAW_NAME_LENGTH] = 0
+        # 編碼依第一次出現的順序，穩定排序讓數量相同時先出現的法律在前
+        order = np.argsort(-counts, kind='stable')[:top_n]
+        return [(str(snapshot.law_categories[i]), int(counts[i])) for i in order if counts[i] > 0]
     
-    def get_hot_articles(self, law_name: str, top_n: int = 5) -> List[Tuple[int, int]]:
+    def get_hot_articles(self, law_name: str, top_n: int = 5, term: str = None,
+                         session_period: str = None) -> List[Tuple[int, int]]:
         """獲取特定法律的熱門條號
         
         Args:
-            law_name: 法律名稱
+            law_name: 法律名稱，提案的法律名稱包含此名稱即列入統計
             top_n: 返回前N名，預設為5
+            term: 只統計此屆別，None 表示全部屆別
+            session_period: 只統計此會期，None 表示全部會期
             
         Returns:
             List[Tuple[int, int]]: (條號, 提案數量) 的列表
         """
-        article_counter = Counter()
-        
-        for bill in self.bills:
-            bill_name = bill.get('billName', '')
-            if not bill_name:
-                continue
-                
-            if law_name in self.extract_law_name(bill_name):
-                article_numbers = self.extract_article_numbers(bill_name)
-                for article in article_numbers:
-                    article_counter[article] += 1
-        
-        return article_counter.most_common(top_n) 
\ No newline at end of file
+        snapshot = self.snapshot
+        # 只對法律名稱的類別比對一次，不必逐筆法案重新解析
+        matched_laws = np.array([law_name in name for name in snapshot.law_categories.tolist()], dtype=bool)
+        matched_laws[0] = False  # 沒有提案名稱的法案
+        bill_mask = matched_laws[snapshot.law_codes]
+        
+        mask = self._filter_mask(term, session_period)
+        if mask is not None:
+            bill_mask &= mask
+        
+        articles = snapshot.article_number[bill_mask[snapshot.article_bill]]
+        return self._most_common(articles, top_n)
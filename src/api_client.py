@@ -1,5 +1,5 @@
 import requests
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 import json
 import time
 import random
@@ -7,6 +7,10 @@ from datetime import datetime, timedelta
 import logging
 import os
 import math
+import itertools
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 # 設置日誌記錄
 logging.basicConfig(
@@ -19,36 +23,110 @@ logging.basicConfig(
 )
 logger = logging.getLogger("LYAPIClient")
 
+# 同時下載的頁數預設值
+DEFAULT_WORKERS = 4
+
+# 所有執行緒合計每秒最多送出的請求數
+DEFAULT_RATE_LIMIT = 1.0
+
+# 使用多種不同的 User-Agent
+USER_AGENTS = [
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Safari/605.1.15',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:123.0) Gecko/20100101 Firefox/123.0'
+]
+
+
+class TokenBucket:
+    """執行緒安全的權杖桶限速器，供同一個客戶端的所有下載執行緒共用"""
+    
+    def __init__(self, rate: float, capacity: float = None):
+        """
+        Args:
+            rate: 每秒補充的權杖數（即平均每秒請求數）
+            capacity: 權杖桶容量（允許的瞬間請求數），預設為 1
+        """
+        self.rate = rate
+        self.capacity = capacity or 1
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """取得一個權杖，沒有權杖或暫停中時等待"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                elif self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                else:
+                    wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+    
+    def pause(self, seconds: float):
+        """暫停所有執行緒送出請求（例如收到 403 時整體退避）
+        
+        Args:
+            seconds: 暫停秒數
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0
+
+
 class LYAPIClient:
     """立法院 API 客戶端"""
     
     BASE_URL = "https://data.ly.gov.tw/odw/openDatasetJson.action"
     
-    def __init__(self, timeout=30, max_retries=5, retry_delay=2):
+    def __init__(self, timeout=30, max_retries=5, retry_delay=2, base_url=None,
+                 rate_limit=DEFAULT_RATE_LIMIT):
         """
         初始化 API 客戶端
         
         Args:
             timeout: 請求超時時間（秒）
-            max_retries: 最大重試次數
+            max_retries: 每一頁的最大重試次數
             retry_delay: 初始重試延遲（秒）
+            base_url: API 網址，預設為 BASE_URL（測試時可指向本機伺服器）
+            rate_limit: 所有執行緒合計每秒最多送出的請求數，None 表示不限速
         """
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.base_url = base_url or self.BASE_URL
         self.ITEMS_PER_PAGE = 1000  # 每頁顯示的項目數量
+        self.rate_limiter = TokenBucket(rate_limit) if rate_limit else None
+        
+        # requests.Session 不保證執行緒安全，每個下載執行緒使用各自的 Session
+        self._local = threading.local()
         
-        # 使用多種不同的 User-Agent
-        user_agents = [
-            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Safari/605.1.15',
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:123.0) Gecko/20100101 Firefox/123.0'
-        ]
-        
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': random.choice(user_agents),
+        # 檢查並創建日誌目錄
+        data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+        if not os.path.exists(data_dir):
+            os.makedirs(data_dir)
+    
+    @property
+    def session(self) -> requests.Session:
+        """目前執行緒使用的 Session"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = self._new_session()
+        return session
+    
+    @staticmethod
+    def _new_session() -> requests.Session:
+        """建立帶有瀏覽器請求頭的 Session"""
+        session = requests.Session()
+        session.headers.update({
+            'User-Agent': random.choice(USER_AGENTS),
             'Accept': 'application/json, text/plain, */*',
             'Accept-Language': 'zh-TW,zh;q=0.9,en-US;q=0.8,en;q=0.7',
             'Referer': 'https://data.ly.gov.tw/',
@@ -59,15 +137,14 @@ class LYAPIClient:
             'sec-ch-ua-mobile': '?0',
             'sec-ch-ua-platform': '"macOS"'
         })
-        
-        # 檢查並創建日誌目錄
-        data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
-        if not os.path.exists(data_dir):
-            os.makedirs(data_dir)
+        return session
     
     def get_bills(self, term: str = "all", page: int = 1) -> List[Dict]:
         """獲取單一頁面的法案資料
         
+        每一頁各自有 max_retries 次的重試額度；設定限速時，每次嘗試前都先向
+        共用的權杖桶取得權杖，收到 403 時暫停所有執行緒一段時間。
+        
         Args:
             term: 屆別，預設為 "all"
             page: 頁碼，預設為 1
@@ -89,20 +166,17 @@ class LYAPIClient:
                 jitter = random.uniform(0.5, 1.5)
                 time.sleep(retry_delay * jitter if attempt > 0 else 0)
                 
+                if self.rate_limiter:
+                    self.rate_limiter.acquire()
+                
                 # 隨機選擇 User-Agent
-                user_agents = [
-                    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
-                    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
-                    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Safari/605.1.15',
-                    'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:123.0) Gecko/20100101 Firefox/123.0'
-                ]
-                self.session.headers.update({'User-Agent': random.choice(user_agents)})
+                self.session.headers.update({'User-Agent': random.choice(USER_AGENTS)})
                 
                 logger.info(f"正在請求第 {page} 頁的法案資料 (嘗試 {attempt + 1}/{self.max_retries})...")
                 start_time = time.time()
                 
                 # 直接訪問帶有參數的URL
-                url = f"{self.BASE_URL}?id=20&selectTerm={term}&page={page}"
+                url = f"{self.base_url}?id=20&selectTerm={term}&page={page}"
                 
                 response = self.session.get(
                     url, 
@@ -116,6 +190,9 @@ class LYAPIClient:
                 if response.status_code == 403:
                     logger.error(f"收到403 Forbidden響應。URL: {url}")
                     logger.error(f"請求頭: {self.session.headers}")
+                    # 伺服器開始拒絕請求，所有執行緒一起退避
+                    if self.rate_limiter:
+                        self.rate_limiter.pause(retry_delay)
                     raise requests.exceptions.HTTPError("403 Forbidden")
                 
                 response.raise_for_status()
@@ -330,15 +407,76 @@ class LYAPIClient:
         logger.info(f"當前屆別和會期: 第 {term} 屆 第 {session} 會期")
         return term, session
     
-    def get_all_bills(self, term: str = "all") -> List[Dict]:
+    def iter_pages(self, pages: Iterable[int], term: str = "all", workers: int = DEFAULT_WORKERS,
+                   stop_on_empty: bool = True) -> Iterator[Tuple[int, Optional[List[Dict]]]]:
+        """同時下載多個頁面，依頁碼順序逐頁返回
+        
+        最多 workers 個執行緒同時下載，請求速度由共用的權杖桶限制。先下載完成的
+        頁面會暫存到前面的頁面返回為止，因此呼叫端可以依頁碼順序寫入資料庫。
+        
+        Args:
+            pages: 要下載的頁碼（可為無限序列，例如 itertools.count(1)）
+            term: 屆別，預設為 "all"
+            workers: 同時下載的頁數
+            stop_on_empty: 遇到沒有資料的頁面時是否停止（返回該頁後結束）
+            
+        Yields:
+            Tuple[int, Optional[List[Dict]]]: (頁碼, 法案資料列表)，重試額度用盡仍失敗的頁面為 None
+        """
+        workers = max(1, int(workers))
+        page_iter = iter(pages)
+        window = deque()  # 依頁碼順序排列的 (頁碼, Future)
+        
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='ly-page') as executor:
+            def fill():
+                # 已排入但尚未返回的頁面最多 workers 頁：限制暫存的頁面數，
+                # 也讓最後一頁之後多送出的空頁請求不超過 workers - 1 個
+                while len(window) < workers:
+                    page = next(page_iter, None)
+                    if page is None:
+                        return
+                    window.append((page, executor.submit(self.get_bills, term=term, page=page)))
+            
+            try:
+                fill()
+                while window:
+                    page, future = window.popleft()
+                    try:
+                        bills = future.result()
+                    except Exception as e:
+                        logger.error(f"第 {page} 頁重試 {self.max_retries} 次後仍失敗: {str(e)}")
+                        bills = None
+                    
+                    if stop_on_empty and bills == []:
+                        yield page, bills
+                        return
+                    
+                    fill()
+                    yield page, bills
+            finally:
+                # 提前結束時取消尚未開始的頁面
+                for _, future in window:
+                    future.cancel()
+    
+    def get_all_bills(self, term: str = "all", workers: int = 1) -> List[Dict]:
         """獲取所有頁面的法案資料
         
         Args:
             term: 屆別，預設為 "all"
+            workers: 同時下載的頁數，大於 1 時以 iter_pages 同時下載並在第一個空頁停止
             
         Returns:
             List[Dict]: 所有法案資料列表
         """
+        if workers > 1:
+            all_bills = []
+            for page, bills in self.iter_pages(itertools.count(1), term=term, workers=workers):
+                if bills:
+                    all_bills.extend(bills)
+                    logger.info(f"成功獲取第 {page} 頁資料，共 {len(bills)} 筆（累計 {len(all_bills)} 筆）")
+            logger.info(f"資料獲取完成，共 {len(all_bills)} 筆資料")
+            return all_bills
+        
         all_bills = []
         consecutive_errors = 0
         max_consecutive_errors = 3
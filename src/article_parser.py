@@ -0,0 +1,143 @@
+"""提案名稱條號解析模組
+
+以單一預先編譯的正規表示式掃描提案名稱，一次處理中文數字、阿拉伯數字
+（含全形數字）、「之」條、條號區間（至）與條號列舉（及、、、暨）。
+解析結果依提案名稱快取，供 app.py、st_utils.py、BillAnalyzer 與資料庫共用。
+"""
+import re
+from collections import namedtuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+# 依提案名稱快取的解析結果數量上限
+ARTICLE_CACHE_SIZE = 8192
+
+# 中文數字對照表
+CN_DIGITS = {
+    '零': 0, '〇': 0, '一': 1, '二': 2, '兩': 2, '三': 3, '四': 4,
+    '五': 5, '六': 6, '七': 7, '八': 8, '九': 9
+}
+CN_UNITS = {'十': 10, '百': 100, '千': 1000}
+
+NUMBER_CHARS = '零〇一二兩三四五六七八九十百千萬0-9０-９'
+
+# 「第X條」或「第X條之Y」，前方可帶連接詞；「至」表示與前一條號構成區間
+ARTICLE_PATTERN = re.compile(
+    rf'(?P<sep>至|及|、|，|和|與|暨)?'
+    rf'第(?P<number>[{NUMBER_CHARS}]+)條'
+    rf'(?:之(?P<sub>[{NUMBER_CHARS}]+))?'
+)
+
+Article = namedtuple('Article', ['number', 'sub_number', 'full_text'])
+
+
+def cn_to_arab(cn_str: str) -> Optional[int]:
+    """將中文數字或阿拉伯數字（含全形）轉換為整數
+
+    Args:
+        cn_str: 數字字串，例如「一百零八」、「十五」、「２３」
+
+    Returns:
+        Optional[int]: 轉換後的整數，無法轉換時返回 None
+    """
+    if not cn_str:
+        return None
+
+    # 阿拉伯數字（int 可直接處理全形數字）
+    if cn_str.isdigit():
+        return int(cn_str)
+
+    total = 0    # 「萬」以上的部分
+    section = 0  # 「萬」以下已累計的部分
+    digit = 0    # 尚未乘上單位的數字
+    for char in cn_str:
+        if char in CN_DIGITS:
+            digit = CN_DIGITS[char]
+        elif char in CN_UNITS:
+            # 「十五」的「十」前面沒有數字，視為一十
+            section += (digit or 1) * CN_UNITS[char]
+            digit = 0
+        elif char == '萬':
+            total += (section + digit) * 10000
+            section = digit = 0
+        elif char.isdigit():
+            digit = digit * 10 + int(char)
+        else:
+            return None
+
+    return total + section + digit
+
+
+def _format_article(number: int, sub_number: int) -> str:
+    """產生條號顯示文字"""
+    if sub_number:
+        return f"第{number}條之{sub_number}"
+    return f"第{number}條"
+
+
+@lru_cache(maxsize=ARTICLE_CACHE_SIZE)
+def parse_articles(bill_name: str) -> Tuple[Article, ...]:
+    """解析提案名稱中的條號
+
+    Args:
+        bill_name: 提案名稱
+
+    Returns:
+        Tuple[Article, ...]: 依出現順序排列、不重複的條號
+    """
+    if not bill_name:
+        return ()
+
+    articles = []
+    seen = set()
+
+    def add(number: int, sub_number: int):
+        if (number, sub_number) not in seen:
+            seen.add((number, sub_number))
+            articles.append(Article(number, sub_number, _format_article(number, sub_number)))
+
+    previous = None      # 前一個條號 (number, sub_number)
+    previous_end = -1    # 前一個條號在字串中的結束位置
+    for match in ARTICLE_PATTERN.finditer(bill_name):
+        number = cn_to_arab(match.group('number'))
+        if number is None:
+            previous = None
+            continue
+        sub_number = cn_to_arab(match.group('sub')) if match.group('sub') else 0
+        sub_number = sub_number or 0
+
+        # 「第一條至第十條」：展開區間內的所有條號
+        if (match.group('sep') == '至' and previous is not None and previous_end == match.start()
+                and previous[1] == 0 and sub_number == 0):
+            for middle in range(previous[0] + 1, number):
+                add(middle, 0)
+
+        add(number, sub_number)
+        previous = (number, sub_number)
+        previous_end = match.end()
+
+    return tuple(articles)
+
+
+def extract_article_numbers(bill_name: str) -> List[Dict]:
+    """從法案名稱中提取條號
+
+    Args:
+        bill_name: 法案名稱
+
+    Returns:
+        list: 條號列表，每個條號是一個字典，包含 full_text、number 和 sub_number
+    """
+    return [article._asdict() for article in parse_articles(bill_name)]
+
+
+def extract_article_ints(bill_name: str) -> List[int]:
+    """從法案名稱中提取不重複的條號主號，由小到大排序
+
+    Args:
+        bill_name: 法案名稱
+
+    Returns:
+        List[int]: 條號列表
+    """
+    return sorted({article.number for article in parse_articles(bill_name)})
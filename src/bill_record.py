@@ -0,0 +1,217 @@
+"""法案紀錄模組
+
+搜尋結果、立委提案列表等路徑原本把每筆 sqlite3.Row 轉成 dict，再加上
+all_members、party_stats、total_members 等顯示用的鍵；每位提案人與連署人
+也各是一個 {'name', 'party_class'} 字典。大量搜尋與全部法案的分析因此佔用
+大量記憶體：
+
+- Bill 以 __slots__ 保存欄位，沒有每筆一個雜湊表的負擔。屆別、會期、審查
+  狀態、提案機關、法律名稱等重複出現的字串以 sys.intern 共用同一個物件。
+- Member 依 (姓名, 政黨) 共用同一個物件，Party 以列舉表示政黨分類。
+
+Bill 同時提供 bill['billName']、bill.get()、'party_stats' in bill 等字典介面，
+模板與原本以字典存取的程式不需修改；需要 JSON 時以 to_dict() 轉換。
+"""
+import sys
+from enum import Enum
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# 法案欄位：bills 表的欄位、bill_members 的角色，以及網頁顯示時加入的成員與政黨統計
+BILL_RECORD_FIELDS = (
+    'term', 'sessionPeriod', 'sessionTimes', 'meetingTimes',
+    'billNo', 'billName', 'billOrg', 'billProposer',
+    'billCosignatory', 'billStatus', 'pdfUrl', 'docUrl',
+    'page_number', 'content_hash', 'law_name', 'updated_at',
+    'role', 'all_members', 'party_stats', 'total_members',
+)
+
+# 值的種類有限、在大量法案中重複出現的欄位，讀取時以 sys.intern 共用字串
+INTERNED_FIELDS = frozenset({
+    'term', 'sessionPeriod', 'sessionTimes', 'meetingTimes', 'billOrg',
+    'billProposer', 'billStatus', 'law_name', 'updated_at', 'role',
+})
+
+
+class Party(Enum):
+    """成員的政黨分類：(網頁的 CSS class, 政黨統計使用的名稱)"""
+    DPP = ('dpp', '民進黨')
+    KMT = ('kmt', '國民黨')
+    TPP = ('tpp', '民眾黨')
+    NPP = ('npp', '時代力量')
+    NO_PARTY = ('noparty', '無黨籍')
+    OTHER = ('other', '其他')
+    ORG = ('org', '機關')
+
+    def __init__(self, css_class: str, label: str):
+        self.css_class = css_class
+        self.label = label
+
+
+# 黨團提案的提案機關：(機關名稱包含的文字, 政黨分類)，依序比對
+ORG_PARTIES = (
+    (('民主進步黨', '民進黨'), Party.DPP),
+    (('中國國民黨', '國民黨'), Party.KMT),
+    (('台灣民眾黨', '民眾黨'), Party.TPP),
+    (('時代力量',), Party.NPP),
+    (('台灣基進',), Party.OTHER),
+)
+
+
+def org_party(org: str) -> Optional[Party]:
+    """提案機關為黨團時返回其政黨分類，其他機關返回 None"""
+    for keywords, party in ORG_PARTIES:
+        if any(keyword in org for keyword in keywords):
+            return party
+    return None
+
+
+class Member:
+    """提案人或連署人，相同姓名與政黨的成員共用同一個物件"""
+
+    __slots__ = ('name', 'party')
+
+    _interned: Dict[Tuple[str, Party], 'Member'] = {}
+
+    def __init__(self, name: str, party: Party):
+        self.name = name
+        self.party = party
+
+    @classmethod
+    def of(cls, name: str, party: Party) -> 'Member':
+        """取得共用的成員物件
+
+        Args:
+            name: 顯示的姓名（或提案機關名稱）
+            party: 政黨分類
+
+        Returns:
+            Member: 成員
+        """
+        key = (name, party)
+        member = cls._interned.get(key)
+        if member is None:
+            member = cls._interned[key] = cls(sys.intern(name), party)
+        return member
+
+    @property
+    def party_class(self) -> str:
+        """模板使用的 CSS class"""
+        return self.party.css_class
+
+    def __reduce__(self):
+        # Streamlit 快取以 pickle 保存結果，讀回時同樣取得共用的物件
+        return (Member.of, (self.name, self.party))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Member):
+            return NotImplemented
+        return self.name == other.name and self.party is other.party
+
+    def __hash__(self) -> int:
+        return hash((self.name, self.party))
+
+    def __repr__(self) -> str:
+        return f"Member({self.name!r}, {self.party.name})"
+
+
+class Bill:
+    """一筆法案，欄位以 __slots__ 保存，並提供與 dict 相同的存取方式
+
+    只讀取部分欄位時，沒有讀取的欄位不存在：bill['pdfUrl'] 拋出 KeyError，
+    bill.get('pdfUrl') 返回 None，與原本的字典相同。
+    """
+
+    __slots__ = BILL_RECORD_FIELDS
+
+    _FIELD_SET = frozenset(BILL_RECORD_FIELDS)
+
+    def __init__(self, **fields):
+        for key, value in fields.items():
+            self[key] = value
+
+    @classmethod
+    def from_row(cls, row, fields: Iterable[str] = None) -> 'Bill':
+        """由查詢結果建立法案紀錄
+
+        Args:
+            row: sqlite3.Row 或字典
+            fields: 要讀取的欄位，預設為 row 的全部欄位
+
+        Returns:
+            Bill: 法案紀錄
+
+        Raises:
+            KeyError: 欄位不是法案欄位
+        """
+        return cls.from_rows((row,), fields)[0]
+
+    @classmethod
+    def from_rows(cls, rows: Iterable, fields: Iterable[str] = None) -> List['Bill']:
+        """將多筆查詢結果轉為法案紀錄列表，欄位與是否共用字串只判斷一次"""
+        bills = []
+        plan = None
+        for row in rows:
+            if plan is None:
+                plan = cls._plan(row.keys() if fields is None else fields)
+            bill = cls.__new__(cls)
+            for key, interned in plan:
+                value = row[key]
+                if interned and type(value) is str:
+                    value = sys.intern(value)
+                setattr(bill, key, value)
+            bills.append(bill)
+        return bills
+
+    @classmethod
+    def _plan(cls, fields: Iterable[str]) -> List[Tuple[str, bool]]:
+        """(欄位, 是否共用字串) 列表"""
+        fields = list(fields)
+        unknown = [key for key in fields if key not in cls._FIELD_SET]
+        if unknown:
+            raise KeyError(f"不是法案欄位: {', '.join(unknown)}")
+        return [(key, key in INTERNED_FIELDS) for key in fields]
+
+    def __getitem__(self, key: str):
+        if key not in self._FIELD_SET:
+            raise KeyError(key)
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key: str, value):
+        if key not in self._FIELD_SET:
+            raise KeyError(key)
+        if key in INTERNED_FIELDS and type(value) is str:
+            value = sys.intern(value)
+        setattr(self, key, value)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._FIELD_SET and hasattr(self, key)
+
+    def get(self, key: str, default=None):
+        """與 dict.get 相同"""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self) -> Iterator[str]:
+        """已設定的欄位名稱"""
+        return (key for key in BILL_RECORD_FIELDS if hasattr(self, key))
+
+    def items(self) -> Iterator[Tuple[str, object]]:
+        """已設定的 (欄位, 值)"""
+        return ((key, getattr(self, key)) for key in self.keys())
+
+    def to_dict(self) -> Dict:
+        """轉為字典（Member 轉為 {'name', 'party_class'}），供 JSON 輸出使用"""
+        result = dict(self.items())
+        if 'all_members' in result:
+            result['all_members'] = [{'name': member.name, 'party_class': member.party_class}
+                                     for member in result['all_members']]
+        return result
+
+    def __repr__(self) -> str:
+        return f"Bill(term={self.get('term')!r}, billNo={self.get('billNo')!r}, billName={self.get('billName')!r})"
+
@@ -0,0 +1,194 @@
+"""法案欄位式快照模組
+
+BillAnalyzer 原本對每筆法案的 dict 逐一執行正則運算；查詢每部法律的熱門條號
+時，又要對全部法案重新解析一次法律名稱。BillSnapshot 把分析需要的欄位整理成
+NumPy 陣列：
+
+- 屆別、會期、審查狀態與法律名稱以類別編碼（codes 為整數陣列，categories 為
+  各編碼對應的字串，依第一次出現的順序編號）。
+- 條號攤平成兩個整數陣列：article_bill 為法案在快照中的列號，article_number
+  為條號。
+
+統計改以 np.bincount、布林遮罩等向量運算完成。load_snapshot 依資料版本號把
+快照存成 .npz 檔，資料沒有更新時直接讀檔，不必重新查詢與解析全部法案。
+"""
+import logging
+import os
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+
+try:
+    from src.article_parser import extract_article_ints
+except ImportError:  # 以 src 為工作目錄直接執行腳本時
+    from article_parser import extract_article_ints
+
+logger = logging.getLogger(__name__)
+
+# 快照格式版本，欄位或法律名稱的解析方式改變時加一，舊的快照檔不再使用
+SNAPSHOT_FORMAT = 1
+
+# 從資料庫讀取法案時每批的筆數與讀取的欄位
+SNAPSHOT_BATCH_SIZE = 2000
+SNAPSHOT_FIELDS = ('term', 'sessionPeriod', 'billStatus', 'billName')
+
+# 類別編碼的欄位：(快照欄位名稱, 法案資料的鍵)
+CATEGORY_FIELDS = (
+    ('term', 'term'),
+    ('session', 'sessionPeriod'),
+    ('status', 'billStatus'),
+)
+
+
+class _CategoryEncoder:
+    """依第一次出現的順序為字串編號"""
+
+    def __init__(self, reserved: Iterable[str] = ()):
+        """
+        Args:
+            reserved: 預先編號的值，依序為 0、1、...
+        """
+        self.index: Dict[str, int] = {value: code for code, value in enumerate(reserved)}
+        self.codes: List[int] = []
+
+    def add(self, value: str):
+        code = self.index.get(value)
+        if code is None:
+            code = self.index[value] = len(self.index)
+        self.codes.append(code)
+
+    def categories(self) -> np.ndarray:
+        # dict 保留插入順序，即編碼順序；dtype=str 讓 .npz 不需要 pickle
+        return np.array(list(self.index), dtype=str)
+
+
+class BillSnapshot:
+    """以欄位陣列保存的法案快照"""
+
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        """
+        Args:
+            arrays: 欄位陣列，鍵為 {欄位}_codes、{欄位}_categories、article_bill、
+                article_number 與 data_version
+        """
+        self.arrays = arrays
+        self.law_codes = arrays['law_codes']
+        self.law_categories = arrays['law_categories']
+        self.article_bill = arrays['article_bill']
+        self.article_number = arrays['article_number']
+        self.data_version = int(arrays['data_version'])
+
+    def __len__(self) -> int:
+        return len(self.law_codes)
+
+    @classmethod
+    def from_bills(cls, bills: Iterable[Dict], law_name_func: Callable[[str], str],
+                   data_version: int = -1) -> 'BillSnapshot':
+        """由法案資料建立快照，每筆法案只解析一次法律名稱與條號
+
+        Args:
+            bills: 法案資料，需包含 billName、term、sessionPeriod 與 billStatus
+            law_name_func: 由提案名稱取得法律名稱的函數
+            data_version: 資料版本號，-1 表示不是由資料庫建立
+
+        Returns:
+            BillSnapshot: 快照
+        """
+        encoders = {field: _CategoryEncoder() for field, _ in CATEGORY_FIELDS}
+        # 沒有提案名稱的法案編為 0 號，統計時排除
+        laws = _CategoryEncoder(reserved=('',))
+        article_bill: List[int] = []
+        article_number: List[int] = []
+
+        for row, bill in enumerate(bills):
+            for field, key in CATEGORY_FIELDS:
+                encoders[field].add(bill.get(key) or '')
+            bill_name = bill.get('billName') or ''
+            laws.add(law_name_func(bill_name) if bill_name else '')
+            if bill_name:
+                numbers = extract_article_ints(bill_name)
+                article_bill.extend([row] * len(numbers))
+                article_number.extend(numbers)
+
+        arrays = {
+            'law_codes': np.array(laws.codes, dtype=np.int32),
+            'law_categories': laws.categories(),
+            'article_bill': np.array(article_bill, dtype=np.int32),
+            'article_number': np.array(article_number, dtype=np.int32),
+            'data_version': np.array(data_version, dtype=np.int64),
+        }
+        for field, _ in CATEGORY_FIELDS:
+            arrays[f'{field}_codes'] = np.array(encoders[field].codes, dtype=np.int32)
+            arrays[f'{field}_categories'] = encoders[field].categories()
+        return cls(arrays)
+
+    @classmethod
+    def load(cls, path: str) -> 'BillSnapshot':
+        """讀取 .npz 快照檔"""
+        with np.load(path, allow_pickle=False) as data:
+            return cls({key: data[key] for key in data.files})
+
+    def save(self, path: str):
+        """寫入 .npz 快照檔（先寫入暫存檔再改名，避免其他程序讀到寫到一半的檔案）"""
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, **self.arrays)
+        os.replace(tmp_path, path)
+
+    def mask(self, field: str, value: Optional[str]) -> Optional[np.ndarray]:
+        """類別欄位等於 value 的法案遮罩
+
+        Args:
+            field: term、session 或 status
+            value: 要篩選的值，None 表示不篩選
+
+        Returns:
+            Optional[np.ndarray]: 布林遮罩，不篩選時返回 None
+        """
+        if value is None:
+            return None
+        matches = np.flatnonzero(self.arrays[f'{field}_categories'] == value)
+        if not len(matches):
+            return np.zeros(len(self), dtype=bool)
+        return self.arrays[f'{field}_codes'] == matches[0]
+
+
+def snapshot_path(cache_dir: str, data_version: int) -> Path:
+    """資料版本對應的快照檔路徑"""
+    return Path(cache_dir) / f"bills_v{SNAPSHOT_FORMAT}_{data_version}.npz"
+
+
+def load_snapshot(db, law_name_func: Callable[[str], str], cache_dir: str = None) -> BillSnapshot:
+    """讀取目前資料版本的快照，沒有快照檔時由資料庫建立並存檔
+
+    Args:
+        db: Database 物件
+        law_name_func: 由提案名稱取得法律名稱的函數
+        cache_dir: 快照檔目錄，預設為資料庫所在目錄下的 snapshots
+
+    Returns:
+        BillSnapshot: 快照
+    """
+    cache_dir = cache_dir or os.path.join(os.path.dirname(os.path.abspath(db.db_path)), 'snapshots')
+    data_version = db.get_data_version()
+    path = snapshot_path(cache_dir, data_version)
+    if path.exists():
+        try:
+            return BillSnapshot.load(str(path))
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning("讀取快照檔 %s 時發生錯誤，重新建立: %s", path, e)
+
+    # 只讀取需要的欄位並逐批讀取，建立快照時不會同時保存全部法案
+    bills = db.iter_bills(fields=SNAPSHOT_FIELDS, batch_size=SNAPSHOT_BATCH_SIZE, ordered=False)
+    snapshot = BillSnapshot.from_bills(bills, law_name_func, data_version=data_version)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        snapshot.save(str(path))
+        # 刪除其他資料版本的快照檔
+        for old_path in Path(cache_dir).glob('bills_v*.npz'):
+            if old_path != path:
+                old_path.unlink()
+    except OSError as e:
+        logger.warning("寫入快照檔 %s 時發生錯誤: %s", path, e)
+    return snapshot
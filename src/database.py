@@ -1,29 +1,261 @@
+import base64
+import hashlib
 import sqlite3
-from typing import List, Dict, Tuple, Optional
+import statistics
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from itertools import islice
+from typing import Iterable, Iterator, List, Dict, Tuple, Optional
 import json
 from pathlib import Path
 import os
 
+try:
+    from src.article_parser import extract_article_numbers
+    from src.bill_record import Bill
+    from src.law_names import canonical_law_name
+    from src.legislator_lookup import get_party, reload_legislators, use_database
+    from src.name_matcher import extract_names
+except ImportError:  # 以 src 為工作目錄直接執行腳本時
+    from article_parser import extract_article_numbers
+    from bill_record import Bill
+    from law_names import canonical_law_name
+    from legislator_lookup import get_party, reload_legislators, use_database
+    from name_matcher import extract_names
+
+# 預設儲存設定：WAL 模式讓寫入（排程更新、下載腳本）與讀取（網站）互不阻塞
+DEFAULT_STORAGE_PROFILE = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',     # WAL 模式下仍可保證資料庫一致，只在斷電時可能遺失最後幾筆交易
+    'mmap_size': 268435456,      # 256MB 記憶體映射讀取
+    'cache_size': -65536,        # 64MB 頁面快取（負值單位為 KiB）
+    'temp_store': 'MEMORY',
+    'busy_timeout': 30000,       # 遇到鎖定時最多等待 30 秒
+}
+
+# 每個連線保留的已編譯語句數（sqlite3 預設 128）。搜尋、分頁與儀表板的查詢以參數
+# 傳值，SQL 文字的種類有限，保留較多語句讓連線池中長時間使用的連線不必重新編譯
+DEFAULT_CACHED_STATEMENTS = 512
+
+
+def connect(db_path: str, read_only: bool = False, storage_profile: Dict = None,
+            check_same_thread: bool = True,
+            cached_statements: int = DEFAULT_CACHED_STATEMENTS) -> sqlite3.Connection:
+    """建立套用儲存設定的 SQLite 連線
+    
+    Args:
+        db_path: 資料庫檔案路徑
+        read_only: 是否以 mode=ro 唯讀模式開啟，供網站等只讀取資料的程式使用
+        storage_profile: 覆寫 DEFAULT_STORAGE_PROFILE 的設定，值為 None 表示不設定該項
+        check_same_thread: 是否限制連線只能在建立它的執行緒使用
+        cached_statements: 連線保留的已編譯語句數
+        
+    Returns:
+        sqlite3.Connection: 資料庫連線
+    """
+    profile = dict(DEFAULT_STORAGE_PROFILE)
+    profile.update(storage_profile or {})
+    
+    if read_only:
+        uri = f"{Path(os.path.abspath(db_path)).as_uri()}?mode=ro"
+        conn = sqlite3.connect(uri, uri=True, check_same_thread=check_same_thread,
+                               cached_statements=cached_statements)
+        # journal_mode 記錄在資料庫檔案中，只能由可寫入的連線設定
+        profile.pop('journal_mode', None)
+        profile.pop('synchronous', None)
+    else:
+        conn = sqlite3.connect(db_path, check_same_thread=check_same_thread,
+                               cached_statements=cached_statements)
+    
+    for pragma, value in profile.items():
+        if value is not None:
+            conn.execute(f"PRAGMA {pragma} = {value}")
+    return conn
+
+
+# 每筆法案第一位比對得到的提案人的政黨顏色：同名委員依屆別比對（兩表的屆別可能
+# 一邊補零，以 CAST 轉為數字比較），每筆法案只保留一列，不會因多位提案人重複出現
+PROPOSER_COLORS_CTE = """
+WITH matched_colors AS (
+    SELECT m.term, m.billNo, l.party_color,
+           ROW_NUMBER() OVER (PARTITION BY m.term, m.billNo ORDER BY m.rowid, l.rowid) AS rn
+    FROM bill_members m
+    JOIN legislators l ON l.name = m.name
+                      AND CAST(l.term AS INTEGER) = CAST(m.term AS INTEGER)
+    WHERE m.role = 'proposer'
+),
+proposer_colors AS (
+    SELECT term, billNo, party_color FROM matched_colors WHERE rn = 1
+)
+"""
+
+# API 提供的法案內容欄位，content_hash 依這些欄位計算
+BILL_CONTENT_COLUMNS = (
+    'term', 'sessionPeriod', 'sessionTimes', 'meetingTimes',
+    'billNo', 'billName', 'billOrg', 'billProposer',
+    'billCosignatory', 'billStatus', 'pdfUrl', 'docUrl',
+)
+
+# save_bills 寫入的 bills 欄位（updated_at 由資料庫填入），law_name 為 canonical_law_name 的結果
+BILL_COLUMNS = BILL_CONTENT_COLUMNS + ('page_number', 'content_hash', 'law_name')
+
+# 以 ON CONFLICT DO UPDATE 更新既有法案，保留原本的 rowid，
+# 不會像 INSERT OR REPLACE 一樣先刪除再插入，全文索引也只需更新一次
+UPSERT_BILL_SQL = f"""
+INSERT INTO bills ({', '.join(BILL_COLUMNS)}, updated_at)
+VALUES ({', '.join('?' * len(BILL_COLUMNS))}, CURRENT_TIMESTAMP)
+ON CONFLICT(term, billNo) DO UPDATE SET
+    {', '.join(f'{column} = excluded.{column}' for column in BILL_COLUMNS if column not in ('term', 'billNo'))},
+    updated_at = excluded.updated_at
+"""
+
+# 全部重新載入時可先刪除、載入完成後再一次建立的索引
+BULK_LOAD_INDEXES = {
+    'idx_bills_name': "CREATE INDEX IF NOT EXISTS idx_bills_name ON bills(billName)",
+    'idx_bills_term_session': "CREATE INDEX IF NOT EXISTS idx_bills_term_session ON bills(term, sessionPeriod)",
+    'idx_bills_page': "CREATE INDEX IF NOT EXISTS idx_bills_page ON bills(page_number)",
+    # 依正式法律名稱搜尋、統計時使用
+    'idx_bills_law_name': "CREATE INDEX IF NOT EXISTS idx_bills_law_name ON bills(law_name, term, sessionPeriod)",
+    'idx_bill_articles_law': "CREATE INDEX IF NOT EXISTS idx_bill_articles_law ON bill_articles(law_key, number, sub_number)",
+    # 依立委查詢法案時使用；包含 role 與 billNo 讓查詢只需讀取索引
+    'idx_bill_members_name': "CREATE INDEX IF NOT EXISTS idx_bill_members_name ON bill_members(name, term, role, billNo)",
+}
+
+# FTS5 trigram 分詞器需要的最低 SQLite 版本；較舊的版本不建立全文索引，搜尋改以 LIKE 比對
+FTS_TRIGRAM_MIN_VERSION = (3, 34, 0)
+
+# 全文索引觸發器，延後建立索引時暫時移除
+FTS_TRIGGERS = ('bills_fts_insert', 'bills_fts_delete', 'bills_fts_update')
+
+# 寫入法案前與資料庫中的審查狀態比對，狀態不同（含第一次出現）時記錄一筆狀態變動
+RECORD_STATUS_CHANGE_SQL = """
+INSERT INTO bill_status_history (term, billNo, old_status, new_status)
+SELECT :term, :billNo, old.billStatus, :billStatus
+FROM (SELECT 1)
+LEFT JOIN bills old ON old.term = :term AND old.billNo = :billNo
+WHERE old.billStatus IS NOT :billStatus
+"""
+
+# 資料版本號：每次寫入法案或立委資料時加一，網站的搜尋結果快取以此判斷是否過期
+BUMP_DATA_VERSION_SQL = "UPDATE data_version SET version = version + 1, updated_at = CURRENT_TIMESTAMP WHERE id = 1"
+
+# 一讀後的審查狀態（交付委員會審查或逕付二讀），作為計算通過天數的起點
+FIRST_READING_STATUSES = ('一讀', '交付審查', '逕付二讀', '逕付二讀(交付協商)')
+
+THIRD_READING_STATUS = '三讀'
+
+# 搜尋結果的法案欄位
+SEARCH_RESULT_COLUMNS = (
+    'billNo', 'billName', 'billOrg', 'billProposer', 'billCosignatory',
+    'term', 'sessionPeriod', 'sessionTimes', 'billStatus', 'pdfUrl', 'docUrl',
+)
+
+# iter_bills、iter_legislators 可選取的欄位與預設每批讀取的筆數
+BILL_FIELDS = BILL_CONTENT_COLUMNS + ('law_name', 'updated_at')
+LEGISLATOR_FIELDS = ('name', 'party', 'term', 'party_color', 'constituency', 'committee',
+                     'education', 'experience', 'updated_at')
+DEFAULT_BATCH_SIZE = 500
+
+# _fetch_bill_rows（_update_law_counts、sync_bills）每次查詢的 (term, billNo) 數，參數數需低於舊版 SQLite 的 999 個上限
+LAW_COUNTS_LOOKUP_CHUNK = 400
+
+# 搜尋結果分頁：沒有條號的提案所屬的分組，以及每頁預設的法案數
+OTHER_ARTICLE_GROUP = 'other'
+DEFAULT_PAGE_SIZE = 20
+
+# 搜尋結果的排序鍵（屆別、會期、次別由新到舊），分頁游標記錄上一頁最後一筆的排序鍵
+SEARCH_SORT_COLUMNS = (
+    ('sort_term', "COALESCE(CAST(term AS INTEGER), 0)"),
+    ('sort_session', "COALESCE(CAST(sessionPeriod AS INTEGER), 0)"),
+    ('sort_times', "COALESCE(CAST(sessionTimes AS INTEGER), 0)"),
+    ('sort_bill', "billNo"),
+)
+
+
+def validate_bill(bill: Dict) -> Optional[str]:
+    """檢查法案資料是否可以寫入資料庫
+    
+    Args:
+        bill: 法案資料
+        
+    Returns:
+        Optional[str]: 錯誤說明，資料正確時返回 None
+    """
+    if not isinstance(bill, dict):
+        return "法案資料不是字典"
+    for key in ('term', 'billNo'):
+        if not bill.get(key):
+            return f"缺少 {key}"
+    for column in BILL_CONTENT_COLUMNS:
+        value = bill.get(column)
+        if value is not None and not isinstance(value, (str, int, float)):
+            return f"{column} 的型別不支援: {type(value).__name__}"
+    return None
+
+
+def bill_content_hash(bill: Dict) -> str:
+    """計算法案內容雜湊，內容欄位有任何變動（例如審查狀態）雜湊就會不同
+    
+    Args:
+        bill: 法案資料
+        
+    Returns:
+        str: SHA-1 十六進位字串
+    """
+    content = json.dumps([bill.get(column) for column in BILL_CONTENT_COLUMNS],
+                         ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+
 class Database:
     """資料庫管理類"""
     
-    def __init__(self):
-        """初始化資料庫連接"""
-        # 獲取當前腳本的目錄
-        current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    def __init__(self, db_path: str = None, init_schema: bool = True, check_same_thread: bool = True,
+                 read_only: bool = False, storage_profile: Dict = None):
+        """初始化資料庫連接
         
-        # 確保 data 目錄存在
-        data_dir = os.path.join(current_dir, 'data')
-        if not os.path.exists(data_dir):
-            os.makedirs(data_dir)
+        Args:
+            db_path: 資料庫檔案路徑，預設為 data/bills.db
+            init_schema: 是否建立資料表並執行欄位遷移，連線池在啟動時執行一次後即可略過
+            check_same_thread: 是否限制連線只能在建立它的執行緒使用，連線池需設為 False
+            read_only: 是否以唯讀模式開啟（網站讀取用），唯讀時不建立資料表
+            storage_profile: 覆寫 DEFAULT_STORAGE_PROFILE 的儲存設定
+        """
+        if db_path is None:
+            # 獲取當前腳本的目錄
+            current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
             
-        self.db_path = os.path.join(data_dir, 'bills.db')
+            # 確保 data 目錄存在
+            data_dir = os.path.join(current_dir, 'data')
+            if not os.path.exists(data_dir):
+                os.makedirs(data_dir)
+                
+            db_path = os.path.join(data_dir, 'bills.db')
+        
+        self.db_path = db_path
         print(f"連接資料庫: {os.path.abspath(self.db_path)}")
-        self.conn = sqlite3.connect(self.db_path)
+        # 立委黨籍查詢表讀取這個資料庫的 legislators 表，而不是固定的 data/bills.db
+        use_database(self.db_path)
+        self.read_only = read_only
+        self.conn = connect(self.db_path, read_only=read_only, storage_profile=storage_profile,
+                            check_same_thread=check_same_thread)
         self.conn.row_factory = sqlite3.Row
         
+        # save_bills 以 ON CONFLICT DO UPDATE 更新，由 bills_fts_update 觸發器維護全文索引，不需要此設定；
+        # 但以 INSERT OR REPLACE 寫入 bills 的程式（例如 benchmarks/legacy_save_bills.py）因衝突刪除舊資料列時，
+        # 只有開啟 recursive_triggers 才會觸發 bills_fts_delete，全文索引才不會殘留舊資料
+        self.conn.execute("PRAGMA recursive_triggers = ON")
+        
+        # 全文索引是否可用：SQLite 版本不支援 trigram、建立失敗或資料庫中沒有索引時為 False
+        self.fts_available = sqlite3.sqlite_version_info >= FTS_TRIGRAM_MIN_VERSION
+        
         # 確保資料表存在
-        self.create_tables()
+        if init_schema and not read_only:
+            self.create_tables()
+        if self.fts_available:
+            self.fts_available = self.conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'bills_fts'"
+            ).fetchone() is not None
     
     def create_tables(self):
         """創建資料表"""
@@ -45,6 +277,8 @@ class Database:
             pdfUrl TEXT,
             docUrl TEXT,
             page_number INTEGER,
+            content_hash TEXT,
+            law_name TEXT,
             updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             PRIMARY KEY (term, billNo)
         )
@@ -56,7 +290,12 @@ class Database:
             name TEXT,
             party TEXT,
             term TEXT,
-            party_color TEXT
+            party_color TEXT,
+            constituency TEXT,
+            committee TEXT,
+            education TEXT,
+            experience TEXT,
+            updated_at TIMESTAMP
         )
         """)
         
@@ -86,15 +325,234 @@ class Database:
             except Exception as e:
                 print(f"添加updated_at欄位時出錯: {e}")
         
+        # 增量同步以 content_hash 判斷法案內容是否變動，舊資料庫新增欄位後補算雜湊
+        backfill_hashes = False
+        if 'content_hash' not in columns:
+            try:
+                cursor.execute("ALTER TABLE bills ADD COLUMN content_hash TEXT")
+                print("已添加content_hash欄位到bills表")
+                backfill_hashes = True
+            except Exception as e:
+                print(f"添加content_hash欄位時出錯: {e}")
+        
+        # 搜尋與統計以 law_name 等號比對，舊資料庫新增欄位後補算正式法律名稱
+        backfill_law_names = False
+        if 'law_name' not in columns:
+            try:
+                cursor.execute("ALTER TABLE bills ADD COLUMN law_name TEXT")
+                print("已添加law_name欄位到bills表")
+                backfill_law_names = True
+            except Exception as e:
+                print(f"添加law_name欄位時出錯: {e}")
+        
+        # save_legislators 會寫入委員的詳細資料，舊資料庫的 legislators 表缺少這些欄位
+        cursor.execute("PRAGMA table_info(legislators)")
+        legislator_columns = [col['name'] for col in cursor.fetchall()]
+        for column, column_type in [('constituency', 'TEXT'), ('committee', 'TEXT'),
+                                    ('education', 'TEXT'), ('experience', 'TEXT'),
+                                    ('updated_at', 'TIMESTAMP')]:
+            if column not in legislator_columns:
+                try:
+                    cursor.execute(f"ALTER TABLE legislators ADD COLUMN {column} {column_type}")
+                    print(f"已添加{column}欄位到legislators表")
+                except Exception as e:
+                    print(f"添加{column}欄位時出錯: {e}")
+        
         # 建立索引以加速查詢
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_bills_name ON bills(billName)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_bills_term_session ON bills(term, sessionPeriod)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_bills_page ON bills(page_number)")
+        for index in ('idx_bills_name', 'idx_bills_term_session', 'idx_bills_page', 'idx_bills_law_name'):
+            cursor.execute(BULK_LOAD_INDEXES[index])
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_legislators_name ON legislators(name)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_legislators_term ON legislators(term)")
         
+        # 建立法案條號資料表，於儲存法案時解析條號
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'bill_articles'")
+        articles_exist = cursor.fetchone() is not None
+        
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS bill_articles (
+            term TEXT,
+            billNo TEXT,
+            law_key TEXT,
+            number INTEGER,
+            sub_number INTEGER,
+            full_text TEXT,
+            PRIMARY KEY (term, billNo, number, sub_number)
+        )
+        """)
+        cursor.execute(BULK_LOAD_INDEXES['idx_bill_articles_law'])
+        
+        if not articles_exist:
+            self.rebuild_bill_articles(cursor)
+        
+        # 建立法案成員資料表，於儲存法案時切分提案人、連署人並判定黨籍
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'bill_members'")
+        members_exist = cursor.fetchone() is not None
+        
+        # 主鍵的前綴 (term, billNo) 即為依法案查詢成員的索引
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS bill_members (
+            term TEXT,
+            billNo TEXT,
+            name TEXT,
+            role TEXT,
+            party TEXT,
+            PRIMARY KEY (term, billNo, role, name)
+        )
+        """)
+        cursor.execute(BULK_LOAD_INDEXES['idx_bill_members_name'])
+        
+        if not members_exist:
+            self.rebuild_bill_members(cursor)
+        
+        # 建立熱門法案統計表：各屆、各會期每部法律的提案數，於儲存法案時增量更新
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'law_counts'")
+        law_counts_exist = cursor.fetchone() is not None
+        
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS law_counts (
+            term TEXT,
+            sessionPeriod TEXT,
+            law_name TEXT,
+            count INTEGER,
+            PRIMARY KEY (term, sessionPeriod, law_name)
+        )
+        """)
+        
+        if not law_counts_exist:
+            self.rebuild_law_counts(cursor)
+        
+        # 建立法案審查狀態歷史表，只新增不修改
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'bill_status_history'")
+        history_exists = cursor.fetchone() is not None
+        
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS bill_status_history (
+            term TEXT,
+            billNo TEXT,
+            old_status TEXT,
+            new_status TEXT,
+            observed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """)
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_status_history_status ON bill_status_history(new_status, observed_at)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_status_history_bill ON bill_status_history(term, billNo, observed_at)")
+        
+        # 既有法案以目前的狀態與最後更新時間作為第一筆觀察紀錄
+        if not history_exists:
+            cursor.execute("""
+            INSERT INTO bill_status_history (term, billNo, old_status, new_status, observed_at)
+            SELECT term, billNo, NULL, billStatus, COALESCE(updated_at, CURRENT_TIMESTAMP)
+            FROM bills
+            """)
+        
+        # 建立資料版本表（只有一列）
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS data_version (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            version INTEGER NOT NULL,
+            updated_at TIMESTAMP
+        )
+        """)
+        cursor.execute("PRAGMA table_info(data_version)")
+        if 'updated_at' not in [col['name'] for col in cursor.fetchall()]:
+            cursor.execute("ALTER TABLE data_version ADD COLUMN updated_at TIMESTAMP")
+        cursor.execute("""
+        INSERT OR IGNORE INTO data_version (id, version, updated_at)
+        SELECT 1, 0, COALESCE(MAX(updated_at), CURRENT_TIMESTAMP) FROM bills
+        """)
+        
+        # 建立法案全文索引
+        self.create_search_index(cursor)
+        
+        # 全文索引觸發器更新後再補算，避免每筆更新都重寫全文索引
+        if backfill_hashes:
+            self.rebuild_content_hashes(cursor)
+        if backfill_law_names:
+            self.rebuild_law_names(cursor)
+        
         self.conn.commit()
     
+    def create_search_index(self, cursor: sqlite3.Cursor = None):
+        """建立法案名稱、提案人與連署人的 FTS5 全文索引
+        
+        使用 trigram 分詞器，不需要中文斷詞即可支援任意子字串查詢，
+        並以觸發器讓索引與 bills 資料表保持同步。SQLite 版本低於 3.34 或沒有
+        FTS5 時不建立索引，fts_available 設為 False，搜尋改以 LIKE 比對。
+        
+        Args:
+            cursor: 資料庫游標，未提供時自行建立
+        """
+        cursor = cursor or self.conn.cursor()
+        
+        if sqlite3.sqlite_version_info < FTS_TRIGRAM_MIN_VERSION:
+            print(f"SQLite {sqlite3.sqlite_version} 不支援 trigram 全文索引，搜尋改用 LIKE 比對")
+            self.fts_available = False
+            return
+        
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'bills_fts'")
+        index_exists = cursor.fetchone() is not None
+        
+        try:
+            cursor.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS bills_fts USING fts5(
+                billName,
+                billProposer,
+                billCosignatory,
+                content='bills',
+                content_rowid='rowid',
+                tokenize='trigram'
+            )
+            """)
+        except sqlite3.OperationalError as e:
+            # 例如編譯時未啟用 FTS5
+            print(f"無法建立全文索引，搜尋改用 LIKE 比對: {e}")
+            self.fts_available = False
+            return
+        self.fts_available = True
+        
+        cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS bills_fts_insert AFTER INSERT ON bills BEGIN
+            INSERT INTO bills_fts(rowid, billName, billProposer, billCosignatory)
+            VALUES (new.rowid, new.billName, new.billProposer, new.billCosignatory);
+        END
+        """)
+        cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS bills_fts_delete AFTER DELETE ON bills BEGIN
+            INSERT INTO bills_fts(bills_fts, rowid, billName, billProposer, billCosignatory)
+            VALUES ('delete', old.rowid, old.billName, old.billProposer, old.billCosignatory);
+        END
+        """)
+        # 只有索引欄位變動時才更新全文索引，審查狀態、內容雜湊等欄位更新不必重寫索引；
+        # 舊資料庫的觸發器不限欄位，重新建立
+        cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = 'bills_fts_update'")
+        row = cursor.fetchone()
+        if row and 'UPDATE OF' not in row['sql']:
+            cursor.execute("DROP TRIGGER bills_fts_update")
+        cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS bills_fts_update
+        AFTER UPDATE OF billName, billProposer, billCosignatory ON bills BEGIN
+            INSERT INTO bills_fts(bills_fts, rowid, billName, billProposer, billCosignatory)
+            VALUES ('delete', old.rowid, old.billName, old.billProposer, old.billCosignatory);
+            INSERT INTO bills_fts(rowid, billName, billProposer, billCosignatory)
+            VALUES (new.rowid, new.billName, new.billProposer, new.billCosignatory);
+        END
+        """)
+        
+        # 既有資料庫第一次建立索引時，將現有法案寫入索引
+        if not index_exists:
+            self.rebuild_search_index(cursor)
+    
+    def rebuild_search_index(self, cursor: sqlite3.Cursor = None):
+        """依 bills 資料表內容重建全文索引
+        
+        Args:
+            cursor: 資料庫游標，未提供時自行建立
+        """
+        if not self.fts_available:
+            return
+        cursor = cursor or self.conn.cursor()
+        cursor.execute("INSERT INTO bills_fts(bills_fts) VALUES ('rebuild')")
+    
     def get_latest_term_session(self) -> Optional[Tuple[str, str]]:
         """獲取資料庫中最新的屆別和會期
         
@@ -113,82 +571,1037 @@ class Database:
             return row['term'], row['sessionPeriod']
         return None
     
-    def save_bills(self, bills: List[Dict], page_number: int = None):
+    def save_bills(self, bills: List[Dict], page_number: int = None) -> int:
         """儲存法案資料
         
+        先檢查所有資料列，略過缺少屆別、議案編號或欄位型別不正確的法案，
+        再於單一交易中以 executemany 批次寫入 bills、bill_articles 與 bill_members，
+        審查狀態有變動的法案同時寫入 bill_status_history。
+        寫入失敗時整批還原並拋出例外。
+        
         Args:
             bills: 法案資料列表
             page_number: 資料來源頁碼，如果提供則儲存到資料庫
+            
+        Returns:
+            int: 寫入的法案數
         """
+        # 同一批次中重複的法案以最後一筆為準
+        valid_bills = {}
+        for bill in bills:
+            error = validate_bill(bill)
+            if error:
+                print(f"略過無效的提案資料（{error}）: {json.dumps(bill, ensure_ascii=False, default=str)}")
+                continue
+            valid_bills[(bill['term'], bill['billNo'])] = bill
+        
+        if not valid_bills:
+            return 0
+        
+        law_names = {key: canonical_law_name(bill.get('billName')) for key, bill in valid_bills.items()}
+        bill_rows = [
+            [bill.get(column) for column in BILL_CONTENT_COLUMNS] + [page_number, bill_content_hash(bill), law_names[key]]
+            for key, bill in valid_bills.items()
+        ]
+        
+        try:
+            with self.conn:
+                cursor = self.conn.cursor()
+                cursor.executemany(RECORD_STATUS_CHANGE_SQL, [
+                    {'term': bill['term'], 'billNo': bill['billNo'], 'billStatus': bill.get('billStatus')}
+                    for bill in valid_bills.values()
+                ])
+                self._update_law_counts(cursor, valid_bills.values(), law_names)
+                cursor.executemany(UPSERT_BILL_SQL, bill_rows)
+                self._save_bill_articles(cursor, valid_bills.values(), law_names)
+                self._save_bill_members(cursor, valid_bills.values())
+                cursor.execute(BUMP_DATA_VERSION_SQL)
+        except sqlite3.Error as e:
+            print(f"儲存提案時發生錯誤，已還原本批次 {len(valid_bills)} 筆: {e}")
+            raise
+        
+        return len(valid_bills)
+    
+    @staticmethod
+    def _fetch_bill_rows(cursor: sqlite3.Cursor, keys: List[Tuple[str, str]],
+                         columns: List[str]) -> Dict[Tuple[str, str], sqlite3.Row]:
+        """分批以 (term, billNo) IN (VALUES ...) 讀出多筆法案，不必每筆法案查詢一次
+        
+        Args:
+            cursor: 資料庫游標
+            keys: (屆別, 議案編號) 列表
+            columns: 要讀取的欄位（程式內的常數，不可來自使用者輸入）
+            
+        Returns:
+            Dict[Tuple[str, str], sqlite3.Row]: (屆別, 議案編號) -> 資料列，資料庫中沒有的法案不在結果中
+        """
+        rows = {}
+        for start in range(0, len(keys), LAW_COUNTS_LOOKUP_CHUNK):
+            chunk = keys[start:start + LAW_COUNTS_LOOKUP_CHUNK]
+            cursor.execute(f"""
+            SELECT term, billNo, {', '.join(columns)} FROM bills
+            WHERE (term, billNo) IN (VALUES {', '.join(['(?, ?)'] * len(chunk))})
+            """, [value for key in chunk for value in key])
+            for row in cursor.fetchall():
+                rows[(row['term'], row['billNo'])] = row
+        return rows
+    
+    def _update_law_counts(self, cursor: sqlite3.Cursor, bills: Iterable[Dict],
+                           law_names: Dict[Tuple[str, str], str]):
+        """依法案寫入前後的屆別、會期與法律名稱增減 law_counts，需在寫入 bills 前呼叫
+        
+        Args:
+            cursor: 資料庫游標
+            bills: 即將寫入的法案資料
+            law_names: (屆別, 議案編號) -> 正式法律名稱
+        """
+        bills = list(bills)
+        old_rows = self._fetch_bill_rows(cursor, [(bill['term'], bill['billNo']) for bill in bills],
+                                         ['sessionPeriod', 'law_name'])
+        
+        deltas = Counter()
+        for bill in bills:
+            old = old_rows.get((bill['term'], bill['billNo']))
+            if old is not None and old['law_name']:
+                deltas[(bill['term'], old['sessionPeriod'], old['law_name'])] -= 1
+            new_law = law_names[(bill['term'], bill['billNo'])]
+            if new_law:
+                deltas[(bill['term'], bill.get('sessionPeriod'), new_law)] += 1
+        
+        changes = [(*key, delta) for key, delta in deltas.items() if delta]
+        if not changes:
+            return
+        cursor.executemany("""
+        INSERT INTO law_counts (term, sessionPeriod, law_name, count)
+        VALUES (?, ?, ?, ?)
+        ON CONFLICT(term, sessionPeriod, law_name) DO UPDATE SET count = count + excluded.count
+        """, changes)
+        cursor.execute("DELETE FROM law_counts WHERE count <= 0")
+    
+    def rebuild_law_counts(self, cursor: sqlite3.Cursor = None):
+        """依 bills 資料表重新統計 law_counts
+        
+        Args:
+            cursor: 資料庫游標，未提供時自行建立
+        """
+        cursor = cursor or self.conn.cursor()
+        cursor.execute("DELETE FROM law_counts")
+        cursor.execute("""
+        INSERT INTO law_counts (term, sessionPeriod, law_name, count)
+        SELECT term, sessionPeriod, law_name, COUNT(*)
+        FROM bills
+        WHERE law_name <> ''
+        GROUP BY term, sessionPeriod, law_name
+        """)
+    
+    def rebuild_law_names(self, cursor: sqlite3.Cursor = None):
+        """依 bills 資料表重新計算所有法案的正式法律名稱
+        
+        法律別名對照表（law_names.LAW_ALIASES）修改後執行，同時更新條號資料表的
+        分組鍵與 law_counts。
+        
+        Args:
+            cursor: 資料庫游標，未提供時自行建立
+        """
+        cursor = cursor or self.conn.cursor()
+        rows = self.conn.execute("SELECT term, billNo, billName FROM bills").fetchall()
+        cursor.executemany(
+            "UPDATE bills SET law_name = ? WHERE term = ? AND billNo = ?",
+            [(canonical_law_name(row['billName']), row['term'], row['billNo']) for row in rows]
+        )
+        cursor.execute("""
+        UPDATE bill_articles SET law_key = (
+            SELECT law_name FROM bills b WHERE b.term = bill_articles.term AND b.billNo = bill_articles.billNo
+        )
+        """)
+        self.rebuild_law_counts(cursor)
+    
+    def get_data_version(self) -> int:
+        """獲取資料版本號，法案或立委資料寫入後會變大
+        
+        Returns:
+            int: 資料版本號，尚未建立版本表時返回 0
+        """
+        return self.get_data_version_info()['version']
+    
+    def get_data_version_info(self) -> Dict:
+        """獲取資料版本號與最後寫入時間
+        
+        Returns:
+            Dict: {'version': 資料版本號, 'updated_at': 最後寫入時間（UTC，YYYY-MM-DD HH:MM:SS）或 None}
+        """
+        try:
+            row = self.conn.execute("SELECT version, updated_at FROM data_version WHERE id = 1").fetchone()
+        except sqlite3.OperationalError:
+            row = None
+        if row is None:
+            return {'version': 0, 'updated_at': None}
+        return {'version': row['version'], 'updated_at': row['updated_at']}
+    
+    def get_popular_laws(self, term: str = None, session_period: str = None, limit: int = 30) -> List[Dict]:
+        """從 law_counts 獲取提案數最多的法律
+        
+        Args:
+            term: 屆別，預設為資料庫中最新的屆別
+            session_period: 會期，None 表示全部會期
+            limit: 返回的法律數量
+            
+        Returns:
+            List[Dict]: {'law_name', 'total_count'}，依提案數多到少排序
+        """
+        if term is None:
+            latest = self.get_latest_term_session()
+            if latest is None:
+                return []
+            term = latest[0]
+        
+        conditions = ["term = ?"]
+        params = [term]
+        if session_period:
+            conditions.append("sessionPeriod = ?")
+            params.append(session_period)
+        params.append(limit)
+        
         cursor = self.conn.cursor()
+        cursor.execute(f"""
+        SELECT law_name, SUM(count) AS total_count
+        FROM law_counts
+        WHERE {' AND '.join(conditions)}
+        GROUP BY law_name
+        ORDER BY total_count DESC, law_name
+        LIMIT ?
+        """, params)
+        return [dict(row) for row in cursor.fetchall()]
+    
+    def sync_bills(self, bills: List[Dict], page_number: int = None) -> Dict[str, int]:
+        """增量同步法案資料，只寫入新增或內容雜湊改變的法案
         
-        # 檢查表結構
-        cursor.execute("PRAGMA table_info(bills)")
-        columns = {col['name']: col for col in cursor.fetchall()}
+        與 save_bills 不同，內容沒有變動的法案不會重寫（page_number 也維持
+        第一次寫入時的頁碼），每日排程重新抓取最新幾頁時只會寫入少數幾筆，
+        並能發現舊法案的審查狀態變動。
+        
+        Args:
+            bills: 法案資料列表
+            page_number: 資料來源頁碼
+            
+        Returns:
+            Dict[str, int]: {'inserted': 新增數, 'updated': 更新數, 'unchanged': 未變動數, 'invalid': 無效資料數}
+        """
+        result = {'inserted': 0, 'updated': 0, 'unchanged': 0, 'invalid': 0}
         
+        # 同一批次中重複的法案以最後一筆為準（與 save_bills 相同）
+        latest = {}
         for bill in bills:
-            try:
-                # 建立插入語句
-                sql = """
-                INSERT OR REPLACE INTO bills (
-                    term, sessionPeriod, sessionTimes, meetingTimes,
-                    billNo, billName, billOrg, billProposer,
-                    billCosignatory, billStatus, pdfUrl, docUrl,
-                    page_number, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                """
-                
-                params = (
-                    bill.get('term'),
-                    bill.get('sessionPeriod'),
-                    bill.get('sessionTimes'),
-                    bill.get('meetingTimes'),
-                    bill.get('billNo'),
-                    bill.get('billName'),
-                    bill.get('billOrg'),
-                    bill.get('billProposer'),
-                    bill.get('billCosignatory'),
-                    bill.get('billStatus'),
-                    bill.get('pdfUrl'),
-                    bill.get('docUrl'),
-                    page_number
-                )
-                
-                cursor.execute(sql, params)
-                
-            except sqlite3.Error as e:
-                print(f"儲存提案時發生錯誤: {e}")
-                print(f"提案資料: {json.dumps(bill, ensure_ascii=False)}")
+            if validate_bill(bill):
+                result['invalid'] += 1
+                continue
+            latest[(bill['term'], bill['billNo'])] = bill
+        
+        stored = self._fetch_bill_rows(self.conn.cursor(), list(latest), ['content_hash'])
+        changed = []
+        for key, bill in latest.items():
+            row = stored.get(key)
+            if row is None:
+                result['inserted'] += 1
+            elif row['content_hash'] != bill_content_hash(bill):
+                result['updated'] += 1
+            else:
+                result['unchanged'] += 1
                 continue
+            changed.append(bill)
+        
+        if changed:
+            self.save_bills(changed, page_number=page_number)
+        return result
+    
+    def rebuild_content_hashes(self, cursor: sqlite3.Cursor = None):
+        """依 bills 資料表重新計算所有法案的內容雜湊
         
+        Args:
+            cursor: 資料庫游標，未提供時自行建立
+        """
+        cursor = cursor or self.conn.cursor()
+        rows = self.conn.execute(
+            f"SELECT {', '.join(BILL_CONTENT_COLUMNS)} FROM bills"
+        ).fetchall()
+        cursor.executemany(
+            "UPDATE bills SET content_hash = ? WHERE term = ? AND billNo = ?",
+            [(bill_content_hash(dict(row)), row['term'], row['billNo']) for row in rows]
+        )
+    
+    @contextmanager
+    def deferred_indexes(self):
+        """全部重新載入法案時延後建立索引
+        
+        進入時刪除 BULK_LOAD_INDEXES 中的索引與全文索引觸發器，離開時重新建立
+        索引並一次重建全文索引。只適合 reset_and_download_all 的暫存資料庫這類全部重新
+        載入的情境：載入期間以法案名稱、全文搜尋的查詢會變慢或找不到資料。
+        """
+        with self.conn:
+            for index in BULK_LOAD_INDEXES:
+                self.conn.execute(f"DROP INDEX IF EXISTS {index}")
+            for trigger in FTS_TRIGGERS:
+                self.conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        try:
+            yield self
+        finally:
+            print("重新建立索引與全文索引...")
+            with self.conn:
+                cursor = self.conn.cursor()
+                for sql in BULK_LOAD_INDEXES.values():
+                    cursor.execute(sql)
+                self.create_search_index(cursor)
+                self.rebuild_search_index(cursor)
+    
+    def _save_bill_articles(self, cursor: sqlite3.Cursor, bills: Iterable[Dict],
+                            law_names: Dict[Tuple[str, str], str]):
+        """解析提案名稱中的條號並寫入 bill_articles
+        
+        Args:
+            cursor: 資料庫游標
+            bills: 法案資料
+            law_names: (屆別, 議案編號) -> 正式法律名稱，作為條號分組鍵
+        """
+        keys = []
+        rows = []
+        for bill in bills:
+            term = bill.get('term')
+            bill_no = bill.get('billNo')
+            bill_name = bill.get('billName') or ''
+            keys.append((term, bill_no))
+            
+            law_key = law_names[(term, bill_no)]
+            rows.extend(
+                (term, bill_no, law_key, article['number'], article['sub_number'], article['full_text'])
+                for article in extract_article_numbers(bill_name)
+            )
+        
+        cursor.executemany("DELETE FROM bill_articles WHERE term = ? AND billNo = ?", keys)
+        cursor.executemany("""
+        INSERT OR IGNORE INTO bill_articles (term, billNo, law_key, number, sub_number, full_text)
+        VALUES (?, ?, ?, ?, ?, ?)
+        """, rows)
+    
+    def rebuild_bill_articles(self, cursor: sqlite3.Cursor = None):
+        """依 bills 資料表重新解析所有提案的條號
+        
+        Args:
+            cursor: 資料庫游標，未提供時自行建立
+        """
+        cursor = cursor or self.conn.cursor()
+        cursor.execute("DELETE FROM bill_articles")
+        
+        for bills in self._iter_bill_batches(('term', 'billNo', 'billName', 'law_name')):
+            law_names = {(bill['term'], bill['billNo']): bill['law_name'] for bill in bills}
+            self._save_bill_articles(cursor, bills, law_names)
+    
+    def _save_bill_members(self, cursor: sqlite3.Cursor, bills: Iterable[Dict]):
+        """切分提案人與連署人並寫入 bill_members，黨籍依該屆資料判定
+        
+        Args:
+            cursor: 資料庫游標
+            bills: 法案資料
+        """
+        keys = []
+        rows = []
+        for bill in bills:
+            term = bill.get('term')
+            bill_no = bill.get('billNo')
+            keys.append((term, bill_no))
+            for role, field in (('proposer', 'billProposer'), ('cosignatory', 'billCosignatory')):
+                for name in extract_names(bill.get(field), keep_romanization=False):
+                    rows.append((term, bill_no, name, role, get_party(name, term)))
+        
+        cursor.executemany("DELETE FROM bill_members WHERE term = ? AND billNo = ?", keys)
+        cursor.executemany("""
+        INSERT OR IGNORE INTO bill_members (term, billNo, name, role, party)
+        VALUES (?, ?, ?, ?, ?)
+        """, rows)
+    
+    def rebuild_bill_members(self, cursor: sqlite3.Cursor = None):
+        """依 bills 資料表重新切分所有提案的提案人與連署人
+        
+        Args:
+            cursor: 資料庫游標，未提供時自行建立
+        """
+        cursor = cursor or self.conn.cursor()
+        cursor.execute("DELETE FROM bill_members")
+        
+        for bills in self._iter_bill_batches(('term', 'billNo', 'billProposer', 'billCosignatory')):
+            self._save_bill_members(cursor, bills)
+    
+    def refresh_member_parties(self):
+        """立委資料更新後，重新判定 bill_members 中每位成員的黨籍"""
+        cursor = self.conn.cursor()
+        rows = cursor.execute("SELECT DISTINCT term, name FROM bill_members").fetchall()
+        cursor.executemany(
+            "UPDATE bill_members SET party = ? WHERE term = ? AND name = ?",
+            [(get_party(row['name'], row['term']), row['term'], row['name']) for row in rows]
+        )
+        # 黨籍改變會影響搜尋結果頁面的政黨統計
+        cursor.execute(BUMP_DATA_VERSION_SQL)
         self.conn.commit()
     
-    def get_all_bills(self) -> List[Dict]:
-        """獲取所有法案資料
+    def get_term_members(self, term: str, session_period: str = None, role: str = 'proposer') -> List[Dict]:
+        """獲取某屆（會期）所有提案或連署過法案的成員
         
+        Args:
+            term: 屆別
+            session_period: 會期，None 表示全部會期
+            role: proposer（提案）或 cosignatory（連署）
+            
         Returns:
-            List[Dict]: 法案資料列表
+            List[Dict]: 成員列表，包含 name、party 與 bills_count
         """
+        conditions = ["m.term = ?", "m.role = ?"]
+        params = [term, role]
+        if session_period:
+            conditions.append("b.sessionPeriod = ?")
+            params.append(session_period)
+        
         cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM bills")
+        cursor.execute(f"""
+        SELECT m.name, m.party, COUNT(*) AS bills_count
+        FROM bill_members m
+        JOIN bills b ON b.term = m.term AND b.billNo = m.billNo
+        WHERE {' AND '.join(conditions)}
+        GROUP BY m.name, m.party
+        ORDER BY m.name
+        """, params)
         return [dict(row) for row in cursor.fetchall()]
     
-    def search_bills_by_law(self, law_name: str) -> List[Dict]:
+    def get_member_bills(self, name: str, term: str, role: Optional[str] = 'proposer',
+                         session_period: str = None) -> List[Dict]:
+        """以 bill_members 索引查詢某位立委提案或連署的法案
+        
+        Args:
+            name: 立委姓名
+            term: 屆別
+            role: proposer（提案）或 cosignatory（連署），None 表示兩者一次查詢
+            session_period: 會期，None 表示全部會期
+            
+        Returns:
+            List[Bill]: 法案列表，role 欄位為該立委在法案中的角色
+        """
+        conditions = ["m.name = ?", "m.term = ?"]
+        params = [name, term]
+        if role:
+            conditions.append("m.role = ?")
+            params.append(role)
+        if session_period:
+            conditions.append("b.sessionPeriod = ?")
+            params.append(session_period)
+        
+        cursor = self.conn.cursor()
+        cursor.execute(f"""
+        SELECT b.billNo, b.billName, b.billOrg, b.billProposer, b.billCosignatory,
+               b.term, b.sessionPeriod, b.billStatus, b.pdfUrl, b.docUrl, b.law_name, m.role
+        FROM bill_members m
+        JOIN bills b ON b.term = m.term AND b.billNo = m.billNo
+        WHERE {' AND '.join(conditions)}
+        """, params)
+        return Bill.from_rows(cursor)
+    
+    def get_legislator_law_stats(self, term: str, session_period: str = None, role: str = 'proposer',
+                                 limit: int = None, top_laws: int = 10) -> List[Dict]:
+        """以一次查詢統計某屆（會期）每位立委提案或連署的法律與審查狀態分布
+        
+        先由 bill_members 計算每位立委的法案數，再以 (name, term, role, billNo) 索引
+        只讀取前 limit 名立委的法案，依法律與審查狀態分組；法律只保留每位立委數量
+        最多的 top_laws 部。
+        
+        Args:
+            term: 屆別
+            session_period: 會期，None 表示全部會期
+            role: proposer（提案）或 cosignatory（連署）
+            limit: 只返回法案數最多的前幾位立委，None 表示全部
+            top_laws: 每位立委返回的法律數
+            
+        Returns:
+            List[Dict]: 依法案數由多到少排序，每位立委包含 name、party、bills_count、
+                laws（[{'law_name', 'count'}]，由多到少）與 statuses（{審查狀態: 法案數}，
+                沒有狀態的法案以空字串表示）
+        """
+        # 沒有指定會期時，提案數直接由 bill_members 計算，不必聯結 bills
+        session_join = ""
+        member_params = [term, role]
+        if session_period:
+            session_join = "JOIN bills b ON b.term = m.term AND b.billNo = m.billNo AND b.sessionPeriod = ?"
+            member_params.insert(0, session_period)
+        
+        cursor = self.conn.cursor()
+        cursor.execute(f"""
+        WITH totals AS (
+            SELECT m.name, MAX(m.party) AS party, COUNT(*) AS bills_count
+            FROM bill_members m
+            {session_join}
+            WHERE m.term = ? AND m.role = ?
+            GROUP BY m.name
+            ORDER BY bills_count DESC, m.name
+            LIMIT ?
+        ),
+        member_bills AS (
+            -- 只讀取前幾名立委的法案，以 (name, term, role, billNo) 索引查詢
+            SELECT m.name, b.law_name, COALESCE(b.billStatus, '') AS status
+            FROM bill_members m
+            JOIN bills b ON b.term = m.term AND b.billNo = m.billNo
+            WHERE m.name IN (SELECT name FROM totals) AND m.term = ? AND m.role = ?
+            {'AND b.sessionPeriod = ?' if session_period else ''}
+        ),
+        groups AS (
+            SELECT name, 'law' AS kind, law_name AS value, COUNT(*) AS count,
+                   ROW_NUMBER() OVER (PARTITION BY name ORDER BY COUNT(*) DESC, law_name) AS rank
+            FROM member_bills
+            GROUP BY name, law_name
+            UNION ALL
+            SELECT name, 'status', status, COUNT(*), 0
+            FROM member_bills
+            GROUP BY name, status
+        )
+        SELECT t.name, t.party, t.bills_count, g.kind, g.value, g.count
+        FROM totals t
+        JOIN groups g ON g.name = t.name
+        WHERE g.rank <= ?
+        ORDER BY t.bills_count DESC, t.name, g.count DESC
+        """, member_params + [limit if limit else -1, term, role]
+             + ([session_period] if session_period else []) + [top_laws])
+        
+        legislators = {}
+        for row in cursor.fetchall():
+            legislator = legislators.get(row['name'])
+            if legislator is None:
+                legislator = legislators[row['name']] = {
+                    'name': row['name'],
+                    'party': row['party'],
+                    'bills_count': row['bills_count'],
+                    'laws': [],
+                    'statuses': {},
+                }
+            if row['kind'] == 'law':
+                legislator['laws'].append({'law_name': row['value'], 'count': row['count']})
+            else:
+                legislator['statuses'][row['value']] = row['count']
+        return list(legislators.values())
+    
+    def get_status_changes(self, status: str = THIRD_READING_STATUS, days: int = 30) -> List[Dict]:
+        """獲取最近 days 天內審查狀態變為 status 的法案
+        
+        Args:
+            status: 審查狀態，預設為三讀
+            days: 最近幾天
+            
+        Returns:
+            List[Dict]: 法案資料，含 old_status、new_status 與 observed_at，依觀察時間新到舊排序
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("""
+        SELECT b.*, h.old_status, h.new_status, h.observed_at
+        FROM bill_status_history h
+        JOIN bills b ON b.term = h.term AND b.billNo = h.billNo
+        WHERE h.new_status = ? AND h.observed_at >= datetime('now', ?)
+        ORDER BY h.observed_at DESC
+        """, (status, f'-{int(days)} days'))
+        return [dict(row) for row in cursor.fetchall()]
+    
+    def get_passage_latency(self, min_bills: int = 1) -> List[Dict]:
+        """計算各法律從一讀到三讀的天數中位數
+        
+        起點為法案第一次被觀察到 FIRST_READING_STATUSES 狀態的時間，終點為第一次
+        被觀察到三讀的時間。時間為資料更新時觀察到的時間，而非院會日期，精確度
+        取決於排程更新的頻率。
+        
+        Args:
+            min_bills: 至少需有幾筆三讀法案才列出該法律
+            
+        Returns:
+            List[Dict]: {'law_name', 'bills', 'median_days'}，依法案數多到少排序
+        """
+        placeholders = ', '.join('?' * len(FIRST_READING_STATUSES))
+        cursor = self.conn.cursor()
+        cursor.execute(f"""
+        WITH first_reading AS (
+            SELECT term, billNo, MIN(observed_at) AS observed_at
+            FROM bill_status_history
+            WHERE new_status IN ({placeholders})
+            GROUP BY term, billNo
+        ),
+        third_reading AS (
+            SELECT term, billNo, MIN(observed_at) AS observed_at
+            FROM bill_status_history
+            WHERE new_status = ?
+            GROUP BY term, billNo
+        )
+        SELECT b.law_name, julianday(t.observed_at) - julianday(f.observed_at) AS days
+        FROM third_reading t
+        JOIN first_reading f ON f.term = t.term AND f.billNo = t.billNo
+        JOIN bills b ON b.term = t.term AND b.billNo = t.billNo
+        WHERE t.observed_at >= f.observed_at
+        """, (*FIRST_READING_STATUSES, THIRD_READING_STATUS))
+        
+        days_by_law = defaultdict(list)
+        for row in cursor.fetchall():
+            days_by_law[row['law_name']].append(row['days'])
+        
+        results = [
+            {'law_name': law_name, 'bills': len(days), 'median_days': statistics.median(days)}
+            for law_name, days in days_by_law.items()
+            if law_name and len(days) >= min_bills
+        ]
+        results.sort(key=lambda item: (-item['bills'], item['median_days']))
+        return results
+    
+    def get_all_bills(self) -> List[Bill]:
+        """獲取所有法案資料（BILL_FIELDS 欄位，不含 page_number、content_hash 等寫入時使用的欄位）
+        
+        結果全部保存在記憶體中；逐筆處理全部法案時請使用 iter_bills。
+        
+        Returns:
+            List[Bill]: 法案列表
+        """
+        cursor = self.conn.execute(f"SELECT {', '.join(BILL_FIELDS)} FROM bills")
+        return Bill.from_rows(cursor)
+    
+    def get_bill_statuses(self) -> List[str]:
+        """獲取資料庫中出現過的審查狀態
+        
+        Returns:
+            List[str]: 審查狀態列表（沒有狀態的法案以空字串表示）
+        """
+        cursor = self.conn.execute("SELECT DISTINCT COALESCE(billStatus, '') AS status FROM bills")
+        return [row['status'] for row in cursor.fetchall()]
+    
+    def iter_bills(self, filters: Dict = None, fields: Iterable[str] = None,
+                   batch_size: int = DEFAULT_BATCH_SIZE, ordered: bool = True) -> Iterator[Bill]:
+        """依條件逐批讀取法案，不會一次把整個結果載入記憶體
+        
+        查詢在呼叫時立即執行（欄位或條件錯誤會立刻拋出例外），返回的迭代器
+        每次以 fetchmany 讀取 batch_size 筆。結果依屆別、會期、次別由新到舊排序；
+        ordered 為 False 時依 rowid 順序讀取，全表掃描不需要先排序全部結果。
+        
+        Args:
+            filters: 篩選條件，可包含
+                law_name: 法律名稱（與搜尋相同的比對方式）
+                term: 屆別
+                session_period: 會期
+                statuses: 審查狀態列表（空字串代表沒有狀態）
+                proposer: 提案人姓名或提案機關
+                article: (條號, 之幾)
+            fields: 要讀取的欄位，預設為 BILL_FIELDS 全部欄位
+            batch_size: 每批讀取的筆數
+            ordered: 是否依屆別、會期、次別由新到舊排序
+            
+        Returns:
+            Iterator[Bill]: 法案
+            
+        Raises:
+            ValueError: 欄位名稱不正確
+        """
+        filters = filters or {}
+        fields = list(fields or BILL_FIELDS)
+        unknown = [field for field in fields if field not in BILL_FIELDS]
+        if unknown:
+            raise ValueError(f"不支援的欄位: {', '.join(unknown)}")
+        
+        conditions = []
+        params = ()
+        if filters.get('law_name'):
+            where, params = self._search_conditions(filters['law_name'], filters.get('term'),
+                                                    filters.get('session_period'))
+            conditions.append(where)
+        else:
+            if filters.get('term'):
+                conditions.append("term = ?")
+                params += (filters['term'],)
+            if filters.get('session_period'):
+                conditions.append("sessionPeriod = ?")
+                params += (filters['session_period'],)
+        
+        statuses = filters.get('statuses')
+        if statuses is not None:
+            if not statuses:
+                return iter(())
+            conditions.append(f"COALESCE(billStatus, '') IN ({', '.join('?' * len(statuses))})")
+            params += tuple(statuses)
+        
+        if filters.get('proposer'):
+            # 立委以 bill_members 的 (name, term, role, billNo) 索引查詢，政府機關與黨團比對提案機關
+            conditions.append("""((term, billNo) IN (
+                SELECT term, billNo FROM bill_members WHERE name = ? AND role = 'proposer'
+            ) OR billOrg = ?)""")
+            params += (filters['proposer'], filters['proposer'])
+        
+        if filters.get('article'):
+            conditions.append("""EXISTS (
+                SELECT 1 FROM bill_articles a
+                WHERE a.term = bills.term AND a.billNo = bills.billNo AND a.number = ? AND a.sub_number = ?
+            )""")
+            params += tuple(filters['article'])
+        
+        if ordered:
+            order = ', '.join(f'{expression} DESC' for _, expression in SEARCH_SORT_COLUMNS)
+        else:
+            order = 'rowid'
+        cursor = self.conn.execute(f"""
+        SELECT {', '.join(fields)}
+        FROM bills
+        {'WHERE ' + ' AND '.join(conditions) if conditions else ''}
+        ORDER BY {order}
+        """, params)
+        return self._iter_rows(cursor, batch_size)
+    
+    @staticmethod
+    def _iter_rows(cursor: sqlite3.Cursor, batch_size: int, convert=Bill.from_rows) -> Iterator:
+        """以 fetchmany 逐批讀取查詢結果，convert 將每批的 sqlite3.Row 轉為紀錄"""
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            yield from convert(rows)
+    
+    def _iter_bill_batches(self, fields: Iterable[str], batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[List[Bill]]:
+        """依 rowid 順序逐批讀取全部法案，每次返回一批"""
+        bills = self.iter_bills(fields=fields, batch_size=batch_size, ordered=False)
+        while True:
+            batch = list(islice(bills, batch_size))
+            if not batch:
+                break
+            yield batch
+    
+    @staticmethod
+    def _law_search_terms(law_name: str) -> Tuple[str, List[str]]:
+        """取得法律名稱實際使用的搜尋字串與需排除的字串
+        
+        Args:
+            law_name: 使用者輸入的法律名稱
+            
+        Returns:
+            Tuple[str, List[str]]: (搜尋字串, 排除字串列表)
+        """
+        base_name = law_name.strip('「」')  # 移除可能的引號
+        
+        # 特殊處理某些法案
+        if '刑法' in base_name and '陸海空軍刑法' not in base_name:
+            return '中華民國刑法', ['施行法', '陸海空軍刑法']
+        if base_name == '民法':
+            return '民法', ['施行法', '入出國及移民法']
+        
+        # 一般法律搜尋
+        return base_name, ['施行法']
+    
+    def _text_match_condition(self, text: str, columns: List[str], alias: str = '') -> Tuple[str, tuple]:
+        """建立以全文索引比對子字串的查詢條件
+        
+        trigram 分詞器只能索引三個字以上的字串，較短的關鍵字或全文索引無法使用時
+        改用 LIKE 比對。
+        
+        Args:
+            text: 搜尋字串
+            columns: 要比對的欄位
+            alias: bills 資料表在查詢中的別名
+            
+        Returns:
+            Tuple[str, tuple]: (SQL 條件, 參數)
+        """
+        prefix = f"{alias}." if alias else ''
+        if len(text) >= 3 and self.fts_available:
+            phrase = '"' + text.replace('"', '""') + '"'
+            match = f"{{{' '.join(columns)}}} : {phrase}"
+            return f"{prefix}rowid IN (SELECT rowid FROM bills_fts WHERE bills_fts MATCH ?)", (match,)
+        
+        condition = " OR ".join(f"{prefix}{column} LIKE ?" for column in columns)
+        return f"({condition})", tuple(f"%{text}%" for _ in columns)
+    
+    def _has_law_name(self, law_name: str) -> bool:
+        """檢查資料庫中是否有正式法律名稱為 law_name 的法案"""
+        row = self.conn.execute("SELECT 1 FROM bills WHERE law_name = ? LIMIT 1", (law_name,)).fetchone()
+        return row is not None
+    
+    def _search_conditions(self, law_name: str, term: str = None, session_period: str = None) -> Tuple[str, tuple]:
+        """建立法律名稱搜尋的 WHERE 條件
+        
+        輸入的名稱（含簡稱，例如 勞基法）換成正式法律名稱後，若資料庫中有該法律的
+        法案就以 law_name 等號比對；否則視為名稱片段，退回全文索引比對提案名稱。
+        
+        Args:
+            law_name: 法律名稱
+            term: 屆別
+            session_period: 會期
+            
+        Returns:
+            Tuple[str, tuple]: (SQL 條件, 參數)
+        """
+        canonical = canonical_law_name(law_name)
+        if canonical and self._has_law_name(canonical):
+            conditions = ["law_name = ?"]
+            params = (canonical,)
+        else:
+            keyword, excludes = self._law_search_terms(law_name)
+            
+            condition, params = self._text_match_condition(keyword, ['billName'])
+            conditions = [condition]
+            for exclude in excludes:
+                conditions.append("billName NOT LIKE ?")
+                params += (f"%{exclude}%",)
+        
+        # 添加屆別條件
+        if term:
+            conditions.append("term = ?")
+            params += (term,)
+        
+        # 添加會期條件
+        if session_period:
+            conditions.append("sessionPeriod = ?")
+            params += (session_period,)
+        
+        return ' AND '.join(conditions), params
+    
+    def search_bills(self, law_name: str, term: str = None, session_period: str = None) -> List[Bill]:
+        """依法律名稱搜尋提案，供網站與 Streamlit 共用
+        
+        Args:
+            law_name: 法律名稱
+            term: 屆別，未提供時搜尋全部屆別
+            session_period: 會期，未提供時搜尋全部會期
+            
+        Returns:
+            List[Bill]: 相關提案列表，依屆別、會期、次別由新到舊排序
+        """
+        where, params = self._search_conditions(law_name, term, session_period)
+        
+        cursor = self.conn.cursor()
+        cursor.execute(f"""
+        SELECT {', '.join(SEARCH_RESULT_COLUMNS)}
+        FROM bills 
+        WHERE {where}
+        ORDER BY 
+            CAST(term AS INTEGER) DESC,
+            CAST(sessionPeriod AS INTEGER) DESC,
+            COALESCE(CAST(sessionTimes AS INTEGER), 0) DESC,
+            billNo DESC
+        """, params)
+        return Bill.from_rows(cursor)
+    
+    def search_bills_by_article(self, law_name: str, term: str = None, session_period: str = None) -> List[Dict]:
+        """依法律名稱搜尋提案，並以 bill_articles 按條號分組
+        
+        沒有條號的提案歸入「其他修正」，排在最後。同一提案修正多個條號時，
+        各分組共用同一個法案紀錄。
+        
+        Args:
+            law_name: 法律名稱
+            term: 屆別，未提供時搜尋全部屆別
+            session_period: 會期，未提供時搜尋全部會期
+            
+        Returns:
+            List[Dict]: 條號分組列表，每組包含 article、bills 與 bills_count
+        """
+        where, params = self._search_conditions(law_name, term, session_period)
+        
+        cursor = self.conn.cursor()
+        cursor.execute(f"""
+        WITH matched AS (
+            SELECT {', '.join(SEARCH_RESULT_COLUMNS)}
+            FROM bills 
+            WHERE {where}
+        )
+        SELECT m.*, COALESCE(a.full_text, '其他修正') AS article
+        FROM matched m
+        LEFT JOIN bill_articles a ON a.term = m.term AND a.billNo = m.billNo
+        ORDER BY 
+            a.number IS NULL,
+            a.number,
+            a.sub_number,
+            CAST(m.term AS INTEGER) DESC,
+            CAST(m.sessionPeriod AS INTEGER) DESC,
+            COALESCE(CAST(m.sessionTimes AS INTEGER), 0) DESC,
+            m.billNo DESC
+        """, params)
+        
+        groups = []
+        bills = {}
+        for row in cursor:
+            article = row['article']
+            key = (row['term'], row['billNo'])
+            bill = bills.get(key)
+            if bill is None:
+                bill = bills[key] = Bill.from_row(row, SEARCH_RESULT_COLUMNS)
+            
+            if not groups or groups[-1]['article'] != article:
+                groups.append({'article': article, 'bills': [], 'bills_count': 0})
+            groups[-1]['bills'].append(bill)
+            groups[-1]['bills_count'] += 1
+        
+        return groups
+    
+    def count_bills(self, law_name: str, term: str = None, session_period: str = None) -> int:
+        """計算符合法律名稱搜尋的提案數
+        
+        Args:
+            law_name: 法律名稱
+            term: 屆別，未提供時搜尋全部屆別
+            session_period: 會期，未提供時搜尋全部會期
+            
+        Returns:
+            int: 提案數
+        """
+        where, params = self._search_conditions(law_name, term, session_period)
+        return self.conn.execute(f"SELECT COUNT(*) FROM bills WHERE {where}", params).fetchone()[0]
+    
+    def count_bills_by_article(self, law_name: str, term: str = None, session_period: str = None) -> List[Dict]:
+        """依條號統計符合搜尋的提案數，只取分組標題，不讀取法案內容
+        
+        Args:
+            law_name: 法律名稱
+            term: 屆別，未提供時搜尋全部屆別
+            session_period: 會期，未提供時搜尋全部會期
+            
+        Returns:
+            List[Dict]: {'article', 'number', 'sub_number', 'bills_count'}，依條號排序，
+                        沒有條號的提案歸入「其他修正」（number 為 None），排在最後
+        """
+        where, params = self._search_conditions(law_name, term, session_period)
+        
+        cursor = self.conn.cursor()
+        cursor.execute(f"""
+        WITH matched AS (
+            SELECT term, billNo FROM bills WHERE {where}
+        )
+        SELECT a.full_text AS article, a.number, a.sub_number, COUNT(*) AS bills_count
+        FROM matched m
+        JOIN bill_articles a ON a.term = m.term AND a.billNo = m.billNo
+        GROUP BY a.number, a.sub_number
+        ORDER BY a.number, a.sub_number
+        """, params)
+        groups = [dict(row) for row in cursor.fetchall()]
+        
+        cursor.execute(f"""
+        SELECT COUNT(*) FROM bills
+        WHERE {where}
+        AND NOT EXISTS (SELECT 1 FROM bill_articles a WHERE a.term = bills.term AND a.billNo = bills.billNo)
+        """, params)
+        others = cursor.fetchone()[0]
+        if others:
+            groups.append({'article': '其他修正', 'number': None, 'sub_number': None, 'bills_count': others})
+        return groups
+    
+    def count_bills_by_status(self, law_name: str, term: str = None, session_period: str = None) -> Dict[str, int]:
+        """依審查狀態統計符合搜尋的提案數
+        
+        Args:
+            law_name: 法律名稱
+            term: 屆別，未提供時搜尋全部屆別
+            session_period: 會期，未提供時搜尋全部會期
+            
+        Returns:
+            Dict[str, int]: 審查狀態（沒有狀態時為空字串） -> 提案數
+        """
+        where, params = self._search_conditions(law_name, term, session_period)
+        cursor = self.conn.execute(f"""
+        SELECT COALESCE(billStatus, '') AS status, COUNT(*) AS bills_count
+        FROM bills
+        WHERE {where}
+        GROUP BY status
+        """, params)
+        return {row['status']: row['bills_count'] for row in cursor.fetchall()}
+    
+    def search_bills_page(self, law_name: str, term: str = None, session_period: str = None,
+                          article=None, statuses: List[str] = None, cursor: str = None,
+                          limit: int = DEFAULT_PAGE_SIZE) -> Tuple[List[Bill], Optional[str]]:
+        """以游標分頁讀取單一分組的搜尋結果
+        
+        游標記錄上一頁最後一筆的排序鍵，下一頁從該筆之後開始讀取（keyset 分頁），
+        不論翻到第幾頁都只需讀取一頁的資料。
+        
+        Args:
+            law_name: 法律名稱
+            term: 屆別，未提供時搜尋全部屆別
+            session_period: 會期，未提供時搜尋全部會期
+            article: (條號, 之幾) 只讀取修正該條的提案；OTHER_ARTICLE_GROUP 表示沒有條號的提案
+            statuses: 只讀取這些審查狀態的提案（空字串代表沒有狀態）
+            cursor: 上一頁返回的游標，未提供時從第一筆開始
+            limit: 每頁法案數
+            
+        Returns:
+            Tuple[List[Bill], Optional[str]]: (法案列表, 下一頁游標)，沒有下一頁時游標為 None
+            
+        Raises:
+            ValueError: 游標格式不正確
+        """
+        where, params = self._search_conditions(law_name, term, session_period)
+        conditions = [where]
+        
+        if article == OTHER_ARTICLE_GROUP:
+            conditions.append("NOT EXISTS (SELECT 1 FROM bill_articles a WHERE a.term = bills.term AND a.billNo = bills.billNo)")
+        elif article is not None:
+            conditions.append("""EXISTS (
+                SELECT 1 FROM bill_articles a
+                WHERE a.term = bills.term AND a.billNo = bills.billNo AND a.number = ? AND a.sub_number = ?
+            )""")
+            params += tuple(article)
+        
+        if statuses is not None:
+            if not statuses:
+                return [], None
+            conditions.append(f"COALESCE(billStatus, '') IN ({', '.join('?' * len(statuses))})")
+            params += tuple(statuses)
+        
+        sort_expressions = [expression for _, expression in SEARCH_SORT_COLUMNS]
+        if cursor:
+            conditions.append(f"({', '.join(sort_expressions)}) < (?, ?, ?, ?)")
+            params += self._decode_cursor(cursor)
+        
+        rows = self.conn.execute(f"""
+        SELECT {', '.join(SEARCH_RESULT_COLUMNS)},
+               {', '.join(f'{expression} AS {name}' for name, expression in SEARCH_SORT_COLUMNS)}
+        FROM bills
+        WHERE {' AND '.join(conditions)}
+        ORDER BY {', '.join(f'{expression} DESC' for expression in sort_expressions)}
+        LIMIT ?
+        """, params + (limit + 1,)).fetchall()
+        
+        bills = Bill.from_rows(rows[:limit], SEARCH_RESULT_COLUMNS)
+        next_cursor = None
+        if len(rows) > limit:
+            # 游標為本頁最後一筆的排序鍵
+            next_cursor = self._encode_cursor([rows[limit - 1][name] for name, _ in SEARCH_SORT_COLUMNS])
+        return bills, next_cursor
+    
+    @staticmethod
+    def _encode_cursor(sort_key: List) -> str:
+        """將排序鍵編碼為網址安全的游標字串"""
+        content = json.dumps(sort_key, ensure_ascii=False, separators=(',', ':'))
+        return base64.urlsafe_b64encode(content.encode('utf-8')).decode('ascii').rstrip('=')
+    
+    @staticmethod
+    def _decode_cursor(cursor: str) -> tuple:
+        """解碼游標字串，返回 (屆別, 會期, 次別, 議案編號)"""
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            sort_key = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8'))
+        except (ValueError, UnicodeError) as e:
+            raise ValueError(f"游標格式不正確: {cursor}") from e
+        if (not isinstance(sort_key, list) or len(sort_key) != 4
+                or not all(isinstance(value, int) for value in sort_key[:3])
+                or not isinstance(sort_key[3], str)):
+            raise ValueError(f"游標格式不正確: {cursor}")
+        return tuple(sort_key)
+    
+    def search_bills_by_law(self, law_name: str) -> List[Bill]:
         """搜尋特定法律的相關提案
         
         Args:
             law_name: 法律名稱
             
         Returns:
-            List[Dict]: 相關提案列表
+            List[Bill]: 相關提案列表
         """
         cursor = self.conn.cursor()
         cursor.execute("""
         SELECT * FROM bills 
-        WHERE billName LIKE ? 
+        WHERE law_name = ? 
         ORDER BY term DESC, sessionPeriod DESC, sessionTimes DESC
-        """, (f"%{law_name}%",))
-        return [dict(row) for row in cursor.fetchall()]
+        """, (canonical_law_name(law_name),))
+        return Bill.from_rows(cursor)
     
     def get_bills_count(self) -> int:
         """獲取資料庫中的法案總數
@@ -205,6 +1618,10 @@ class Database:
         cursor = self.conn.cursor()
         try:
             cursor.execute("DELETE FROM bills")
+            cursor.execute("DELETE FROM bill_articles")
+            cursor.execute("DELETE FROM law_counts")
+            cursor.execute("DELETE FROM bill_members")
+            cursor.execute(BUMP_DATA_VERSION_SQL)
             self.conn.commit()
             print("已成功清除所有資料")
         except sqlite3.Error as e:
@@ -256,9 +1673,13 @@ class Database:
                 continue
         
         self.conn.commit()
+        
+        # 重新載入立委黨籍查詢表，並更新已儲存法案成員的黨籍
+        reload_legislators()
+        self.refresh_member_parties()
     
     def get_all_legislators(self) -> List[Dict]:
-        """獲取所有立法委員資料
+        """獲取所有立法委員資料（逐筆處理時請使用 iter_legislators）
         
         Returns:
             List[Dict]: 立法委員資料列表
@@ -267,6 +1688,30 @@ class Database:
         cursor.execute("SELECT * FROM legislators")
         return [dict(row) for row in cursor.fetchall()]
     
+    def iter_legislators(self, term: str = None, fields: Iterable[str] = None,
+                         batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[Dict]:
+        """逐批讀取立法委員資料，不會一次把整個結果載入記憶體
+        
+        Args:
+            term: 屆別，None 表示全部屆別
+            fields: 要讀取的欄位，預設為 LEGISLATOR_FIELDS 全部欄位
+            batch_size: 每批讀取的筆數
+            
+        Returns:
+            Iterator[Dict]: 立法委員資料
+            
+        Raises:
+            ValueError: 欄位名稱不正確
+        """
+        fields = list(fields or LEGISLATOR_FIELDS)
+        unknown = [field for field in fields if field not in LEGISLATOR_FIELDS]
+        if unknown:
+            raise ValueError(f"不支援的欄位: {', '.join(unknown)}")
+        
+        where, params = ("WHERE term = ?", (term,)) if term else ("", ())
+        cursor = self.conn.execute(f"SELECT {', '.join(fields)} FROM legislators {where} ORDER BY rowid", params)
+        return self._iter_rows(cursor, batch_size, convert=lambda rows: [dict(row) for row in rows])
+    
     def get_legislators_by_term(self, term: str) -> List[Dict]:
         """獲取特定屆別的立法委員資料
         
@@ -296,6 +1741,7 @@ class Database:
         try:
             cursor.execute("DELETE FROM legislators")
             self.conn.commit()
+            reload_legislators()
             print("已成功清除所有立法委員資料")
         except sqlite3.Error as e:
             print(f"清除立法委員資料時發生錯誤: {e}")
@@ -313,18 +1759,21 @@ class Database:
         cursor = self.conn.cursor()
         
         if search_term:
-            cursor.execute("""
+            condition, params = self._text_match_condition(search_term, ['billName', 'billProposer'], alias='b')
+            cursor.execute(f"""
+            {PROPOSER_COLORS_CTE}
             SELECT b.*, l.party_color
             FROM bills b
-            LEFT JOIN legislators l ON b.billProposer LIKE '%' || l.name || '%'
-            WHERE b.billName LIKE ? OR b.billProposer LIKE ?
+            LEFT JOIN proposer_colors l ON l.term = b.term AND l.billNo = b.billNo
+            WHERE {condition}
             ORDER BY b.term DESC, b.sessionPeriod DESC, b.sessionTimes DESC
-            """, (f"%{search_term}%", f"%{search_term}%"))
+            """, params)
         else:
-            cursor.execute("""
+            cursor.execute(f"""
+            {PROPOSER_COLORS_CTE}
             SELECT b.*, l.party_color
             FROM bills b
-            LEFT JOIN legislators l ON b.billProposer LIKE '%' || l.name || '%'
+            LEFT JOIN proposer_colors l ON l.term = b.term AND l.billNo = b.billNo
             ORDER BY b.term DESC, b.sessionPeriod DESC, b.sessionTimes DESC
             """)
         
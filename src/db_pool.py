@@ -0,0 +1,152 @@
+"""資料庫連線池模組
+
+Flask 應用程式啟動時建立一次資料表並執行欄位遷移，之後每個請求從連線池
+借用一個 Database，請求結束（teardown_appcontext）時歸還，不必每次重新
+連線、建立資料表與索引。
+
+連線池大小由 app.config['DB_POOL_SIZE'] 或環境變數 DB_POOL_SIZE 設定，
+應與 gunicorn 每個 worker 的執行緒數（--threads）一致。借出的連線預設為
+唯讀（mode=ro），搭配 WAL 模式，排程更新寫入資料時不會阻塞網站讀取。
+"""
+import os
+import queue
+import threading
+from typing import Optional
+
+from flask import current_app, g
+
+try:
+    from src.database import Database
+except ImportError:  # 以 src 為工作目錄直接執行腳本時
+    from database import Database
+
+# 預設連線池大小
+DEFAULT_POOL_SIZE = 4
+
+# 連線池用盡時等待歸還的秒數
+DEFAULT_POOL_TIMEOUT = 30
+
+
+class DatabasePool:
+    """Database 連線池，連線於需要時才建立，最多 size 個"""
+
+    def __init__(self, db_path: str = None, size: int = DEFAULT_POOL_SIZE,
+                 timeout: float = DEFAULT_POOL_TIMEOUT, read_only: bool = True):
+        """建立連線池並執行一次資料表建立與遷移
+
+        Args:
+            db_path: 資料庫檔案路徑，預設為 data/bills.db
+            size: 連線池大小
+            timeout: 連線池用盡時等待歸還的秒數
+            read_only: 借出的連線是否為唯讀（mode=ro），網站只讀取資料時使用
+        """
+        # 以可寫入的連線建立資料表，同時將資料庫切換為 WAL 模式
+        schema_db = Database(db_path)
+        self.db_path = schema_db.db_path
+        self.read_only = read_only
+        # 遷移用的連線不放入連線池，避免 gunicorn fork 後多個 worker 共用同一個連線
+        schema_db.close()
+
+        self.size = max(1, int(size))
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        """清空連線池（程序 fork 後呼叫，子程序不可沿用父程序的連線）"""
+        self._idle = queue.LifoQueue()
+        self._created = 0
+        self._pid = os.getpid()
+
+    def acquire(self) -> Database:
+        """借用一個資料庫連線
+
+        Returns:
+            Database: 資料庫物件
+
+        Raises:
+            TimeoutError: 連線池用盡且在 timeout 秒內沒有連線歸還
+        """
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    self._reset()
+
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            if self._created < self.size:
+                self._created += 1
+                create = True
+            else:
+                create = False
+        if create:
+            try:
+                return Database(self.db_path, init_schema=False, check_same_thread=False,
+                                read_only=self.read_only)
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+
+        try:
+            return self._idle.get(timeout=self.timeout)
+        except queue.Empty:
+            raise TimeoutError(f"等待資料庫連線逾時（連線池大小 {self.size}）")
+
+    def release(self, db: Database):
+        """歸還資料庫連線，未提交的交易會被還原
+
+        Args:
+            db: 由 acquire() 取得的資料庫物件
+        """
+        if self._pid != os.getpid():
+            return
+        if db.conn.in_transaction:
+            db.conn.rollback()
+        self._idle.put(db)
+
+    def close_all(self):
+        """關閉連線池中所有閒置的連線"""
+        while True:
+            try:
+                db = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            db.close()
+            with self._lock:
+                self._created -= 1
+
+
+def init_app(app, db_path: str = None) -> DatabasePool:
+    """為 Flask 應用程式建立連線池，並於請求結束時歸還連線
+
+    Args:
+        app: Flask 應用程式
+        db_path: 資料庫檔案路徑，未提供時使用 app.config['DATABASE_PATH']
+
+    Returns:
+        DatabasePool: 連線池
+    """
+    size = app.config.get('DB_POOL_SIZE') or os.environ.get('DB_POOL_SIZE') or DEFAULT_POOL_SIZE
+    pool = DatabasePool(db_path or app.config.get('DATABASE_PATH'), size=int(size))
+    app.extensions['db_pool'] = pool
+    app.teardown_appcontext(release_db)
+    return pool
+
+
+def get_db() -> Database:
+    """取得目前請求使用的資料庫連線，同一請求內重複呼叫會取得同一個連線"""
+    if 'db' not in g:
+        g.db = current_app.extensions['db_pool'].acquire()
+    return g.db
+
+
+def release_db(exception: Optional[BaseException] = None):
+    """請求結束時歸還資料庫連線"""
+    db = g.pop('db', None)
+    if db is not None:
+        current_app.extensions['db_pool'].release(db)
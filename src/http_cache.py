@@ -0,0 +1,204 @@
+"""HTTP 條件式請求與壓縮模組
+
+資料每天只在排程更新（render.yaml 的 cron）時變動，搜尋結果與 API 回應在兩次
+更新之間都相同：
+
+- conditional_response 以資料版本號與請求參數計算 ETag，並以資料最後寫入時間
+  作為 Last-Modified。瀏覽器或反向代理帶著 If-None-Match / If-Modified-Since
+  重新驗證時，直接回應 304，不必查詢資料庫與渲染模板。
+- init_app 註冊 after_request，依 Accept-Encoding 以 brotli（有安裝 brotli
+  套件時）或 gzip 壓縮 HTML 與 JSON 回應。搜尋刑法等熱門法律的結果頁面有大量
+  重複的委員標籤，gzip 壓縮後只剩原本的百分之幾。
+"""
+import gzip
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from functools import wraps
+from typing import Optional
+
+from flask import current_app, make_response, request
+
+try:
+    from src.db_pool import get_db
+except ImportError:  # 以 src 為工作目錄直接執行腳本時
+    from db_pool import get_db
+
+try:
+    import brotli
+except ImportError:  # brotli 為選用套件，未安裝時只提供 gzip
+    brotli = None
+
+# 瀏覽器快取秒數
+DEFAULT_MAX_AGE = 300
+
+# CDN、反向代理等共用快取的秒數
+DEFAULT_SHARED_MAX_AGE = 600
+
+# 小於此位元組數的回應不壓縮
+MIN_COMPRESS_SIZE = 1024
+
+# gzip 壓縮等級（1-9），等級越高越慢
+GZIP_LEVEL = 6
+
+# brotli 壓縮等級（0-11），動態產生的頁面使用中等等級
+BROTLI_QUALITY = 5
+
+COMPRESSIBLE_MIMETYPES = ('text/html', 'text/plain', 'text/css', 'application/json', 'application/javascript')
+
+# 依 (ETag, 編碼, 內容摘要) 保存的壓縮結果數上限；刑法的結果頁面壓縮一次要數十毫秒
+COMPRESSED_CACHE_SIZE = 64
+
+_compressed: 'OrderedDict[tuple, bytes]' = OrderedDict()
+_compressed_lock = threading.Lock()
+
+
+def _last_modified(updated_at: Optional[str]) -> Optional[datetime]:
+    """將資料庫的 CURRENT_TIMESTAMP（UTC）字串轉為 datetime"""
+    if not updated_at:
+        return None
+    try:
+        return datetime.strptime(updated_at[:19], '%Y-%m-%d %H:%M:%S').replace(tzinfo=timezone.utc)
+    except ValueError:
+        return None
+
+
+def request_etag(data_version: int) -> str:
+    """以資料版本號、路徑與查詢參數計算 ETag
+
+    Args:
+        data_version: 資料版本號
+
+    Returns:
+        str: ETag（不含引號）
+    """
+    params = '&'.join(f"{key}={value}" for key, value in sorted(request.args.items(multi=True)))
+    content = f"{data_version}|{request.path}|{params}"
+    return hashlib.sha1(content.encode('utf-8')).hexdigest()[:20]
+
+
+def _cache_control() -> str:
+    max_age = current_app.config.get('HTTP_CACHE_MAX_AGE', DEFAULT_MAX_AGE)
+    shared_max_age = current_app.config.get('HTTP_CACHE_S_MAXAGE', DEFAULT_SHARED_MAX_AGE)
+    return f"public, max-age={max_age}, s-maxage={shared_max_age}"
+
+
+def _set_validators(response, etag: str, last_modified: Optional[datetime]):
+    """設定 ETag、Last-Modified 與 Cache-Control 標頭"""
+    # 壓縮後內容不同但語意相同，使用弱 ETag，所有編碼共用同一個值
+    response.set_etag(etag, weak=True)
+    if last_modified is not None:
+        response.last_modified = last_modified
+    response.headers['Cache-Control'] = _cache_control()
+    response.vary.add('Accept-Encoding')
+
+
+def is_not_modified(etag: str, last_modified: Optional[datetime]) -> bool:
+    """檢查請求帶來的驗證資訊是否與目前資料相符
+
+    有 If-None-Match 時只比對 ETag；否則比對 If-Modified-Since。
+    """
+    if request.if_none_match:
+        return request.if_none_match.contains_weak(etag)
+    if request.if_modified_since and last_modified is not None:
+        return last_modified <= request.if_modified_since
+    return False
+
+
+def conditional_response(view):
+    """為 GET 路由加上 ETag / Last-Modified 與 304 回應"""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        if request.method not in ('GET', 'HEAD'):
+            return view(*args, **kwargs)
+
+        info = get_db().get_data_version_info()
+        etag = request_etag(info['version'])
+        last_modified = _last_modified(info['updated_at'])
+
+        if is_not_modified(etag, last_modified):
+            response = current_app.response_class(status=304)
+            _set_validators(response, etag, last_modified)
+            return response
+
+        response = make_response(view(*args, **kwargs))
+        if response.status_code == 200:
+            _set_validators(response, etag, last_modified)
+        else:
+            # 錯誤回應不可被瀏覽器或 CDN 保存，否則資料版本更新前都會重複取得錯誤頁面
+            response.headers['Cache-Control'] = 'no-store'
+        return response
+    return wrapper
+
+
+def _choose_encoding() -> Optional[str]:
+    """依 Accept-Encoding 選擇壓縮方式，優先使用 brotli"""
+    accept = request.accept_encodings
+    if brotli is not None and accept['br']:
+        return 'br'
+    if accept['gzip']:
+        return 'gzip'
+    return None
+
+
+def compress_response(response):
+    """依 Accept-Encoding 壓縮 HTML 與 JSON 回應
+
+    Args:
+        response: Flask 回應
+
+    Returns:
+        回應（可能已壓縮）
+    """
+    if (response.status_code != 200 or response.direct_passthrough or response.is_streamed
+            or 'Content-Encoding' in response.headers
+            or response.mimetype not in COMPRESSIBLE_MIMETYPES):
+        return response
+
+    response.vary.add('Accept-Encoding')
+    data = response.get_data()
+    if len(data) < MIN_COMPRESS_SIZE:
+        return response
+
+    encoding = _choose_encoding()
+    if encoding is None:
+        return response
+
+    # 只保存帶有 ETag 的回應的壓縮結果；鍵值另含內容摘要，同一個 ETag 的內容
+    # 不同時（例如同一網址先前的回應）不會取得舊的壓縮結果
+    etag = response.get_etag()[0]
+    key = (etag, encoding, hashlib.blake2b(data, digest_size=16).digest())
+    with _compressed_lock:
+        compressed = _compressed.get(key) if etag else None
+        if compressed is not None:
+            _compressed.move_to_end(key)
+
+    if compressed is None:
+        if encoding == 'br':
+            compressed = brotli.compress(data, quality=BROTLI_QUALITY)
+        else:
+            compressed = gzip.compress(data, compresslevel=GZIP_LEVEL)
+        if etag:
+            with _compressed_lock:
+                _compressed[key] = compressed
+                while len(_compressed) > COMPRESSED_CACHE_SIZE:
+                    _compressed.popitem(last=False)
+
+    response.set_data(compressed)
+    response.headers['Content-Encoding'] = encoding
+    return response
+
+
+def init_app(app):
+    """設定快取秒數並註冊回應壓縮
+
+    快取秒數由 app.config 或環境變數 HTTP_CACHE_MAX_AGE、HTTP_CACHE_S_MAXAGE 設定。
+
+    Args:
+        app: Flask 應用程式
+    """
+    app.config.setdefault('HTTP_CACHE_MAX_AGE', int(os.environ.get('HTTP_CACHE_MAX_AGE', DEFAULT_MAX_AGE)))
+    app.config.setdefault('HTTP_CACHE_S_MAXAGE', int(os.environ.get('HTTP_CACHE_S_MAXAGE', DEFAULT_SHARED_MAX_AGE)))
+    app.after_request(compress_response)
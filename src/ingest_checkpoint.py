@@ -0,0 +1,172 @@
+"""可續傳的全量重新載入
+
+reset_and_download_all 重新下載全部法案時，資料先寫入資料庫旁的暫存資料庫
+（預設為 bills.db.reload），每完成一頁就在 ingest_checkpoints 表記錄頁碼、
+內容雜湊與筆數。程式中斷後重新執行會略過已完成的頁面，從第一個缺少的頁面
+繼續下載。
+
+全部頁面完成後，於正式資料庫的單一交易中將暫存資料複製到影子表
+（bills_shadow 等），刪除舊表並把影子表改名為正式名稱，再重建索引與全文
+索引。交易提交前網站讀到的都是舊資料，不會看到空的資料庫。
+"""
+import hashlib
+import json
+import os
+import re
+import sqlite3
+from typing import Dict, List, Optional, Set
+
+try:
+    from src.database import BULK_LOAD_INDEXES, BUMP_DATA_VERSION_SQL, Database
+except ImportError:  # 以 src 為工作目錄直接執行腳本時
+    from database import BULK_LOAD_INDEXES, BUMP_DATA_VERSION_SQL, Database
+
+# 重新載入時整表替換的資料表
+RELOAD_TABLES = ('bills', 'bill_articles', 'bill_members', 'law_counts')
+
+# 暫存資料庫的副檔名
+RELOAD_SUFFIX = '.reload'
+
+
+def page_hash(bills: List[Dict]) -> str:
+    """計算單頁法案資料的內容雜湊
+
+    Args:
+        bills: 法案資料列表
+
+    Returns:
+        str: SHA-256 十六進位字串
+    """
+    content = json.dumps(bills, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+class ShadowReload:
+    """以暫存資料庫與檢查點進行可續傳的全量重新載入"""
+
+    def __init__(self, db_path: str, staging_path: str = None):
+        """開啟（或建立）暫存資料庫
+
+        Args:
+            db_path: 正式資料庫路徑
+            staging_path: 暫存資料庫路徑，預設為 db_path + '.reload'
+        """
+        self.db_path = db_path
+        self.staging_path = staging_path or db_path + RELOAD_SUFFIX
+        self.staging = Database(self.staging_path)
+        self.staging.conn.execute("""
+        CREATE TABLE IF NOT EXISTS ingest_checkpoints (
+            page_number INTEGER PRIMARY KEY,
+            content_hash TEXT,
+            row_count INTEGER,
+            completed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """)
+        self.staging.conn.commit()
+
+    def completed_pages(self) -> Dict[int, Dict]:
+        """獲取已完成的頁面
+
+        Returns:
+            Dict[int, Dict]: 頁碼 -> {'content_hash', 'row_count', 'completed_at'}
+        """
+        rows = self.staging.conn.execute("""
+        SELECT page_number, content_hash, row_count, completed_at
+        FROM ingest_checkpoints
+        ORDER BY page_number
+        """).fetchall()
+        return {row['page_number']: dict(row) for row in rows}
+
+    def missing_pages(self, last_page: int) -> List[int]:
+        """1 到 last_page 之間尚未完成的頁碼"""
+        done: Set[int] = set(self.completed_pages())
+        return [page for page in range(1, last_page + 1) if page not in done]
+
+    def save_page(self, page_number: int, bills: List[Dict]) -> int:
+        """將一頁法案寫入暫存資料庫並記錄檢查點
+
+        法案與檢查點分兩個交易寫入：若在兩者之間中斷，續傳時會重新寫入這一頁，
+        save_bills 以 upsert 寫入，重複寫入不影響結果。
+
+        Args:
+            page_number: 頁碼
+            bills: 法案資料列表
+
+        Returns:
+            int: 寫入的法案數
+        """
+        saved = self.staging.save_bills(bills, page_number=page_number)
+        with self.staging.conn:
+            self.staging.conn.execute("""
+            INSERT OR REPLACE INTO ingest_checkpoints (page_number, content_hash, row_count, completed_at)
+            VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+            """, (page_number, page_hash(bills), saved))
+        return saved
+
+    def swap_into(self, db: Optional[Database] = None):
+        """以影子表加改名的方式，將暫存資料一次替換進正式資料庫
+
+        Args:
+            db: 正式資料庫物件，未提供時自行開啟 db_path
+        """
+        self.staging.close()
+        own_db = db is None
+        db = db or Database(self.db_path)
+        conn = db.conn
+        conn.execute("ATTACH DATABASE ? AS reload", (self.staging_path,))
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                cursor = conn.cursor()
+                # 暫存資料庫的狀態歷史只有「第一次出現」，改以新舊資料比對記錄狀態變動
+                cursor.execute("""
+                INSERT INTO main.bill_status_history (term, billNo, old_status, new_status)
+                SELECT r.term, r.billNo, m.billStatus, r.billStatus
+                FROM reload.bills r
+                LEFT JOIN main.bills m ON m.term = r.term AND m.billNo = r.billNo
+                WHERE m.billStatus IS NOT r.billStatus
+                """)
+                for table in RELOAD_TABLES:
+                    self._copy_to_shadow(cursor, table)
+                for table in RELOAD_TABLES:
+                    cursor.execute(f"DROP TABLE main.{table}")
+                    cursor.execute(f"ALTER TABLE main.{table}_shadow RENAME TO {table}")
+                # 舊表的索引與全文索引觸發器已隨 DROP TABLE 刪除，依正式名稱重新建立
+                for sql in BULK_LOAD_INDEXES.values():
+                    cursor.execute(sql)
+                db.create_search_index(cursor)
+                db.rebuild_search_index(cursor)
+                cursor.execute(BUMP_DATA_VERSION_SQL)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+        finally:
+            conn.execute("DETACH DATABASE reload")
+            if own_db:
+                db.close()
+
+    @staticmethod
+    def _copy_to_shadow(cursor: sqlite3.Cursor, table: str):
+        """依正式表的結構建立影子表，並複製暫存資料庫中同名表的資料"""
+        cursor.execute(f"DROP TABLE IF EXISTS main.{table}_shadow")
+        row = cursor.execute(
+            "SELECT sql FROM main.sqlite_master WHERE type = 'table' AND name = ?", (table,)
+        ).fetchone()
+        create_sql = re.sub(rf'^CREATE TABLE\s+(IF NOT EXISTS\s+)?"?{table}"?',
+                            f'CREATE TABLE {table}_shadow', row[0], count=1)
+        cursor.execute(create_sql)
+
+        # 舊資料庫以 ALTER TABLE 新增的欄位順序可能不同，依欄位名稱複製
+        main_columns = [col[1] for col in cursor.execute(f"PRAGMA main.table_info({table})")]
+        reload_columns = {col[1] for col in cursor.execute(f"PRAGMA reload.table_info({table})")}
+        columns = ', '.join(column for column in dict.fromkeys(main_columns) if column in reload_columns)
+        cursor.execute(f"INSERT INTO main.{table}_shadow ({columns}) SELECT {columns} FROM reload.{table}")
+
+    def discard(self):
+        """刪除暫存資料庫（完成替換或放棄續傳時呼叫）"""
+        self.staging.close()
+        for suffix in ('', '-wal', '-shm'):
+            path = self.staging_path + suffix
+            if os.path.exists(path):
+                os.remove(path)
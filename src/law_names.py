@@ -0,0 +1,163 @@
+"""法律名稱正規化模組
+
+以法律簡稱、舊名與正式名稱的對照表（LAW_ALIASES）建立單一 Aho–Corasick
+自動機，單次掃描提案名稱中第一個「」內的法律名稱，找出最左、最長且落在名稱
+邊界上的別名，換成正式名稱；沒有比對到別名時，截斷條號與修正說明後的法律名稱
+即為正式名稱。
+
+寫入法案時以 canonical_law_name 計算一次並存入 bills.law_name，搜尋、熱門法案
+與立委頁面都直接以等號比對這個欄位，不必每次查詢都重新清理法案名稱。
+"""
+import re
+import threading
+from typing import Dict, Optional, Tuple
+
+try:
+    from src.aho_corasick import AhoCorasick
+    from src.bill_utils import LAW_NAME_END_PATTERN, get_law_key
+except ImportError:  # 以 src 為工作目錄直接執行腳本時
+    from aho_corasick import AhoCorasick
+    from bill_utils import LAW_NAME_END_PATTERN, get_law_key
+
+# 正式名稱 -> 簡稱、舊名（正式名稱本身也會加入自動機）
+LAW_ALIASES: Dict[str, Tuple[str, ...]] = {
+    '中華民國刑法': ('刑法',),
+    '陸海空軍刑法': ('軍刑法',),
+    '民法': ('民法總則編', '民法債編', '民法物權編', '民法親屬編', '民法繼承編'),
+    # get_law_key 會在「條文」處截斷，增修條文需以完整名稱比對
+    '中華民國憲法增修條文': ('憲法增修條文', '中華民國憲法增修'),
+    '國民法官法': (),
+    '入出國及移民法': (),
+    '所得稅法': (),
+    '國土計畫法': (),
+    '環境基本法': (),
+    '貨物稅條例': (),
+    '公務人員退休資遣撫卹法': ('退撫法',),
+    '性別平等工作法': ('性工法', '性別工作平等法'),
+    '勞動基準法': ('勞基法',),
+    '就業服務法': ('就服法',),
+    '全民健康保險法': ('健保法',),
+    '公教人員保險法': ('公保法', '公務人員保險法'),
+    '社會秩序維護法': ('社維法',),
+    '道路交通管理處罰條例': ('道交條例',),
+    '消費者保護法': ('消保法',),
+    '證券交易法': ('證交法',),
+    '食品安全衛生管理法': ('食安法', '食品衛生管理法'),
+    '個人資料保護法': ('個資法', '電腦處理個人資料保護法'),
+    '公職人員選舉罷免法': ('選罷法',),
+    '臺灣地區與大陸地區人民關係條例': ('兩岸人民關係條例', '兩岸條例'),
+    '民事訴訟法': ('民訴法',),
+    '刑事訴訟法': ('刑訴法',),
+    '行政訴訟法': ('行訴法',),
+    '行政程序法': ('行程法',),
+    '國家賠償法': ('國賠法',),
+    '公務員懲戒法': ('公懲法',),
+    '公務人員保障暨培訓委員會組織法': ('公務人員保障訓練委員會組織法',),
+    '考試院組織法': ('考試院組織條例',),
+}
+
+# 別名之前可以出現的字元（名稱開頭以外）
+LEFT_BOUNDARIES = '「、，'
+
+# 別名之後可以出現的字元（名稱結尾以外）；另可接條號、修正說明（LAW_NAME_END_PATTERN）
+RIGHT_BOUNDARIES = '」、，第零一二三四五六七八九十百千０１２３４５６７８９0123456789'
+
+QUOTED_NAME_PATTERN = re.compile(r'「([^」]+)」')
+
+
+class LawAliasMatcher:
+    """以 Aho–Corasick 自動機比對法律別名"""
+
+    def __init__(self, aliases: Dict[str, Tuple[str, ...]] = None):
+        """建立自動機
+
+        Args:
+            aliases: 正式名稱與別名對照表，預設為 LAW_ALIASES
+        """
+        if aliases is None:
+            aliases = LAW_ALIASES
+
+        # 別名 -> 正式名稱
+        self.patterns: Dict[str, str] = {}
+        for canonical, names in aliases.items():
+            self.patterns[canonical] = canonical
+            for name in names:
+                self.patterns[name] = canonical
+
+        self._automaton = AhoCorasick(self.patterns)
+
+    @staticmethod
+    def _is_bounded(text: str, start: int, end: int) -> bool:
+        """檢查比對結果是否落在法律名稱邊界上
+
+        「中華民國刑法施行法」中的「中華民國刑法」、「入出國及移民法」中的「民法」
+        都不在邊界上，不會被換成別名的正式名稱。
+        """
+        if start > 0 and text[start - 1] not in LEFT_BOUNDARIES and not text[start - 1].isspace():
+            return False
+        if end == len(text) or text[end] in RIGHT_BOUNDARIES or text[end].isspace():
+            return True
+        return LAW_NAME_END_PATTERN.match(text, end) is not None
+
+    def match(self, text: str) -> Optional[str]:
+        """單次掃描字串，找出最左、最長且落在名稱邊界上的別名
+
+        Args:
+            text: 法律名稱或提案名稱
+
+        Returns:
+            Optional[str]: 別名對應的正式名稱，沒有比對到時返回 None
+        """
+        automaton = self._automaton
+        goto, fail, output = automaton.goto, automaton.fail, automaton.output
+        best = None
+        state = 0
+        for i, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            for pattern in output[state]:
+                start = i + 1 - len(pattern)
+                if best is not None and (start > best[0] or
+                                         (start == best[0] and len(pattern) <= len(best[1]))):
+                    continue
+                if self._is_bounded(text, start, i + 1):
+                    best = (start, pattern)
+        return self.patterns[best[1]] if best else None
+
+
+_matcher: Optional[LawAliasMatcher] = None
+_matcher_lock = threading.Lock()
+
+
+def get_matcher() -> LawAliasMatcher:
+    """取得共用的法律別名自動機"""
+    global _matcher
+    if _matcher is None:
+        with _matcher_lock:
+            if _matcher is None:
+                _matcher = LawAliasMatcher()
+    return _matcher
+
+
+def canonical_law_name(bill_name: str) -> str:
+    """擷取提案名稱的正式法律名稱
+
+    Args:
+        bill_name: 提案名稱（例如「勞基法第九條條文修正草案」，請審議案。）或使用者輸入的法律名稱
+
+    Returns:
+        str: 正式法律名稱，例如 勞動基準法；無法擷取時返回空字串
+    """
+    if not bill_name:
+        return ''
+
+    # 只看第一個引號內的法律名稱
+    quoted = QUOTED_NAME_PATTERN.search(bill_name)
+    name = (quoted.group(1) if quoted else bill_name).strip()
+
+    canonical = get_matcher().match(name)
+    if canonical:
+        return canonical
+    return get_law_key(name)
@@ -0,0 +1,332 @@
+"""立委黨籍查詢模組
+
+將立委黨籍對照表整理成以 (屆別, 姓名) 為鍵的查詢結構，於模組內只建立一次，
+資料來源為法案資料庫同目錄下 legislative.db 的 historical_legislators 表與法案
+資料庫本身的 legislators 表（Database 建立時以 use_database() 指定，未指定時為
+data/ 下的預設資料庫），找不到時退回內建的第8-11屆對照表。同一位委員可能在多個屆別
+任職（例如王定宇），各屆黨籍也可能不同，因此查詢時優先採用該屆的黨籍。
+
+匯入立委資料後呼叫 reload_legislators() 即可重新載入；其他程序（例如排程更新）
+寫入資料庫時，也會在 RELOAD_CHECK_INTERVAL 秒內依檔案修改時間自動重新載入。
+"""
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 未指定法案資料庫時的資料來源（資料庫路徑, 資料表），後面的來源優先
+DEFAULT_SOURCES = [
+    (os.path.join(ROOT_DIR, 'data', 'legislative.db'), 'historical_legislators'),
+    (os.path.join(ROOT_DIR, 'data', 'bills.db'), 'legislators'),
+]
+
+# 檢查資料來源是否更新的間隔（秒）
+RELOAD_CHECK_INTERVAL = 60
+
+# 政黨全名與簡稱對照表
+PARTY_ALIASES = {
+    '民主進步黨': '民進黨',
+    '中國國民黨': '國民黨',
+    '台灣民眾黨': '民眾黨',
+    '臺灣民眾黨': '民眾黨',
+    '無': '無黨籍',
+    '無黨': '無黨籍',
+}
+
+# 內建立委黨籍對照表（第8-11屆），資料庫沒有資料時使用
+DEFAULT_LEGISLATORS = {
+    # 民進黨籍立委
+    '伍麗華': '民進黨', '何欣純': '民進黨', '劉建國': '民進黨', '吳思瑤': '民進黨',
+    '吳沛憶': '民進黨', '吳琪銘': '民進黨', '吳秉叡': '民進黨', '張宏陸': '民進黨',
+    '張雅琳': '民進黨', '徐富癸': '民進黨', '李坤城': '民進黨', '李昆澤': '民進黨',
+    '李柏毅': '民進黨', '林俊憲': '民進黨', '林宜瑾': '民進黨', '林岱樺': '民進黨',
+    '林月琴': '民進黨', '林楚茵': '民進黨', '林淑芬': '民進黨', '柯建銘': '民進黨',
+    '楊曜': '民進黨', '沈伯洋': '民進黨', '沈發惠': '民進黨', '洪申翰': '民進黨',
+    '游錫堃': '民進黨', '王世堅': '民進黨', '王定宇': '民進黨', '王正旭': '民進黨',
+    '王美惠': '民進黨', '王義川': '民進黨', '羅美玲': '民進黨', '范雲': '民進黨',
+    '莊瑞雄': '民進黨', '蔡其昌': '民進黨', '蔡易餘': '民進黨', '蘇巧慧': '民進黨',
+    '許智傑': '民進黨', '賴惠員': '民進黨', '賴瑞隆': '民進黨', '邱志偉': '民進黨',
+    '邱議瑩': '民進黨', '郭國文': '民進黨', '郭昱晴': '民進黨', '鍾佳濱': '民進黨',
+    '陳亭妃': '民進黨', '陳俊宇': '民進黨', '陳冠廷': '民進黨', '陳培瑜': '民進黨',
+    '陳瑩': '民進黨', '陳秀寳': '民進黨', '陳素月': '民進黨', '黃捷': '民進黨',
+    '黃秀芳': '民進黨', '王榮璋': '民進黨', '何志偉': '民進黨', '余天': '民進黨',
+    '吳玉琴': '民進黨', '呂孫綾': '民進黨', '李俊俋': '民進黨', '李麗芬': '民進黨',
+    '周春米': '民進黨', '林靜儀': '民進黨', '邱泰源': '民進黨', '莊競程': '民進黨',
+    '陳明文': '民進黨', '陳歐珀': '民進黨', '黃世杰': '民進黨', '黃國書': '民進黨',
+    '葉宜津': '民進黨', '劉世芳': '民進黨', '劉櫂豪': '民進黨', '蔡培慧': '民進黨',
+    '蔡適應': '民進黨', '鄭運鵬': '民進黨', '賴品妤': '民進黨', '蘇治芬': '民進黨',
+    '蘇震清': '民進黨', '許添財': '民進黨', '黃偉哲': '民進黨', '尤美女': '民進黨',
+    '姚文智': '民進黨', '鄭麗君': '民進黨', '蔡煌瑯': '民進黨', '洪宗熠': '民進黨',
+
+    # 國民黨籍立委
+    '丁學忠': '國民黨', '傅崐萁': '國民黨', '吳宗憲': '國民黨', '呂玉玲': '國民黨',
+    '廖偉翔': '國民黨', '廖先翔': '國民黨', '張嘉郡': '國民黨', '張智倫': '國民黨',
+    '徐巧芯': '國民黨', '徐欣瑩': '國民黨', '李彥秀': '國民黨', '林倩綺': '國民黨',
+    '林德福': '國民黨', '林思銘': '國民黨', '林沛祥': '國民黨', '柯志恩': '國民黨',
+    '楊瓊瓔': '國民黨', '江啟臣': '國民黨', '洪孟楷': '國民黨', '涂權吉': '國民黨',
+    '游顥': '國民黨', '牛煦庭': '國民黨', '王育敏': '國民黨', '王鴻薇': '國民黨',
+    '盧縣一': '國民黨', '羅廷瑋': '國民黨', '羅明才': '國民黨', '羅智強': '國民黨',
+    '翁曉玲': '國民黨', '萬美玲': '國民黨', '葉元之': '國民黨', '葛如鈞': '國民黨',
+    '蘇清泉': '國民黨', '許宇甄': '國民黨', '謝衣鳯': '國民黨', '謝龍介': '國民黨',
+    '賴士葆': '國民黨', '邱若華': '國民黨', '邱鎮軍': '國民黨', '鄭天財': '國民黨',
+    '鄭正鈐': '國民黨', '陳永康': '國民黨', '陳玉珍': '國民黨', '陳菁徽': '國民黨',
+    '陳雪生': '國民黨', '韓國瑜': '國民黨', '顏寬恒': '國民黨', '馬文君': '國民黨',
+    '魯明哲': '國民黨', '黃仁': '國民黨', '黃健豪': '國民黨', '黃建賓': '國民黨',
+    '溫玉霞': '國民黨', '李貴敏': '國民黨', '陳超明': '國民黨', '丁守中': '國民黨',
+    '孔文吉': '國民黨', '王惠美': '國民黨', '李德維': '國民黨', '林文瑞': '國民黨',
+    '林為洲': '國民黨', '林奕華': '國民黨', '林麗蟬': '國民黨', '徐志榮': '國民黨',
+    '翁重鈞': '國民黨', '張育美': '國民黨', '許淑華': '國民黨', '陳以信': '國民黨',
+    '曾銘宗': '國民黨', '費鴻泰': '國民黨', '葉毓蘭': '國民黨', '廖國棟': '國民黨',
+    '廖婉汝': '國民黨', '鄭麗文': '國民黨',
+
+    # 民眾黨籍立委
+    '劉書彬': '民眾黨', '吳春城': '民眾黨', '張啓楷': '民眾黨', '林國成': '民眾黨',
+    '林憶君': '民眾黨', '陳昭姿': '民眾黨', '麥玉珍': '民眾黨', '黃珊珊': '民眾黨',
+    '邱臣遠': '民眾黨', '高虹安': '民眾黨', '張其祿': '民眾黨', '蔡壁如': '民眾黨',
+    '賴香伶': '民眾黨',
+
+    # 時代力量立委
+    '黃國昌': '時代力量', '王婉諭': '時代力量', '邱顯智': '時代力量', '陳椒華': '時代力量',
+    '林昶佐': '時代力量', '洪慈庸': '時代力量',
+
+    # 無黨籍立委
+    '高金素梅': '無黨籍', '趙正宇': '無黨籍'
+}
+
+
+def normalize_term(term) -> Optional[str]:
+    """將屆別統一為不補零的數字字串，例如「08」、「第8屆」皆轉為「8」
+
+    Args:
+        term: 屆別
+
+    Returns:
+        Optional[str]: 標準化後的屆別，無法辨識時返回 None
+    """
+    if term is None:
+        return None
+    match = re.search(r'\d+', str(term))
+    return str(int(match.group(0))) if match else None
+
+
+def normalize_party(party: str) -> str:
+    """將政黨全名轉換為簡稱
+
+    Args:
+        party: 政黨名稱
+
+    Returns:
+        str: 政黨簡稱
+    """
+    party = (party or '').strip()
+    return PARTY_ALIASES.get(party, party or '無黨籍')
+
+
+def sources_for_database(db_path: str) -> List[Tuple[str, str]]:
+    """依法案資料庫路徑取得立委資料來源
+
+    Args:
+        db_path: 法案資料庫路徑
+
+    Returns:
+        List[Tuple[str, str]]: 同目錄 legislative.db 的 historical_legislators 表與
+        法案資料庫的 legislators 表，後面的來源優先
+    """
+    db_path = os.path.abspath(db_path)
+    return [
+        (os.path.join(os.path.dirname(db_path), 'legislative.db'), 'historical_legislators'),
+        (db_path, 'legislators'),
+    ]
+
+
+def _lookup_keys(name: str) -> List[str]:
+    """產生查詢用的姓名鍵值
+
+    原住民委員的姓名可能帶有族名（如「伍麗華Saidhai Tahovecahe」），
+    除了完整姓名外也以開頭的中文姓名查詢。
+    """
+    name = re.sub(r'\s+', '', name or '')
+    keys = [name]
+    match = re.match(r'[一-龥]{2,4}', name)
+    if match and match.group(0) != name:
+        keys.append(match.group(0))
+    return keys
+
+
+class LegislatorLookup:
+    """立委黨籍查詢表"""
+
+    def __init__(self, sources: List[Tuple[str, str]] = None):
+        """初始化查詢表
+
+        Args:
+            sources: (資料庫路徑, 資料表) 列表，預設為 DEFAULT_SOURCES
+        """
+        self.sources = sources if sources is not None else DEFAULT_SOURCES
+        self._by_term: Dict[Tuple[str, str], str] = {}
+        self._by_name: Dict[str, str] = dict(DEFAULT_LEGISLATORS)
+        self._signature = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        self.version = 0  # 每次重新載入加一，供依賴此查詢表的快取判斷是否過期
+        self.reload()
+
+    def _source_signature(self) -> tuple:
+        """以資料庫檔案與 WAL 檔的修改時間、大小判斷資料是否更新
+
+        WAL 模式下寫入先進入 -wal 檔，主檔案要到 checkpoint 才會改變，
+        只看主檔案的修改時間會一直使用舊資料。
+        """
+        signature = []
+        for path, _ in self.sources:
+            for file_path in (path, path + '-wal'):
+                try:
+                    stat = os.stat(file_path)
+                    signature.append((stat.st_mtime_ns, stat.st_size))
+                except OSError:
+                    signature.append(None)
+        return tuple(signature)
+
+    @staticmethod
+    def _read_source(path: str, table: str) -> List[Tuple[str, str, str]]:
+        """以唯讀模式讀取立委資料
+
+        Returns:
+            List[Tuple[str, str, str]]: (屆別, 姓名, 政黨) 列表，資料庫或資料表不存在時返回空列表
+        """
+        if not os.path.exists(path):
+            return []
+        try:
+            conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+            try:
+                return conn.execute(f"SELECT term, name, party FROM {table}").fetchall()
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            return []
+
+    def reload(self):
+        """重新載入立委黨籍資料"""
+        with self._lock:
+            signature = self._source_signature()
+            by_term = {}
+            latest = {}  # 姓名 -> (屆別, 政黨)，保留最新一屆的黨籍
+
+            for path, table in self.sources:
+                for term, name, party in self._read_source(path, table):
+                    term = normalize_term(term)
+                    if not term or not name:
+                        continue
+                    party = normalize_party(party)
+                    for key in _lookup_keys(name):
+                        by_term[(term, key)] = party
+                        if key not in latest or int(term) >= latest[key][0]:
+                            latest[key] = (int(term), party)
+
+            by_name = dict(DEFAULT_LEGISLATORS)
+            by_name.update({name: party for name, (_, party) in latest.items()})
+
+            # 一次替換整份資料，查詢中的執行緒不會看到載入到一半的資料
+            self._by_term, self._by_name = by_term, by_name
+            self._signature = signature
+            self._checked_at = time.monotonic()
+            self.version += 1
+
+    def set_sources(self, sources: List[Tuple[str, str]]):
+        """改用其他資料來源並重新載入
+
+        Args:
+            sources: (資料庫路徑, 資料表) 列表
+        """
+        if sources != self.sources:
+            self.sources = sources
+            self.reload()
+
+    def refresh_if_stale(self):
+        """資料來源有更新時重新載入，每 RELOAD_CHECK_INTERVAL 秒最多檢查一次"""
+        now = time.monotonic()
+        if now - self._checked_at < RELOAD_CHECK_INTERVAL:
+            return
+        self._checked_at = now
+        if self._source_signature() != self._signature:
+            self.reload()
+
+    def known_names(self) -> List[str]:
+        """取得所有已知的立委姓名（已移除空白）
+
+        Returns:
+            List[str]: 姓名列表
+        """
+        self.refresh_if_stale()
+        return list(self._by_name)
+
+    def get_party(self, name: str, term=None) -> Optional[str]:
+        """查詢立委黨籍
+
+        Args:
+            name: 立委姓名
+            term: 屆別，提供時優先採用該屆的黨籍
+
+        Returns:
+            Optional[str]: 政黨簡稱（民進黨、國民黨等），查無此人時返回 None
+        """
+        self.refresh_if_stale()
+        keys = _lookup_keys(name)
+        term = normalize_term(term)
+        if term:
+            by_term = self._by_term
+            for key in keys:
+                if (term, key) in by_term:
+                    return by_term[(term, key)]
+        by_name = self._by_name
+        for key in keys:
+            if key in by_name:
+                return by_name[key]
+        return None
+
+
+_lookup = None
+_lookup_sources = None  # use_database() 指定的資料來源，None 表示 DEFAULT_SOURCES
+_lookup_lock = threading.Lock()
+
+
+def get_lookup() -> LegislatorLookup:
+    """取得模組共用的查詢表，第一次呼叫時才載入資料"""
+    global _lookup
+    if _lookup is None:
+        with _lookup_lock:
+            if _lookup is None:
+                _lookup = LegislatorLookup(_lookup_sources)
+    return _lookup
+
+
+def use_database(db_path: str):
+    """讓共用的查詢表讀取指定法案資料庫的立委資料
+
+    查詢表尚未載入時只記錄資料來源，第一次查詢時才讀取；已載入且來源不同時重新載入。
+
+    Args:
+        db_path: 法案資料庫路徑
+    """
+    global _lookup_sources
+    sources = sources_for_database(db_path)
+    with _lookup_lock:
+        _lookup_sources = sources
+        lookup = _lookup
+    if lookup is not None:
+        lookup.set_sources(sources)
+
+
+def get_party(name: str, term=None) -> Optional[str]:
+    """查詢立委黨籍，參數與返回值同 LegislatorLookup.get_party"""
+    return get_lookup().get_party(name, term)
+
+
+def reload_legislators():
+    """匯入立委資料後呼叫，重新載入共用的查詢表"""
+    if _lookup is not None:
+        _lookup.reload()
@@ -0,0 +1,250 @@
+"""提案人、連署人姓名切分模組
+
+以已知立委姓名建立 Aho–Corasick 自動機，單次線性掃描 billProposer、
+billCosignatory 字串切出姓名。字串先依連續空白或分隔符號切成片段，整段就是
+已知姓名時直接查表；其餘片段（例如只以一個全形空格相連的「陳賴素美　吳琪銘」）
+交由自動機比對。比對時忽略姓名內的空白，因此「范　雲」、「Kolas  Yotaka」等
+夾有空白的姓名也能正確辨識；只有自動機比對不到的部分才退回原本的正規表示式猜測。
+"""
+import re
+import threading
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from src.aho_corasick import AhoCorasick
+    from src.legislator_lookup import get_lookup
+except ImportError:  # 以 src 為工作目錄直接執行腳本時
+    from aho_corasick import AhoCorasick
+    from legislator_lookup import get_lookup
+
+# 依名單字串快取的切分結果數量上限
+NAME_CACHE_SIZE = 8192
+
+# 原住民委員的中文姓名與族名羅馬拼音
+ABORIGINAL_NAMES = {
+    '伍麗華': 'Saidhai Tahovecahe',
+    '鄭天財': 'Sra Kacaw',
+    '高金素梅': 'Ciwas Ali',
+    '萬美玲': 'Walis Pelin',
+    '谷辣斯．尤達卡': 'Kolas Yotaka',
+}
+
+# 姓名之間的分隔符號
+SEPARATORS = '、，,'
+
+# 「本院委員XXX等N人」
+COMMITTEE_PATTERN = re.compile(r'本院委員.+?等\d+人')
+
+# 片段分隔：連續兩個以上的空白（英文族名中間除外）或分隔符號
+TOKEN_SPLIT_PATTERN = re.compile(
+    rf'(?<![A-Za-z])\s{{2,}}|\s{{2,}}(?![A-Za-z])|[{SEPARATORS}]'
+)
+
+LATIN_PATTERN = re.compile(r'[A-Za-z]')
+
+CHINESE_NAME_PATTERN = re.compile(r'[一-龥]{2,4}')
+
+# 原住民姓名（中文+英文組合）或一般中文姓名
+FALLBACK_NAME_PATTERN = re.compile(
+    r'[一-龥]{2,4}(?:\s*[A-Za-z]+){2,3}|[一-龥]{2,4}'
+)
+
+
+def _compact(text: str) -> str:
+    """移除所有空白（含全形空格與不斷行空格）"""
+    return ''.join(text.split())
+
+
+def _is_latin(char: str) -> bool:
+    return char.isascii() and char.isalpha()
+
+
+class NameMatcher:
+    """以 Aho–Corasick 自動機切分姓名"""
+
+    def __init__(self, names: List[str], aboriginal_names: Dict[str, str] = None):
+        """建立自動機
+
+        Args:
+            names: 已知姓名列表
+            aboriginal_names: 原住民委員中文姓名與族名對照表，預設為 ABORIGINAL_NAMES
+        """
+        if aboriginal_names is None:
+            aboriginal_names = ABORIGINAL_NAMES
+
+        # 比對用鍵值（已移除空白） -> (含族名的完整姓名, 中文姓名)
+        self.patterns: Dict[str, Tuple[str, str]] = {}
+        for name in names:
+            name = _compact(name)
+            # 夾帶英文的姓名由 ABORIGINAL_NAMES 提供正確的顯示格式
+            if name and not any(_is_latin(char) for char in name):
+                self.patterns[name] = (name, name)
+        for chinese, romanized in aboriginal_names.items():
+            self.patterns[chinese] = (chinese, chinese)
+            self.patterns[chinese + _compact(romanized)] = (chinese + romanized, chinese)
+            self.patterns[_compact(romanized)] = (romanized, chinese)
+
+        self._automaton = AhoCorasick(self.patterns)
+
+    def _scan(self, token: str) -> List[Tuple[int, int, str]]:
+        """單次掃描片段，找出所有落在姓名邊界上的已知姓名
+
+        掃描時略過空白，因此姓名內的空白（如「范　雲」）不影響比對。
+
+        Returns:
+            List[Tuple[int, int, str]]: (起點, 終點, 比對鍵值) 列表
+        """
+        automaton = self._automaton
+        goto, fail, output = automaton.goto, automaton.fail, automaton.output
+        matches = []
+        positions = []  # 已讀入的非空白字元在片段中的位置
+        state = 0
+        for i, char in enumerate(token):
+            if char.isspace():
+                continue
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            positions.append(i)
+
+            for pattern in output[state]:
+                start = positions[-len(pattern)]
+                if self._is_boundary(token, start - 1) and self._is_boundary(token, i + 1, allow_latin=True):
+                    matches.append((start, i + 1, pattern))
+        return matches
+
+    def _match_token(self, token: str, keep_romanization: bool) -> List[str]:
+        """以自動機切分片段，比對不到的部分退回正規表示式"""
+        # 取最左、最長且不重疊的比對結果
+        selected = []
+        last_end = 0
+        for start, end, pattern in sorted(self._scan(token), key=lambda m: (m[0], -m[1])):
+            if start >= last_end:
+                selected.append((start, end, pattern))
+                last_end = end
+
+        names = []
+        cursor = 0
+        for start, end, pattern in selected:
+            if start > cursor:
+                names.extend(self._fallback(token[cursor:start], keep_romanization))
+            full_name, chinese_name = self.patterns[pattern]
+            names.append(full_name if keep_romanization else chinese_name)
+            cursor = end
+        if cursor < len(token):
+            names.extend(self._fallback(token[cursor:], keep_romanization))
+        return names
+
+    @staticmethod
+    def _is_boundary(text: str, index: int, allow_latin: bool = False) -> bool:
+        """檢查位置是否為姓名邊界（字串頭尾、空白或分隔符號）"""
+        if index < 0 or index >= len(text):
+            return True
+        char = text[index]
+        return char.isspace() or char in SEPARATORS or (allow_latin and _is_latin(char))
+
+    @staticmethod
+    def _fallback(segment: str, keep_romanization: bool) -> List[str]:
+        """以正規表示式猜測自動機比對不到的姓名"""
+        names = []
+        parts = segment.split()
+        if not parts:
+            return names
+        # 「范　雲」這類以單一空白隔開的單字姓名
+        if len(parts) > 1 and all(len(part) == 1 for part in parts):
+            segment = ''.join(parts)
+        for match in FALLBACK_NAME_PATTERN.finditer(segment):
+            name = ' '.join(match.group(0).split())
+            if keep_romanization:
+                names.append(name)
+            else:
+                names.append(re.match(r'[一-龥]+', name).group(0))
+        return names
+
+    def extract(self, names_str: str, keep_romanization: bool = True) -> List[str]:
+        """從字串中提取人名列表
+
+        Args:
+            names_str: 包含多個姓名的字串
+            keep_romanization: 原住民委員是否保留族名，False 時只返回中文姓名
+
+        Returns:
+            list: 依出現順序排列、不重複的人名列表
+        """
+        if not names_str:
+            return []
+
+        text = COMMITTEE_PATTERN.sub('', names_str)
+
+        names = []
+        patterns = self.patterns
+        for token in TOKEN_SPLIT_PATTERN.split(text):
+            token = token.strip()
+            if not token:
+                continue
+            # 片段沒有空白時可直接查表，否則移除空白後再查
+            plain = token.isalpha()
+            key = token if plain else ''.join(token.split())
+            if key in patterns:
+                full_name, chinese_name = patterns[key]
+                names.append(full_name if keep_romanization else chinese_name)
+            elif plain and not LATIN_PATTERN.search(token):
+                # 姓名只能從片段開頭或空白後開始，沒有空白與英文的片段不可能再比對到已知姓名
+                if CHINESE_NAME_PATTERN.fullmatch(token):
+                    names.append(token)
+                else:
+                    names.extend(self._fallback(token, keep_romanization))
+            else:
+                names.extend(self._match_token(token, keep_romanization))
+
+        # 如果沒有找到任何名字，嘗試使用分隔符號分割
+        if not names:
+            for sep in ['、', '，', ',', ' ']:
+                if sep in text:
+                    parts = [part.strip() for part in text.split(sep)]
+                    names.extend([part for part in parts if part and len(part) >= 2])
+                    break
+
+        # 移除重複的名字
+        return list(dict.fromkeys(names))
+
+
+_matcher: Optional[NameMatcher] = None
+_matcher_version = None
+_matcher_lock = threading.Lock()
+
+
+def get_matcher() -> NameMatcher:
+    """取得共用的姓名切分器，立委資料重新載入後自動重建"""
+    global _matcher, _matcher_version
+    lookup = get_lookup()
+    lookup.refresh_if_stale()
+    if _matcher is None or _matcher_version != lookup.version:
+        with _matcher_lock:
+            if _matcher is None or _matcher_version != lookup.version:
+                _matcher = NameMatcher(lookup.known_names())
+                _matcher_version = lookup.version
+                _extract_names.cache_clear()
+    return _matcher
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def _extract_names(names_str: str, keep_romanization: bool) -> Tuple[str, ...]:
+    return tuple(_matcher.extract(names_str, keep_romanization))
+
+
+def extract_names(names_str: str, keep_romanization: bool = True) -> list:
+    """從字串中提取人名列表
+
+    Args:
+        names_str: 包含多個姓名的字串
+        keep_romanization: 原住民委員是否保留族名，False 時只返回中文姓名
+
+    Returns:
+        list: 人名列表
+    """
+    if not names_str:
+        return []
+    get_matcher()  # 立委資料更新時先重建自動機並清除快取
+    return list(_extract_names(names_str, keep_romanization))
@@ -80,25 +80,18 @@ def check_name_consistency():
     db = Database()
     
     try:
-        # 獲取所有委員姓名
-        cursor = db.conn.cursor()
-        cursor.execute("SELECT name FROM legislators")
-        legislator_names = set(standardize_name(row['name']) for row in cursor.fetchall())
+        # 獲取所有委員姓名（逐批讀取，只保留姓名集合）
+        legislator_names = set(standardize_name(legislator['name'])
+                               for legislator in db.iter_legislators(fields=['name']))
         
         # 獲取所有提案人姓名
-        cursor.execute("""
-        SELECT DISTINCT billProposer 
-        FROM bills 
-        WHERE billProposer IS NOT NULL 
-        AND billProposer NOT LIKE '%委員會%' 
-        AND billProposer NOT LIKE '%行政院%'
-        """)
-        
         proposer_names = set()
-        for row in cursor.fetchall():
-            if row['billProposer']:
-                names = row['billProposer'].split(',')  # 使用逗號分割
-                proposer_names.update(standardize_name(name) for name in names if name.strip())
+        for bill in db.iter_bills(fields=['billProposer'], ordered=False):
+            proposers = bill['billProposer']
+            if not proposers or '委員會' in proposers or '行政院' in proposers:
+                continue
+            names = proposers.split(',')  # 使用逗號分割
+            proposer_names.update(standardize_name(name) for name in names if name.strip())
         
         # 比較差異
         only_in_legislators = legislator_names - proposer_names
@@ -0,0 +1,151 @@
+"""參數化查詢組合模組
+
+Streamlit 儀表板的分析頁面依屆別、會期、立委、提案機關等條件查詢 bills。
+BillQuery 以方法串接的方式組合條件，所有的值都以 ? 參數傳入，不會直接寫進
+SQL 文字：
+
+- 不會因為立委姓名或機關名稱中的引號造成 SQL 注入或語法錯誤。
+- 篩選條件的組合相同時產生完全相同的 SQL 文字，sqlite3 的語句快取
+  （connect 的 cached_statements）可以重複使用已編譯的語句，不必每次切換
+  屆別或立委都重新編譯。
+
+欄位名稱、排序與分組運算式由程式內的常數提供，不可來自使用者輸入。
+
+用法：
+    sql, params = (BillQuery(['billName', 'law_name'])
+                   .term('11').session_period('02')
+                   .member('王美惠', '11', 'proposer')
+                   .build())
+"""
+import sqlite3
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    from src.bill_record import Bill
+except ImportError:  # 以 src 為工作目錄直接執行腳本時
+    from bill_record import Bill
+
+# 立委以 bill_members 的 (name, term, role, billNo) 索引查詢，不必掃描整個提案表。
+# 議案編號只在同一屆內唯一，外層同樣限定屆別，才不會選到其他屆別相同編號的法案；
+# 不使用 (term, billNo) IN 的寫法，SQLite 會為列值比較再執行一次子查詢
+MEMBER_CONDITION = ("term = ? AND billNo IN "
+                    "(SELECT billNo FROM bill_members WHERE name = ? AND term = ? AND role = ?)")
+
+
+class BillQuery:
+    """組合 bills 表的參數化查詢"""
+
+    def __init__(self, columns: Iterable[str] = ('*',), distinct: bool = False):
+        """
+        Args:
+            columns: 要查詢的欄位或運算式
+            distinct: 是否使用 SELECT DISTINCT
+        """
+        self.columns = list(columns)
+        self.distinct = distinct
+        self.conditions: List[str] = []
+        self.params: List = []
+        self.group_columns: List[str] = []
+        self.order_expressions: List[str] = []
+        self.limit_count: Optional[int] = None
+
+    def where(self, condition: str, *params) -> 'BillQuery':
+        """加入一個以 AND 連接的條件
+
+        Args:
+            condition: 以 ? 表示參數的條件
+            params: 條件的參數
+
+        Returns:
+            BillQuery: 查詢本身，可繼續串接
+        """
+        self.conditions.append(condition)
+        self.params.extend(params)
+        return self
+
+    def term(self, term: Optional[str]) -> 'BillQuery':
+        """篩選屆別，None 表示全部屆別"""
+        return self.where("term = ?", term) if term else self
+
+    def session_period(self, session_period: Optional[str]) -> 'BillQuery':
+        """篩選會期，None 表示全部會期"""
+        return self.where("sessionPeriod = ?", session_period) if session_period else self
+
+    def member(self, name: str, term: str, role: str) -> 'BillQuery':
+        """篩選立委在指定屆別提案（proposer）或連署（cosignatory）的法案"""
+        return self.where(MEMBER_CONDITION, term, name, term, role)
+
+    def proposer_like(self, name: str) -> 'BillQuery':
+        """篩選提案人欄位包含指定姓名的法案"""
+        return self.where("billProposer LIKE ?", f"%{name}%")
+
+    def org_like(self, keyword: str) -> 'BillQuery':
+        """篩選提案機關包含指定文字的法案"""
+        return self.where("billOrg LIKE ?", f"%{keyword}%")
+
+    def not_empty(self, column: str) -> 'BillQuery':
+        """篩選欄位不是 NULL 或空字串的法案"""
+        return self.where(f"{column} IS NOT NULL AND {column} != ''")
+
+    def group_by(self, *columns: str) -> 'BillQuery':
+        """依欄位分組"""
+        self.group_columns.extend(columns)
+        return self
+
+    def order_by(self, *expressions: str) -> 'BillQuery':
+        """排序運算式，例如 'count DESC'"""
+        self.order_expressions.extend(expressions)
+        return self
+
+    def limit(self, count: int) -> 'BillQuery':
+        """限制筆數，筆數以參數傳入"""
+        self.limit_count = int(count)
+        return self
+
+    def build(self) -> Tuple[str, Tuple]:
+        """產生 SQL 與參數
+
+        Returns:
+            Tuple[str, Tuple]: (SQL, 參數)
+        """
+        parts = [f"SELECT {'DISTINCT ' if self.distinct else ''}{', '.join(self.columns)} FROM bills"]
+        params = list(self.params)
+        if self.conditions:
+            parts.append("WHERE " + " AND ".join(self.conditions))
+        if self.group_columns:
+            parts.append("GROUP BY " + ", ".join(self.group_columns))
+        if self.order_expressions:
+            parts.append("ORDER BY " + ", ".join(self.order_expressions))
+        if self.limit_count is not None:
+            parts.append("LIMIT ?")
+            params.append(self.limit_count)
+        return "\n".join(parts), tuple(params)
+
+    def fetch_all(self, conn: sqlite3.Connection) -> List[Dict]:
+        """執行查詢並返回所有結果
+
+        Args:
+            conn: 資料庫連線（row_factory 為 sqlite3.Row）
+
+        Returns:
+            List[Dict]: 查詢結果
+        """
+        sql, params = self.build()
+        return [dict(row) for row in conn.execute(sql, params).fetchall()]
+
+    def fetch_bills(self, conn: sqlite3.Connection) -> List[Bill]:
+        """執行查詢並返回法案紀錄（欄位須為 bills 表的欄位）
+
+        Args:
+            conn: 資料庫連線（row_factory 為 sqlite3.Row）
+
+        Returns:
+            List[Bill]: 法案列表
+        """
+        sql, params = self.build()
+        return Bill.from_rows(conn.execute(sql, params))
+
+    def fetch_column(self, conn: sqlite3.Connection) -> List:
+        """執行查詢並返回第一個欄位的所有值"""
+        sql, params = self.build()
+        return [row[0] for row in conn.execute(sql, params).fetchall()]
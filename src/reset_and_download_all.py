@@ -4,9 +4,11 @@ import time
 import os
 import sys
 import sqlite3
+from contextlib import closing
 from datetime import datetime
-from api_client import LYAPIClient
+from api_client import DEFAULT_WORKERS, LYAPIClient
 from database import Database
+from ingest_checkpoint import ShadowReload, page_hash
 
 # 設置日誌記錄
 logging.basicConfig(
@@ -64,43 +66,6 @@ def get_page_backup_dir():
     page_backup_dir = os.path.join(backup_dir, 'pages')
     return page_backup_dir
 
-def reset_database():
-    """重置資料庫"""
-    logger.info("開始重置資料庫...")
-    db = Database()
-    try:
-        # 先備份資料庫
-        backup_db_path = backup_database()
-        if backup_db_path:
-            logger.info(f"資料庫已成功備份至 {backup_db_path}")
-        
-        # 先關閉資料庫連接
-        db.close()
-        
-        # 獲取資料庫路徑
-        data_dir = ensure_data_dir()
-        db_path = os.path.join(data_dir, 'bills.db')
-        
-        # 嘗試刪除資料庫文件
-        try:
-            if os.path.exists(db_path):
-                os.remove(db_path)
-                logger.info(f"已刪除舊資料庫文件 {db_path}")
-        except Exception as e:
-            logger.error(f"刪除資料庫文件時發生錯誤: {str(e)}")
-            return False
-        
-        # 重新初始化資料庫
-        db = Database()
-        logger.info("已重新創建資料表")
-        
-        return True
-    except Exception as e:
-        logger.error(f"重置資料庫時發生錯誤: {str(e)}")
-        return False
-    finally:
-        db.close()
-
 def backup_database():
     """備份資料庫"""
     try:
@@ -127,121 +92,175 @@ def backup_database():
         logger.error(f"備份資料庫時發生錯誤: {str(e)}")
         return None
 
-def download_all_bills_with_page():
-    """下載所有法案並記錄頁碼"""
+def download_all_bills_with_page(workers: int = DEFAULT_WORKERS, restart: bool = False):
+    """下載所有法案並記錄頁碼
+    
+    資料先寫入暫存資料庫並逐頁記錄檢查點，中斷後重新執行會從缺少的頁面繼續。
+    全部頁面完成後才一次替換進正式資料庫，下載期間網站仍使用舊資料。
+    
+    Args:
+        workers: 同時下載的頁數
+        restart: 是否捨棄先前的檢查點，從第一頁重新下載
+        
+    Returns:
+        bool: 是否完成下載並替換正式資料
+    """
     logger.info("開始下載所有法案資料...")
     
-    # 初始化客戶端和資料庫
+    # 初始化客戶端與暫存資料庫
     client = LYAPIClient(timeout=60, max_retries=5, retry_delay=3)
-    db = Database()
+    db_path = os.path.join(ensure_data_dir(), 'bills.db')
+    reload = ShadowReload(db_path)
+    if restart:
+        logger.info("捨棄先前的檢查點，從第一頁重新下載")
+        reload.discard()
+        reload = ShadowReload(db_path)
+    
+    completed = reload.completed_pages()
+    if completed:
+        logger.info(f"從檢查點續傳：已完成 {len(completed)} 頁（{reload.staging_path}）")
     
     start_time = time.time()
     total_bills = 0
     max_pages_to_check = 100  # 最多檢查的頁數
     
     try:
-        # 估計總頁數
-        estimated_total = client.get_total_bills_count()
-        if estimated_total > 0:
-            max_pages_to_check = min(max_pages_to_check, (estimated_total // 1000) + 5)
+        end_page = _find_end_page(completed)
+        if end_page is None:
+            # 估計總頁數
+            estimated_total = client.get_total_bills_count()
+            if estimated_total > 0:
+                max_pages_to_check = min(max_pages_to_check, (estimated_total // 1000) + 5)
+        else:
+            max_pages_to_check = end_page
         
-        logger.info(f"預計檢查 {max_pages_to_check} 頁資料")
+        # 已完成的頁面不再下載
+        pending_pages = [page for page in range(1, max_pages_to_check + 1) if page not in completed]
+        logger.info(f"預計檢查 {max_pages_to_check} 頁資料，尚需下載 {len(pending_pages)} 頁")
         
-        # 逐頁下載資料
-        for page in range(1, max_pages_to_check + 1):
-            logger.info(f"正在下載第 {page}/{max_pages_to_check} 頁...")
-            
-            try:
-                bills = client.get_bills(term="all", page=page)
-                
-                if not bills:
-                    logger.info(f"第 {page} 頁沒有資料，下載結束")
-                    break
-                
-                logger.info(f"成功獲取第 {page} 頁資料，共 {len(bills)} 筆")
-                
-                # 備份頁面數據
-                page_backup_dir = get_page_backup_dir()
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                backup_filename = f"page_{page}_{timestamp}.json"
-                backup_path = os.path.join(page_backup_dir, backup_filename)
-                with open(backup_path, 'w', encoding='utf-8') as f:
-                    json.dump(bills, f, ensure_ascii=False, indent=2)
-                logger.info(f"已將第 {page} 頁資料備份至: {backup_path}")
-                
-                # 儲存資料，並記錄頁碼
-                db.save_bills(bills, page_number=page)
-                total_bills += len(bills)
-                
-                # 每 10 頁顯示一次進度
-                if page % 10 == 0:
-                    elapsed_time = time.time() - start_time
-                    logger.info(f"已下載 {total_bills} 筆資料，耗時 {elapsed_time:.2f} 秒")
-                
-                # 隨機延遲
-                delay = 2 + (time.time() % 3)  # 2-5秒延遲
-                logger.info(f"等待 {delay:.2f} 秒後繼續...")
-                time.sleep(delay)
-                
-            except Exception as e:
-                logger.error(f"下載第 {page} 頁時發生錯誤: {str(e)}")
-                # 延遲後繼續嘗試下一頁
-                time.sleep(10)
-                continue
+        # 同時下載多個頁面（共用限速器），並依頁碼順序寫入暫存資料庫
+        # 暫存資料庫沒有讀取者，載入完成後再一次建立索引
+        with reload.staging.deferred_indexes():
+            pages = client.iter_pages(pending_pages, term="all", workers=workers)
+            with closing(pages):
+                for page, bills in pages:
+                    if bills is None:
+                        logger.error(f"下載第 {page} 頁失敗，略過此頁")
+                        continue
+                    
+                    if not bills:
+                        # 空頁也記錄檢查點，續傳時即可知道最後一頁
+                        reload.save_page(page, bills)
+                        logger.info(f"第 {page} 頁沒有資料，下載結束")
+                        break
+                    
+                    logger.info(f"成功獲取第 {page}/{max_pages_to_check} 頁資料，共 {len(bills)} 筆")
+                    
+                    try:
+                        # 備份頁面數據
+                        page_backup_dir = get_page_backup_dir()
+                        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                        backup_filename = f"page_{page}_{timestamp}.json"
+                        backup_path = os.path.join(page_backup_dir, backup_filename)
+                        with open(backup_path, 'w', encoding='utf-8') as f:
+                            json.dump(bills, f, ensure_ascii=False, indent=2)
+                        logger.info(f"已將第 {page} 頁資料備份至: {backup_path}")
+                        
+                        # 儲存資料並記錄檢查點
+                        total_bills += reload.save_page(page, bills)
+                    except Exception as e:
+                        logger.error(f"儲存第 {page} 頁時發生錯誤: {str(e)}")
+                        continue
+                    
+                    # 每 10 頁顯示一次進度
+                    if page % 10 == 0:
+                        elapsed_time = time.time() - start_time
+                        logger.info(f"已下載 {total_bills} 筆資料，耗時 {elapsed_time:.2f} 秒")
         
         elapsed_time = time.time() - start_time
-        logger.info(f"下載完成！總共下載 {total_bills} 筆資料，耗時 {elapsed_time:.2f} 秒")
+        logger.info(f"本次下載 {total_bills} 筆資料，耗時 {elapsed_time:.2f} 秒")
         
-        # 查詢資料庫中的頁碼統計
-        cursor = db.conn.cursor()
-        cursor.execute("""
-        SELECT page_number, COUNT(*) as count 
-        FROM bills 
-        GROUP BY page_number 
-        ORDER BY page_number
-        """)
-        
-        logger.info("\n各頁資料統計：")
-        for row in cursor.fetchall():
-            if row['page_number'] is not None:
-                logger.info(f"第 {row['page_number']} 頁：{row['count']} 筆")
+        completed = reload.completed_pages()
+        end_page = _find_end_page(completed)
+        if end_page is None:
+            logger.error(f"檢查 {max_pages_to_check} 頁後仍未找到最後一頁，暫不替換正式資料")
+            return False
+        missing_pages = reload.missing_pages(end_page - 1)
+        if missing_pages:
+            logger.error(f"第 {missing_pages} 頁尚未完成，暫不替換正式資料；重新執行即可從檢查點續傳")
+            return False
         
-        # 查詢資料庫中的屆別統計
-        cursor.execute("""
-        SELECT term, COUNT(*) as count 
-        FROM bills 
-        GROUP BY term 
-        ORDER BY CAST(term AS INTEGER) DESC
-        """)
+        # 全部頁面完成，以影子表一次替換正式資料
+        logger.info(f"共 {end_page - 1} 頁已完成，替換正式資料庫中的法案資料...")
+        db = Database(db_path)
+        try:
+            reload.swap_into(db)
+            reload.discard()
+            logger.info("已替換正式資料，並刪除暫存資料庫")
+            log_database_stats(db)
+        finally:
+            db.close()
         
-        logger.info("\n各屆別資料統計：")
-        for row in cursor.fetchall():
-            logger.info(f"第 {row['term']} 屆：{row['count']} 筆")
-            
         return True
     except Exception as e:
-        logger.error(f"下載過程中發生錯誤: {str(e)}")
+        logger.error(f"下載過程中發生錯誤: {str(e)}；重新執行即可從檢查點續傳")
         return False
     finally:
-        db.close()
+        reload.staging.close()
+
+def _find_end_page(completed: dict):
+    """由檢查點找出記錄為空頁的最小頁碼（即最後一頁的下一頁）"""
+    empty_hash = page_hash([])
+    end_pages = [page for page, checkpoint in completed.items() if checkpoint['content_hash'] == empty_hash]
+    return min(end_pages) if end_pages else None
+
+def log_database_stats(db: Database):
+    """顯示資料庫中的頁碼與屆別統計"""
+    # 查詢資料庫中的頁碼統計
+    cursor = db.conn.cursor()
+    cursor.execute("""
+    SELECT page_number, COUNT(*) as count 
+    FROM bills 
+    GROUP BY page_number 
+    ORDER BY page_number
+    """)
+    
+    logger.info("\n各頁資料統計：")
+    for row in cursor.fetchall():
+        if row['page_number'] is not None:
+            logger.info(f"第 {row['page_number']} 頁：{row['count']} 筆")
+    
+    # 查詢資料庫中的屆別統計
+    cursor.execute("""
+    SELECT term, COUNT(*) as count 
+    FROM bills 
+    GROUP BY term 
+    ORDER BY CAST(term AS INTEGER) DESC
+    """)
+    
+    logger.info("\n各屆別資料統計：")
+    for row in cursor.fetchall():
+        logger.info(f"第 {row['term']} 屆：{row['count']} 筆")
 
 def main():
-    logger.info("======= 開始重置並下載所有法案 =======")
+    logger.info("======= 開始重新下載所有法案 =======")
     
     # 詢問用戶確認
-    if len(sys.argv) <= 1 or sys.argv[1] != "--force":
-        confirmation = input("此操作將會重置資料庫並重新下載所有資料。確定要繼續嗎？(y/n): ")
+    if "--force" not in sys.argv[1:]:
+        confirmation = input("此操作將會重新下載所有資料並替換資料庫中的法案。確定要繼續嗎？(y/n): ")
         if confirmation.lower() != 'y':
             logger.info("操作已取消")
             return
     
-    # 重置資料庫
-    if not reset_database():
-        logger.error("資料庫重置失敗，終止操作")
-        return
-        
-    # 下載所有法案
-    if not download_all_bills_with_page():
+    # 先備份資料庫；下載完成前不會修改正式資料
+    backup_db_path = backup_database()
+    if backup_db_path:
+        logger.info(f"資料庫已成功備份至 {backup_db_path}")
+    
+    # 下載所有法案，同時下載的頁數可由環境變數 DOWNLOAD_WORKERS 設定；
+    # 加上 --restart 會捨棄先前的檢查點
+    workers = int(os.environ.get('DOWNLOAD_WORKERS', DEFAULT_WORKERS))
+    if not download_all_bills_with_page(workers=workers, restart="--restart" in sys.argv[1:]):
         logger.error("下載法案失敗")
     
     logger.info("======= 操作完成 =======")
@@ -0,0 +1,224 @@
+"""搜尋結果快取模組
+
+首頁的熱門法案按鈕會一再搜尋相同的法律，每次都要重新查詢、整理提案人黨籍並
+渲染模板。SearchCache 以 (法律名稱, 屆別, 排序方式, 資料版本號) 為鍵快取渲染
+後的頁面：
+
+- 程序內以 LRU 保存最近使用的結果，有數量上限與存活時間（TTL）。
+- 設定 SEARCH_CACHE_PATH 時另以 SQLite 檔案作為共用快取，gunicorn 的多個
+  worker 可以共用彼此渲染好的結果。
+
+資料版本號（Database.get_data_version）在每次寫入法案或立委資料時加一，
+鍵值包含版本號，排程更新後所有舊的快取自然失效，不需要另外清除。
+"""
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+try:
+    from src.database import connect
+except ImportError:  # 以 src 為工作目錄直接執行腳本時
+    from database import connect
+
+# 程序內快取的結果數上限
+DEFAULT_CACHE_SIZE = 256
+
+# 快取結果的存活秒數
+DEFAULT_CACHE_TTL = 600
+
+# 共用快取檔案保存的結果數上限
+DEFAULT_SHARED_CACHE_SIZE = 2048
+
+# 共用快取只存少量資料，不需要大型頁面快取與記憶體映射
+SHARED_CACHE_STORAGE_PROFILE = {'mmap_size': None, 'cache_size': None, 'busy_timeout': 1000}
+
+CacheKey = Tuple[str, str, str, int]
+
+
+class SharedCache:
+    """以 SQLite 檔案保存的共用快取，供同一台機器上的多個程序使用"""
+
+    def __init__(self, path: str, max_entries: int = DEFAULT_SHARED_CACHE_SIZE):
+        """
+        Args:
+            path: 快取檔案路徑
+            max_entries: 保存的結果數上限，超過時刪除最舊的結果
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = None
+        self._pid = None
+
+    def _connection(self) -> sqlite3.Connection:
+        """取得目前程序的連線（fork 後的子程序重新連線）"""
+        if self._conn is None or self._pid != os.getpid():
+            conn = connect(self.path, storage_profile=SHARED_CACHE_STORAGE_PROFILE, check_same_thread=False)
+            conn.execute("""
+            CREATE TABLE IF NOT EXISTS search_cache (
+                cache_key TEXT PRIMARY KEY,
+                data_version INTEGER,
+                value TEXT,
+                created_at REAL
+            )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_search_cache_created ON search_cache(created_at)")
+            conn.commit()
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+    @staticmethod
+    def _encode(key: CacheKey) -> str:
+        return '\x1f'.join(str(part) for part in key)
+
+    def get(self, key: CacheKey, ttl: float) -> Optional[str]:
+        """取得未過期的快取結果
+
+        Args:
+            key: 快取鍵
+            ttl: 存活秒數
+
+        Returns:
+            Optional[str]: 快取的結果，沒有或已過期時返回 None
+        """
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT value FROM search_cache WHERE cache_key = ? AND created_at >= ?",
+                (self._encode(key), time.time() - ttl)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: CacheKey, value: str):
+        """保存結果，同時刪除舊資料版本與超過上限的結果
+
+        Args:
+            key: 快取鍵，最後一項為資料版本號
+            value: 要快取的結果
+        """
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute("""
+                INSERT OR REPLACE INTO search_cache (cache_key, data_version, value, created_at)
+                VALUES (?, ?, ?, ?)
+                """, (self._encode(key), key[-1], value, time.time()))
+                conn.execute("DELETE FROM search_cache WHERE data_version < ?", (key[-1],))
+                conn.execute("""
+                DELETE FROM search_cache WHERE cache_key IN (
+                    SELECT cache_key FROM search_cache ORDER BY created_at DESC LIMIT -1 OFFSET ?
+                )
+                """, (self.max_entries,))
+
+
+class SearchCache:
+    """有數量上限與存活時間的 LRU 快取，可搭配共用快取檔案"""
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_SIZE, ttl: float = DEFAULT_CACHE_TTL,
+                 shared_path: str = None):
+        """
+        Args:
+            max_entries: 程序內快取的結果數上限，0 表示停用快取
+            ttl: 快取結果的存活秒數
+            shared_path: 共用快取檔案路徑，未提供時只使用程序內快取
+        """
+        self.max_entries = max(0, int(max_entries))
+        self.ttl = ttl
+        self.shared = SharedCache(shared_path) if shared_path else None
+        self._entries: 'OrderedDict[CacheKey, Tuple[float, str]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: CacheKey) -> Optional[str]:
+        """取得快取結果，程序內找不到時再查共用快取
+
+        Args:
+            key: (法律名稱, 屆別, 排序方式, 資料版本號)
+
+        Returns:
+            Optional[str]: 快取的結果，沒有時返回 None
+        """
+        if not self.max_entries:
+            return None
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if now - entry[0] < self.ttl:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                del self._entries[key]
+
+        value = None
+        if self.shared is not None:
+            try:
+                value = self.shared.get(key, self.ttl)
+            except sqlite3.Error as e:
+                print(f"讀取共用快取時發生錯誤: {e}")
+
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.shared_hits += 1
+            self._store(key, value, now)
+        return value
+
+    def set(self, key: CacheKey, value: str):
+        """保存結果
+
+        Args:
+            key: (法律名稱, 屆別, 排序方式, 資料版本號)
+            value: 要快取的結果
+        """
+        if not self.max_entries:
+            return
+
+        with self._lock:
+            self._store(key, value, time.monotonic())
+        if self.shared is not None:
+            try:
+                self.shared.set(key, value)
+            except sqlite3.Error as e:
+                print(f"寫入共用快取時發生錯誤: {e}")
+
+    def _store(self, key: CacheKey, value: str, now: float):
+        """寫入程序內快取並淘汰最久未使用的結果，呼叫前需持有 _lock"""
+        self._entries[key] = (now, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """清空程序內快取"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict:
+        """快取命中統計
+
+        Returns:
+            Dict: 程序內命中數、共用快取命中數、未命中數、淘汰數與目前的結果數
+        """
+        with self._lock:
+            lookups = self.hits + self.shared_hits + self.misses
+            return {
+                'hits': self.hits,
+                'shared_hits': self.shared_hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': round((self.hits + self.shared_hits) / lookups, 4) if lookups else 0.0,
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'ttl': self.ttl,
+                'shared': self.shared is not None,
+            }
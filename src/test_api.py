@@ -33,11 +33,9 @@ def analyze_bills():
     
     try:
         print("從資料庫讀取資料...")
-        bills = db.get_all_bills()
-        print(f"讀取到 {len(bills)} 筆資料")
-        
-        # 創建分析器
-        analyzer = BillAnalyzer(bills)
+        # 依資料版本讀取（或建立）欄位式快照，不必把全部法案載入為 dict
+        analyzer = BillAnalyzer.from_database(db)
+        print(f"讀取到 {len(analyzer.snapshot)} 筆資料")
         
         # 獲取修法熱點
         print("\n=== 修法熱點（前10名）===")
@@ -57,10 +55,10 @@ def analyze_bills():
             # 顯示一些原始提案名稱作為範例
             print("\n提案範例：")
             sample_count = 0
-            for bill in bills:
+            for bill in db.iter_bills(fields=['billName'], ordered=False):
                 if sample_count >= 3:  # 只顯示前3個範例
                     break
-                bill_name = bill.get('billName', '')
+                bill_name = bill['billName'] or ''
                 if law_name in analyzer.extract_law_name(bill_name):
                     print(f"  - {bill_name}")
                     sample_count += 1
@@ -1,3 +1,4 @@
+import logging
 import sys
 import os
 from pathlib import Path
@@ -10,8 +11,22 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from src.api_client import LYAPIClient
 from src.database import Database
 
-def update_bills():
-    """更新法案資料"""
+# 日誌格式與輸出由 api_client 匯入時設定
+logger = logging.getLogger("UpdateBills")
+
+# 每日同步重新抓取的最新頁數（每頁 1000 筆）
+DEFAULT_SYNC_PAGES = 3
+
+def update_bills(sync_pages: int = DEFAULT_SYNC_PAGES):
+    """更新法案資料
+    
+    資料庫已有資料時，重新抓取最新的 sync_pages 頁，依內容雜湊只寫入新增或
+    變動的法案（例如審查狀態由「審查完畢」變為「三讀」），而不是只抓比資料庫
+    最新會期更新的法案。
+    
+    Args:
+        sync_pages: 重新抓取的最新頁數
+    """
     client = LYAPIClient()
     db = Database()
     
@@ -22,37 +37,44 @@ def update_bills():
         # 獲取當前最新的屆期資料
         current_term, current_session = client.get_current_term_session()
         
-        print(f"資料庫中最新資料：{latest_in_db if latest_in_db else '無資料'}")
-        print(f"立法院目前資料：第 {current_term} 屆 第 {current_session} 會期")
+        logger.info(f"資料庫中最新資料：{latest_in_db if latest_in_db else '無資料'}")
+        logger.info(f"立法院目前資料：第 {current_term} 屆 第 {current_session} 會期")
         
         # 如果資料庫為空，下載所有資料
         if not latest_in_db:
-            print("資料庫為空，開始下載所有資料...")
+            logger.info("資料庫為空，開始下載所有資料...")
             bills = client.get_all_bills()
             if bills:
                 db.save_bills(bills)
-                print(f"成功下載並儲存 {len(bills)} 筆資料")
+                logger.info(f"成功下載並儲存 {len(bills)} 筆資料")
         else:
-            db_term, db_session = latest_in_db
+            logger.info(f"重新抓取最新 {sync_pages} 頁，比對內容雜湊...")
+            totals = {'inserted': 0, 'updated': 0, 'unchanged': 0, 'invalid': 0}
+            for page, bills in client.iter_pages(range(1, sync_pages + 1)):
+                if bills is None:
+                    logger.warning(f"第 {page} 頁下載失敗，略過")
+                    continue
+                if not bills:
+                    break
+                result = db.sync_bills(bills, page_number=page)
+                for key, count in result.items():
+                    totals[key] += count
+                logger.info(f"第 {page} 頁：新增 {result['inserted']} 筆，更新 {result['updated']} 筆，"
+                            f"未變動 {result['unchanged']} 筆")
             
-            # 檢查是否需要更新
-            if (current_term > db_term) or (current_term == db_term and current_session > db_session):
-                print("發現新資料，開始更新...")
-                new_bills = client.get_latest_bills(db_term, db_session)
-                if new_bills:
-                    db.save_bills(new_bills)
-                    print(f"成功更新 {len(new_bills)} 筆新資料")
-            else:
-                print("資料庫已是最新狀態")
+            logger.info(f"同步完成：新增 {totals['inserted']} 筆，更新 {totals['updated']} 筆，"
+                        f"未變動 {totals['unchanged']} 筆，無效 {totals['invalid']} 筆")
         
         # 顯示資料庫統計
         total_bills = db.get_bills_count()
-        print(f"\n資料庫現有 {total_bills} 筆法案資料")
+        logger.info(f"資料庫現有 {total_bills} 筆法案資料")
         
     finally:
         db.close()
 
 if __name__ == "__main__":
-    print(f"開始更新資料 ({datetime.now().strftime('%Y-%m-%d %H:%M:%S')})")
-    update_bills()
-    print(f"更新完成 ({datetime.now().strftime('%Y-%m-%d %H:%M:%S')})") 
\ No newline at end of file
+    # 可由第一個參數或環境變數 SYNC_PAGES 指定重新抓取的頁數
+    sync_pages = int(sys.argv[1]) if len(sys.argv) > 1 else int(os.environ.get('SYNC_PAGES', DEFAULT_SYNC_PAGES))
+    logger.info(f"開始更新資料 ({datetime.now().strftime('%Y-%m-%d %H:%M:%S')})")
+    update_bills(sync_pages)
+    logger.info(f"更新完成 ({datetime.now().strftime('%Y-%m-%d %H:%M:%S')})")
@@ -1,207 +1,12 @@
 """Streamlit 工具函數模組"""
-import re
 from collections import defaultdict
 import streamlit as st
-
-def cn_to_arab(cn_str):
-    """將中文數字轉換為阿拉伯數字
-    
-    Args:
-        cn_str: 中文數字字串
-        
-    Returns:
-        int: 阿拉伯數字
-    """
-    # 中文數字對照表
-    cn_num = {
-        '零': 0, '一': 1, '二': 2, '三': 3, '四': 4, '五': 5,
-        '六': 6, '七': 7, '八': 8, '九': 9, '十': 10,
-        '百': 100, '千': 1000, '萬': 10000,
-        '０': 0, '１': 1, '２': 2, '３': 3, '４': 4, '５': 5,
-        '６': 6, '７': 7, '８': 8, '９': 9
-    }
-    
-    # 如果是純數字，直接返回
-    if cn_str.isdigit():
-        return int(cn_str)
-        
-    # 如果字串中包含非中文數字，返回原始字串
-    for char in cn_str:
-        if char not in cn_num and char not in ['百', '千', '萬', '零']:
-            return cn_str
-            
-    # 處理特殊情況
-    if not cn_str:
-        return 0
-        
-    # 處理一位數
-    if len(cn_str) == 1:
-        return cn_num.get(cn_str, cn_str)
-        
-    # 處理「十」開頭的數字
-    if cn_str.startswith('十'):
-        if len(cn_str) == 1:
-            return 10
-        return 10 + cn_to_arab(cn_str[1:])
-
-    # 處理帶「千」的數字
-    if '千' in cn_str:
-        parts = cn_str.split('千')
-        base = cn_num[parts[0]] * 1000
-        if not parts[1]:
-            return base
-        if parts[1].startswith('零'):
-            # 處理「一千零八」這樣的情況
-            remaining = parts[1][1:]
-            if remaining:
-                return base + cn_to_arab(remaining)
-            return base
-        return base + cn_to_arab(parts[1])
-        
-    # 處理帶「百」的數字
-    if '百' in cn_str:
-        parts = cn_str.split('百')
-        base = cn_num[parts[0]] * 100
-        if not parts[1]:
-            return base
-        if parts[1].startswith('零'):
-            remaining = parts[1][1:]
-            if remaining:
-                return base + cn_to_arab(remaining)
-            return base
-        return base + cn_to_arab(parts[1])
-        
-    # 處理帶「十」的數字
-    if '十' in cn_str:
-        parts = cn_str.split('十')
-        base = cn_num[parts[0]] * 10
-        if not parts[1]:
-            return base
-        return base + cn_num[parts[1]]
-        
-    # 處理其他情況
-    return cn_num.get(cn_str, cn_str)
-
-def extract_article_numbers(bill_name: str) -> list:
-    """從法案名稱中提取條號
-    
-    Args:
-        bill_name: 法案名稱
-        
-    Returns:
-        list: 條號列表，每個條號是一個字典，包含 full_text 和 number
-    """
-    articles = []
-    
-    # 處理中文數字的條號，如「第二條及第三條」
-    cn_pattern = r'第([零一二三四五六七八九十百千萬０１２３４５６７８９]+)條(?:之([零一二三四五六七八九十百千萬０１２３４５６７８９]+))?(?:及|、|，|和|暨)第([零一二三四五六七八九十百千萬０１２３４５６７８９]+)條(?:之([零一二三四五六七八九十百千萬０１２３４５６７８９]+))?'
-    cn_matches = re.finditer(cn_pattern, bill_name)
-    
-    for match in cn_matches:
-        # 第一個條號
-        first_number = cn_to_arab(match.group(1))
-        if isinstance(first_number, str):
-            continue
-        first_sub = cn_to_arab(match.group(2)) if match.group(2) else 0
-        if isinstance(first_sub, str):
-            first_sub = 0
-        
-        if first_sub:
-            first_text = f"第{first_number}條之{first_sub}"
-        else:
-            first_text = f"第{first_number}條"
-            
-        articles.append({
-            'full_text': first_text,
-            'number': first_number,
-            'sub_number': first_sub
-        })
-        
-        # 第二個條號
-        second_number = cn_to_arab(match.group(3))
-        if isinstance(second_number, str):
-            continue
-        second_sub = cn_to_arab(match.group(4)) if match.group(4) else 0
-        if isinstance(second_sub, str):
-            second_sub = 0
-        
-        if second_sub:
-            second_text = f"第{second_number}條之{second_sub}"
-        else:
-            second_text = f"第{second_number}條"
-            
-        articles.append({
-            'full_text': second_text,
-            'number': second_number,
-            'sub_number': second_sub
-        })
-    
-    # 處理單一中文數字條號，如「第二條」
-    cn_single_pattern = r'第([零一二三四五六七八九十百千萬０１２３４５６７８９]+)條(?:之([零一二三四五六七八九十百千萬０１２３４５６７８９]+))?'
-    cn_single_matches = re.finditer(cn_single_pattern, bill_name)
-    
-    for match in cn_single_matches:
-        number = cn_to_arab(match.group(1))
-        if isinstance(number, str):
-            continue
-        sub_number = cn_to_arab(match.group(2)) if match.group(2) else 0
-        if isinstance(sub_number, str):
-            sub_number = 0
-        
-        # 檢查是否已經在多條模式中處理過
-        already_processed = False
-        for article in articles:
-            if article['number'] == number and article['sub_number'] == sub_number:
-                already_processed = True
-                break
-                
-        if already_processed:
-            continue
-            
-        if sub_number:
-            full_text = f"第{number}條之{sub_number}"
-        else:
-            full_text = f"第{number}條"
-            
-        articles.append({
-            'full_text': full_text,
-            'number': number,
-            'sub_number': sub_number
-        })
-    
-    # 處理阿拉伯數字條號，如「第1條」
-    arab_single_pattern = r'第(\d+)條(?:之(\d+))?'
-    arab_single_matches = re.finditer(arab_single_pattern, bill_name)
-    
-    for match in arab_single_matches:
-        number = int(match.group(1))
-        sub_number = int(match.group(2)) if match.group(2) else 0
-        
-        # 檢查是否已經處理過
-        already_processed = False
-        for article in articles:
-            if article['number'] == number and article['sub_number'] == sub_number:
-                already_processed = True
-                break
-                
-        if already_processed:
-            continue
-            
-        if sub_number:
-            full_text = f"第{number}條之{sub_number}"
-        else:
-            full_text = f"第{number}條"
-            
-        articles.append({
-            'full_text': full_text,
-            'number': number,
-            'sub_number': sub_number
-        })
-    
-    return articles
+# 條號解析已移至 src.article_parser；streamlit_app_fixed.py 仍由本模組匯入 extract_article_numbers
+from src.article_parser import extract_article_numbers
+from src.name_matcher import extract_names as match_names
 
 def extract_names(names_str: str) -> list:
-    """從字串中提取人名列表
+    """從字串中提取人名列表，原住民委員只保留中文姓名
     
     Args:
         names_str: 包含多個姓名的字串
@@ -209,77 +14,7 @@ def extract_names(names_str: str) -> list:
     Returns:
         list: 人名列表
     """
-    if not names_str:
-        return []
-    
-    # 移除全形空格和換行符號
-    names_str = names_str.replace('　', ' ').replace('\n', ' ')
-    
-    # 移除"本院委員XXX等N人"的部分
-    names_str = re.sub(r'本院委員.+?等\d+人', '', names_str)
-    
-    # 原住民特定委員名稱映射
-    aboriginal_special_cases = {
-        '伍麗華Saidhai Tahovecahe': '伍麗華',
-        '鄭天財Sra Kacaw': '鄭天財',
-        '伍麗華 Saidhai Tahovecahe': '伍麗華',
-        '鄭天財 Sra Kacaw': '鄭天財',
-        '高金素梅Ciwas Ali': '高金素梅',
-        '高金素梅 Ciwas Ali': '高金素梅',
-        '萬美玲Walis Pelin': '萬美玲',
-        '萬美玲 Walis Pelin': '萬美玲'
-    }
-    
-    # 檢查是否有特定原住民委員名稱
-    all_names = []
-    for full_name, short_name in aboriginal_special_cases.items():
-        if full_name in names_str:
-            all_names.append(short_name)
-            names_str = names_str.replace(full_name, '')  # 從原字串中移除已識別的名稱
-    
-    # 匹配原住民名字（中文+英文組合）
-    aboriginal_pattern = r'([\u4e00-\u9fa5]{2,4}\s*[A-Za-z]+\s*[A-Za-z]+(?:\s*[A-Za-z]+)?)'
-    aboriginal_matches = re.finditer(aboriginal_pattern, names_str)
-    
-    for match in aboriginal_matches:
-        aboriginal_name = match.group(0).strip()
-        if aboriginal_name:
-            # 檢查是否需要轉換為短名稱
-            short_name = None
-            for full, short in aboriginal_special_cases.items():
-                if aboriginal_name in full or full in aboriginal_name:
-                    short_name = short
-                    break
-            
-            # 如有短名稱則使用短名稱，否則使用原名
-            name_to_append = short_name if short_name else aboriginal_name
-            
-            # 如果是短名稱，或原名不在特殊映射中，則添加到列表
-            if short_name or aboriginal_name not in aboriginal_special_cases.keys():
-                all_names.append(name_to_append)
-            
-            # 將匹配到的原住民名字從原始字串中移除，避免重複匹配
-            names_str = names_str.replace(aboriginal_name, '')
-    
-    # 然後匹配一般中文名字
-    chinese_pattern = r'([\u4e00-\u9fa5]{2,4})'
-    chinese_matches = re.finditer(chinese_pattern, names_str)
-    
-    for match in chinese_matches:
-        chinese_name = match.group(0).strip()
-        if chinese_name:
-            all_names.append(chinese_name)
-    
-    # 如果沒有找到任何名字，嘗試使用分隔符號分割
-    if not all_names:
-        for sep in ['、', '，', ',', ' ']:
-            if sep in names_str:
-                parts = [part.strip() for part in names_str.split(sep)]
-                all_names.extend([part for part in parts if part and len(part) >= 2])
-                break
-    
-    # 移除重複的名字
-    return list(dict.fromkeys(all_names))
+    return match_names(names_str, keep_romanization=False)
 
 def get_status_group(status: str) -> str:
     """根據審查進度獲取分組名稱
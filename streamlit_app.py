@@ -1,14 +1,14 @@
 import streamlit as st
-import sqlite3
-from src.database import Database
-from src.bill_utils import get_popular_bills_sql, clean_law_name
-import re
+from contextlib import contextmanager
+from src.bill_record import Party, org_party
+from src.db_pool import DatabasePool
+from src.query_builder import BillQuery
+from src.law_names import canonical_law_name
 from collections import defaultdict
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 from st_utils import (
-    extract_article_numbers, 
     get_status_group, 
     get_bill_type, 
     process_members,
@@ -97,338 +97,6 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# 定義函數
-def cn_to_arab(cn_str):
-    """將中文數字轉換為阿拉伯數字
-    
-    Args:
-        cn_str: 中文數字字串
-        
-    Returns:
-        int: 阿拉伯數字
-    """
-    # 中文數字對照表
-    cn_num = {
-        '零': 0, '一': 1, '二': 2, '三': 3, '四': 4, '五': 5,
-        '六': 6, '七': 7, '八': 8, '九': 9, '十': 10,
-        '百': 100, '千': 1000, '萬': 10000,
-        '０': 0, '１': 1, '２': 2, '３': 3, '４': 4, '５': 5,
-        '６': 6, '７': 7, '８': 8, '９': 9
-    }
-    
-    # 如果是純數字，直接返回
-    if cn_str.isdigit():
-        return int(cn_str)
-        
-    # 如果字串中包含非中文數字，返回原始字串
-    for char in cn_str:
-        if char not in cn_num and char not in ['百', '千', '萬', '零']:
-            return cn_str
-            
-    # 處理特殊情況
-    if not cn_str:
-        return 0
-        
-    # 處理一位數
-    if len(cn_str) == 1:
-        return cn_num.get(cn_str, cn_str)
-        
-    # 處理「十」開頭的數字
-    if cn_str.startswith('十'):
-        if len(cn_str) == 1:
-            return 10
-        return 10 + cn_to_arab(cn_str[1:])
-
-    # 處理帶「千」的數字
-    if '千' in cn_str:
-        parts = cn_str.split('千')
-        base = cn_num[parts[0]] * 1000
-        if not parts[1]:
-            return base
-        if parts[1].startswith('零'):
-            # 處理「一千零八」這樣的情況
-            remaining = parts[1][1:]
-            if remaining:
-                return base + cn_to_arab(remaining)
-            return base
-        return base + cn_to_arab(parts[1])
-        
-    # 處理帶「百」的數字
-    if '百' in cn_str:
-        parts = cn_str.split('百')
-        base = cn_num[parts[0]] * 100
-        if not parts[1]:
-            return base
-        if parts[1].startswith('零'):
-            remaining = parts[1][1:]
-            if remaining:
-                return base + cn_to_arab(remaining)
-            return base
-        return base + cn_to_arab(parts[1])
-        
-    # 處理帶「十」的數字
-    if '十' in cn_str:
-        parts = cn_str.split('十')
-        base = cn_num[parts[0]] * 10
-        if not parts[1]:
-            return base
-        return base + cn_num[parts[1]]
-        
-    # 處理其他情況
-    return cn_num.get(cn_str, cn_str)
-
-def advanced_clean_law_name(bill_name: str, proposer_type: str = None) -> str:
-    """更精確地清理法案名稱，考慮提案者類型
-    
-    Args:
-        bill_name: 法案名稱
-        proposer_type: 提案者類型 (government, party_group, legislator)
-        
-    Returns:
-        str: 清理後的法案名稱
-    """
-    # 針對行政院提案的特殊處理
-    if proposer_type == 'government':
-        # 公務人員相關法規
-        if '公務人員保障暨培訓委員會組織法' in bill_name or '公務人員保障訓練委員會組織法' in bill_name:
-            return '公務人員保障暨培訓委員會組織法'
-        elif '公務人員保障法施行細則' in bill_name:
-            return '公務人員保障法施行細則'
-        elif '公務人員考試法' in bill_name:
-            return '公務人員考試法'
-        elif '公務人員任用法' in bill_name:
-            return '公務人員任用法'
-            
-        # 組織改造相關
-        elif '行政院功能業務與組織調整' in bill_name:
-            return '行政院組織改造'
-        elif '考試院組織法' in bill_name or '考試院組織條例' in bill_name:
-            return '考試院組織法'
-        elif '考選部組織法' in bill_name:
-            return '考選部組織法'
-        elif '銓敘部組織法' in bill_name:
-            return '銓敘部組織法'
-        elif '公務人員退休撫卹基金管理委員會組織條例' in bill_name:
-            return '公務人員退休撫卹基金管理委員會組織條例'
-        elif '審計部組織法' in bill_name:
-            return '審計部組織法'
-        elif '監察院組織法' in bill_name:
-            return '監察院組織法'
-        elif '中央選舉委員會組織法' in bill_name:
-            return '中央選舉委員會組織法'
-        elif '國家通訊傳播委員會組織法' in bill_name:
-            return '國家通訊傳播委員會組織法'
-        elif '司法院組織法' in bill_name:
-            return '司法院組織法'
-        elif '組織法' in bill_name:
-            # 擷取 "XXX組織法"
-            org_law_match = re.search(r'「?([^「」]+(?:委員會|部|署|局|處)組織法)', bill_name)
-            if org_law_match:
-                return org_law_match.group(1)
-                
-    # 移除引號
-    bill_name = bill_name.strip('「」')
-    
-    # 特殊處理某些常見法案
-    if '陸海空軍刑法' in bill_name or '軍刑法' in bill_name:
-        return '陸海空軍刑法'
-    if '刑法' in bill_name and '陸海空軍刑法' not in bill_name:
-        return '中華民國刑法'
-    if '民法' in bill_name and '國民法官法' not in bill_name and '入出國及移民法' not in bill_name:
-        return '民法'
-    if '國民法官法' in bill_name:
-        return '國民法官法'
-    if '入出國及移民法' in bill_name:
-        return '入出國及移民法'
-    if '所得稅法' in bill_name:
-        return '所得稅法'
-    if '國土計畫法' in bill_name:
-        return '國土計畫法'
-    if '環境基本法' in bill_name:
-        return '環境基本法'
-    if '公務人員退休資遣撫卹法' in bill_name or '退撫法' in bill_name:
-        return '公務人員退休資遣撫卹法'
-    if '性別平等工作法' in bill_name or '性工法' in bill_name:
-        return '性別平等工作法'
-    if '貨物稅條例' in bill_name:
-        return '貨物稅條例'
-    if '勞動基準法' in bill_name or '勞基法' in bill_name:
-        return '勞動基準法'
-    if '就業服務法' in bill_name or '就服法' in bill_name:
-        return '就業服務法'
-    if '全民健康保險法' in bill_name or '健保法' in bill_name:
-        return '全民健康保險法'
-    if '社會秩序維護法' in bill_name or '社維法' in bill_name:
-        return '社會秩序維護法'
-    if '道路交通管理處罰條例' in bill_name or '道交條例' in bill_name:
-        return '道路交通管理處罰條例'
-    if '消費者保護法' in bill_name or '消保法' in bill_name:
-        return '消費者保護法'
-    if '公司法' in bill_name:
-        return '公司法'
-    
-    # 依序移除後綴
-    suffixes = ['修正條文', '修正草案', '部分條文修正草案', '條文', '草案']
-    for suffix in suffixes:
-        if suffix in bill_name:
-            bill_name = bill_name[:bill_name.index(suffix)].strip()
-            break
-            
-    # 移除條號（如果還有的話）
-    if '第' in bill_name and '條' in bill_name:
-        # 找到最後一個「第」的位置
-        last_index = bill_name.rindex('第')
-        bill_name = bill_name[:last_index].strip()
-        
-    return bill_name.strip()
-
-def extract_names(names_str: str) -> list:
-    """從字串中提取人名列表
-    
-    Args:
-        names_str: 包含多個姓名的字串
-        
-    Returns:
-        list: 人名列表
-    """
-    if not names_str:
-        return []
-    
-    # 移除全形空格和換行符號
-    names_str = names_str.replace('　', ' ').replace('\n', ' ')
-    
-    # 移除"本院委員XXX等N人"的部分
-    names_str = re.sub(r'本院委員.+?等\d+人', '', names_str)
-    
-    # 首先嘗試匹配原住民名字（中文+英文組合）
-    aboriginal_names = []
-    aboriginal_pattern = r'([\u4e00-\u9fa5]{2,4}\s*[A-Za-z]+\s*[A-Za-z]+(?:\s*[A-Za-z]+)?)'
-    aboriginal_matches = re.finditer(aboriginal_pattern, names_str)
-    
-    for match in aboriginal_matches:
-        aboriginal_name = match.group(0).strip()
-        if aboriginal_name:
-            aboriginal_names.append(aboriginal_name)
-            # 將匹配到的原住民名字從原始字串中移除，避免重複匹配
-            names_str = names_str.replace(aboriginal_name, '')
-    
-    # 然後匹配一般中文名字
-    chinese_names = []
-    chinese_pattern = r'([\u4e00-\u9fa5]{2,4})'
-    chinese_matches = re.finditer(chinese_pattern, names_str)
-    
-    for match in chinese_matches:
-        chinese_name = match.group(0).strip()
-        if chinese_name:
-            chinese_names.append(chinese_name)
-    
-    # 合併原住民名字和中文名字
-    all_names = aboriginal_names + chinese_names
-    
-    # 如果沒有找到任何名字，嘗試使用分隔符號分割
-    if not all_names:
-        for sep in ['、', '，', ',', ' ']:
-            if sep in names_str:
-                parts = [part.strip() for part in names_str.split(sep)]
-                all_names.extend([part for part in parts if part and len(part) >= 2])
-                break
-    
-    # 移除重複的名字
-    return list(dict.fromkeys(all_names))
-
-# 自訂SQL查詢取得熱門法案（含會期篩選）
-def get_popular_bills_sql_with_session(session_period=None):
-    base_sql = """
-    WITH RawBillNames AS (
-        SELECT 
-            CASE 
-                WHEN billName LIKE '%刑法%' AND billName NOT LIKE '%陸海空軍刑法%' THEN '中華民國刑法'
-                WHEN billName LIKE '%所得稅法%' THEN '所得稅法'
-                WHEN billName LIKE '%國土計畫法%' THEN '國土計畫法'
-                WHEN billName LIKE '%環境基本法%' THEN '環境基本法'
-                WHEN billName LIKE '%公務人員退休資遣撫卹法%' THEN '公務人員退休資遣撫卹法'
-                WHEN billName LIKE '%性別平等工作法%' THEN '性別平等工作法'
-                WHEN billName LIKE '%貨物稅條例%' THEN '貨物稅條例'
-                WHEN billName LIKE '「%」%' THEN
-                    CASE
-                        WHEN SUBSTR(
-                            SUBSTR(billName, INSTR(billName, '「') + 1),
-                            1,
-                            INSTR(SUBSTR(billName, INSTR(billName, '「') + 1), '」') - 1
-                        ) LIKE '%部分條文%' THEN
-                            REPLACE(
-                                SUBSTR(
-                                    SUBSTR(billName, INSTR(billName, '「') + 1),
-                                    1,
-                                    INSTR(SUBSTR(billName, INSTR(billName, '「') + 1), '部分條文') - 1
-                                ),
-                                '修正草案',
-                                ''
-                            )
-                        ELSE
-                            SUBSTR(
-                                SUBSTR(billName, INSTR(billName, '「') + 1),
-                                1,
-                                INSTR(SUBSTR(billName, INSTR(billName, '「') + 1), '」') - 1
-                            )
-                    END
-                ELSE billName
-            END as raw_name,
-            term,
-            sessionPeriod
-        FROM bills
-        WHERE term = '11'
-    """
-    
-    # 添加會期過濾條件
-    if session_period and session_period != "全部":
-        base_sql += f" AND sessionPeriod = '{session_period}'"
-    
-    base_sql += """
-    ),
-    CleanBillNames AS (
-        SELECT 
-            CASE
-                WHEN raw_name = '中華民國刑法' THEN '中華民國刑法'
-                WHEN raw_name = '所得稅法' THEN '所得稅法'
-                WHEN raw_name = '國土計畫法' THEN '國土計畫法'
-                WHEN raw_name = '環境基本法' THEN '環境基本法'
-                WHEN raw_name = '公務人員退休資遣撫卹法' THEN '公務人員退休資遣撫卹法'
-                WHEN raw_name = '性別平等工作法' THEN '性別平等工作法'
-                WHEN raw_name = '貨物稅條例' THEN '貨物稅條例'
-                WHEN raw_name LIKE '%部分條文%' THEN
-                    REPLACE(
-                        SUBSTR(raw_name, 1, INSTR(raw_name, '部分條文') - 1),
-                        '修正草案',
-                        ''
-                    )
-                WHEN raw_name LIKE '%第%條%' THEN
-                    SUBSTR(raw_name, 1, INSTR(raw_name, '第') - 1)
-                WHEN raw_name LIKE '%修正條文%' THEN
-                    SUBSTR(raw_name, 1, INSTR(raw_name, '修正條文') - 1)
-                WHEN raw_name LIKE '%修正草案%' THEN
-                    SUBSTR(raw_name, 1, INSTR(raw_name, '修正草案') - 1)
-                WHEN raw_name LIKE '%條文%' THEN
-                    SUBSTR(raw_name, 1, INSTR(raw_name, '條文') - 1)
-                WHEN raw_name LIKE '%草案%' THEN
-                    SUBSTR(raw_name, 1, INSTR(raw_name, '草案') - 1)
-                ELSE raw_name
-            END as clean_name,
-            term,
-            sessionPeriod
-        FROM RawBillNames
-    )
-    SELECT 
-        TRIM(clean_name) as law_name,
-        COUNT(*) as total_count
-    FROM CleanBillNames
-    WHERE TRIM(clean_name) != ''
-    GROUP BY TRIM(clean_name)
-    ORDER BY total_count DESC, law_name
-    LIMIT 30
-    """
-    return base_sql
-
 # 自定義函數用於顯示法案狀態標籤
 def display_status_badge(status):
     if not status:
@@ -476,18 +144,8 @@ def process_all_members(bill):
     if bill['billOrg'] and '本院委員' not in bill['billOrg']:
         if '行政院' in bill['billOrg']:
             return {'行政院': 1}
-        elif '民主進步黨' in bill['billOrg'] or '民進黨' in bill['billOrg']:
-            return {'民進黨': 1}
-        elif '中國國民黨' in bill['billOrg'] or '國民黨' in bill['billOrg']:
-            return {'國民黨': 1}
-        elif '台灣民眾黨' in bill['billOrg'] or '民眾黨' in bill['billOrg']:
-            return {'民眾黨': 1}
-        elif '時代力量' in bill['billOrg']:
-            return {'時代力量': 1}
-        elif '台灣基進' in bill['billOrg']:
-            return {'其他': 1}
-        else:
-            return {'其他': 1}
+        # 黨團依政黨計算，其他機關歸為「其他」
+        return {(org_party(bill['billOrg']) or Party.OTHER).label: 1}
     
     # 初始化政黨統計
     party_stats = {'民進黨': 0, '國民黨': 0, '民眾黨': 0, '時代力量': 0, '無黨籍': 0, '其他': 0}
@@ -605,20 +263,197 @@ def display_party_ratio(parties, container=None):
         display.progress(pct, f"{party}: {count} ({pct*100:.1f}%)")
 
 # 主頁面
+# ===== 資料快取 =====
+# Streamlit 每次操作元件都會從頭重新執行整個腳本。連線池以 st.cache_resource 在
+# 所有使用者之間共用；查詢結果以 st.cache_data 快取，參數中包含資料版本號，
+# 排程更新寫入資料後版本號改變，舊的快取結果不再被使用。
+
+# 快取結果的存活秒數與數量上限（版本號已處理資料更新，這裡只用來限制記憶體）
+CACHE_TTL = 3600
+CACHE_MAX_ENTRIES = 256
+SEARCH_CACHE_MAX_ENTRIES = 64
+
+# 提案人或連署人法案列表的欄位
+MEMBER_BILL_COLUMNS = ['billNo', 'billName', 'billOrg', 'billProposer', 'billCosignatory',
+                       'term', 'sessionPeriod', 'billStatus', 'pdfUrl', 'docUrl', 'law_name']
+
+# 按政黨分析所需的欄位
+PARTY_ANALYSIS_COLUMNS = ['billNo', 'billName', 'billOrg', 'billProposer', 'billCosignatory',
+                          'term', 'sessionPeriod', 'billStatus', 'law_name']
+
+@st.cache_resource
+def get_db_pool():
+    """所有使用者共用的唯讀資料庫連線池"""
+    return DatabasePool()
+
+@contextmanager
+def borrow_db():
+    """從連線池借用資料庫連線，結束時歸還"""
+    pool = get_db_pool()
+    db = pool.acquire()
+    try:
+        yield db
+    finally:
+        pool.release(db)
+
+def get_data_version():
+    """目前的資料版本號，作為快取函數的參數"""
+    with borrow_db() as db:
+        return db.get_data_version()
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def load_terms(data_version):
+    """所有屆別，由新到舊"""
+    query = BillQuery(['term'], distinct=True).order_by("CAST(term AS INTEGER) DESC")
+    with borrow_db() as db:
+        return query.fetch_column(db.conn)
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def load_session_periods(term, data_version):
+    """指定屆別的所有會期"""
+    query = (BillQuery(['sessionPeriod'], distinct=True)
+             .where("term = ?", term)
+             .order_by("CAST(sessionPeriod AS INTEGER)"))
+    with borrow_db() as db:
+        return query.fetch_column(db.conn)
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def load_popular_laws(term, session_period, data_version):
+    """熱門法案（由 law_counts 統計表查詢）"""
+    with borrow_db() as db:
+        return db.get_popular_laws(term, session_period)
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=SEARCH_CACHE_MAX_ENTRIES, show_spinner=False)
+def load_search_results(law_name, term, session_period, data_version):
+    """搜尋法律的所有法案，並計算每個法案的政黨統計"""
+    with borrow_db() as db:
+        bills = db.search_bills(law_name, term=term, session_period=session_period)
+    for bill in bills:
+        bill['party_stats'] = process_all_members(bill)
+    return bills
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=SEARCH_CACHE_MAX_ENTRIES, show_spinner=False)
+def load_article_groups(law_name, term, session_period, data_version):
+    """搜尋法律的法案並依條號分組（條號已於儲存法案時寫入 bill_articles）"""
+    with borrow_db() as db:
+        article_groups = db.search_bills_by_article(law_name, term=term, session_period=session_period)
+    # 同一法案可能出現在多個條號分組，只處理一次
+    for group in article_groups:
+        for bill in group['bills']:
+            if 'party_stats' not in bill:
+                bill['party_stats'] = process_all_members(bill)
+    return article_groups
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def load_term_members(term, session_period, data_version):
+    """指定屆期的提案立委與黨籍（由 bill_members 取得）"""
+    with borrow_db() as db:
+        return db.get_term_members(term, session_period=session_period)
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def load_bill_orgs(term, session_period, data_version):
+    """指定屆期有提案的機關與黨團"""
+    query = BillQuery(['billOrg'], distinct=True).term(term).session_period(session_period).not_empty('billOrg')
+    with borrow_db() as db:
+        return query.fetch_column(db.conn)
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def load_entity_bills(name, entity_type, role, term, session_period, data_version):
+    """立委、政府機關或黨團在指定屆期提案或連署的法案
+
+    Args:
+        name: 立委姓名、機關名稱或黨團名稱
+        entity_type: legislator、government 或 party_group
+        role: proposer 或 cosignatory
+        term: 屆別
+        session_period: 會期，None 表示全部會期
+        data_version: 資料版本號
+
+    Returns:
+        list: 法案列表，提案法案另含 party_stats
+    """
+    if entity_type in ('government', 'party_group') and role != 'proposer':
+        return []  # 政府機關與黨團不連署
+
+    if entity_type in ('government', 'party_group'):
+        keyword = name.replace('黨團', '') if entity_type == 'party_group' else name
+        query = BillQuery(MEMBER_BILL_COLUMNS).term(term).session_period(session_period).org_like(keyword)
+        with borrow_db() as db:
+            bills = query.fetch_bills(db.conn)
+    else:
+        bills = load_member_bills(name, term, session_period, data_version)[role]
+
+    if role == 'proposer':
+        for bill in bills:
+            bill['party_stats'] = process_all_members(bill)
+    return bills
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def load_member_bills(name, term, session_period, data_version):
+    """立委在指定屆期提案與連署的法案，兩種角色以一次查詢取得
+
+    Returns:
+        dict: {'proposer': 提案法案列表, 'cosignatory': 連署法案列表}
+    """
+    with borrow_db() as db:
+        bills = db.get_member_bills(name, term, role=None, session_period=session_period)
+    by_role = {'proposer': [], 'cosignatory': []}
+    for bill in bills:
+        by_role.setdefault(bill['role'], []).append(bill)
+    return by_role
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def load_legislator_stats(term, session_period, limit, top_laws, data_version):
+    """按立委分析：提案數前幾名立委的法律與審查狀態分布（一次查詢）"""
+    with borrow_db() as db:
+        return db.get_legislator_law_stats(term, session_period=session_period,
+                                           limit=limit, top_laws=top_laws)
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def load_term_bills(term, session_period, data_version):
+    """按政黨分析：指定屆期的所有法案與政黨統計"""
+    query = BillQuery(PARTY_ANALYSIS_COLUMNS).term(term).session_period(session_period)
+    with borrow_db() as db:
+        bills = query.fetch_bills(db.conn)
+    for bill in bills:
+        bill['party_stats'] = process_all_members(bill)
+    return bills
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def load_org_counts(term, session_period, data_version):
+    """按政府機關分析：各提案機關的提案數"""
+    query = (BillQuery(['billOrg', 'billName', 'billStatus', 'COUNT(*) as count'])
+             .term(term).session_period(session_period)
+             .not_empty('billOrg')
+             .group_by('billOrg')
+             .order_by('count DESC'))
+    with borrow_db() as db:
+        return query.fetch_all(db.conn)
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def load_org_laws(term, session_period, data_version):
+    """按政府機關分析：各提案機關的法律名稱與提案數"""
+    query = (BillQuery(['billOrg', 'law_name', 'COUNT(*) as count'])
+             .term(term).session_period(session_period)
+             .not_empty('billOrg')
+             .group_by('billOrg', 'law_name'))
+    with borrow_db() as db:
+        return query.fetch_all(db.conn)
+
 def home():
     st.title("立法院法案分析")
     st.subheader("搜尋與查詢立法委員提案")
     
-    db = Database()
     try:
+        # 查詢結果依資料版本號快取，切換排序或會期時不必重新查詢
+        data_version = get_data_version()
+        
         # 獲取所有屆別
-        cursor = db.conn.cursor()
-        cursor.execute("SELECT DISTINCT term FROM bills ORDER BY CAST(term AS INTEGER) DESC")
-        terms = [row['term'] for row in cursor.fetchall()]
+        terms = load_terms(data_version)
         
-        # 獲取第11屆的所有會期
-        cursor.execute("SELECT DISTINCT sessionPeriod FROM bills WHERE term = '11' ORDER BY CAST(sessionPeriod AS INTEGER)")
-        session_periods = [row['sessionPeriod'] for row in cursor.fetchall()]
+        # 熱門法案顯示最新一屆，獲取該屆的所有會期
+        popular_term = terms[0] if terms else None
+        session_periods = load_session_periods(popular_term, data_version)
         
         # 創建搜尋表單
         col1, col2 = st.columns([3, 1])
@@ -638,9 +473,10 @@ def home():
         # 會期過濾功能
         selected_session = st.selectbox("選擇會期", ["全部"] + session_periods, key="session_filter")
         
-        # 獲取過濾後的熱門法案
-        cursor.execute(get_popular_bills_sql_with_session(selected_session if selected_session != "全部" else None))
-        popular_bills = [dict(row) for row in cursor.fetchall()]
+        # 獲取過濾後的熱門法案（由 law_counts 統計表查詢）
+        popular_bills = load_popular_laws(
+            popular_term, selected_session if selected_session != "全部" else None, data_version
+        ) if popular_term else []
         
         # 使用Grid佈局顯示熱門法案
         hot_cols = 3
@@ -659,7 +495,7 @@ def home():
                                     key=f"popular_{i}", 
                                     use_container_width=True):
                             st.session_state['law_name'] = bill['law_name']
-                            st.session_state['term'] = "11"  # 熱門法案只顯示第11屆
+                            st.session_state['term'] = popular_term  # 熱門法案只顯示最新一屆
                             st.session_state['session_period'] = selected_session
                             st.session_state['search'] = True
                             st.rerun()
@@ -678,52 +514,11 @@ def home():
             
             # 搜尋法案
             if search_law_name:
-                # 構建搜尋條件
-                base_name = search_law_name.strip('「」')  # 移除可能的引號
-                
-                # 特殊處理某些法案
-                if '刑法' in base_name and '陸海空軍刑法' not in base_name:
-                    search_condition = "billName LIKE '%中華民國刑法%' AND billName NOT LIKE '%施行法%' AND billName NOT LIKE '%陸海空軍刑法%'"
-                    params = tuple()
-                elif base_name == '民法':
-                    search_condition = "billName LIKE '%民法%' AND billName NOT LIKE '%施行法%' AND billName NOT LIKE '%入出國及移民法%'"
-                    params = tuple()
-                elif base_name == '入出國及移民法':
-                    search_condition = "billName LIKE '%入出國及移民法%' AND billName NOT LIKE '%施行法%'"
-                    params = tuple()
-                else:
-                    # 一般法律搜尋
-                    search_condition = "billName LIKE ? AND billName NOT LIKE '%施行法%'"
-                    params = (f"%{base_name}%",)
-                
-                # 添加屆別條件
-                if search_term:
-                    search_condition += " AND term = ?"
-                    params = params + (search_term,)
-                
-                # 添加會期條件
-                if search_session:
-                    search_condition += " AND sessionPeriod = ?"
-                    params = params + (search_session,)
-                
-                # 執行查詢
-                query = f"""
-                SELECT billNo, billName, billOrg, billProposer, billCosignatory, 
-                       term, sessionPeriod, sessionTimes, billStatus, pdfUrl, docUrl
-                FROM bills 
-                WHERE {search_condition}
-                ORDER BY 
-                    CAST(term AS INTEGER) DESC,
-                    CAST(sessionPeriod AS INTEGER) DESC,
-                    COALESCE(CAST(sessionTimes AS INTEGER), 0) DESC,
-                    billNo DESC
-                """
-                
-                cursor.execute(query, params)
-                bills = [dict(row) for row in cursor.fetchall()]
+                # 搜尋相關法案（已計算政黨統計）
+                bills = load_search_results(search_law_name, search_term, search_session, data_version)
                 
                 # 顯示搜尋結果
-                st.header(f"搜尋結果：{clean_law_name(search_law_name)}")
+                st.header(f"搜尋結果：{canonical_law_name(search_law_name)}")
                 
                 # 顯示過濾條件
                 filter_info = f"第{search_term}屆" if search_term else "全部屆別"
@@ -736,42 +531,11 @@ def home():
                     sort_by = st.radio("排序方式", ["按條號排序", "按審查進度排序"], horizontal=True, key="sort_option")
                     
                     if sort_by == "按條號排序":
-                        # 按條號分組
-                        articles_dict = defaultdict(lambda: {'bills': [], 'bills_count': 0})
-                        
-                        for bill in bills:
-                            # 提取條號
-                            articles = extract_article_numbers(bill['billName'])
-                            
-                            # 處理提案人和連署人資訊（改為處理所有委員）
-                            bill['party_stats'] = process_all_members(bill)
-                            
-                            # 如果沒有找到條號，使用預設值
-                            if not articles:
-                                key = '其他修正'
-                                articles_dict[key]['bills'].append(bill)
-                                articles_dict[key]['bills_count'] += 1
-                                continue
-                            
-                            # 將法案加入對應的條號
-                            for article in articles:
-                                key = article['full_text']
-                                articles_dict[key]['bills'].append(bill)
-                                articles_dict[key]['bills_count'] += 1
-                        
-                        # 排序條號
-                        def get_sort_key(article_text):
-                            if article_text == '其他修正':
-                                return (float('inf'), 0)
-                            match = re.search(r'第(\d+)條(?:之(\d+))?', article_text)
-                            if match:
-                                number = int(match.group(1))
-                                sub_number = int(match.group(2)) if match.group(2) else 0
-                                return (number, sub_number)
-                            return (float('inf'), 0)
+                        # 按條號分組，已處理提案人和連署人資訊
+                        article_groups = load_article_groups(search_law_name, search_term, search_session, data_version)
                         
                         # 顯示條號分組結果
-                        sorted_articles = sorted(articles_dict.items(), key=lambda x: get_sort_key(x[0]))
+                        sorted_articles = [(group['article'], group) for group in article_groups]
                         
                         for article_text, data in sorted_articles:
                             # 使用更明顯的樣式來顯示摺疊區塊
@@ -815,9 +579,6 @@ def home():
                         status_groups = defaultdict(lambda: {'bills': [], 'bills_count': 0})
                         
                         for bill in bills:
-                            # 處理提案人和連署人資訊（改為處理所有委員）
-                            bill['party_stats'] = process_all_members(bill)
-                            
                             # 獲取審查進度分組
                             status_group = get_status_group(bill.get('billStatus', ''))
                             status_groups[status_group]['bills'].append(bill)
@@ -884,42 +645,19 @@ def home():
             
             if analysis_button:
                 # 根據不同類型分析
+                analysis_session_period = None if analysis_session == "全部" else analysis_session
+                
                 if analysis_type == "按立委分析":
-                    # 查詢立委提案數
-                    session_filter = f"AND sessionPeriod = '{analysis_session}'" if analysis_session != "全部" else ""
-                    
-                    query = f"""
-                    SELECT billProposer, billName, billStatus, COUNT(*) as count
-                    FROM bills
-                    WHERE term = '{analysis_term}' 
-                    {session_filter}
-                    AND billProposer IS NOT NULL 
-                    AND billProposer != ''
-                    GROUP BY billProposer
-                    ORDER BY count DESC
-                    LIMIT 20
-                    """
-                    
-                    cursor.execute(query)
-                    results = [dict(row) for row in cursor.fetchall()]
+                    # 以一次查詢取得前10名立委的提案數、前5項法律與審查狀態分布
+                    results = load_legislator_stats(analysis_term, analysis_session_period, 10, 5, data_version)
                     
                     if results:
-                        st.subheader(f"第{analysis_term}屆{'' if analysis_session == '全部' else f'第{analysis_session}會期'}立委提案數量前20名")
-                        
-                        # 顯示立委提案統計
-                        legislator_data = defaultdict(int)
-                        for row in results:
-                            proposers = extract_names(row['billProposer'])
-                            for proposer in proposers:
-                                legislator_data[proposer] += 1
-                        
-                        # 篩選前10名
-                        sorted_legislators = sorted(legislator_data.items(), key=lambda x: x[1], reverse=True)[:10]
+                        st.subheader(f"第{analysis_term}屆{'' if analysis_session == '全部' else f'第{analysis_session}會期'}立委提案數量前10名")
                         
                         # 使用Matplotlib生成圓餅圖
                         plt.figure(figsize=(10, 6))
-                        labels = [name for name, _ in sorted_legislators]
-                        sizes = [count for _, count in sorted_legislators]
+                        labels = [legislator['name'] for legislator in results]
+                        sizes = [legislator['bills_count'] for legislator in results]
                         colors = plt.cm.tab20(np.linspace(0, 1, len(labels)))
                         
                         plt.pie(sizes, labels=labels, autopct='%1.1f%%', startangle=90, colors=colors)
@@ -931,73 +669,53 @@ def home():
                         
                         # 顯示詳細資料
                         st.subheader("立委提案詳細統計")
-                        for legislator, count in sorted_legislators:
-                            st.write(f"**{legislator}**: {count}件")
+                        for legislator_stats in results:
+                            legislator = legislator_stats['name']
+                            st.write(f"**{legislator}**: {legislator_stats['bills_count']}件")
                             
-                            # 查詢此立委提案的法案類型分布
-                            law_query = f"""
-                            SELECT billName, billStatus
-                            FROM bills
-                            WHERE term = '{analysis_term}'
-                            {session_filter}
-                            AND billProposer LIKE '%{legislator}%'
-                            """
+                            # 此立委的法案類型分布（寫入法案時已計算正式法律名稱）
+                            top_laws = [(law['law_name'] or '其他', law['count']) for law in legislator_stats['laws']]
                             
-                            cursor.execute(law_query)
-                            law_results = [dict(row) for row in cursor.fetchall()]
+                            # 使用Matplotlib生成柱狀圖
+                            plt.figure(figsize=(10, 4))
+                            plt.bar(
+                                [name[:8] + '...' if len(name) > 8 else name for name, _ in top_laws], 
+                                [count for _, count in top_laws],
+                                color='skyblue'
+                            )
+                            plt.title(f"{legislator}的前5項法案提案")
+                            plt.xticks(rotation=45, ha='right')
+                            plt.tight_layout()
                             
-                            if law_results:
-                                # 分析法案類型
-                                law_types = defaultdict(int)
-                                for law in law_results:
-                                    # 清理法案名稱，獲取基本法律名稱
-                                    clean_name = clean_law_name(law['billName'])
-                                    law_types[clean_name] += 1
-                                
-                                # 顯示此立委的法案類型分布
-                                top_laws = sorted(law_types.items(), key=lambda x: x[1], reverse=True)[:5]
-                                
-                                # 使用Matplotlib生成柱狀圖
-                                plt.figure(figsize=(10, 4))
-                                plt.bar(
-                                    [name[:8] + '...' if len(name) > 8 else name for name, _ in top_laws], 
-                                    [count for _, count in top_laws],
-                                    color='skyblue'
-                                )
-                                plt.title(f"{legislator}的前5項法案提案")
-                                plt.xticks(rotation=45, ha='right')
-                                plt.tight_layout()
-                                
-                                # 顯示在Streamlit中
-                                st.pyplot(plt)
-                                
-                                # 顯示審查狀態分佈
-                                status_stats = defaultdict(int)
-                                for law in law_results:
-                                    status = get_status_group(law.get('billStatus', ''))
-                                    status_stats[status] += 1
-                                
-                                # 使用Matplotlib生成圓餅圖
-                                plt.figure(figsize=(8, 6))
-                                status_labels = list(status_stats.keys())
-                                status_sizes = list(status_stats.values())
-                                status_colors = {
-                                    '三讀': "#28a745",  # 綠色
-                                    '二讀': "#17a2b8",  # 青色
-                                    '一讀': "#007bff",  # 藍色
-                                    '審查完畢': "#6f42c1",  # 紫色
-                                    '委員會審查': "#fd7e14",  # 橙色
-                                    '待審查': "#6c757d",  # 灰色
-                                    '退回/撤回': "#dc3545"   # 紅色
-                                }
-                                colors = [status_colors.get(status, "#6c757d") for status in status_labels]
-                                
-                                plt.pie(status_sizes, labels=status_labels, autopct='%1.1f%%', startangle=90, colors=colors)
-                                plt.axis('equal')
-                                plt.title(f"{legislator}的法案審查狀態分佈", fontsize=16, pad=20)
-                                
-                                # 顯示在Streamlit中
-                                st.pyplot(plt)
+                            # 顯示在Streamlit中
+                            st.pyplot(plt)
+                            
+                            # 顯示審查狀態分佈
+                            status_stats = defaultdict(int)
+                            for status, count in legislator_stats['statuses'].items():
+                                status_stats[get_status_group(status)] += count
+                            
+                            # 使用Matplotlib生成圓餅圖
+                            plt.figure(figsize=(8, 6))
+                            status_labels = list(status_stats.keys())
+                            status_sizes = list(status_stats.values())
+                            status_colors = {
+                                '三讀': "#28a745",  # 綠色
+                                '二讀': "#17a2b8",  # 青色
+                                '一讀': "#007bff",  # 藍色
+                                '審查完畢': "#6f42c1",  # 紫色
+                                '委員會審查': "#fd7e14",  # 橙色
+                                '待審查': "#6c757d",  # 灰色
+                                '退回/撤回': "#dc3545"   # 紅色
+                            }
+                            colors = [status_colors.get(status, "#6c757d") for status in status_labels]
+                            
+                            plt.pie(status_sizes, labels=status_labels, autopct='%1.1f%%', startangle=90, colors=colors)
+                            plt.axis('equal')
+                            plt.title(f"{legislator}的法案審查狀態分佈", fontsize=16, pad=20)
+                            
+                            # 顯示在Streamlit中
+                            st.pyplot(plt)
                             
                             st.divider()
                             
@@ -1005,22 +723,10 @@ def home():
                         st.warning("沒有找到相關立委提案資料")
                     
                 elif analysis_type == "按政黨分析":
-                    # 查詢政黨提案數
-                    session_filter = f"AND sessionPeriod = '{analysis_session}'" if analysis_session != "全部" else ""
-                    
                     st.subheader(f"第{analysis_term}屆{'' if analysis_session == '全部' else f'第{analysis_session}會期'}政黨提案分析")
                     
-                    # 取得所有法案，然後分析政黨分布
-                    query = f"""
-                    SELECT billNo, billName, billOrg, billProposer, billCosignatory, 
-                           term, sessionPeriod, billStatus
-                    FROM bills 
-                    WHERE term = '{analysis_term}'
-                    {session_filter}
-                    """
-                    
-                    cursor.execute(query)
-                    bills = [dict(row) for row in cursor.fetchall()]
+                    # 取得所有法案（已計算政黨統計），然後分析政黨分布
+                    bills = load_term_bills(analysis_term, analysis_session_period, data_version)
                     
                     if bills:
                         # 初始化政黨統計
@@ -1051,7 +757,7 @@ def home():
                         # 分析每個法案
                         for bill in bills:
                             # 取得主要提案政黨
-                            bill_parties = process_all_members(bill)
+                            bill_parties = bill['party_stats']
                             
                             # 跳過沒有提案人/機關的情況
                             if not bill_parties:
@@ -1064,8 +770,7 @@ def home():
                             party_stats[main_party] = party_stats.get(main_party, 0) + 1
                             
                             # 分析法案類型
-                            clean_name = clean_law_name(bill['billName'])
-                            party_law_stats[main_party][clean_name] += 1
+                            party_law_stats[main_party][bill['law_name']] += 1
                             
                             # 分析審查狀態
                             status = get_status_group(bill.get('billStatus', ''))
@@ -1151,24 +856,10 @@ def home():
                 
                 elif analysis_type == "按政府機關分析":
                     # 政府機關提案分析
-                    session_filter = f"AND sessionPeriod = '{analysis_session}'" if analysis_session != "全部" else ""
-                    
                     st.subheader(f"第{analysis_term}屆{'' if analysis_session == '全部' else f'第{analysis_session}會期'}政府機關提案分析")
                     
                     # 查詢政府機關提案
-                    query = f"""
-                    SELECT billOrg, billName, billStatus, COUNT(*) as count
-                    FROM bills
-                    WHERE term = '{analysis_term}' 
-                    {session_filter}
-                    AND billOrg IS NOT NULL 
-                    AND billOrg != ''
-                    GROUP BY billOrg
-                    ORDER BY count DESC
-                    """
-                    
-                    cursor.execute(query)
-                    results = [dict(row) for row in cursor.fetchall()]
+                    results = load_org_counts(analysis_term, analysis_session_period, data_version)
                     
                     if results:
                         # 初始化機關分類
@@ -1243,8 +934,8 @@ def home():
                         # 顯示在Streamlit中
                         st.pyplot(plt)
                         
-                        # 分析五院提案的法案類型
-                        for org in results:
+                        # 分析五院提案的法案類型（各機關的法律名稱與提案數以一次查詢取得）
+                        for org in load_org_laws(analysis_term, analysis_session_period, data_version):
                             org_name = org['billOrg']
                             
                             # 歸類到哪個院
@@ -1265,22 +956,8 @@ def home():
                                 else:
                                     main_org = '其他'
                             
-                            # 查詢此機關提案的法案
-                            law_query = f"""
-                            SELECT billName, billStatus
-                            FROM bills
-                            WHERE term = '{analysis_term}'
-                            {session_filter}
-                            AND billOrg = '{org_name}'
-                            """
-                            
-                            cursor.execute(law_query)
-                            law_results = [dict(row) for row in cursor.fetchall()]
-                            
-                            for law in law_results:
-                                # 清理法案名稱，獲取基本法律名稱
-                                clean_name = advanced_clean_law_name(law['billName'], 'government')
-                                gov_law_stats[main_org][clean_name] += 1
+                            # 寫入法案時已計算正式法律名稱
+                            gov_law_stats[main_org][org['law_name']] += org['count']
                         
                         # 顯示每個院的法案統計
                         for org, laws in gov_law_stats.items():
@@ -1347,19 +1024,17 @@ def home():
     
     except Exception as e:
         st.error(f"發生錯誤: {str(e)}")
-    finally:
-        db.close()
 
 # 新增立委提案檢視頁面
 def legislator_page():
     st.title("立委提案與連署檢視")
     
-    db = Database()
     try:
+        # 查詢結果依資料版本號快取
+        data_version = get_data_version()
+        
         # 獲取所有屆別
-        cursor = db.conn.cursor()
-        cursor.execute("SELECT DISTINCT term FROM bills ORDER BY CAST(term AS INTEGER) DESC")
-        terms = [row['term'] for row in cursor.fetchall()]
+        terms = load_terms(data_version)
         
         # 選擇屆別和會期
         col1, col2 = st.columns(2)
@@ -1367,33 +1042,15 @@ def legislator_page():
             selected_term = st.selectbox("選擇屆別", ["11"] + [t for t in terms if t != "11"], key="leg_term_select")
         
         with col2:
-            cursor.execute(f"SELECT DISTINCT sessionPeriod FROM bills WHERE term = '{selected_term}' ORDER BY CAST(sessionPeriod AS INTEGER)")
-            session_periods = [row['sessionPeriod'] for row in cursor.fetchall()]
+            session_periods = load_session_periods(selected_term, data_version)
             selected_session = st.selectbox("選擇會期", ["全部"] + session_periods, key="leg_session_select")
         
-        # 獲取此屆期的立委名單
-        session_filter = f"AND sessionPeriod = '{selected_session}'" if selected_session != "全部" else ""
-        query = f"""
-        SELECT DISTINCT billProposer FROM bills 
-        WHERE term = '{selected_term}' 
-        {session_filter}
-        AND billProposer IS NOT NULL 
-        AND billProposer != ''
-        """
-        
-        cursor.execute(query)
-        proposers_data = [row['billProposer'] for row in cursor.fetchall()]
+        # 獲取此屆期的立委名單（由 bill_members 取得，黨籍已於匯入時判定）
+        selected_session_period = None if selected_session == "全部" else selected_session
+        term_members = load_term_members(selected_term, selected_session_period, data_version)
         
         # 另外獲取法案提案機關
-        org_query = f"""
-        SELECT DISTINCT billOrg FROM bills 
-        WHERE term = '{selected_term}' 
-        {session_filter}
-        AND billOrg IS NOT NULL 
-        AND billOrg != ''
-        """
-        cursor.execute(org_query)
-        org_data = [row['billOrg'] for row in cursor.fetchall()]
+        org_data = load_bill_orgs(selected_term, selected_session_period, data_version)
         
         # 提取所有立委姓名並按政黨分類
         legislators_by_party = {
@@ -1445,26 +1102,11 @@ def legislator_page():
                     government_orgs.append(org)
         
         # 處理立委提案
-        for proposer in proposers_data:
-            legislators = extract_names(proposer)
-            for legislator in legislators:
-                # 使用st_utils中的函數判斷立委所屬政黨
-                parties = count_party_members(legislator)
-                if parties:
-                    # 按政黨數量排序，取數量最多的政黨
-                    sorted_parties = sorted(parties.items(), key=lambda x: x[1], reverse=True)
-                    main_party = sorted_parties[0][0]
-                    
-                    # 將立委添加到對應政黨列表中
-                    if main_party in legislators_by_party:
-                        if legislator not in legislators_by_party[main_party]:
-                            legislators_by_party[main_party].append(legislator)
-                    else:
-                        if legislator not in legislators_by_party['其他']:
-                            legislators_by_party['其他'].append(legislator)
-                else:
-                    if legislator not in legislators_by_party['其他']:
-                        legislators_by_party['其他'].append(legislator)
+        for member in term_members:
+            legislator = member['name']
+            main_party = member['party'] if member['party'] in legislators_by_party else '其他'
+            if legislator not in legislators_by_party[main_party]:
+                legislators_by_party[main_party].append(legislator)
         
         # 處理完所有立委後，添加調試資訊
         # 計算每個政黨的立委數量
@@ -1645,39 +1287,15 @@ def legislator_page():
             # 設置標籤頁
             tab1, tab2, tab3, tab4 = st.tabs(["提案法案統計", "連署法案統計", "提案法案列表", "連署法案列表"])
             
-            session_filter = f"AND sessionPeriod = '{session}'" if session != "全部" else ""
-            
-            # 根據不同類型構建不同的查詢條件
-            if entity_type == 'legislator':
-                proposer_condition = f"AND billProposer LIKE '%{legislator}%'"
-                cosign_condition = f"AND billCosignatory LIKE '%{legislator}%'"
-            elif entity_type == 'government':
-                proposer_condition = f"AND billOrg LIKE '%{legislator}%'"
-                cosign_condition = "AND 1=0"  # 政府機關不連署
-            elif entity_type == 'party_group':
-                party_name = legislator.replace('黨團', '')
-                proposer_condition = f"AND billOrg LIKE '%{party_name}%'"
-                cosign_condition = "AND 1=0"  # 黨團不連署
-            else:
-                proposer_condition = f"AND billProposer LIKE '%{legislator}%'"
-                cosign_condition = f"AND billCosignatory LIKE '%{legislator}%'"
+            # 提案與連署法案各查詢一次，四個標籤頁共用
+            session_period = None if session == "全部" else session
+            proposer_results = load_entity_bills(legislator, entity_type, 'proposer', term, session_period, data_version)
+            cosign_results = load_entity_bills(legislator, entity_type, 'cosignatory', term, session_period, data_version)
             
             with tab1:
                 # 1. 提案：長條圖顯示前十名法案
                 st.subheader("提案法案分析")
                 
-                # 查詢立委提案的法案
-                proposer_query = f"""
-                SELECT billName, billStatus
-                FROM bills
-                WHERE term = '{term}'
-                {session_filter}
-                {proposer_condition}
-                """
-                
-                cursor.execute(proposer_query)
-                proposer_results = [dict(row) for row in cursor.fetchall()]
-                
                 if proposer_results:
                     st.write(f"共提案 {len(proposer_results)} 件法案")
                     
@@ -1690,12 +1308,9 @@ def legislator_page():
                         for i, law in enumerate(proposer_results):
                             st.write(f"{i+1}. {law['billName']}")
                             
-                    # 改進法案分類邏輯
+                    # 依寫入法案時計算的正式法律名稱分類
                     for law in proposer_results:
-                        bill_name = law['billName']
-                        # 使用改進的法案名稱清理函數
-                        clean_name = advanced_clean_law_name(bill_name, entity_type)
-                        law_types[clean_name] += 1
+                        law_types[law['law_name']] += 1
                     
                     # 顯示此提案者的法案類型分布
                     top_laws = sorted(law_types.items(), key=lambda x: x[1], reverse=True)[:10]
@@ -1732,7 +1347,7 @@ def legislator_page():
                                 
                                 # 顯示該法律名稱下的所有法案
                                 matching_bills = [bill['billName'] for bill in proposer_results 
-                                                if advanced_clean_law_name(bill['billName'], entity_type) == name]
+                                                if bill['law_name'] == name]
                                 for i, bill_name in enumerate(matching_bills[:5]):  # 只顯示前5個
                                     st.write(f"  {i+1}. {bill_name}")
                                 if len(matching_bills) > 5:
@@ -1746,18 +1361,6 @@ def legislator_page():
                 # 2. 連署：長條圖顯示前十名法案
                 st.subheader("連署法案分析")
                 
-                # 查詢立委連署的法案
-                cosign_query = f"""
-                SELECT billName, billStatus
-                FROM bills
-                WHERE term = '{term}'
-                {session_filter}
-                {cosign_condition}
-                """
-                
-                cursor.execute(cosign_query)
-                cosign_results = [dict(row) for row in cursor.fetchall()]
-                
                 if cosign_results:
                     st.write(f"共連署 {len(cosign_results)} 件法案")
                     
@@ -1770,9 +1373,7 @@ def legislator_page():
                     # 分析法案類型
                     law_types = defaultdict(int)
                     for law in cosign_results:
-                        # 清理法案名稱，獲取基本法律名稱
-                        clean_name = advanced_clean_law_name(law['billName'], entity_type)
-                        law_types[clean_name] += 1
+                        law_types[law['law_name']] += 1
                     
                     # 顯示此立委的法案類型分布
                     top_laws = sorted(law_types.items(), key=lambda x: x[1], reverse=True)[:10]
@@ -1809,7 +1410,7 @@ def legislator_page():
                                 
                                 # 顯示該法律名稱下的所有法案
                                 matching_bills = [bill['billName'] for bill in cosign_results 
-                                                if advanced_clean_law_name(bill['billName'], entity_type) == name]
+                                                if bill['law_name'] == name]
                                 for i, bill_name in enumerate(matching_bills[:5]):  # 只顯示前5個
                                     st.write(f"  {i+1}. {bill_name}")
                                 if len(matching_bills) > 5:
@@ -1823,26 +1424,10 @@ def legislator_page():
                 # 3. 直接列出提案，依進度排列
                 st.subheader("提案法案列表 (依審查進度排序)")
                 
-                # 查詢更詳細的法案信息
-                proposer_detailed_query = f"""
-                SELECT billNo, billName, billOrg, billProposer, billCosignatory, 
-                       term, sessionPeriod, billStatus, pdfUrl, docUrl
-                FROM bills
-                WHERE term = '{term}'
-                {session_filter}
-                {proposer_condition}
-                """
-                
-                cursor.execute(proposer_detailed_query)
-                proposer_results = [dict(row) for row in cursor.fetchall()]
-                
                 if proposer_results:
-                    # 按審查進度分組
+                    # 按審查進度分組（提案法案已處理提案人和連署人資訊）
                     status_groups = defaultdict(list)
                     for bill in proposer_results:
-                        # 處理提案人和連署人資訊
-                        bill['party_stats'] = process_all_members(bill)
-                        
                         status = get_status_group(bill.get('billStatus', ''))
                         status_groups[status].append(bill)
                     
@@ -1913,8 +1498,6 @@ def legislator_page():
     
     except Exception as e:
         st.error(f"發生錯誤: {str(e)}")
-    finally:
-        db.close()
 
 # 設定session_state變數
 if 'search' not in st.session_state:
@@ -1,7 +1,7 @@
 import streamlit as st
 import sqlite3
 from src.database import Database
-from src.bill_utils import get_popular_bills_sql, clean_law_name
+from src.law_names import canonical_law_name
 import re
 from collections import defaultdict
 import matplotlib.pyplot as plt
@@ -336,99 +336,6 @@ def extract_names(names_str: str) -> list:
     # 移除重複的名字
     return list(dict.fromkeys(all_names))
 
-# 自訂SQL查詢取得熱門法案（含會期篩選）
-def get_popular_bills_sql_with_session(session_period=None):
-    base_sql = """
-    WITH RawBillNames AS (
-        SELECT 
-            CASE 
-                WHEN billName LIKE '%刑法%' AND billName NOT LIKE '%陸海空軍刑法%' THEN '中華民國刑法'
-                WHEN billName LIKE '%所得稅法%' THEN '所得稅法'
-                WHEN billName LIKE '%國土計畫法%' THEN '國土計畫法'
-                WHEN billName LIKE '%環境基本法%' THEN '環境基本法'
-                WHEN billName LIKE '%公務人員退休資遣撫卹法%' THEN '公務人員退休資遣撫卹法'
-                WHEN billName LIKE '%性別平等工作法%' THEN '性別平等工作法'
-                WHEN billName LIKE '%貨物稅條例%' THEN '貨物稅條例'
-                WHEN billName LIKE '「%」%' THEN
-                    CASE
-                        WHEN SUBSTR(
-                            SUBSTR(billName, INSTR(billName, '「') + 1),
-                            1,
-                            INSTR(SUBSTR(billName, INSTR(billName, '「') + 1), '」') - 1
-                        ) LIKE '%部分條文%' THEN
-                            REPLACE(
-                                SUBSTR(
-                                    SUBSTR(billName, INSTR(billName, '「') + 1),
-                                    1,
-                                    INSTR(SUBSTR(billName, INSTR(billName, '「') + 1), '部分條文') - 1
-                                ),
-                                '修正草案',
-                                ''
-                            )
-                        ELSE
-                            SUBSTR(
-                                SUBSTR(billName, INSTR(billName, '「') + 1),
-                                1,
-                                INSTR(SUBSTR(billName, INSTR(billName, '「') + 1), '」') - 1
-                            )
-                    END
-                ELSE billName
-            END as raw_name,
-            term,
-            sessionPeriod
-        FROM bills
-        WHERE term = '11'
-    """
-    
-    # 添加會期過濾條件
-    if session_period and session_period != "全部":
-        base_sql += f" AND sessionPeriod = '{session_period}'"
-    
-    base_sql += """
-    ),
-    CleanBillNames AS (
-        SELECT 
-            CASE
-                WHEN raw_name = '中華民國刑法' THEN '中華民國刑法'
-                WHEN raw_name = '所得稅法' THEN '所得稅法'
-                WHEN raw_name = '國土計畫法' THEN '國土計畫法'
-                WHEN raw_name = '環境基本法' THEN '環境基本法'
-                WHEN raw_name = '公務人員退休資遣撫卹法' THEN '公務人員退休資遣撫卹法'
-                WHEN raw_name = '性別平等工作法' THEN '性別平等工作法'
-                WHEN raw_name = '貨物稅條例' THEN '貨物稅條例'
-                WHEN raw_name LIKE '%部分條文%' THEN
-                    REPLACE(
-                        SUBSTR(raw_name, 1, INSTR(raw_name, '部分條文') - 1),
-                        '修正草案',
-                        ''
-                    )
-                WHEN raw_name LIKE '%第%條%' THEN
-                    SUBSTR(raw_name, 1, INSTR(raw_name, '第') - 1)
-                WHEN raw_name LIKE '%修正條文%' THEN
-                    SUBSTR(raw_name, 1, INSTR(raw_name, '修正條文') - 1)
-                WHEN raw_name LIKE '%修正草案%' THEN
-                    SUBSTR(raw_name, 1, INSTR(raw_name, '修正草案') - 1)
-                WHEN raw_name LIKE '%條文%' THEN
-                    SUBSTR(raw_name, 1, INSTR(raw_name, '條文') - 1)
-                WHEN raw_name LIKE '%草案%' THEN
-                    SUBSTR(raw_name, 1, INSTR(raw_name, '草案') - 1)
-                ELSE raw_name
-            END as clean_name,
-            term,
-            sessionPeriod
-        FROM RawBillNames
-    )
-    SELECT 
-        TRIM(clean_name) as law_name,
-        COUNT(*) as total_count
-    FROM CleanBillNames
-    WHERE TRIM(clean_name) != ''
-    GROUP BY TRIM(clean_name)
-    ORDER BY total_count DESC, law_name
-    LIMIT 30
-    """
-    return base_sql
-
 # 自定義函數用於顯示法案狀態標籤
 def display_status_badge(status):
     if not status:
@@ -639,8 +546,7 @@ def home():
         selected_session = st.selectbox("選擇會期", ["全部"] + session_periods, key="session_filter")
         
         # 獲取過濾後的熱門法案
-        cursor.execute(get_popular_bills_sql_with_session(selected_session if selected_session != "全部" else None))
-        popular_bills = [dict(row) for row in cursor.fetchall()]
+        popular_bills = db.get_popular_laws('11', selected_session if selected_session != "全部" else None)
         
         # 使用Grid佈局顯示熱門法案
         hot_cols = 3
@@ -723,7 +629,7 @@ def home():
                 bills = [dict(row) for row in cursor.fetchall()]
                 
                 # 顯示搜尋結果
-                st.header(f"搜尋結果：{clean_law_name(search_law_name)}")
+                st.header(f"搜尋結果：{canonical_law_name(search_law_name)}")
                 
                 # 顯示過濾條件
                 filter_info = f"第{search_term}屆" if search_term else "全部屆別"
@@ -936,7 +842,7 @@ def home():
                             
                             # 查詢此立委提案的法案類型分布
                             law_query = f"""
-                            SELECT billName, billStatus
+                            SELECT billName, billStatus, law_name
                             FROM bills
                             WHERE term = '{analysis_term}'
                             {session_filter}
@@ -950,9 +856,8 @@ def home():
                                 # 分析法案類型
                                 law_types = defaultdict(int)
                                 for law in law_results:
-                                    # 清理法案名稱，獲取基本法律名稱
-                                    clean_name = clean_law_name(law['billName'])
-                                    law_types[clean_name] += 1
+                                    # 寫入法案時已計算的正式法律名稱
+                                    law_types[law['law_name']] += 1
                                 
                                 # 顯示此立委的法案類型分布
                                 top_laws = sorted(law_types.items(), key=lambda x: x[1], reverse=True)[:5]
@@ -1013,7 +918,7 @@ def home():
                     # 取得所有法案，然後分析政黨分布
                     query = f"""
                     SELECT billNo, billName, billOrg, billProposer, billCosignatory, 
-                           term, sessionPeriod, billStatus
+                           term, sessionPeriod, billStatus, law_name
                     FROM bills 
                     WHERE term = '{analysis_term}'
                     {session_filter}
@@ -1064,8 +969,7 @@ def home():
                             party_stats[main_party] = party_stats.get(main_party, 0) + 1
                             
                             # 分析法案類型
-                            clean_name = clean_law_name(bill['billName'])
-                            party_law_stats[main_party][clean_name] += 1
+                            party_law_stats[main_party][bill['law_name']] += 1
                             
                             # 分析審查狀態
                             status = get_status_group(bill.get('billStatus', ''))